@@ -145,6 +145,54 @@ _ROUTER_MODULES: Final[tuple[str, ...]] = (
     "data_readiness",  # Capture source dataset readiness endpoints
 )
 
+# First path segment(s) under the v1 prefix served by each router module. The
+# loader mounts routers per segment, so keep this in sync when adding routes.
+_ROUTER_PATH_SEGMENTS: Final[dict[str, tuple[str, ...]]] = {
+    "review": ("review",),
+    "rules": ("review", "rules"),
+    "rulesets": ("rulesets",),
+    "screen": ("screen",),
+    "ergonomics": ("ergonomics",),
+    "products": ("products",),
+    "standards": ("standards",),
+    "costs": ("costs",),
+    "overlay": ("overlay",),
+    "export": ("export",),
+    "roi": ("roi",),
+    "imports": ("import", "parse"),
+    "audit": ("audit",),
+    "compliance": ("compliance",),
+    "feasibility": ("feasibility",),
+    "finance_scenarios": ("finance",),
+    "finance_jobs": ("finance",),
+    "finance_export": ("finance",),
+    "finance_workbook": ("finance",),
+    "finance_feasibility": ("finance",),
+    "entitlements": ("entitlements",),
+    "test_users": ("users",),
+    "users_secure": ("secure-users",),
+    "users_db": ("users-db",),
+    "projects": ("projects",),
+    "singapore_properties": ("singapore-property",),
+    "market_intelligence": ("market-intelligence",),
+    "agents": ("agents",),
+    "commercial_property_packs": ("agents",),
+    "deal_outcomes": ("deals",),
+    "deals": ("deals",),
+    "performance": ("performance",),
+    "advanced_intelligence": ("analytics",),
+    "listings": ("integrations",),
+    "developers": ("developers",),
+    "team": ("team",),
+    "workflow": ("workflow",),
+    "regulatory": ("regulatory",),
+    "development_phases": ("projects",),
+    "ai": ("ai",),
+    "ai_config": ("ai-config",),
+    "geocoding": ("geocoding",),
+    "data_readiness": ("data-readiness",),
+}
+
 _LAZY_SUBMODULES: Final[tuple[str, ...]] = (
     *_ROUTER_MODULES,
     "developers_checklists",
@@ -200,6 +248,62 @@ def build_api_router() -> Router:
     return api_router
 
 
+@lru_cache(maxsize=1)
+def _router_groups() -> dict[str, tuple[str, ...]]:
+    """Map each path segment to the router modules that must load together.
+
+    Modules sharing any segment form one group, kept in ``_ROUTER_MODULES``
+    order so route precedence matches the aggregated router.
+    """
+
+    groups: list[set[str]] = []
+    for module_name in _ROUTER_MODULES:
+        segments = set(_ROUTER_PATH_SEGMENTS[module_name])
+        merged = {module_name}
+        for group in [g for g in groups if segments & _segments_for(g)]:
+            merged |= group
+            groups.remove(group)
+        groups.append(merged)
+
+    by_segment: dict[str, tuple[str, ...]] = {}
+    for group in groups:
+        ordered = tuple(name for name in _ROUTER_MODULES if name in group)
+        for segment in _segments_for(group):
+            by_segment[segment] = ordered
+    return by_segment
+
+
+def _segments_for(module_names: set[str]) -> set[str]:
+    return {segment for name in module_names for segment in _ROUTER_PATH_SEGMENTS[name]}
+
+
+def router_group_for_segment(segment: str) -> tuple[str, ...]:
+    """Return the router modules serving ``/<v1 prefix>/<segment>/...``."""
+
+    return _router_groups().get(segment, ())
+
+
+def router_groups() -> tuple[tuple[str, ...], ...]:
+    """Return every router group once, in registration order."""
+
+    return tuple(
+        sorted(
+            set(_router_groups().values()),
+            key=lambda group: _ROUTER_MODULES.index(group[0]),
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def build_router_group(module_names: tuple[str, ...]) -> Router:
+    """Build and cache a router holding only ``module_names``."""
+
+    group_router: Router = _APIRouter()
+    for module_name in module_names:
+        group_router.include_router(_load_router(module_name))
+    return group_router
+
+
 def __getattr__(name: str) -> object:
     """Preserve lazy backward-compatible access to the aggregated router."""
 
@@ -215,6 +319,9 @@ def __getattr__(name: str) -> object:
 __all__: Final[tuple[str, ...]] = (
     "api_router",
     "build_api_router",
+    "build_router_group",
+    "router_group_for_segment",
+    "router_groups",
     "TAGS_METADATA",
     *_LAZY_SUBMODULES,
 )
@@ -7,7 +7,7 @@ import sys
 from datetime import date, datetime, timedelta
 from enum import Enum
 from importlib import import_module
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Literal, Optional, cast
 from uuid import UUID, uuid4
 
 import structlog
@@ -33,6 +33,7 @@ from app.services.finance import (
     value_property_multiple_approaches,
 )
 from app.services.geocoding import Address
+from app.services.property_search import PropertySearchFilters, search_properties
 from app.utils.lazy import LazyProxy
 
 
@@ -428,6 +429,39 @@ class MarketReportRequest(BaseModel):
     competitive_set_id: str | None = None
 
 
+class PropertySearchItem(BaseModel):
+    """A property in a search result page."""
+
+    id: str
+    name: str
+    address: str
+    property_type: str | None = None
+    district: str | None = None
+    planning_area: str | None = None
+    land_area_sqm: float | None = None
+    plot_ratio: float | None = None
+    tenure: str | None = None
+
+
+class FacetCountResponse(BaseModel):
+    """Match count for one facet value or range bucket."""
+
+    value: str
+    count: int
+    min: float | None = None
+    max: float | None = None
+
+
+class PropertySearchResponse(BaseModel):
+    """Response model for property search with facet counts."""
+
+    total: int
+    limit: int
+    offset: int
+    properties: list[PropertySearchItem]
+    facets: dict[str, list[FacetCountResponse]]
+
+
 class PhotoUploadResponse(BaseModel):
     """Response model for photo upload."""
 
@@ -439,6 +473,29 @@ class PhotoUploadResponse(BaseModel):
     public_url: str
 
 
+class PhotoBatchItem(BaseModel):
+    """Outcome for one photo of a batch upload."""
+
+    filename: str
+    status: Literal["stored", "failed"]
+    photo_id: str | None = None
+    storage_key: str | None = None
+    location: dict[str, float] | None = None
+    capture_timestamp: datetime | None = None
+    auto_tags: list[str] = Field(default_factory=list)
+    public_url: str | None = None
+    error: str | None = None
+
+
+class PhotoBatchUploadResponse(BaseModel):
+    """Response model for batch photo upload."""
+
+    property_id: str
+    stored: int
+    failed: int
+    photos: list[PhotoBatchItem]
+
+
 class VoiceNoteUploadRequest(BaseModel):
     """Request model for voice note upload metadata."""
 
@@ -1040,6 +1097,77 @@ async def analyze_development_potential(
         ) from e
 
 
+@router.get("/properties/search")
+async def search_property_list(
+    q: str | None = Query(
+        None, description="Words to match in property name, address, or area"
+    ),
+    location: str | None = Query(
+        None, description="Address, district, or planning area substring"
+    ),
+    property_type: PropertyType | None = None,
+    min_gpr: float | None = Query(None, ge=0),
+    max_gpr: float | None = Query(None, ge=0),
+    min_land_area: float | None = Query(None, ge=0),
+    max_land_area: float | None = Query(None, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_session),
+    role: Role = Depends(get_request_role),
+) -> PropertySearchResponse:
+    """
+    Search properties with facet counts.
+
+    Facets count matches per property type, GPR range and land area range;
+    each facet ignores its own filter so other buckets show what selecting
+    them would return.
+    """
+    filters = PropertySearchFilters(
+        keywords=q,
+        location=location,
+        property_type=property_type,
+        min_gpr=min_gpr,
+        max_gpr=max_gpr,
+        min_land_area=min_land_area,
+        max_land_area=max_land_area,
+    )
+    page = await search_properties(
+        db, filters, limit=limit, offset=offset, include_counts=True
+    )
+
+    return PropertySearchResponse(
+        total=page.total or 0,
+        limit=limit,
+        offset=offset,
+        properties=[
+            PropertySearchItem(
+                id=str(p.id),
+                name=p.name,
+                address=p.address,
+                property_type=p.property_type.value if p.property_type else None,
+                district=p.district,
+                planning_area=p.planning_area,
+                land_area_sqm=float(p.land_area_sqm) if p.land_area_sqm else None,
+                plot_ratio=float(p.plot_ratio) if p.plot_ratio else None,
+                tenure=p.tenure_type.value if p.tenure_type else None,
+            )
+            for p in page.properties
+        ],
+        facets={
+            name: [
+                FacetCountResponse(
+                    value=facet.value,
+                    count=facet.count,
+                    min=facet.min,
+                    max=facet.max,
+                )
+                for facet in facets
+            ]
+            for name, facets in page.facets.items()
+        },
+    )
+
+
 @router.post("/properties/{property_id}/photos")
 async def upload_property_photo(
     property_id: str,
@@ -1117,6 +1245,100 @@ async def upload_property_photo(
         ) from e
 
 
+@router.post("/properties/{property_id}/photos/batch")
+async def upload_property_photos_batch(
+    property_id: str,
+    files: list[UploadFile] = File(...),
+    notes: str | None = None,
+    tags: str | None = None,
+    phase: str | None = None,
+    db: AsyncSession = Depends(get_session),
+    _identity: deps.RequestIdentity = Depends(deps.require_reviewer),
+) -> PhotoBatchUploadResponse:
+    """
+    Upload a site visit's photos in one request.
+
+    Photos are read from the multipart upload as workers become free and
+    processed like single uploads; all records are stored in one
+    transaction. Each photo reports its own status, ordered by EXIF capture
+    time.
+
+    Args:
+        property_id: The property ID
+        files: The image files to upload
+        notes: Optional notes applied to every photo
+        tags: Optional comma-separated tags applied to every photo
+        phase: Property phase (acquisition or sales) - determines watermark text
+    """
+    if len(files) > settings.PHOTO_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.PHOTO_BATCH_MAX_FILES} photos per batch",
+        )
+
+    # Prepare user metadata
+    user_metadata: dict[str, Any] = {}
+    if notes:
+        user_metadata["notes"] = notes
+    if tags:
+        user_metadata["tags"] = tags.split(",")
+    if phase:
+        user_metadata["phase"] = phase
+
+    photo_manager = _new_photo_manager()
+
+    try:
+        results = await photo_manager.process_photo_batch(
+            photos=files,
+            property_id=property_id,
+            session=db,
+            user_metadata=user_metadata,
+            phase=phase,
+        )
+    except Exception as e:
+        log_event(
+            _logger,
+            "agents_endpoint_unhandled_exception",
+            endpoint=__name__,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        raise HTTPException(
+            status_code=400, detail="Request could not be processed"
+        ) from e
+
+    items = []
+    for result in results:
+        if result.metadata is None:
+            items.append(
+                PhotoBatchItem(
+                    filename=result.filename, status="failed", error=result.error
+                )
+            )
+            continue
+        payload = result.metadata.to_dict()
+        items.append(
+            PhotoBatchItem(
+                filename=result.filename,
+                status="stored",
+                photo_id=payload["photo_id"],
+                storage_key=payload["storage_key"],
+                location=payload.get("location"),
+                capture_timestamp=datetime.fromisoformat(payload["capture_timestamp"]),
+                auto_tags=payload["auto_tagged_conditions"],
+                public_url=payload["public_url"],
+            )
+        )
+
+    stored = sum(1 for item in items if item.status == "stored")
+    return PhotoBatchUploadResponse(
+        property_id=property_id,
+        stored=stored,
+        failed=len(items) - stored,
+        photos=items,
+    )
+
+
 @router.get("/properties/{property_id}/photos")
 async def get_property_photos(
     property_id: str,
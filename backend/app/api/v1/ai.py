@@ -47,6 +47,8 @@ from app.schemas.ai import (
     DDItemResponse,
     DDRecommendationResponse,
     # Deal Scoring
+    DealScoreBatchRequest,
+    DealScoreBatchResponse,
     DealScoreRequest,
     DealScoreResponse,
     # Document Extraction
@@ -546,38 +548,72 @@ async def score_deal(
                 detail="Deal not found or could not be scored",
             )
 
-        raw_factors = (
-            list(getattr(result, "positive_factors", []))
-            + list(getattr(result, "neutral_factors", []))
-            + list(getattr(result, "risk_factors", []))
-        )
-        total_factors = len(raw_factors) or 1
-        factor_scores = [
-            FactorScoreItem(
-                factor=f.name,
-                score=abs(float(f.impact_score)) * 100,
-                weight=1 / total_factors,
-                weighted_score=float(f.impact_score) * 100 / total_factors,
-                rationale=f.evidence or f.description,
-            )
-            for f in raw_factors
-        ]
-
-        return DealScoreResponse(
-            deal_id=request.deal_id,
-            overall_score=float(result.score),
-            grade=_score_grade(float(result.score)),
-            factor_scores=factor_scores,
-            recommendation=result.recommendation,
-            confidence=_confidence_score(result.confidence),
-            scored_at=result.scored_at,
-        )
+        return _deal_score_response(request.deal_id, result)
     except HTTPException:
         raise
     except Exception as exc:
         raise _internal_error(exc, __name__) from exc
 
 
+@router.post("/deals/score/batch", response_model=DealScoreBatchResponse)
+async def score_deals(
+    request: DealScoreBatchRequest,
+    identity: Role = Depends(require_viewer),
+    db: AsyncSession = Depends(get_db),
+) -> DealScoreBatchResponse:
+    """Score a page of deals in one pass.
+
+    Deals that do not exist are listed in ``missing_deal_ids``.
+    """
+    try:
+        results = await _service("deal_scoring").score_deals(
+            deal_ids=request.deal_ids,
+            db=db,
+            user_id=_identity_user_id(identity),
+            include_comparables=False,
+        )
+        return DealScoreBatchResponse(
+            scores=[
+                _deal_score_response(deal_id, result)
+                for deal_id, result in results.items()
+            ],
+            missing_deal_ids=[
+                deal_id for deal_id in request.deal_ids if deal_id not in results
+            ],
+        )
+    except Exception as exc:
+        raise _internal_error(exc, __name__) from exc
+
+
+def _deal_score_response(deal_id: str, result: Any) -> DealScoreResponse:
+    raw_factors = (
+        list(getattr(result, "positive_factors", []))
+        + list(getattr(result, "neutral_factors", []))
+        + list(getattr(result, "risk_factors", []))
+    )
+    total_factors = len(raw_factors) or 1
+    factor_scores = [
+        FactorScoreItem(
+            factor=f.name,
+            score=abs(float(f.impact_score)) * 100,
+            weight=1 / total_factors,
+            weighted_score=float(f.impact_score) * 100 / total_factors,
+            rationale=f.evidence or f.description,
+        )
+        for f in raw_factors
+    ]
+
+    return DealScoreResponse(
+        deal_id=deal_id,
+        overall_score=float(result.score),
+        grade=_score_grade(float(result.score)),
+        factor_scores=factor_scores,
+        recommendation=result.recommendation,
+        confidence=_confidence_score(result.confidence),
+        scored_at=result.scored_at,
+    )
+
+
 # ============================================================================
 # Scenario Optimizer Endpoints
 # ============================================================================
@@ -8,9 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import require_viewer
 from app.core.audit.ledger import (
     build_evidence_report,
+    build_inclusion_proof,
     diff_logs,
     serialise_log,
     verify_chain,
+    verify_chain_incremental,
 )
 from app.core.database import get_session
 from app.services.deals.utils import audit_key_from_value
@@ -25,6 +27,16 @@ def _resolve_audit_project_id(project_ref: str) -> int:
     return int(project_id)
 
 
+async def _evidence_report(session: AsyncSession, project_id: int) -> dict[str, object]:
+    verification = await verify_chain_incremental(session, project_id)
+    return build_evidence_report(
+        project_id,
+        verification.valid,
+        verification.entries,
+        checkpoints=verification.checkpoints,
+    )
+
+
 @router.get("/{project_id}")
 async def list_project_audit(
     project_id: int,
@@ -52,9 +64,7 @@ async def project_audit_evidence(
 ) -> dict[str, object]:
     """Return an evidence-pack summary for a project's audit ledger."""
 
-    valid, logs = await verify_chain(session, project_id)
-    report: dict[str, object] = build_evidence_report(project_id, valid, logs)
-    return report
+    return await _evidence_report(session, project_id)
 
 
 @router.get("/by-ref/{project_ref}/evidence")
@@ -66,9 +76,7 @@ async def project_audit_evidence_by_ref(
     """Return an evidence-pack summary using a UUID/string project reference."""
 
     project_id = _resolve_audit_project_id(project_ref)
-    valid, logs = await verify_chain(session, project_id)
-    report: dict[str, object] = build_evidence_report(project_id, valid, logs)
-    return report
+    return await _evidence_report(session, project_id)
 
 
 @router.get("/{project_id}/diff/{version_a}/{version_b}")
@@ -97,4 +105,19 @@ async def diff_project_audit(
     }
 
 
+@router.get("/{project_id}/proof/{version}")
+async def project_audit_proof(
+    project_id: int,
+    version: int,
+    session: AsyncSession = Depends(get_session),
+    _: str = Depends(require_viewer),
+) -> dict[str, object]:
+    """Return a Merkle inclusion proof tying an entry to a signed checkpoint."""
+
+    proof = await build_inclusion_proof(session, project_id, version)
+    if proof is None:
+        raise HTTPException(status_code=404, detail="Audit entry not checkpointed")
+    return proof
+
+
 __all__ = ["router"]
@@ -23,6 +23,7 @@ router = APIRouter(
 
 
 _logger = get_logger(__name__)
+_RENDER_QUEUE_RETRY_AFTER_SECONDS = 5
 
 
 def _report_storage_path(property_id: str, filename: str) -> PathLib:
@@ -120,6 +121,15 @@ async def generate_professional_pack(
         }
 
     except Exception as exc:
+        queue_full = _load_optional_class(
+            "PDFRenderQueueFull", "app.services.agents.pdf_render"
+        )
+        if queue_full is not None and isinstance(exc, queue_full):
+            raise HTTPException(
+                status_code=503,
+                detail=str(exc),
+                headers={"Retry-After": str(_RENDER_QUEUE_RETRY_AFTER_SECONDS)},
+            ) from exc
         log_event(
             _logger,
             "agents_endpoint_unhandled_exception",
@@ -161,6 +161,14 @@ class DeveloperColorLegendEntry(BaseModel):
     description: str | None = None
 
 
+class PreviewLodSchema(BaseModel):
+    """One level-of-detail tier of a rendered preview."""
+
+    level: str
+    url: str
+    bytes: int
+
+
 class PreviewJobSchema(BaseModel):
     """Preview generation job status representation."""
 
@@ -178,6 +186,7 @@ class PreviewJobSchema(BaseModel):
     message: str | None = None
     geometry_detail_level: str | None = None
     starter_model_assumptions: dict[str, Any] | None = None
+    lods: list[PreviewLodSchema] = Field(default_factory=list)
 
 
 class DeveloperConstraintViolation(BaseModel):
@@ -355,6 +364,7 @@ def _serialise_preview_job(job: Any) -> PreviewJobSchema:
     )
     detail_level = None
     starter_model_assumptions = None
+    lods: list[PreviewLodSchema] = []
     if isinstance(job.metadata, dict):
         raw_level = job.metadata.get("geometry_detail_level")
         if isinstance(raw_level, str):
@@ -362,6 +372,13 @@ def _serialise_preview_job(job: Any) -> PreviewJobSchema:
         raw_assumptions = job.metadata.get("starter_model_assumptions")
         if isinstance(raw_assumptions, dict):
             starter_model_assumptions = raw_assumptions
+        manifest = job.metadata.get("asset_manifest")
+        if status == PreviewJobStatus.READY.value and isinstance(manifest, dict):
+            lods = [
+                PreviewLodSchema.model_validate(entry)
+                for entry in manifest.get("lods") or []
+                if isinstance(entry, dict)
+            ]
     return PreviewJobSchema(
         id=job.id,
         property_id=job.property_id,
@@ -377,4 +394,5 @@ def _serialise_preview_job(job: Any) -> PreviewJobSchema:
         asset_version=job.asset_version,
         geometry_detail_level=detail_level,
         starter_model_assumptions=starter_model_assumptions,
+        lods=lods,
     )
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import math
 import re
 from datetime import datetime
@@ -13,6 +14,7 @@ from uuid import UUID, uuid4
 import structlog
 from backend._compat.datetime import utcnow
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator, model_validator
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -68,6 +70,7 @@ from app.services.finance_project_creation import (
 from app.services.geocoding import Address, GeocodeLookupResult
 from app.services.jurisdictions import get_jurisdiction_config
 from app.services.preview_jobs import PreviewJobService, PreviewJobStatus
+from app.services.preview_render_pool import PreviewRenderQueueFull
 from app.utils.lazy import LazyProxy
 
 router = APIRouter(prefix="/developers", tags=["developers"])
@@ -3444,6 +3447,8 @@ async def developer_log_property_by_gps(
         entry.model_dump() if hasattr(entry, "model_dump") else entry.__dict__
         for entry in visualization.color_legend
     ]
+    # A full render pool must not fail the capture; the job is recorded as
+    # failed and the client can refresh it later.
     preview_job = await preview_service.queue_preview(
         property_id=result.property_id,
         scenario="base",
@@ -3452,6 +3457,7 @@ async def developer_log_property_by_gps(
         geometry_detail_level=request.preview_geometry_detail_level,
         color_legend=legend_payload,
         inline_execution="background",
+        defer_when_saturated=True,
     )
     preview_status = (
         preview_job.status.value
@@ -3718,6 +3724,17 @@ async def link_capture_to_project(
     )
 
 
+_RENDER_QUEUE_RETRY_AFTER_SECONDS = 5
+
+
+def _render_queue_full(exc: PreviewRenderQueueFull) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=str(exc),
+        headers={"Retry-After": str(_RENDER_QUEUE_RETRY_AFTER_SECONDS)},
+    )
+
+
 @router.get(
     "/properties/{property_id}/preview-jobs",
     response_model=list[PreviewJobSchema],
@@ -3766,29 +3783,36 @@ async def create_preview_job(
         ),
     )
     service = PreviewJobService(session)
-    preview_job = await service.queue_preview(
-        property_id=property_id,
-        scenario=(
-            payload.scenario.value
-            if isinstance(payload.scenario, CaptureScenario)
-            else str(payload.scenario)
-        ),
-        massing_layers=massing_payload,
-        camera_orbit=visualization.camera_orbit_hint or {},
-        geometry_detail_level=payload.geometry_detail_level,
-        color_legend=(
-            [
-                entry.model_dump() if hasattr(entry, "model_dump") else entry.__dict__
-                for entry in payload.color_legend
-            ]
-            if payload.color_legend
-            else legend_payload
-        ),
-        metadata_extras={
-            "starter_model_assumptions": engineering_assumptions,
-            "visualization_notes": list(visualization.notes),
-        },
-    )
+    try:
+        preview_job = await service.queue_preview(
+            property_id=property_id,
+            scenario=(
+                payload.scenario.value
+                if isinstance(payload.scenario, CaptureScenario)
+                else str(payload.scenario)
+            ),
+            massing_layers=massing_payload,
+            camera_orbit=visualization.camera_orbit_hint or {},
+            geometry_detail_level=payload.geometry_detail_level,
+            color_legend=(
+                [
+                    (
+                        entry.model_dump()
+                        if hasattr(entry, "model_dump")
+                        else entry.__dict__
+                    )
+                    for entry in payload.color_legend
+                ]
+                if payload.color_legend
+                else legend_payload
+            ),
+            metadata_extras={
+                "starter_model_assumptions": engineering_assumptions,
+                "visualization_notes": list(visualization.notes),
+            },
+        )
+    except PreviewRenderQueueFull as exc:
+        raise _render_queue_full(exc) from exc
     await session.commit()
     await session.refresh(preview_job)
     return _serialise_preview_job(preview_job)
@@ -3812,6 +3836,45 @@ async def get_preview_job(
     return _serialise_preview_job(job)
 
 
+@router.get("/preview-jobs/{job_id}/lods")
+async def stream_preview_job_lods(
+    job_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    _identity: RequestIdentity = Depends(require_viewer),
+) -> StreamingResponse:
+    """Stream a preview's LOD tiers as NDJSON, coarse proxy first.
+
+    Tiers already on disk are sent immediately; finer ones follow as the
+    render publishes them, so clients can show a massing before the full
+    mesh is ready.
+    """
+
+    service = PreviewJobService(session)
+    job = await service.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Preview job not found")
+    if job.status == PreviewJobStatus.FAILED or not job.payload_checksum:
+        raise HTTPException(status_code=409, detail="Preview job has no render")
+    detail_level = preview_generator.normalise_geometry_detail_level(
+        (job.metadata or {}).get("geometry_detail_level")
+    )
+    property_id = job.property_id
+    asset_version = job.asset_version or preview_generator.preview_content_key(
+        job.payload_checksum, detail_level
+    )
+
+    async def _lines():
+        async for lod in preview_generator.watch_preview_lods(
+            property_id,
+            asset_version,
+            detail_level,
+            timeout_seconds=settings.PREVIEW_LOD_STREAM_TIMEOUT_SECONDS,
+        ):
+            yield json.dumps(lod.to_payload()) + "\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+
 @router.post(
     "/preview-jobs/{job_id}/refresh",
     response_model=PreviewJobSchema,
@@ -3840,6 +3903,8 @@ async def refresh_preview_job(
                 else None
             ),
         )
+    except PreviewRenderQueueFull as exc:
+        raise _render_queue_full(exc) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     await session.commit()
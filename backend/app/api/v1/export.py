@@ -143,6 +143,9 @@ async def export_project(
         media_type=artifact.media_type,
         filename=artifact.filename,
     )
+    response.headers["X-Export-Cache"] = (
+        "hit" if getattr(artifact, "cached", False) else "miss"
+    )
     renderer = artifact.manifest.get("renderer")
     if renderer:
         response.headers["X-Export-Renderer"] = str(renderer)
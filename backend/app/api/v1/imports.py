@@ -57,6 +57,8 @@ _JOB_SYMBOL_MODULES = {
     "detect_ifc_metadata": "backend.jobs.parse_cad",
     "parse_import_job": "backend.jobs.parse_cad",
     "vectorize_floorplan": "backend.jobs.raster_vector",
+    "merge_page_results": "backend.jobs.raster_vector",
+    "RasterVectorOptions": "backend.jobs.raster_vector",
 }
 
 SUPPORTED_IMPORT_SUFFIXES: tuple[str, ...] = (".dxf", ".ifc", ".json")
@@ -100,6 +102,10 @@ def _get_job_queue() -> _JobQueueLike:
 
 
 class _JobQueueProxy:
+    @property
+    def backend_name(self) -> str | None:
+        return getattr(_get_job_queue(), "backend_name", None)
+
     async def enqueue(
         self, func: Callable[..., Any], /, *args: Any, **kwargs: Any
     ) -> _JobDispatchLike:
@@ -323,7 +329,7 @@ def _summarise_vector_payload(
     if isinstance(options_raw, Mapping):
         bitmap_flag = bool(options_raw.get("bitmap_walls"))
         infer_flag = bool(options_raw.get("infer_walls", infer_walls))
-    return {
+    summary: dict[str, Any] = {
         "paths": len(payload.get("paths") or []),
         "walls": len(payload.get("walls") or []),
         "source": payload.get("source"),
@@ -334,6 +340,12 @@ def _summarise_vector_payload(
             "bitmap_walls": bitmap_flag,
         },
     }
+    pages = payload.get("pages")
+    if isinstance(pages, list):
+        summary["pages"] = pages
+    if payload.get("partial"):
+        summary["partial"] = True
+    return summary
 
 
 def _derive_vector_layers(payload: Mapping[str, Any]) -> list[dict[str, Any]]:
@@ -528,6 +540,16 @@ def _build_parse_summary(record: ImportRecord) -> dict[str, Any]:
     return summary
 
 
+def _partial_vector_payload(pages: list[Any], infer_walls: bool) -> dict[str, Any]:
+    """Merge the pages that finished before vectorisation failed."""
+
+    merge_page_results = _load_job_symbol("merge_page_results")
+    options = _load_job_symbol("RasterVectorOptions")(infer_walls=infer_walls)
+    payload = dict(merge_page_results(list(pages), options).to_payload())
+    payload["partial"] = True
+    return payload
+
+
 async def _vectorize_payload_if_requested(
     *,
     enable_raster_processing: bool,
@@ -549,6 +571,25 @@ async def _vectorize_payload_if_requested(
 
     vector_payload: dict[str, Any] | None = None
     safe_content_type = content_type or ""
+    completed_pages: list[Any] = []
+
+    def _record_page(page: Any) -> None:
+        # Runs on the vectorisation worker thread as each PDF page finishes.
+        completed_pages.append(page)
+        logger.info(
+            "vectorize_page_completed",
+            import_id=import_id,
+            page=page.page_index + 1,
+            pages_completed=len(completed_pages),
+            paths=len(page.paths),
+            duration_ms=round(page.duration_ms, 2),
+        )
+
+    # Callbacks cannot cross a queue boundary, so per-page progress is only
+    # observed when the job runs in this process.
+    page_kwargs: dict[str, Any] = (
+        {"on_page": _record_page} if job_queue.backend_name == "inline" else {}
+    )
 
     try:
         vectorize = _load_job_symbol("vectorize_floorplan")
@@ -558,6 +599,7 @@ async def _vectorize_payload_if_requested(
             content_type=safe_content_type,
             filename=filename,
             infer_walls=infer_walls,
+            **page_kwargs,
         )
         if dispatch.result and isinstance(dispatch.result, Mapping):
             vector_payload = dict(dispatch.result)
@@ -567,16 +609,20 @@ async def _vectorize_payload_if_requested(
                 content_type=safe_content_type,
                 filename=filename,
                 infer_walls=infer_walls,
+                on_page=_record_page,
             )
             if isinstance(inline_result, Mapping):
                 vector_payload = dict(inline_result)
-    except Exception as exc:  # pragma: no cover - defensive logging surface
+    except Exception as exc:
         logger.warning(
             "vectorization_failed",
             import_id=import_id,
             filename=filename,
             error=str(exc),
+            pages_completed=len(completed_pages),
         )
+        if completed_pages:
+            vector_payload = _partial_vector_payload(completed_pages, infer_walls)
 
     if vector_payload is None:
         return None, None, None
@@ -131,7 +131,11 @@ async def generate_market_report(
         recommendations=report.recommendations,
     )
 
-    return MarketReportResponse(report=payload, generated_at=report.generated_at)
+    return MarketReportResponse(
+        report=payload,
+        generated_at=report.generated_at,
+        snapshot_refreshed_at=report.snapshot_refreshed_at,
+    )
 
 
 @router.get("/health")  # public-endpoint: liveness probe for CI smoke tests
@@ -1,17 +1,31 @@
 """Audit ledger utilities."""
 
 from .ledger import (
+    ChainHead,
+    ChainVerification,
+    LedgerWriter,
     append_event,
+    build_inclusion_proof,
     compute_event_hash,
     diff_logs,
+    ledger_writer,
+    recover_chain_heads,
     serialise_log,
     verify_chain,
+    verify_chain_incremental,
 )
 
 __all__ = [
+    "ChainHead",
+    "ChainVerification",
+    "LedgerWriter",
     "append_event",
+    "build_inclusion_proof",
     "compute_event_hash",
     "diff_logs",
+    "ledger_writer",
+    "recover_chain_heads",
     "serialise_log",
     "verify_chain",
+    "verify_chain_incremental",
 ]
@@ -5,16 +5,24 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
-from collections.abc import Mapping
+import logging
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 from backend._compat.datetime import UTC
-from sqlalchemy import select
+from sqlalchemy import Select, and_, event, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.audit.merkle import inclusion_proof, merkle_root, verify_inclusion
 from app.core.config import settings
-from app.models.audit import AuditLog
+from app.models.audit import AuditCheckpoint, AuditLog
+
+logger = logging.getLogger(__name__)
 
 
 def _as_utc(timestamp: datetime | None) -> datetime | None:
@@ -81,17 +89,279 @@ def _sign_hash(hash_value: str) -> str:
     return digest.hexdigest()
 
 
-async def _latest_entry(session: AsyncSession, project_id: int) -> AuditLog | None:
-    """Fetch the most recent audit entry for ``project_id``."""
+_PENDING_KEY = "audit_ledger_pending"
+_UNFLUSHED_KEY = "audit_ledger_unflushed"
+_TIPS_KEY = "audit_ledger_tips"
+_ANCHORED_KEY = "audit_ledger_anchored"
+_SESSION_KEYS = (_PENDING_KEY, _UNFLUSHED_KEY, _TIPS_KEY, _ANCHORED_KEY)
 
-    stmt = (
-        select(AuditLog)
-        .where(AuditLog.project_id == project_id)
-        .order_by(AuditLog.version.desc())
-        .limit(1)
+# First key of the two-key PostgreSQL advisory lock taken per project while a
+# transaction appends to its chain ("AUDT").
+_ADVISORY_LOCK_NAMESPACE = 0x41554454
+
+
+@dataclass(frozen=True, slots=True)
+class ChainHead:
+    """Latest committed position of a project's audit chain."""
+
+    version: int
+    hash: str
+
+
+def _chain_heads_statement(project_ids: Iterable[int] | None = None) -> Select:
+    latest = select(
+        AuditLog.project_id, func.max(AuditLog.version).label("version")
+    ).group_by(AuditLog.project_id)
+    if project_ids is not None:
+        latest = latest.where(AuditLog.project_id.in_(list(project_ids)))
+    latest_subquery = latest.subquery()
+    return select(AuditLog.project_id, AuditLog.version, AuditLog.hash).join(
+        latest_subquery,
+        and_(
+            AuditLog.project_id == latest_subquery.c.project_id,
+            AuditLog.version == latest_subquery.c.version,
+        ),
     )
-    result = await session.execute(stmt)
-    return result.scalars().first()
+
+
+def _link(log: AuditLog, head: ChainHead | None) -> None:
+    """Place ``log`` directly after ``head`` and (re)compute its hash."""
+
+    log.version = 1 if head is None else head.version + 1
+    log.prev_hash = head.hash if head is not None else None
+    log.hash = compute_event_hash(_payload_for_hash(log))
+    log.signature = _sign_hash(log.hash)
+
+
+class LedgerWriter:
+    """Sequence audit events in memory and persist them per commit window.
+
+    ``append_event`` chains each event off the session's latest staged event
+    or the cached committed head of the project, so it needs no database
+    round trip. The first flush that touches a project in a transaction
+    anchors it: on PostgreSQL it takes a transaction-scoped advisory lock on
+    the project, then a single query re-reads the committed heads of every
+    newly anchored project and re-links any event whose provisional position
+    went stale (another process appended in between). Later flushes in the
+    same transaction chain from the anchored position without querying. The
+    unit of work writes each batch as one multi-row ``INSERT``. Cached heads
+    advance on commit; a rollback drops them along with the session state.
+
+    When a flush carries a project's chain across an
+    ``AUDIT_CHECKPOINT_INTERVAL`` boundary, the completed intervals are
+    verified and sealed into checkpoints in the same transaction.
+
+    The advisory lock serialises appenders per project until commit, so the
+    ``uq_audit_logs_project_version`` constraint is only a backstop there.
+    SQLite allows a single writer at a time, so a concurrent appender fails
+    with a lock error rather than forking the chain.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._heads: weakref.WeakKeyDictionary[Any, dict[int, ChainHead]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _engine(session: Session | AsyncSession) -> Any:
+        bind = session.get_bind()
+        return getattr(bind, "engine", bind)
+
+    def _cache(self, session: Session | AsyncSession) -> dict[int, ChainHead]:
+        engine = self._engine(session)
+        with self._lock:
+            return self._heads.setdefault(engine, {})
+
+    @staticmethod
+    def _state(session: Session | AsyncSession, key: str) -> Any:
+        factory = list if key in (_PENDING_KEY, _UNFLUSHED_KEY) else dict
+        return session.info.setdefault(key, factory())
+
+    def head(self, session: AsyncSession, project_id: int) -> ChainHead | None:
+        """Return the position the next event for ``project_id`` chains from."""
+
+        tip = self._state(session, _TIPS_KEY).get(project_id)
+        if tip is not None:
+            return tip
+        return self._cache(session).get(project_id)
+
+    def stage(self, session: AsyncSession, log: AuditLog) -> None:
+        """Assign ``log`` its provisional chain position and add it to the session."""
+
+        project_id = int(log.project_id)
+        _link(log, self.head(session, project_id))
+        self._state(session, _TIPS_KEY)[project_id] = ChainHead(
+            version=log.version, hash=log.hash
+        )
+        self._state(session, _PENDING_KEY).append(log)
+        self._state(session, _UNFLUSHED_KEY).append(log)
+        session.add(log)
+
+    async def recover(
+        self, session: AsyncSession, project_ids: Iterable[int] | None = None
+    ) -> dict[int, ChainHead]:
+        """Reload committed chain heads (all projects by default) into memory."""
+
+        result = await session.execute(_chain_heads_statement(project_ids))
+        heads = {
+            int(project_id): ChainHead(version=int(version), hash=hash_value)
+            for project_id, version, hash_value in result.all()
+        }
+        cache = self._cache(session)
+        with self._lock:
+            if project_ids is None:
+                cache.clear()
+            cache.update(heads)
+        return heads
+
+    def _anchor(
+        self, session: Session, project_ids: set[int]
+    ) -> dict[int, ChainHead | None]:
+        """Lock ``project_ids`` for this transaction and read their committed heads."""
+
+        with session.no_autoflush:
+            if session.get_bind().dialect.name == "postgresql":
+                for project_id in sorted(project_ids):
+                    session.execute(
+                        select(
+                            func.pg_advisory_xact_lock(
+                                _ADVISORY_LOCK_NAMESPACE, project_id
+                            )
+                        )
+                    )
+            rows = session.execute(_chain_heads_statement(project_ids)).all()
+        heads: dict[int, ChainHead | None] = dict.fromkeys(project_ids)
+        for project_id, version, hash_value in rows:
+            heads[int(project_id)] = ChainHead(version=int(version), hash=hash_value)
+        return heads
+
+    def _relink_unflushed(self, session: Session) -> None:
+        staged = session.info.pop(_UNFLUSHED_KEY, None) or ()
+        unflushed = [log for log in staged if log in session.new]
+        if not unflushed:
+            return
+        anchored = self._state(session, _ANCHORED_KEY)
+        new_projects = {int(log.project_id) for log in unflushed} - anchored.keys()
+        if new_projects:
+            anchored.update(self._anchor(session, new_projects))
+        tips = self._state(session, _TIPS_KEY)
+        flushed_from = {
+            project_id: head.version if head is not None else 0
+            for project_id, head in anchored.items()
+        }
+        for log in unflushed:
+            project_id = int(log.project_id)
+            head = anchored[project_id]
+            expected_version = 1 if head is None else head.version + 1
+            expected_prev = head.hash if head is not None else None
+            if log.version != expected_version or log.prev_hash != expected_prev:
+                _link(log, head)
+            anchored[project_id] = tips[project_id] = ChainHead(
+                version=log.version, hash=log.hash
+            )
+
+        interval = settings.AUDIT_CHECKPOINT_INTERVAL
+        for project_id in {int(log.project_id) for log in unflushed}:
+            if anchored[project_id].version // interval > (
+                flushed_from[project_id] // interval
+            ):
+                staged_logs = [
+                    log for log in unflushed if int(log.project_id) == project_id
+                ]
+                self._seal_completed(session, project_id, staged_logs, interval)
+
+    @staticmethod
+    def _seal_completed(
+        session: Session,
+        project_id: int,
+        staged_logs: Sequence[AuditLog],
+        interval: int,
+    ) -> None:
+        """Seal every complete ``interval`` after the project's last checkpoint."""
+
+        with session.no_autoflush:
+            last = session.execute(
+                select(AuditCheckpoint)
+                .where(AuditCheckpoint.project_id == project_id)
+                .order_by(AuditCheckpoint.end_version.desc())
+                .limit(1)
+            ).scalar_one_or_none()
+            sealed_through = last.end_version if last is not None else 0
+            persisted = session.execute(
+                select(AuditLog)
+                .where(
+                    AuditLog.project_id == project_id,
+                    AuditLog.version > sealed_through,
+                )
+                .order_by(AuditLog.version)
+            ).scalars()
+            entries = list(persisted) + list(staged_logs)
+        previous_hash = last.chain_hash if last is not None else None
+        for position, entry in enumerate(entries):
+            if entry.version != sealed_through + position + 1 or not _entry_is_valid(
+                entry, previous_hash
+            ):
+                logger.warning(
+                    "Audit chain for project %s is invalid at version %s; "
+                    "not sealing",
+                    project_id,
+                    entry.version,
+                )
+                return
+            previous_hash = entry.hash
+        while len(entries) >= interval:
+            session.add(_seal(project_id, entries[:interval]))
+            entries = entries[interval:]
+
+    def _promote(self, session: Session) -> None:
+        pending = session.info.pop(_PENDING_KEY, None)
+        for key in _SESSION_KEYS:
+            session.info.pop(key, None)
+        if not pending:
+            return
+        cache = self._cache(session)
+        with self._lock:
+            for log in pending:
+                if not inspect(log).persistent:
+                    continue
+                current = cache.get(log.project_id)
+                if current is None or log.version > current.version:
+                    cache[log.project_id] = ChainHead(
+                        version=log.version, hash=log.hash
+                    )
+
+    def _discard(self, session: Session) -> None:
+        pending = session.info.pop(_PENDING_KEY, None)
+        for key in _SESSION_KEYS:
+            session.info.pop(key, None)
+        if not pending:
+            return
+        cache = self._cache(session)
+        with self._lock:
+            for log in pending:
+                cache.pop(log.project_id, None)
+
+    def install(self) -> None:
+        """Hook the writer into every ORM session's flush and transaction events."""
+
+        listeners: tuple[tuple[str, Callable[..., None]], ...] = (
+            ("before_flush", lambda session, *_: self._relink_unflushed(session)),
+            ("after_commit", self._promote),
+            ("after_rollback", self._discard),
+        )
+        for identifier, listener in listeners:
+            event.listen(Session, identifier, listener)
+
+
+ledger_writer = LedgerWriter()
+ledger_writer.install()
+
+
+async def recover_chain_heads(session: AsyncSession) -> int:
+    """Prime the in-memory chain heads from the database; returns the count."""
+
+    return len(await ledger_writer.recover(session))
 
 
 async def append_event(
@@ -103,31 +373,28 @@ async def append_event(
     actual_seconds: float | None = None,
     context: Mapping[str, Any] | None = None,
     recorded_at: datetime | None = None,
+    flush: bool = False,
 ) -> AuditLog:
-    """Append an event to the project audit ledger and return the stored row."""
+    """Append an event to the project audit ledger and return the staged row.
 
-    previous = await _latest_entry(session, project_id)
-    version = 1 if previous is None else previous.version + 1
-    prev_hash = previous.hash if previous is not None else None
-    timestamp = _as_utc(recorded_at) or datetime.now(UTC)
+    The row is written with the session's next flush or commit, batched with
+    any other events from the same commit window. Pass ``flush=True`` when
+    the caller needs the row's ``id``; its version and hash are final once
+    flushed.
+    """
 
-    normalised_context = _normalise_context(context)
+    timestamp = _as_utc(recorded_at) or datetime.now(UTC)
     log = AuditLog(
         project_id=project_id,
         event_type=event_type,
         baseline_seconds=_coerce_float(baseline_seconds),
         actual_seconds=_coerce_float(actual_seconds),
-        context=normalised_context,
+        context=_normalise_context(context),
         recorded_at=timestamp,
-        version=version,
-        prev_hash=prev_hash,
     )
-    payload = _payload_for_hash(log)
-    log.hash = compute_event_hash(payload)
-    log.signature = _sign_hash(log.hash)
-
-    session.add(log)
-    await session.flush()
+    ledger_writer.stage(session, log)
+    if flush:
+        await session.flush()
     return log
 
 
@@ -150,10 +417,12 @@ def serialise_log(log: AuditLog) -> dict[str, Any]:
     }
 
 
-def build_evidence_report(
-    project_id: int, valid: bool, logs: list[AuditLog]
-) -> dict[str, Any]:
-    """Assemble an evidence-oriented summary for a project's audit ledger."""
+def _summarise_logs(logs: Iterable[AuditLog]) -> dict[str, Any]:
+    """Aggregate the evidence sections for a run of consecutive entries.
+
+    Summaries are JSON-serialisable so checkpoints can persist them, and
+    summaries of adjacent ranges combine with :func:`_merge_summaries`.
+    """
 
     event_counts: dict[str, int] = {}
     exports: list[dict[str, Any]] = []
@@ -162,11 +431,21 @@ def build_evidence_report(
     scenario_events: list[dict[str, Any]] = []
     finance_events: list[dict[str, Any]] = []
     submission_events: list[dict[str, Any]] = []
+    entry_count = 0
+    signed_entries = 0
+    first_recorded_at: str | None = None
+    last_recorded_at: str | None = None
 
     for log in logs:
+        entry_count += 1
+        if log.signature:
+            signed_entries += 1
         event_counts[log.event_type] = event_counts.get(log.event_type, 0) + 1
         context = _normalise_context(log.context)
         recorded_at = log.recorded_at.isoformat() if log.recorded_at else None
+        if entry_count == 1:
+            first_recorded_at = recorded_at
+        last_recorded_at = recorded_at
 
         for key in ("recipient", "recipient_email", "shared_with"):
             value = context.get(key)
@@ -265,40 +544,109 @@ def build_evidence_report(
                 }
             )
 
-    first_log = logs[0] if logs else None
-    last_log = logs[-1] if logs else None
+    return {
+        "entry_count": entry_count,
+        "signed_entries": signed_entries,
+        "first_recorded_at": first_recorded_at,
+        "last_recorded_at": last_recorded_at,
+        "event_counts": event_counts,
+        "recipients": sorted(recipients),
+        "exports": exports,
+        "imports": imports,
+        "scenario_events": scenario_events,
+        "finance_events": finance_events,
+        "submission_events": submission_events,
+    }
+
+
+_SUMMARY_SECTIONS = (
+    "exports",
+    "imports",
+    "scenario_events",
+    "finance_events",
+    "submission_events",
+)
+
+
+def _merge_summaries(summaries: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+    """Combine range summaries, ordered oldest first, into one summary."""
+
+    merged: dict[str, Any] = {
+        "entry_count": 0,
+        "signed_entries": 0,
+        "first_recorded_at": None,
+        "last_recorded_at": None,
+        "event_counts": {},
+        "recipients": set(),
+        **{section: [] for section in _SUMMARY_SECTIONS},
+    }
+    for summary in summaries:
+        if not summary.get("entry_count"):
+            continue
+        if merged["entry_count"] == 0:
+            merged["first_recorded_at"] = summary.get("first_recorded_at")
+        merged["last_recorded_at"] = summary.get("last_recorded_at")
+        merged["entry_count"] += int(summary.get("entry_count", 0))
+        merged["signed_entries"] += int(summary.get("signed_entries", 0))
+        for event_type, count in (summary.get("event_counts") or {}).items():
+            merged["event_counts"][event_type] = merged["event_counts"].get(
+                event_type, 0
+            ) + int(count)
+        merged["recipients"].update(summary.get("recipients") or [])
+        for section in _SUMMARY_SECTIONS:
+            merged[section].extend(summary.get(section) or [])
+    merged["recipients"] = sorted(merged["recipients"])
+    return merged
+
+
+def build_evidence_report(
+    project_id: int,
+    valid: bool,
+    logs: list[AuditLog],
+    *,
+    checkpoints: Sequence[AuditCheckpoint] = (),
+) -> dict[str, Any]:
+    """Assemble an evidence-oriented summary for a project's audit ledger.
+
+    ``logs`` are the entries after the last of ``checkpoints``; sealed ranges
+    contribute the summaries stored on their checkpoints instead of being
+    rescanned.
+    """
+
+    summary = _merge_summaries(
+        [checkpoint.summary or {} for checkpoint in checkpoints]
+        + [_summarise_logs(logs)]
+    )
+    if logs:
+        latest_hash = logs[-1].hash
+    elif checkpoints:
+        latest_hash = checkpoints[-1].chain_hash
+    else:
+        latest_hash = None
     event_type_summary = [
         {"event_type": event_type, "count": count}
-        for event_type, count in sorted(event_counts.items())
+        for event_type, count in sorted(summary["event_counts"].items())
     ]
     return {
         "project_id": project_id,
         "valid": valid,
         "report_generated_at": datetime.now(UTC).isoformat(),
         "timeframe": {
-            "first_recorded_at": (
-                first_log.recorded_at.isoformat()
-                if first_log and first_log.recorded_at
-                else None
-            ),
-            "last_recorded_at": (
-                last_log.recorded_at.isoformat()
-                if last_log and last_log.recorded_at
-                else None
-            ),
+            "first_recorded_at": summary["first_recorded_at"],
+            "last_recorded_at": summary["last_recorded_at"],
         },
         "chain": {
-            "entry_count": len(logs),
-            "signed_entries": sum(1 for log in logs if log.signature),
-            "latest_hash": last_log.hash if last_log else None,
+            "entry_count": summary["entry_count"],
+            "signed_entries": summary["signed_entries"],
+            "latest_hash": latest_hash,
         },
         "event_types": event_type_summary,
-        "exports": exports,
-        "imports": imports,
-        "recipients": sorted(recipients),
-        "scenario_events": scenario_events,
-        "finance_events": finance_events,
-        "submission_events": submission_events,
+        "exports": summary["exports"],
+        "imports": summary["imports"],
+        "recipients": summary["recipients"],
+        "scenario_events": summary["scenario_events"],
+        "finance_events": summary["finance_events"],
+        "submission_events": summary["submission_events"],
     }
 
 
@@ -349,30 +697,208 @@ def diff_logs(log_a: AuditLog, log_b: AuditLog) -> dict[str, Any]:
     return diff
 
 
+def _checkpoint_digest(checkpoint: AuditCheckpoint) -> str:
+    # The summary stands in for the sealed range in evidence reports, so it
+    # is covered by the signature alongside the Merkle root.
+    return compute_event_hash(
+        {
+            "project_id": int(checkpoint.project_id),
+            "start_version": int(checkpoint.start_version),
+            "end_version": int(checkpoint.end_version),
+            "merkle_root": checkpoint.merkle_root,
+            "chain_hash": checkpoint.chain_hash,
+            "summary_hash": compute_event_hash(checkpoint.summary or {}),
+        }
+    )
+
+
+def _entry_is_valid(log: AuditLog, previous_hash: str | None) -> bool:
+    if log.prev_hash != previous_hash:
+        return False
+    expected_hash = compute_event_hash(_payload_for_hash(log))
+    return log.hash == expected_hash and log.signature == _sign_hash(expected_hash)
+
+
+@dataclass(slots=True)
+class ChainVerification:
+    """Outcome of verifying a ledger from its latest trusted checkpoint.
+
+    ``entries`` holds the rows after the last checkpoint, which are the only
+    rows whose hashes and signatures were recomputed.
+    """
+
+    project_id: int
+    valid: bool
+    checkpoints: list[AuditCheckpoint]
+    entries: list[AuditLog]
+    sealed: int = 0
+
+    @property
+    def entry_count(self) -> int:
+        sealed_count = self.checkpoints[-1].end_version if self.checkpoints else 0
+        return sealed_count + len(self.entries)
+
+
+async def _load_checkpoints(
+    session: AsyncSession, project_id: int
+) -> tuple[bool, list[AuditCheckpoint]]:
+    result = await session.execute(
+        select(AuditCheckpoint)
+        .where(AuditCheckpoint.project_id == project_id)
+        .order_by(AuditCheckpoint.end_version)
+    )
+    checkpoints = list(result.scalars().all())
+    expected_start = 1
+    for checkpoint in checkpoints:
+        if checkpoint.start_version != expected_start:
+            return False, checkpoints
+        if checkpoint.signature != _sign_hash(_checkpoint_digest(checkpoint)):
+            return False, checkpoints
+        expected_start = checkpoint.end_version + 1
+    return True, checkpoints
+
+
+def _seal(project_id: int, entries: Sequence[AuditLog]) -> AuditCheckpoint:
+    checkpoint = AuditCheckpoint(
+        project_id=project_id,
+        start_version=entries[0].version,
+        end_version=entries[-1].version,
+        merkle_root=merkle_root([entry.hash for entry in entries]),
+        chain_hash=entries[-1].hash,
+        summary=_summarise_logs(entries),
+    )
+    checkpoint.signature = _sign_hash(_checkpoint_digest(checkpoint))
+    return checkpoint
+
+
+async def verify_chain_incremental(
+    session: AsyncSession,
+    project_id: int,
+    *,
+    seal: bool = False,
+    interval: int | None = None,
+) -> ChainVerification:
+    """Verify ``project_id`` by re-hashing only entries after the last checkpoint.
+
+    Checkpoint signatures and contiguity are checked, then the tail is
+    verified against the last checkpoint's chain hash. The ledger writer
+    seals new intervals as it appends, so this is read-only by default;
+    ``seal`` backfills every complete ``interval`` of the verified tail into
+    new checkpoints (added to the session; the caller commits) for chains
+    written before that.
+    """
+
+    checkpoints_valid, checkpoints = await _load_checkpoints(session, project_id)
+    sealed_through = checkpoints[-1].end_version if checkpoints else 0
+    previous_hash = checkpoints[-1].chain_hash if checkpoints else None
+    result = await session.execute(
+        select(AuditLog)
+        .where(AuditLog.project_id == project_id, AuditLog.version > sealed_through)
+        .order_by(AuditLog.version)
+    )
+    entries = list(result.scalars().all())
+    verification = ChainVerification(
+        project_id=project_id,
+        valid=checkpoints_valid,
+        checkpoints=checkpoints,
+        entries=entries,
+    )
+    if not checkpoints_valid:
+        return verification
+
+    for position, entry in enumerate(entries):
+        if entry.version != sealed_through + position + 1 or not _entry_is_valid(
+            entry, previous_hash
+        ):
+            verification.valid = False
+            return verification
+        previous_hash = entry.hash
+
+    size = interval or settings.AUDIT_CHECKPOINT_INTERVAL
+    if seal and len(entries) >= size:
+        while len(verification.entries) >= size:
+            checkpoint = _seal(project_id, verification.entries[:size])
+            session.add(checkpoint)
+            verification.checkpoints.append(checkpoint)
+            verification.entries = verification.entries[size:]
+            verification.sealed += 1
+        await session.flush()
+    return verification
+
+
 async def verify_chain(
     session: AsyncSession, project_id: int
 ) -> tuple[bool, list[AuditLog]]:
-    """Validate the audit chain for ``project_id`` and return ordered entries."""
+    """Validate the audit chain for ``project_id`` and return ordered entries.
+
+    Entries sealed by a trusted checkpoint are returned without re-hashing.
+    """
 
-    stmt = (
+    verification = await verify_chain_incremental(session, project_id, seal=False)
+    if not verification.checkpoints:
+        return verification.valid, verification.entries
+    result = await session.execute(
         select(AuditLog)
-        .where(AuditLog.project_id == project_id)
+        .where(
+            AuditLog.project_id == project_id,
+            AuditLog.version <= verification.checkpoints[-1].end_version,
+        )
         .order_by(AuditLog.version)
     )
-    result = await session.execute(stmt)
-    logs = list(result.scalars().all())
+    return verification.valid, list(result.scalars().all()) + verification.entries
 
-    previous_hash = None
-    for log in logs:
-        expected_payload = _payload_for_hash(log)
-        expected_hash = compute_event_hash(expected_payload)
-        expected_signature = _sign_hash(expected_hash)
-        if log.prev_hash != previous_hash:
-            return False, logs
-        if log.hash != expected_hash:
-            return False, logs
-        if log.signature != expected_signature:
-            return False, logs
-        previous_hash = log.hash
-
-    return True, logs
+
+async def build_inclusion_proof(
+    session: AsyncSession, project_id: int, version: int
+) -> dict[str, Any] | None:
+    """Prove that entry ``version`` belongs to a signed checkpoint.
+
+    Returns ``None`` when the entry does not exist or is not sealed yet.
+    """
+
+    checkpoint = (
+        await session.execute(
+            select(AuditCheckpoint).where(
+                AuditCheckpoint.project_id == project_id,
+                AuditCheckpoint.start_version <= version,
+                AuditCheckpoint.end_version >= version,
+            )
+        )
+    ).scalar_one_or_none()
+    if checkpoint is None:
+        return None
+    rows = (
+        await session.execute(
+            select(AuditLog.version, AuditLog.hash)
+            .where(
+                AuditLog.project_id == project_id,
+                AuditLog.version.between(
+                    checkpoint.start_version, checkpoint.end_version
+                ),
+            )
+            .order_by(AuditLog.version)
+        )
+    ).all()
+    leaves = [hash_value for _, hash_value in rows]
+    versions = [int(row_version) for row_version, _ in rows]
+    if version not in versions:
+        return None
+    index = versions.index(version)
+    proof = inclusion_proof(leaves, index)
+    signature_valid = checkpoint.signature == _sign_hash(_checkpoint_digest(checkpoint))
+    return {
+        "project_id": project_id,
+        "version": version,
+        "hash": leaves[index],
+        "proof": proof,
+        "checkpoint": {
+            "start_version": checkpoint.start_version,
+            "end_version": checkpoint.end_version,
+            "merkle_root": checkpoint.merkle_root,
+            "chain_hash": checkpoint.chain_hash,
+            "signature": checkpoint.signature,
+        },
+        "valid": signature_valid
+        and len(leaves) == checkpoint.end_version - checkpoint.start_version + 1
+        and verify_inclusion(leaves[index], proof, checkpoint.merkle_root),
+    }
@@ -0,0 +1,80 @@
+"""Merkle trees over audit ledger entry hashes.
+
+Leaves are the hex ``hash`` values of consecutive ledger entries. Leaf and
+interior nodes are domain separated (``0x00`` / ``0x01`` prefixes) and an
+unpaired node is promoted to the next level unchanged, so a root commits to
+both the entries and their order.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Sequence
+from typing import Literal, TypedDict
+
+
+class ProofStep(TypedDict):
+    """Sibling hash needed to climb one level towards the root."""
+
+    side: Literal["left", "right"]
+    hash: str
+
+
+def _leaf(hash_value: str) -> bytes:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(hash_value)).digest()
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _next_level(level: Sequence[bytes]) -> list[bytes]:
+    paired = [_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        paired.append(level[-1])
+    return paired
+
+
+def merkle_root(leaves: Sequence[str]) -> str:
+    """Return the hex Merkle root over ``leaves`` (entry hashes in order)."""
+
+    if not leaves:
+        raise ValueError("Cannot build a Merkle root without leaves")
+    level = [_leaf(value) for value in leaves]
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0].hex()
+
+
+def inclusion_proof(leaves: Sequence[str], index: int) -> list[ProofStep]:
+    """Return the sibling path proving ``leaves[index]`` is under the root."""
+
+    if not 0 <= index < len(leaves):
+        raise IndexError(f"Leaf index {index} outside 0..{len(leaves) - 1}")
+    proof: list[ProofStep] = []
+    level = [_leaf(value) for value in leaves]
+    position = index
+    while len(level) > 1:
+        sibling = position ^ 1
+        if sibling < len(level):
+            side: Literal["left", "right"] = "left" if sibling < position else "right"
+            proof.append({"side": side, "hash": level[sibling].hex()})
+        level = _next_level(level)
+        position //= 2
+    return proof
+
+
+def verify_inclusion(leaf: str, proof: Sequence[ProofStep], root: str) -> bool:
+    """Return whether ``proof`` links the entry hash ``leaf`` to ``root``."""
+
+    current = _leaf(leaf)
+    for step in proof:
+        sibling = bytes.fromhex(step["hash"])
+        if step["side"] == "left":
+            current = _node(sibling, current)
+        else:
+            current = _node(current, sibling)
+    return current.hex() == root
+
+
+__all__ = ["ProofStep", "inclusion_proof", "merkle_root", "verify_inclusion"]
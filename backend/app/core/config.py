@@ -121,6 +121,19 @@ def _load_fractional_float(name: str, default: float) -> float:
     return default
 
 
+def _load_non_negative_int(name: str, default: int) -> int:
+    """Return a non-negative integer configuration value."""
+
+    raw_value = os.getenv(name)
+    if raw_value is None:
+        return default
+    try:
+        candidate = int(raw_value)
+    except (TypeError, ValueError):
+        return default
+    return candidate if candidate >= 0 else default
+
+
 def _load_positive_int(name: str, default: int) -> int:
     """Return a positive integer configuration value."""
 
@@ -134,6 +147,34 @@ def _load_positive_int(name: str, default: int) -> int:
     return candidate if candidate > 0 else default
 
 
+def _load_queue_values(name: str) -> dict[str, int]:
+    """Return positive ``queue=value`` pairs such as ``imports:parse=2,preview=1``."""
+
+    raw_value = os.getenv(name)
+    if not raw_value:
+        return {}
+    values: dict[str, int] = {}
+    for entry in raw_value.split(","):
+        queue, separator, value = entry.rpartition("=")
+        queue = queue.strip()
+        if not separator or not queue:
+            continue
+        try:
+            candidate = int(value)
+        except ValueError:
+            continue
+        if candidate > 0:
+            values[queue] = candidate
+    return values
+
+
+def _load_csv(name: str) -> tuple[str, ...]:
+    """Return the non-empty comma-separated entries of ``name``."""
+
+    raw_value = os.getenv(name, "")
+    return tuple(entry.strip() for entry in raw_value.split(",") if entry.strip())
+
+
 def _load_allowed_origins() -> list[str]:
     """Retrieve allowed CORS origins from the environment."""
 
@@ -226,6 +267,8 @@ class Settings:
     RQ_REDIS_URL: str
     RATE_LIMIT_REDIS_URL: str
     RATE_LIMIT_STORAGE_URI: str
+    RATE_LIMIT_BACKEND: str
+    RATE_LIMIT_MAX_KEYS: int
 
     ODA_LICENSE_KEY: str
 
@@ -237,6 +280,7 @@ class Settings:
     S3_ACCESS_KEY: str
     S3_SECRET_KEY: str
     IMPORTS_BUCKET_NAME: str
+    EXPORT_CACHE_MAX_ENTRIES: int
     EXPORTS_BUCKET_NAME: str
     DOCUMENTS_BUCKET_NAME: str
 
@@ -270,7 +314,25 @@ class Settings:
     DB_MAX_OVERFLOW: int
     PREVIEW_MAX_VERSIONS: int
     PREVIEW_GEOMETRY_DETAIL_LEVEL: str
+    PREVIEW_CACHE_MAX_MB: int
+    PREVIEW_MESH_QUANTIZE: bool
+    PREVIEW_LOD_STREAM_TIMEOUT_SECONDS: float
+    PREVIEW_RENDER_WORKERS: int
+    PREVIEW_RENDER_QUEUE_LIMIT: int
+    PDF_RENDER_WORKERS: int
+    PDF_RENDER_QUEUE_LIMIT: int
+    PHOTO_PIPELINE_WORKERS: int
+    PHOTO_BATCH_CONCURRENCY: int
+    PHOTO_BATCH_MAX_FILES: int
     CAPTURE_LIVE_SOURCE_SCAN_ENABLED: bool
+    JOB_PROCESS_MAX_WORKERS: int
+    JOB_PROCESS_QUEUE_LIMITS: dict[str, int]
+    JOB_PROCESS_TIMEOUT_SECONDS: float
+    JOB_PROCESS_QUEUE_TIMEOUTS: dict[str, int]
+    RETENTION_SWEEP_INTERVAL_SECONDS: float
+    RETENTION_SWEEP_BATCH_SIZE: int
+    AUDIT_CHECKPOINT_INTERVAL: int
+    API_ROUTER_WARMUP: tuple[str, ...]
 
     def __init__(self) -> None:
         self.PROJECT_NAME = os.getenv("PROJECT_NAME", "Building Compliance Platform")
@@ -321,6 +383,12 @@ class Settings:
             "RATE_LIMIT_STORAGE_URI",
             self.RATE_LIMIT_REDIS_URL or "memory://",
         )
+        # RateLimiter state: "memory" keeps GCRA counters per process (at most
+        # RATE_LIMIT_MAX_KEYS keys); "redis" shares them via RATE_LIMIT_REDIS_URL.
+        self.RATE_LIMIT_BACKEND = (
+            os.getenv("RATE_LIMIT_BACKEND", "memory").strip().lower() or "memory"
+        )
+        self.RATE_LIMIT_MAX_KEYS = _load_positive_int("RATE_LIMIT_MAX_KEYS", 100_000)
 
         self.ODA_LICENSE_KEY = os.getenv("ODA_LICENSE_KEY", "")
 
@@ -335,6 +403,11 @@ class Settings:
         self.S3_SECRET_KEY = os.getenv("S3_SECRET_KEY", "minioadmin")
         self.IMPORTS_BUCKET_NAME = os.getenv("IMPORTS_BUCKET_NAME", "cad-imports")
         self.EXPORTS_BUCKET_NAME = os.getenv("EXPORTS_BUCKET_NAME", "cad-exports")
+        # Content-addressed export artefacts kept on local storage; the least
+        # recently served are evicted beyond this count.
+        self.EXPORT_CACHE_MAX_ENTRIES = _load_positive_int(
+            "EXPORT_CACHE_MAX_ENTRIES", 256
+        )
         self.DOCUMENTS_BUCKET_NAME = os.getenv("DOCUMENTS_BUCKET_NAME", "documents")
         # Backwards-compatible default used by legacy storage helpers
         self.S3_BUCKET = os.getenv("S3_BUCKET", self.IMPORTS_BUCKET_NAME)
@@ -401,11 +474,80 @@ class Settings:
         self.DB_MAX_OVERFLOW = _load_positive_int("DB_MAX_OVERFLOW", 20)
         self.OFFLINE_MODE = _load_bool("OFFLINE_MODE", False)
         self.PREVIEW_MAX_VERSIONS = _load_positive_int("PREVIEW_MAX_VERSIONS", 3)
+        # Parsed CAD entity tables kept in the content-addressed quicklook
+        # cache; the least recently used tables are evicted beyond this count.
+        self.CAD_QUICKLOOK_CACHE_MAX_ENTRIES = _load_positive_int(
+            "CAD_QUICKLOOK_CACHE_MAX_ENTRIES", 512
+        )
         self.PREVIEW_GEOMETRY_DETAIL_LEVEL = _load_geometry_detail_level()
+        # Size budget for content-addressed preview assets; least recently used
+        # renders are evicted once it is exceeded.
+        self.PREVIEW_CACHE_MAX_MB = _load_positive_int("PREVIEW_CACHE_MAX_MB", 2048)
+        # Store preview meshes with KHR_mesh_quantization (int16 positions,
+        # int8 normals, uint8 colours) to roughly halve GLB size.
+        self.PREVIEW_MESH_QUANTIZE = _load_bool("PREVIEW_MESH_QUANTIZE", False)
+        # How long the LOD stream waits for finer preview tiers to appear.
+        self.PREVIEW_LOD_STREAM_TIMEOUT_SECONDS = _load_positive_float(
+            "PREVIEW_LOD_STREAM_TIMEOUT_SECONDS", 30.0
+        )
+        # Processes rendering inline-backend previews off the event loop; 0
+        # renders on a worker thread instead. Renders beyond the queue limit
+        # (queued plus running) are rejected so callers can retry later.
+        self.PREVIEW_RENDER_WORKERS = _load_non_negative_int(
+            "PREVIEW_RENDER_WORKERS", min(os.cpu_count() or 2, 4)
+        )
+        self.PREVIEW_RENDER_QUEUE_LIMIT = _load_positive_int(
+            "PREVIEW_RENDER_QUEUE_LIMIT", 32
+        )
+        # Processes laying out professional-pack PDFs off the event loop; 0
+        # builds on a worker thread instead. Builds beyond the queue limit
+        # (queued plus running) are rejected so callers can retry later.
+        self.PDF_RENDER_WORKERS = _load_non_negative_int(
+            "PDF_RENDER_WORKERS", min(os.cpu_count() or 2, 2)
+        )
+        self.PDF_RENDER_QUEUE_LIMIT = _load_positive_int("PDF_RENDER_QUEUE_LIMIT", 16)
+        # Threads encoding and watermarking photo versions; Pillow releases the
+        # GIL while resampling and encoding, so versions encode in parallel.
+        self.PHOTO_PIPELINE_WORKERS = _load_positive_int(
+            "PHOTO_PIPELINE_WORKERS", min(os.cpu_count() or 2, 4)
+        )
+        # Photos of a batch upload read and processed at once, and the most
+        # photos accepted per batch request.
+        self.PHOTO_BATCH_CONCURRENCY = _load_positive_int("PHOTO_BATCH_CONCURRENCY", 4)
+        self.PHOTO_BATCH_MAX_FILES = _load_positive_int("PHOTO_BATCH_MAX_FILES", 100)
         self.CAPTURE_LIVE_SOURCE_SCAN_ENABLED = _load_bool(
             "CAPTURE_LIVE_SOURCE_SCAN_ENABLED",
             False,
         )
+        # Process-pool job backend (JOB_QUEUE_BACKEND=process). Queues without an
+        # explicit limit may use every worker in the pool.
+        self.JOB_PROCESS_MAX_WORKERS = _load_positive_int(
+            "JOB_PROCESS_MAX_WORKERS", min(os.cpu_count() or 2, 4)
+        )
+        self.JOB_PROCESS_QUEUE_LIMITS = _load_queue_values("JOB_PROCESS_QUEUE_LIMITS")
+        self.JOB_PROCESS_TIMEOUT_SECONDS = _load_positive_float(
+            "JOB_PROCESS_TIMEOUT_SECONDS", 300.0
+        )
+        self.JOB_PROCESS_QUEUE_TIMEOUTS = _load_queue_values(
+            "JOB_PROCESS_QUEUE_TIMEOUTS"
+        )
+        # Background expiry of uploads, reference documents and previews when
+        # STORAGE_RETENTION_DAYS is set.
+        self.RETENTION_SWEEP_INTERVAL_SECONDS = _load_positive_float(
+            "RETENTION_SWEEP_INTERVAL_SECONDS", 3600.0
+        )
+        self.RETENTION_SWEEP_BATCH_SIZE = _load_positive_int(
+            "RETENTION_SWEEP_BATCH_SIZE", 500
+        )
+        # Audit ledger entries covered by each signed Merkle checkpoint;
+        # verification only re-hashes entries after the latest checkpoint.
+        self.AUDIT_CHECKPOINT_INTERVAL = _load_positive_int(
+            "AUDIT_CHECKPOINT_INTERVAL", 256
+        )
+        # API v1 path segments (e.g. "finance,agents") whose routers the
+        # lifespan imports in the background; "*" warms every router group.
+        # Other groups are mounted on the first request under their prefix.
+        self.API_ROUTER_WARMUP = _load_csv("API_ROUTER_WARMUP")
 
     def _load_listing_token_secret(self) -> str:
         raw = os.getenv("LISTING_TOKEN_SECRET")
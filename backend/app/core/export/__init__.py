@@ -1,27 +1,39 @@
-"""Export utilities for CAD and BIM artefacts."""
+"""Export utilities for CAD and BIM artefacts.
+
+Writers render on a worker thread and write the artefact into a storage
+stream (a temporary file renamed into place), so the event loop never holds
+or copies the payload. The native renderers (ezdxf, ifcopenshell, reportlab)
+still build their document in memory before serialising it; only the JSON
+manifest fallback is encoded chunk by chunk. Artefacts are cached under a
+hash of the project's geometry checksums, overlay statuses and the export
+options, so unchanged projects are served from storage without re-rendering.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import hashlib
 import importlib
 import io
 import json
 import os
 import time
 import uuid
-from collections.abc import Iterable, Iterator, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from types import ModuleType
-from typing import Any, cast
+from typing import Any, BinaryIO, cast
 
 from backend._compat.datetime import UTC
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.audit.ledger import append_event
+from app.core.config import settings
 from app.core.metrics import EXPORT_BASELINE_SECONDS
 from app.core.models.geometry import CanonicalGeometry, GeometryNode
 from app.models.overlay import OverlaySourceGeometry, OverlaySuggestion
@@ -44,6 +56,10 @@ pdf_canvas = reportlab_pdfgen
 
 DEFAULT_PENDING_WATERMARK = "PRELIMINARY – Pending overlay approvals"
 
+# Bump when writer output changes so previously cached artefacts are ignored.
+_EXPORT_CACHE_VERSION = 1
+_MANIFEST_SUFFIX = ".manifest.json"
+
 
 class ExportFormat(str, Enum):
     """Supported export formats."""
@@ -133,6 +149,7 @@ class ExportArtifact:
     filename: str
     media_type: str
     manifest: dict[str, Any]
+    cached: bool = False
 
     def open(self) -> io.BufferedReader:
         """Return a binary stream for the stored artefact."""
@@ -148,6 +165,9 @@ class ProjectGeometryMissing(ExportError):
     """Raised when no source geometry exists for a project."""
 
 
+ArtifactWriteFn = Callable[[BinaryIO], dict[str, Any]]
+
+
 class ArtifactStorage:
     """Abstract interface for storing generated artefacts."""
 
@@ -162,11 +182,47 @@ class ArtifactStorage:
     ) -> ExportArtifact:
         raise NotImplementedError
 
+    def lookup(
+        self, *, project_id: int, fmt: ExportFormat, cache_key: str
+    ) -> ExportArtifact | None:
+        """Return a previously stored artefact for ``cache_key``, if any."""
+
+        return None
+
+    def store_stream(
+        self,
+        *,
+        project_id: int,
+        fmt: ExportFormat,
+        write: ArtifactWriteFn,
+        cache_key: str | None = None,
+    ) -> ExportArtifact:
+        """Store the artefact produced by ``write``, which returns its manifest.
+
+        The default implementation buffers the payload and delegates to
+        :meth:`store`; backends that can write incrementally override it.
+        """
+
+        buffer = io.BytesIO()
+        manifest = write(buffer)
+        return self.store(
+            project_id=project_id,
+            fmt=fmt,
+            payload=buffer.getvalue(),
+            manifest=manifest,
+        )
+
 
 class LocalExportStorage(ArtifactStorage):
-    """Filesystem backed artefact storage."""
+    """Filesystem backed artefact storage.
+
+    Cached artefacts are bounded to ``max_cached`` (default
+    ``EXPORT_CACHE_MAX_ENTRIES``); the least recently served are evicted.
+    """
 
-    def __init__(self, base_dir: Path | str | None = None) -> None:
+    def __init__(
+        self, base_dir: Path | str | None = None, *, max_cached: int | None = None
+    ) -> None:
         if base_dir is not None:
             root = Path(base_dir)
         else:
@@ -178,24 +234,29 @@ class LocalExportStorage(ArtifactStorage):
                 root = Path(tmp_root) / "optimal_build" / "exports"
         self.base_dir = root
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.max_cached = max_cached or settings.EXPORT_CACHE_MAX_ENTRIES
 
-    def store(
-        self,
-        *,
+    def _default_filename(self, project_id: int, fmt: ExportFormat) -> str:
+        timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+        return (
+            f"project-{project_id}-{timestamp}-{uuid.uuid4().hex[:8]}.{fmt.extension}"
+        )
+
+    def _cached_paths(
+        self, project_id: int, fmt: ExportFormat, cache_key: str
+    ) -> tuple[Path, Path]:
+        target = self.base_dir / f"project-{project_id}-{cache_key}.{fmt.extension}"
+        return target, target.with_name(f"{target.name}{_MANIFEST_SUFFIX}")
+
+    @staticmethod
+    def _artifact(
         project_id: int,
         fmt: ExportFormat,
-        payload: bytes,
+        target: Path,
         manifest: Mapping[str, Any],
-        filename: str | None = None,
+        *,
+        cached: bool = False,
     ) -> ExportArtifact:
-        timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
-        suffix = (
-            filename
-            or f"project-{project_id}-{timestamp}-{uuid.uuid4().hex[:8]}.{fmt.extension}"
-        )
-        target = self.base_dir / suffix
-        with target.open("wb") as stream:
-            stream.write(payload)
         manifest_payload = dict(manifest)
         manifest_payload.setdefault("format", fmt.value)
         return ExportArtifact(
@@ -205,42 +266,130 @@ class LocalExportStorage(ArtifactStorage):
             filename=target.name,
             media_type=fmt.media_type,
             manifest=manifest_payload,
+            cached=cached,
         )
 
+    def store(
+        self,
+        *,
+        project_id: int,
+        fmt: ExportFormat,
+        payload: bytes,
+        manifest: Mapping[str, Any],
+        filename: str | None = None,
+    ) -> ExportArtifact:
+        target = self.base_dir / (filename or self._default_filename(project_id, fmt))
+        with target.open("wb") as stream:
+            stream.write(payload)
+        return self._artifact(project_id, fmt, target, manifest)
+
+    def lookup(
+        self, *, project_id: int, fmt: ExportFormat, cache_key: str
+    ) -> ExportArtifact | None:
+        target, manifest_path = self._cached_paths(project_id, fmt, cache_key)
+        try:
+            manifest = json.loads(manifest_path.read_text("utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or not target.exists():
+            return None
+        try:
+            os.utime(manifest_path)  # recency signal for eviction
+        except OSError:
+            pass
+        return self._artifact(project_id, fmt, target, manifest, cached=True)
+
+    def _evict_cached(self) -> None:
+        """Drop the least recently served cached artefacts beyond ``max_cached``."""
+
+        manifests: list[tuple[float, Path]] = []
+        for entry in os.scandir(self.base_dir):
+            if entry.name.endswith(_MANIFEST_SUFFIX) and not entry.name.startswith("."):
+                try:
+                    manifests.append((entry.stat().st_mtime, Path(entry.path)))
+                except OSError:
+                    continue
+        if len(manifests) <= self.max_cached:
+            return
+        manifests.sort()
+        for _, manifest_path in manifests[: len(manifests) - self.max_cached]:
+            # Remove the manifest first so a concurrent lookup misses cleanly.
+            manifest_path.unlink(missing_ok=True)
+            manifest_path.with_name(
+                manifest_path.name[: -len(_MANIFEST_SUFFIX)]
+            ).unlink(missing_ok=True)
+
+    def store_stream(
+        self,
+        *,
+        project_id: int,
+        fmt: ExportFormat,
+        write: ArtifactWriteFn,
+        cache_key: str | None = None,
+    ) -> ExportArtifact:
+        if cache_key:
+            target, manifest_path = self._cached_paths(project_id, fmt, cache_key)
+        else:
+            target = self.base_dir / self._default_filename(project_id, fmt)
+            manifest_path = None
+        token = uuid.uuid4().hex
+        partial = target.with_name(f".{target.name}.{token}.tmp")
+        try:
+            with partial.open("wb") as stream:
+                manifest = write(stream)
+            os.replace(partial, target)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+        artifact = self._artifact(project_id, fmt, target, manifest)
+        if manifest_path is not None:
+            # The manifest lands last and marks the cached artefact complete.
+            manifest_partial = manifest_path.with_name(
+                f".{manifest_path.name}.{token}.tmp"
+            )
+            manifest_partial.write_text(
+                json.dumps(artifact.manifest, sort_keys=True, default=str), "utf-8"
+            )
+            os.replace(manifest_partial, manifest_path)
+            self._evict_cached()
+        return artifact
+
 
 def _iter_nodes(geometries: Iterable[CanonicalGeometry]) -> Iterator[GeometryNode]:
     for geometry in geometries:
         yield from geometry.iter_nodes()
 
 
+def _iter_geometry_features(
+    geometries: Iterable[CanonicalGeometry],
+    *,
+    mapping: LayerMapping,
+) -> Iterator[dict[str, Any]]:
+    for node in _iter_nodes(geometries):
+        yield {
+            "layer": mapping.map_source(node.kind),
+            "id": node.node_id,
+            "kind": node.kind,
+            "properties": dict(node.properties),
+        }
+
+
 def _normalise_geometry(
     geometries: Iterable[CanonicalGeometry],
     *,
     mapping: LayerMapping,
 ) -> list[dict[str, Any]]:
-    features: list[dict[str, Any]] = []
-    for node in _iter_nodes(geometries):
-        layer = mapping.map_source(node.kind)
-        features.append(
-            {
-                "layer": layer,
-                "id": node.node_id,
-                "kind": node.kind,
-                "properties": dict(node.properties),
-            }
-        )
-    return features
+    return list(_iter_geometry_features(geometries, mapping=mapping))
 
 
-def _normalise_overlays(
+def _iter_overlay_features(
     overlays: Iterable[OverlaySuggestion],
     *,
     mapping: LayerMapping,
     include_approved: bool,
     include_pending: bool,
     include_rejected: bool,
-) -> list[dict[str, Any]]:
-    features: list[dict[str, Any]] = []
+) -> Iterator[dict[str, Any]]:
     for overlay in overlays:
         status = (overlay.status or "pending").lower()
         include = False
@@ -274,22 +423,47 @@ def _normalise_overlays(
         props = overlay.props or {}
         if not isinstance(props, dict):
             props = {}
-        features.append(
-            {
-                "layer": layer,
-                "code": overlay.code,
-                "title": overlay.title,
-                "type": overlay.type,
-                "status": status,
-                "severity": overlay.severity,
-                "style": mapping.style_for(overlay.code, overlay.severity),
-                "nodes": normalised_nodes,
-                "target_ids": target_ids,
-                "rule_refs": rule_refs,
-                "props": props,
-            }
+        yield {
+            "layer": layer,
+            "code": overlay.code,
+            "title": overlay.title,
+            "type": overlay.type,
+            "status": status,
+            "severity": overlay.severity,
+            "style": mapping.style_for(overlay.code, overlay.severity),
+            "nodes": normalised_nodes,
+            "target_ids": target_ids,
+            "rule_refs": rule_refs,
+            "props": props,
+        }
+
+
+def _normalise_overlays(
+    overlays: Iterable[OverlaySuggestion],
+    *,
+    mapping: LayerMapping,
+    include_approved: bool,
+    include_pending: bool,
+    include_rejected: bool,
+) -> list[dict[str, Any]]:
+    return list(
+        _iter_overlay_features(
+            overlays,
+            mapping=mapping,
+            include_approved=include_approved,
+            include_pending=include_pending,
+            include_rejected=include_rejected,
         )
-    return features
+    )
+
+
+def _add_to_layer(
+    grouped: dict[str, list[dict[str, Any]]], feature: Mapping[str, Any]
+) -> dict[str, Any]:
+    payload = dict(feature)
+    layer = payload.setdefault("layer", "MODEL")
+    grouped.setdefault(layer, []).append(payload)
+    return payload
 
 
 def _group_by_layer(
@@ -297,13 +471,22 @@ def _group_by_layer(
 ) -> dict[str, list[dict[str, Any]]]:
     grouped: dict[str, list[dict[str, Any]]] = {}
     for feature in features:
-        layer = feature.get("layer", "MODEL")
-        payload = dict(feature)
-        payload.setdefault("layer", layer)
-        grouped.setdefault(layer, []).append(payload)
+        _add_to_layer(grouped, feature)
     return grouped
 
 
+def _write_json(stream: BinaryIO, payload: Mapping[str, Any]) -> None:
+    """Encode ``payload`` into ``stream`` chunk by chunk."""
+
+    for chunk in json.JSONEncoder(sort_keys=True).iterencode(payload):
+        stream.write(chunk.encode("utf-8"))
+
+
+def _reset_stream(stream: BinaryIO) -> None:
+    stream.seek(0)
+    stream.truncate()
+
+
 def _pending_failures(overlays: Iterable[OverlaySuggestion]) -> bool:
     for overlay in overlays:
         if (overlay.status or "pending").lower() == "pending":
@@ -312,7 +495,12 @@ def _pending_failures(overlays: Iterable[OverlaySuggestion]) -> bool:
 
 
 class BaseWriter:
-    """Base class for export writers."""
+    """Base class for export writers.
+
+    :meth:`write` streams the artefact into a binary stream while consuming
+    the feature iterators once, and returns the manifest. Writers without a
+    native renderer emit the manifest itself as JSON.
+    """
 
     format: ExportFormat
 
@@ -320,12 +508,11 @@ class BaseWriter:
         self.mapping = mapping
         self.options = options
 
-    def _build_manifest(
+    def _start_manifest(
         self,
         *,
-        geometry: list[dict[str, Any]],
-        overlays: list[dict[str, Any]],
         watermark: str | None,
+        metadata: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
         manifest: dict[str, Any] = {
             "format": self.format.value,
@@ -336,142 +523,198 @@ class BaseWriter:
                 "include_pending_overlays": self.options.include_pending_overlays,
                 "include_rejected_overlays": self.options.include_rejected_overlays,
             },
-            "layers": _group_by_layer(geometry) if geometry else {},
-            "overlays": _group_by_layer(overlays) if overlays else {},
+            "layers": {},
+            "overlays": {},
         }
         if watermark:
             manifest["watermark"] = watermark
         if self.mapping.styles:
             manifest["styles"] = self.mapping.styles
+        if metadata:
+            for key, value in metadata.items():
+                manifest.setdefault(key, value)
+        return manifest
+
+    def _build_manifest(
+        self,
+        *,
+        geometry: Iterable[dict[str, Any]],
+        overlays: Iterable[dict[str, Any]],
+        watermark: str | None,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        manifest = self._start_manifest(watermark=watermark, metadata=metadata)
+        self._drain(manifest, geometry, overlays)
+        return manifest
+
+    @staticmethod
+    def _drain(
+        manifest: dict[str, Any],
+        geometry: Iterable[dict[str, Any]],
+        overlays: Iterable[dict[str, Any]],
+    ) -> None:
+        for feature in geometry:
+            _add_to_layer(manifest["layers"], feature)
+        for feature in overlays:
+            _add_to_layer(manifest["overlays"], feature)
+
+    def write(
+        self,
+        stream: BinaryIO,
+        geometry: Iterable[dict[str, Any]],
+        overlays: Iterable[dict[str, Any]],
+        watermark: str | None,
+        *,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        manifest = self._build_manifest(
+            geometry=geometry,
+            overlays=overlays,
+            watermark=watermark,
+            metadata=metadata,
+        )
+        _write_json(stream, manifest)
         return manifest
 
     def render(
         self,
-        geometry: list[dict[str, Any]],
-        overlays: list[dict[str, Any]],
+        geometry: Iterable[dict[str, Any]],
+        overlays: Iterable[dict[str, Any]],
         watermark: str | None,
     ) -> tuple[bytes, dict[str, Any]]:
-        raise NotImplementedError
+        """Render into memory; prefer :meth:`write` for large projects."""
+
+        buffer = io.BytesIO()
+        manifest = self.write(buffer, geometry, overlays, watermark)
+        return buffer.getvalue(), manifest
 
 
 class DXFWriter(BaseWriter):
     format = ExportFormat.DXF
 
-    def render(
+    def write(
         self,
-        geometry: list[dict[str, Any]],
-        overlays: list[dict[str, Any]],
+        stream: BinaryIO,
+        geometry: Iterable[dict[str, Any]],
+        overlays: Iterable[dict[str, Any]],
         watermark: str | None,
-    ) -> tuple[bytes, dict[str, Any]]:
-        manifest = self._build_manifest(
-            geometry=geometry, overlays=overlays, watermark=watermark
-        )
+        *,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        manifest = self._start_manifest(watermark=watermark, metadata=metadata)
+        geometry, overlays = iter(geometry), iter(overlays)
         if ezdxf is not None:  # pragma: no cover - exercised when dependency available
             try:
                 doc = ezdxf.new()
                 modelspace = doc.modelspace()
-                for layer, entities in manifest["layers"].items():
+                for feature in geometry:
+                    entity = _add_to_layer(manifest["layers"], feature)
+                    layer = entity["layer"]
                     if layer not in doc.layers:
                         doc.layers.new(name=layer)
-                    for entity in entities:
-                        label = entity.get("kind", "entity")
-                        modelspace.add_text(label, dxfattribs={"layer": layer})
-                for layer, items in manifest["overlays"].items():
+                    label = entity.get("kind", "entity")
+                    modelspace.add_text(label, dxfattribs={"layer": layer})
+                for feature in overlays:
+                    overlay = _add_to_layer(manifest["overlays"], feature)
+                    layer = overlay["layer"]
                     if layer not in doc.layers:
                         doc.layers.new(name=layer)
-                    for overlay in items:
-                        label = f"{overlay.get('code')}:{overlay.get('status')}"
-                        modelspace.add_text(label, dxfattribs={"layer": layer})
+                    label = f"{overlay.get('code')}:{overlay.get('status')}"
+                    modelspace.add_text(label, dxfattribs={"layer": layer})
                 if watermark:
                     modelspace.add_text(watermark, dxfattribs={"layer": "WATERMARK"})
-                buffer = io.BytesIO()
-                doc.write(buffer)
+                text_stream = io.TextIOWrapper(
+                    stream, encoding=doc.output_encoding, errors="dxfreplace"
+                )
+                try:
+                    doc.write(text_stream)
+                    text_stream.flush()
+                finally:
+                    text_stream.detach()
                 manifest["renderer"] = "ezdxf"
-                return buffer.getvalue(), manifest
+                return manifest
             except (
                 Exception
             ):  # pragma: no cover - fallback for unexpected writer errors
-                pass
-        payload = json.dumps(manifest, sort_keys=True).encode("utf-8")
-        return payload, manifest
+                _reset_stream(stream)
+        self._drain(manifest, geometry, overlays)
+        _write_json(stream, manifest)
+        return manifest
 
 
 class DWGWriter(BaseWriter):
     format = ExportFormat.DWG
 
-    def render(
-        self,
-        geometry: list[dict[str, Any]],
-        overlays: list[dict[str, Any]],
-        watermark: str | None,
-    ) -> tuple[bytes, dict[str, Any]]:
-        manifest = self._build_manifest(
-            geometry=geometry, overlays=overlays, watermark=watermark
-        )
-        manifest.setdefault("renderer", "fallback")
-        return json.dumps(manifest, sort_keys=True).encode("utf-8"), manifest
-
 
 class IFCWriter(BaseWriter):
     format = ExportFormat.IFC
 
-    def render(
+    def write(
         self,
-        geometry: list[dict[str, Any]],
-        overlays: list[dict[str, Any]],
+        stream: BinaryIO,
+        geometry: Iterable[dict[str, Any]],
+        overlays: Iterable[dict[str, Any]],
         watermark: str | None,
-    ) -> tuple[bytes, dict[str, Any]]:
-        manifest = self._build_manifest(
-            geometry=geometry, overlays=overlays, watermark=watermark
-        )
+        *,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        manifest = self._start_manifest(watermark=watermark, metadata=metadata)
+        geometry = iter(geometry)
         if (
             ifcopenshell is not None
         ):  # pragma: no cover - exercised when dependency available
             try:
                 model = ifcopenshell.file(schema="IFC4")
-                for entities in manifest["layers"].values():
-                    for entity in entities:
-                        model.create_entity(
-                            "IfcAnnotation",
-                            GlobalId=str(uuid.uuid4()),
-                            Name=entity.get("kind", "Annotation"),
-                            Description=json.dumps(entity.get("properties", {})),
-                        )
-                buffer = io.BytesIO()
-                buffer.write(model.to_string().encode("utf-8"))
+                for feature in geometry:
+                    entity = _add_to_layer(manifest["layers"], feature)
+                    model.create_entity(
+                        "IfcAnnotation",
+                        GlobalId=str(uuid.uuid4()),
+                        Name=entity.get("kind", "Annotation"),
+                        Description=json.dumps(entity.get("properties", {})),
+                    )
+                self._drain(manifest, (), overlays)
+                stream.write(model.to_string().encode("utf-8"))
                 manifest["renderer"] = "ifcopenshell"
-                return buffer.getvalue(), manifest
+                return manifest
             except (
                 Exception
             ):  # pragma: no cover - fallback for optional dependency failure
-                pass
-        return json.dumps(manifest, sort_keys=True).encode("utf-8"), manifest
+                _reset_stream(stream)
+        self._drain(manifest, geometry, overlays)
+        _write_json(stream, manifest)
+        return manifest
 
 
 class PDFWriter(BaseWriter):
     format = ExportFormat.PDF
 
-    def render(
+    def write(
         self,
-        geometry: list[dict[str, Any]],
-        overlays: list[dict[str, Any]],
+        stream: BinaryIO,
+        geometry: Iterable[dict[str, Any]],
+        overlays: Iterable[dict[str, Any]],
         watermark: str | None,
-    ) -> tuple[bytes, dict[str, Any]]:
+        *,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
         manifest = self._build_manifest(
-            geometry=geometry, overlays=overlays, watermark=watermark
+            geometry=geometry,
+            overlays=overlays,
+            watermark=watermark,
+            metadata=metadata,
         )
         if (
             pdf_canvas is not None
         ):  # pragma: no cover - exercised when dependency available
             try:
-                buffer = io.BytesIO()
-                pdf = pdf_canvas.Canvas(buffer)
+                pdf = pdf_canvas.Canvas(stream)
                 pdf.drawString(36, 800, "Optimal Build Export")
                 y = 780
                 for layer, entities in manifest["layers"].items():
                     pdf.drawString(36, y, f"Layer: {layer} ({len(entities)} entities)")
                     y -= 16
-                if overlays:
+                if manifest["overlays"]:
                     pdf.drawString(36, y, "Overlays:")
                     y -= 16
                     for layer, entries in manifest["overlays"].items():
@@ -482,14 +725,14 @@ class PDFWriter(BaseWriter):
                     pdf.setFillColorRGB(1, 0, 0)
                     pdf.drawString(120, 400, watermark)
                 pdf.save()
-                buffer.seek(0)
                 manifest["renderer"] = "reportlab"
-                return buffer.getvalue(), manifest
+                return manifest
             except (
                 Exception
             ):  # pragma: no cover - fallback for optional dependency failure
-                pass
-        return json.dumps(manifest, sort_keys=True).encode("utf-8"), manifest
+                _reset_stream(stream)
+        _write_json(stream, manifest)
+        return manifest
 
 
 _WRITERS: dict[ExportFormat, type[BaseWriter]] = {
@@ -509,6 +752,66 @@ def get_writer(format: ExportFormat, *, options: ExportOptions) -> BaseWriter:
     return writer_cls(mapping=options.layer_mapping, options=options)
 
 
+def _available_renderers() -> list[str]:
+    modules = {"ezdxf": ezdxf, "ifcopenshell": ifcopenshell, "reportlab": pdf_canvas}
+    return sorted(name for name, module in modules.items() if module is not None)
+
+
+def export_cache_key(
+    geometry_checksums: Iterable[tuple[int, str]],
+    overlays: Iterable[OverlaySuggestion],
+    options: ExportOptions,
+) -> str:
+    """Return the artefact cache key for a project's current export inputs.
+
+    The key covers the source geometry checksums, each overlay's status and
+    last update, the export options and the renderers available in this
+    process, so any change that would alter the artefact yields a new key.
+    """
+
+    overlay_state = sorted(
+        (
+            overlay.id,
+            overlay.code,
+            (overlay.status or "pending").lower(),
+            overlay.updated_at.isoformat() if overlay.updated_at else None,
+        )
+        for overlay in overlays
+    )
+    payload = {
+        "version": _EXPORT_CACHE_VERSION,
+        "geometry": sorted(
+            [record_id, checksum] for record_id, checksum in geometry_checksums
+        ),
+        "overlays": overlay_state,
+        "options": dataclasses.asdict(options),
+        "renderers": _available_renderers(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _render_artifact(
+    stream: BinaryIO,
+    *,
+    writer: BaseWriter,
+    graphs: Sequence[dict[str, Any]],
+    overlay_features: Sequence[dict[str, Any]],
+    options: ExportOptions,
+    watermark: str | None,
+    metadata: Mapping[str, Any],
+) -> dict[str, Any]:
+    geometry_features: Iterable[dict[str, Any]] = ()
+    if options.include_source:
+        geometry_features = _iter_geometry_features(
+            (CanonicalGeometry.from_dict(graph) for graph in graphs),
+            mapping=options.layer_mapping,
+        )
+    return writer.write(
+        stream, geometry_features, overlay_features, watermark, metadata=metadata
+    )
+
+
 async def generate_project_export(
     session: AsyncSession,
     *,
@@ -516,68 +819,84 @@ async def generate_project_export(
     options: ExportOptions,
     storage: ArtifactStorage | None = None,
 ) -> ExportArtifact:
-    """Generate an export artefact for the given project."""
+    """Generate an export artefact for the given project.
+
+    A stored artefact whose cache key still matches the project is returned
+    as-is; otherwise the writer streams a new artefact into storage on a
+    worker thread.
+    """
 
     started_at = time.perf_counter()
-    result = await session.execute(
-        select(OverlaySourceGeometry).where(
+    checksum_result = await session.execute(
+        select(OverlaySourceGeometry.id, OverlaySourceGeometry.checksum).where(
             OverlaySourceGeometry.project_id == project_id
         )
     )
-    records = list(result.scalars().unique())
-    if not records:
+    geometry_checksums = [(row.id, row.checksum) for row in checksum_result]
+    if not geometry_checksums:
         raise ProjectGeometryMissing(
             f"No source geometry found for project {project_id}"
         )
 
-    geometries: list[CanonicalGeometry] = []
-    for record in records:
-        payload = record.graph
-        if isinstance(payload, dict):
-            geometries.append(CanonicalGeometry.from_dict(payload))
-    if not geometries:
-        raise ProjectGeometryMissing(
-            f"Source geometry payload missing for project {project_id}"
-        )
-
     overlay_result = await session.execute(
         select(OverlaySuggestion).where(OverlaySuggestion.project_id == project_id)
     )
     overlay_suggestions = list(overlay_result.scalars().unique())
 
-    geometry_features: list[dict[str, Any]] = []
-    if options.include_source:
-        geometry_features = _normalise_geometry(
-            geometries, mapping=options.layer_mapping
-        )
-
-    overlay_features = _normalise_overlays(
-        overlay_suggestions,
-        mapping=options.layer_mapping,
-        include_approved=options.include_approved_overlays,
-        include_pending=options.include_pending_overlays,
-        include_rejected=options.include_rejected_overlays,
-    )
-
-    watermark = (
-        options.pending_watermark if _pending_failures(overlay_suggestions) else None
-    )
-
-    writer = get_writer(options.format, options=options)
-    payload, manifest = writer.render(geometry_features, overlay_features, watermark)
-    manifest.setdefault("project_id", project_id)
-    manifest.setdefault("generated_at", datetime.now(UTC).isoformat())
-    if manifest.get("renderer") == "fallback":
-        payload = json.dumps(manifest, sort_keys=True).encode("utf-8")
-
+    cache_key = export_cache_key(geometry_checksums, overlay_suggestions, options)
     storage_backend = storage or LocalExportStorage()
     artifact = await asyncio.to_thread(
-        storage_backend.store,
+        storage_backend.lookup,
         project_id=project_id,
         fmt=options.format,
-        payload=payload,
-        manifest=manifest,
+        cache_key=cache_key,
     )
+    if artifact is None:
+        graph_result = await session.execute(
+            select(OverlaySourceGeometry.graph)
+            .where(OverlaySourceGeometry.project_id == project_id)
+            .order_by(OverlaySourceGeometry.id)
+        )
+        graphs = [graph for graph in graph_result.scalars() if isinstance(graph, dict)]
+        if not graphs:
+            raise ProjectGeometryMissing(
+                f"Source geometry payload missing for project {project_id}"
+            )
+        watermark = (
+            options.pending_watermark
+            if _pending_failures(overlay_suggestions)
+            else None
+        )
+        # Read the ORM attributes here: the worker thread must not touch
+        # session-bound instances.
+        overlay_features = _normalise_overlays(
+            overlay_suggestions,
+            mapping=options.layer_mapping,
+            include_approved=options.include_approved_overlays,
+            include_pending=options.include_pending_overlays,
+            include_rejected=options.include_rejected_overlays,
+        )
+        writer = get_writer(options.format, options=options)
+        metadata = {
+            "project_id": project_id,
+            "generated_at": datetime.now(UTC).isoformat(),
+        }
+        artifact = await asyncio.to_thread(
+            storage_backend.store_stream,
+            project_id=project_id,
+            fmt=options.format,
+            write=lambda stream: _render_artifact(
+                stream,
+                writer=writer,
+                graphs=graphs,
+                overlay_features=overlay_features,
+                options=options,
+                watermark=watermark,
+                metadata=metadata,
+            ),
+            cache_key=cache_key,
+        )
+
     approved_count = sum(
         1
         for overlay in overlay_suggestions
@@ -596,6 +915,7 @@ async def generate_project_export(
             "accepted_suggestions": approved_count,
             "include_pending": options.include_pending_overlays,
             "include_rejected": options.include_rejected_overlays,
+            "cached": artifact.cached,
         },
     )
     await session.commit()
@@ -612,6 +932,7 @@ __all__ = [
     "LayerMapping",
     "LocalExportStorage",
     "ProjectGeometryMissing",
+    "export_cache_key",
     "generate_project_export",
     "get_writer",
 ]
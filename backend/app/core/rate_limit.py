@@ -1,22 +1,40 @@
 """Rate limiting middleware for API protection.
 
 Provides configurable rate limiting per endpoint, user, and IP address
-to prevent abuse and ensure fair resource usage.
+to prevent abuse and ensure fair resource usage. Limits are enforced with
+GCRA counters kept in process or, with ``RATE_LIMIT_BACKEND=redis``, in
+Redis so that every worker shares one quota.
 """
 
 from __future__ import annotations
 
-import hashlib
+import asyncio
+import math
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
 from typing import Any, Callable
 
 from fastapi import HTTPException, Request, status
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.datastructures import MutableHeaders
 from starlette.responses import Response
+from starlette.types import Message, Receive, Scope, Send
+
+try:  # pragma: no cover - optional dependency, available in some deployments
+    from redis import Redis  # type: ignore[import-untyped]
+    from redis.asyncio import Redis as AsyncRedis  # type: ignore[import-untyped]
+except ModuleNotFoundError:  # pragma: no cover - keep in-process fallback working
+    Redis = None  # type: ignore[assignment]
+    AsyncRedis = None  # type: ignore[assignment]
+
+from app.core.config import settings
+from app.utils.logging import get_logger, log_event
+
+logger = get_logger(__name__)
 
 
 class RateLimitTier(str, Enum):
@@ -84,27 +102,345 @@ ENDPOINT_LIMITS: dict[str, RateLimitConfig] = {
 }
 
 
-@dataclass
-class RateLimitState:
-    """Tracks rate limit state for a key."""
+class _TrieNode:
+    __slots__ = ("children", "wildcard", "config")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.wildcard: _TrieNode | None = None
+        self.config: RateLimitConfig | None = None
+
+
+def _path_segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+class EndpointLimitTrie:
+    """Endpoint patterns precompiled into a path-segment prefix trie.
+
+    ``*`` matches exactly one path segment. Literal segments take precedence
+    over wildcards, so exact endpoints override broader patterns.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, limits: Mapping[str, RateLimitConfig]) -> None:
+        self._root = _TrieNode()
+        for pattern, config in limits.items():
+            node = self._root
+            for segment in _path_segments(pattern):
+                if segment == "*":
+                    if node.wildcard is None:
+                        node.wildcard = _TrieNode()
+                    node = node.wildcard
+                else:
+                    node = node.children.setdefault(segment, _TrieNode())
+            node.config = config
+
+    def match(self, path: str) -> RateLimitConfig | None:
+        """Return the config registered for ``path``, if any pattern matches."""
+
+        segments = _path_segments(path)
+        stack: list[tuple[_TrieNode, int]] = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth == len(segments):
+                if node.config is not None:
+                    return node.config
+                continue
+            # Pushed last so the literal branch is explored first.
+            if node.wildcard is not None:
+                stack.append((node.wildcard, depth + 1))
+            child = node.children.get(segments[depth])
+            if child is not None:
+                stack.append((child, depth + 1))
+        return None
+
+
+# GCRA windows in the order they are stored: burst, minute, hour, day.
+_WINDOW_NAMES = ("burst", "minute", "hour", "day")
+
+
+@dataclass(slots=True, frozen=True)
+class GcraLimits:
+    """Per-window periods (seconds) and request limits for one decision."""
+
+    periods: tuple[float, float, float, float]
+    limits: tuple[int, int, int, int]
+
+    @classmethod
+    def from_config(cls, config: RateLimitConfig, tier: RateLimitTier) -> GcraLimits:
+        multiplier = config.tier_multipliers.get(tier, 1.0)
+        return cls(
+            periods=(float(config.burst_window_seconds), 60.0, 3600.0, 86400.0),
+            limits=(
+                int(config.burst_size * multiplier),
+                int(config.requests_per_minute * multiplier),
+                int(config.requests_per_hour * multiplier),
+                int(config.requests_per_day * multiplier),
+            ),
+        )
+
+    def interval(self, index: int) -> float:
+        """Emission interval of window ``index``; 0 when it admits nothing."""
+
+        limit = self.limits[index]
+        return self.periods[index] / limit if limit > 0 else 0.0
+
+
+@dataclass(slots=True, frozen=True)
+class GcraResult:
+    """Backend outcome: admission flag, backend clock and theoretical arrivals."""
+
+    allowed: bool
+    now: float
+    tats: tuple[float, ...]
+
+
+def gcra_step(
+    tats: Sequence[float] | None, limits: GcraLimits, now: float, cost: int
+) -> GcraResult:
+    """Apply the generic cell-rate algorithm to every window at once.
+
+    A request is admitted only if every window admits it, in which case each
+    theoretical arrival time (TAT) advances by its emission interval. ``cost``
+    of 0 inspects the state without consuming quota. Mirrors ``_GCRA_LUA``.
+    """
+
+    current = tuple(
+        max(tats[index] if tats else now, now) for index in range(len(_WINDOW_NAMES))
+    )
+    allowed = True
+    for index, tat in enumerate(current):
+        interval = limits.interval(index)
+        if interval <= 0 or tat + interval * cost - now > limits.periods[index]:
+            allowed = False
+    if allowed and cost > 0:
+        current = tuple(
+            tat + limits.interval(index) * cost for index, tat in enumerate(current)
+        )
+    return GcraResult(allowed=allowed, now=now, tats=current)
+
+
+class GcraState:
+    """Theoretical arrival times for one limiter key, one float per window."""
+
+    __slots__ = ("burst", "minute", "hour", "day")
 
-    minute_count: int = 0
-    minute_reset: float = 0.0
-    hour_count: int = 0
-    hour_reset: float = 0.0
-    day_count: int = 0
-    day_reset: float = 0.0
-    burst_tokens: float = 0.0
-    burst_last_update: float = 0.0
+    def __init__(self, tats: Sequence[float]) -> None:
+        self.burst, self.minute, self.hour, self.day = tats
+
+    @property
+    def tats(self) -> tuple[float, float, float, float]:
+        return (self.burst, self.minute, self.hour, self.day)
+
+    @property
+    def expires_at(self) -> float:
+        return max(self.burst, self.minute, self.hour, self.day)
+
+
+class RateLimitBackend:
+    """Storage for GCRA state shared by every :class:`RateLimiter` using it."""
+
+    def acquire(self, key: str, limits: GcraLimits, *, cost: int = 1) -> GcraResult:
+        raise NotImplementedError
+
+    async def acquire_async(
+        self, key: str, limits: GcraLimits, *, cost: int = 1
+    ) -> GcraResult:
+        """Async variant for the middleware; backends doing I/O override it."""
+
+        return self.acquire(key, limits, cost=cost)
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """Process-local GCRA counters kept in least-recently-used order.
+
+    Expired keys are evicted a few at a time from the cold end on each call,
+    and the table never grows beyond ``max_keys`` entries.
+    """
+
+    _EVICTIONS_PER_CALL = 8
+
+    def __init__(
+        self,
+        *,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_keys = max(max_keys, 1)
+        self._clock = clock
+        self._states: OrderedDict[str, GcraState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def _evict(self, now: float) -> None:
+        for _ in range(self._EVICTIONS_PER_CALL):
+            if not self._states:
+                return
+            key, state = next(iter(self._states.items()))
+            if state.expires_at > now and len(self._states) <= self.max_keys:
+                return
+            del self._states[key]
+
+    def acquire(self, key: str, limits: GcraLimits, *, cost: int = 1) -> GcraResult:
+        now = self._clock()
+        with self._lock:
+            state = self._states.get(key)
+            result = gcra_step(state.tats if state else None, limits, now, cost)
+            if result.allowed and cost > 0:
+                if state is None:
+                    self._states[key] = GcraState(result.tats)
+                else:
+                    state.burst, state.minute, state.hour, state.day = result.tats
+                    self._states.move_to_end(key)
+            self._evict(now)
+        return result
+
+
+# KEYS[1] holds a hash of per-window TATs in milliseconds of Redis server time;
+# ARGV is the cost followed by (period_ms, interval_ms) for each window.
+_GCRA_LUA = """
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + tonumber(clock[2]) / 1000
+local cost = tonumber(ARGV[1])
+local fields = {'burst', 'minute', 'hour', 'day'}
+local stored = redis.call('HMGET', KEYS[1], unpack(fields))
+local tats = {}
+local allowed = 1
+for i = 1, #fields do
+  local period = tonumber(ARGV[i * 2])
+  local interval = tonumber(ARGV[i * 2 + 1])
+  local tat = math.max(tonumber(stored[i]) or now, now)
+  if interval <= 0 or tat + interval * cost - now > period then
+    allowed = 0
+  end
+  tats[i] = tat
+end
+if allowed == 1 and cost > 0 then
+  local updates = {}
+  local ttl = 0
+  for i = 1, #fields do
+    tats[i] = tats[i] + tonumber(ARGV[i * 2 + 1]) * cost
+    updates[#updates + 1] = fields[i]
+    updates[#updates + 1] = tostring(tats[i])
+    ttl = math.max(ttl, tats[i] - now)
+  end
+  redis.call('HSET', KEYS[1], unpack(updates))
+  redis.call('PEXPIRE', KEYS[1], math.ceil(ttl))
+end
+for i = 1, #fields do
+  tats[i] = tostring(tats[i])
+end
+return {allowed, tostring(now), tats[1], tats[2], tats[3], tats[4]}
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """GCRA counters in Redis, updated atomically by a Lua script.
+
+    All workers sharing the Redis database share one quota. ``acquire_async``
+    runs the script on ``async_client`` (a ``redis.asyncio`` client) so the
+    event loop never waits on the socket; without one it runs the blocking
+    call on a worker thread. When Redis is unreachable decisions fall back to
+    ``fallback`` (process-local) and Redis is retried after ``retry_seconds``.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        async_client: Any | None = None,
+        prefix: str = "ratelimit:",
+        fallback: RateLimitBackend | None = None,
+        retry_seconds: float = 5.0,
+    ) -> None:
+        self.prefix = prefix
+        self.fallback = InMemoryRateLimitBackend() if fallback is None else fallback
+        self.retry_seconds = retry_seconds
+        self._script = client.register_script(_GCRA_LUA)
+        self._async_script = (
+            async_client.register_script(_GCRA_LUA)
+            if async_client is not None
+            else None
+        )
+        self._retry_at = 0.0
+
+    @staticmethod
+    def _script_args(limits: GcraLimits, cost: int) -> list[Any]:
+        args: list[Any] = [cost]
+        for index, period in enumerate(limits.periods):
+            args.extend((period * 1000.0, limits.interval(index) * 1000.0))
+        return args
+
+    @staticmethod
+    def _result(reply: Sequence[Any]) -> GcraResult:
+        allowed, now_ms, *tats_ms = reply
+        return GcraResult(
+            allowed=int(allowed) == 1,
+            now=float(now_ms) / 1000.0,
+            tats=tuple(float(tat) / 1000.0 for tat in tats_ms),
+        )
+
+    def _degrade(self, exc: Exception) -> None:
+        self._retry_at = time.monotonic() + self.retry_seconds
+        log_event(logger, "rate_limit_redis_unavailable", error=str(exc))
+
+    def acquire(self, key: str, limits: GcraLimits, *, cost: int = 1) -> GcraResult:
+        if time.monotonic() < self._retry_at:
+            return self.fallback.acquire(key, limits, cost=cost)
+        try:
+            reply = self._script(
+                keys=[f"{self.prefix}{key}"], args=self._script_args(limits, cost)
+            )
+        except Exception as exc:  # noqa: BLE001 - any Redis failure degrades
+            self._degrade(exc)
+            return self.fallback.acquire(key, limits, cost=cost)
+        return self._result(reply)
+
+    async def acquire_async(
+        self, key: str, limits: GcraLimits, *, cost: int = 1
+    ) -> GcraResult:
+        if time.monotonic() < self._retry_at:
+            return self.fallback.acquire(key, limits, cost=cost)
+        if self._async_script is None:
+            return await asyncio.to_thread(self.acquire, key, limits, cost=cost)
+        try:
+            reply = await self._async_script(
+                keys=[f"{self.prefix}{key}"], args=self._script_args(limits, cost)
+            )
+        except Exception as exc:  # noqa: BLE001 - any Redis failure degrades
+            self._degrade(exc)
+            return self.fallback.acquire(key, limits, cost=cost)
+        return self._result(reply)
 
 
 class RateLimiter:
-    """In-memory rate limiter with sliding window."""
+    """Sliding-window rate limiter backed by GCRA counters.
 
-    def __init__(self) -> None:
-        self._state: dict[str, RateLimitState] = defaultdict(RateLimitState)
-        self._cleanup_interval = 300  # Clean up every 5 minutes
-        self._last_cleanup = time.time()
+    Each key carries one theoretical arrival time per window (burst, minute,
+    hour, day) instead of fixed-window counters, so limits slide smoothly.
+    State lives in ``backend``; use :class:`RedisRateLimitBackend` to share
+    quotas across worker processes.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend | None = None,
+        endpoint_limits: Mapping[str, RateLimitConfig] | None = None,
+    ) -> None:
+        self.backend = InMemoryRateLimitBackend() if backend is None else backend
+        self._endpoint_limits = (
+            ENDPOINT_LIMITS if endpoint_limits is None else endpoint_limits
+        )
+        self._routes = EndpointLimitTrie(self._endpoint_limits)
+
+    def reload_endpoint_limits(self) -> None:
+        """Recompile the endpoint trie after endpoint limits change."""
+
+        self._routes = EndpointLimitTrie(self._endpoint_limits)
 
     def _get_key(
         self,
@@ -112,54 +448,56 @@ class RateLimiter:
         endpoint: str,
     ) -> str:
         """Generate a unique key for rate limiting."""
-        return hashlib.sha256(f"{identifier}:{endpoint}".encode()).hexdigest()[:32]
-
-    def _cleanup_expired(self) -> None:
-        """Remove expired entries to prevent memory growth."""
-        now = time.time()
-        if now - self._last_cleanup < self._cleanup_interval:
-            return
+        return f"{identifier}|{endpoint}"
 
-        expired_keys = []
-        for key, state in self._state.items():
-            # Remove if all windows have expired
-            if (
-                state.minute_reset < now
-                and state.hour_reset < now
-                and state.day_reset < now
-            ):
-                expired_keys.append(key)
+    def _get_config_for_endpoint(self, endpoint: str) -> RateLimitConfig:
+        """Get rate limit config for an endpoint, with wildcard matching."""
+        return self._routes.match(endpoint) or DEFAULT_CONFIG
 
-        for key in expired_keys:
-            del self._state[key]
+    def _acquire(
+        self,
+        identifier: str,
+        endpoint: str,
+        tier: RateLimitTier,
+        config: RateLimitConfig | None,
+        cost: int,
+    ) -> tuple[GcraResult, GcraLimits]:
+        limits = GcraLimits.from_config(
+            config or self._get_config_for_endpoint(endpoint), tier
+        )
+        key = self._get_key(identifier, endpoint)
+        return self.backend.acquire(key, limits, cost=cost), limits
 
-        self._last_cleanup = now
+    async def _acquire_async(
+        self,
+        identifier: str,
+        endpoint: str,
+        tier: RateLimitTier,
+        config: RateLimitConfig | None,
+        cost: int,
+    ) -> tuple[GcraResult, GcraLimits]:
+        limits = GcraLimits.from_config(
+            config or self._get_config_for_endpoint(endpoint), tier
+        )
+        key = self._get_key(identifier, endpoint)
+        return await self.backend.acquire_async(key, limits, cost=cost), limits
 
-    def _get_config_for_endpoint(self, endpoint: str) -> RateLimitConfig:
-        """Get rate limit config for an endpoint, with wildcard matching."""
-        # Exact match first
-        if endpoint in ENDPOINT_LIMITS:
-            return ENDPOINT_LIMITS[endpoint]
-
-        # Wildcard matching (e.g., /api/v1/projects/*/export)
-        for pattern, config in ENDPOINT_LIMITS.items():
-            if "*" in pattern:
-                # Convert to regex-like matching
-                parts = pattern.split("*")
-                if (
-                    len(parts) == 2
-                    and endpoint.startswith(parts[0])
-                    and endpoint.endswith(parts[1])
-                ):
-                    return config
-
-        return DEFAULT_CONFIG
+    @staticmethod
+    def _remaining(result: GcraResult, limits: GcraLimits, index: int) -> int:
+        interval = limits.interval(index)
+        if interval <= 0:
+            return 0
+        # Requests still queued in the window, tolerating float rounding.
+        queued = math.ceil((result.tats[index] - result.now) / interval - 1e-6)
+        return min(max(limits.limits[index] - queued, 0), limits.limits[index])
 
     def check_rate_limit(
         self,
         identifier: str,
         endpoint: str,
         tier: RateLimitTier = RateLimitTier.ANONYMOUS,
+        *,
+        config: RateLimitConfig | None = None,
     ) -> tuple[bool, dict[str, Any]]:
         """Check if request is within rate limits.
 
@@ -167,85 +505,52 @@ class RateLimiter:
             identifier: Unique identifier (IP, user ID, API key)
             endpoint: The API endpoint being accessed
             tier: User tier for limit multipliers
+            config: Limits to apply instead of the endpoint's configured ones
 
         Returns:
             Tuple of (allowed, headers) where headers contain rate limit info
         """
-        self._cleanup_expired()
+        result, limits = self._acquire(identifier, endpoint, tier, config, 1)
+        return result.allowed, self._headers(result, limits)
 
-        key = self._get_key(identifier, endpoint)
-        state = self._state[key]
-        config = self._get_config_for_endpoint(endpoint)
-        multiplier = config.tier_multipliers.get(tier, 1.0)
+    async def check_rate_limit_async(
+        self,
+        identifier: str,
+        endpoint: str,
+        tier: RateLimitTier = RateLimitTier.ANONYMOUS,
+        *,
+        config: RateLimitConfig | None = None,
+    ) -> tuple[bool, dict[str, Any]]:
+        """Like :meth:`check_rate_limit`, without blocking the event loop on I/O."""
 
-        now = time.time()
-
-        # Calculate effective limits
-        minute_limit = int(config.requests_per_minute * multiplier)
-        hour_limit = int(config.requests_per_hour * multiplier)
-        day_limit = int(config.requests_per_day * multiplier)
-        burst_limit = int(config.burst_size * multiplier)
-
-        # Reset windows if expired
-        if now > state.minute_reset:
-            state.minute_count = 0
-            state.minute_reset = now + 60
-
-        if now > state.hour_reset:
-            state.hour_count = 0
-            state.hour_reset = now + 3600
-
-        if now > state.day_reset:
-            state.day_count = 0
-            state.day_reset = now + 86400
-
-        # Token bucket for burst control
-        time_passed = now - state.burst_last_update
-        state.burst_tokens = min(
-            burst_limit,
-            state.burst_tokens
-            + time_passed * (burst_limit / config.burst_window_seconds),
+        result, limits = await self._acquire_async(
+            identifier, endpoint, tier, config, 1
         )
-        state.burst_last_update = now
+        return result.allowed, self._headers(result, limits)
 
-        # Check limits
+    def _headers(self, result: GcraResult, limits: GcraLimits) -> dict[str, Any]:
         headers = {
-            "X-RateLimit-Limit-Minute": str(minute_limit),
-            "X-RateLimit-Remaining-Minute": str(
-                max(0, minute_limit - state.minute_count)
-            ),
-            "X-RateLimit-Reset-Minute": str(int(state.minute_reset)),
-            "X-RateLimit-Limit-Hour": str(hour_limit),
-            "X-RateLimit-Remaining-Hour": str(max(0, hour_limit - state.hour_count)),
+            "X-RateLimit-Limit-Minute": str(limits.limits[1]),
+            "X-RateLimit-Remaining-Minute": str(self._remaining(result, limits, 1)),
+            "X-RateLimit-Reset-Minute": str(math.ceil(result.tats[1])),
+            "X-RateLimit-Limit-Hour": str(limits.limits[2]),
+            "X-RateLimit-Remaining-Hour": str(self._remaining(result, limits, 2)),
         }
-
-        # Check burst limit
-        if state.burst_tokens < 1:
-            headers["Retry-After"] = str(config.burst_window_seconds)
-            return False, headers
-
-        # Check minute limit
-        if state.minute_count >= minute_limit:
-            headers["Retry-After"] = str(int(state.minute_reset - now))
-            return False, headers
-
-        # Check hour limit
-        if state.hour_count >= hour_limit:
-            headers["Retry-After"] = str(int(state.hour_reset - now))
-            return False, headers
-
-        # Check day limit
-        if state.day_count >= day_limit:
-            headers["Retry-After"] = str(int(state.day_reset - now))
-            return False, headers
-
-        # Request allowed - update counters
-        state.minute_count += 1
-        state.hour_count += 1
-        state.day_count += 1
-        state.burst_tokens -= 1
-
-        return True, headers
+        if not result.allowed:
+            # Wait until every exhausted window admits one more request.
+            retry_after = max(
+                (
+                    result.tats[index]
+                    + limits.interval(index)
+                    - limits.periods[index]
+                    - result.now
+                    if limits.interval(index) > 0
+                    else limits.periods[index]
+                )
+                for index in range(len(_WINDOW_NAMES))
+            )
+            headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+        return headers
 
     def get_remaining(
         self,
@@ -254,33 +559,50 @@ class RateLimiter:
         tier: RateLimitTier = RateLimitTier.ANONYMOUS,
     ) -> dict[str, int]:
         """Get remaining requests for an identifier."""
-        key = self._get_key(identifier, endpoint)
-        state = self._state[key]
-        config = self._get_config_for_endpoint(endpoint)
-        multiplier = config.tier_multipliers.get(tier, 1.0)
-
+        result, limits = self._acquire(identifier, endpoint, tier, None, 0)
         return {
-            "minute": max(
-                0, int(config.requests_per_minute * multiplier) - state.minute_count
-            ),
-            "hour": max(
-                0, int(config.requests_per_hour * multiplier) - state.hour_count
-            ),
-            "day": max(0, int(config.requests_per_day * multiplier) - state.day_count),
+            name: self._remaining(result, limits, index)
+            for index, name in enumerate(_WINDOW_NAMES)
+            if name != "burst"
         }
 
 
+def build_rate_limit_backend() -> RateLimitBackend:
+    """Create the backend selected by ``RATE_LIMIT_BACKEND``."""
+
+    fallback = InMemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+    if settings.RATE_LIMIT_BACKEND != "redis":
+        return fallback
+    if Redis is None:
+        log_event(logger, "rate_limit_backend_fallback", reason="redis_not_installed")
+        return fallback
+    client = Redis.from_url(
+        settings.RATE_LIMIT_REDIS_URL,
+        socket_timeout=0.25,
+        socket_connect_timeout=0.25,
+    )
+    async_client = AsyncRedis.from_url(
+        settings.RATE_LIMIT_REDIS_URL,
+        socket_timeout=0.25,
+        socket_connect_timeout=0.25,
+    )
+    return RedisRateLimitBackend(client, async_client=async_client, fallback=fallback)
+
+
 # Global rate limiter instance
-_rate_limiter = RateLimiter()
+_rate_limiter: RateLimiter | None = None
 
 
 def get_rate_limiter() -> RateLimiter:
     """Get the global rate limiter instance."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter(build_rate_limit_backend())
     return _rate_limiter
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware for rate limiting."""
+class RateLimitMiddleware:
+    """Pure-ASGI middleware for rate limiting."""
 
     def __init__(
         self,
@@ -289,7 +611,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         enabled: bool = True,
         exclude_paths: list[str] | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self.limiter = limiter or get_rate_limiter()
         self.enabled = enabled
         self.exclude_paths = exclude_paths or [
@@ -327,41 +649,42 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return f"ip:{ip}", RateLimitTier.ANONYMOUS
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request through rate limiter."""
-        if not self.enabled:
-            return await call_next(request)
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Skip excluded paths
-        path = request.url.path
+        path = scope["path"]
         if any(path.startswith(excluded) for excluded in self.exclude_paths):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        identifier, tier = self._get_identifier(request)
-        allowed, headers = self.limiter.check_rate_limit(identifier, path, tier)
+        identifier, tier = self._get_identifier(Request(scope))
+        allowed, headers = await self.limiter.check_rate_limit_async(
+            identifier, path, tier
+        )
 
         if not allowed:
             response = Response(
                 content='{"detail": "Rate limit exceeded. Please retry later."}',
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 media_type="application/json",
+                headers=headers,
             )
-            for key, value in headers.items():
-                response.headers[key] = value
-            return response
-
-        # Process request
-        response = await call_next(request)
+            await response(scope, receive, send)
+            return
 
-        # Add rate limit headers to successful responses
-        for key, value in headers.items():
-            response.headers[key] = value
+        async def send_with_headers(message: Message) -> None:
+            # Add rate limit headers to successful responses
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for key, value in headers.items():
+                    response_headers[key] = value
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
 def rate_limit(
@@ -378,6 +701,12 @@ def rate_limit(
             ...
     """
 
+    # Passed to the limiter directly rather than registered in ENDPOINT_LIMITS.
+    config = RateLimitConfig(
+        requests_per_minute=requests_per_minute or DEFAULT_CONFIG.requests_per_minute,
+        requests_per_hour=requests_per_hour or DEFAULT_CONFIG.requests_per_hour,
+    )
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(request: Request, *args: Any, **kwargs: Any) -> Any:
@@ -395,39 +724,21 @@ def rate_limit(
                         f"ip:{request.client.host if request.client else 'unknown'}"
                     )
 
-            # Create custom config for this decorator
-            config = RateLimitConfig(
-                requests_per_minute=requests_per_minute
-                or DEFAULT_CONFIG.requests_per_minute,
-                requests_per_hour=requests_per_hour or DEFAULT_CONFIG.requests_per_hour,
+            allowed, headers = await limiter.check_rate_limit_async(
+                identifier,
+                request.url.path,
+                RateLimitTier.ANONYMOUS,
+                config=config,
             )
 
-            # Temporarily register this endpoint's config
-            endpoint = request.url.path
-            original_config = ENDPOINT_LIMITS.get(endpoint)
-            ENDPOINT_LIMITS[endpoint] = config
-
-            try:
-                allowed, headers = limiter.check_rate_limit(
-                    identifier,
-                    endpoint,
-                    RateLimitTier.ANONYMOUS,
+            if not allowed:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Rate limit exceeded. Please retry later.",
+                    headers=headers,
                 )
 
-                if not allowed:
-                    raise HTTPException(
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                        detail="Rate limit exceeded. Please retry later.",
-                        headers=headers,
-                    )
-
-                return await func(request, *args, **kwargs)
-            finally:
-                # Restore original config
-                if original_config:
-                    ENDPOINT_LIMITS[endpoint] = original_config
-                elif endpoint in ENDPOINT_LIMITS:
-                    del ENDPOINT_LIMITS[endpoint]
+            return await func(request, *args, **kwargs)
 
         return wrapper
 
@@ -1,5 +1,6 @@
 """Prefect flow package."""
 
+from .anomaly import anomaly_detection_flow  # noqa: F401
 from .ingestion import material_standard_ingestion_flow  # noqa: F401
 from .performance import (
     agent_performance_snapshots_flow,  # noqa: F401
@@ -7,6 +8,7 @@ from .performance import (
 )
 
 __all__ = [
+    "anomaly_detection_flow",
     "material_standard_ingestion_flow",
     "agent_performance_snapshots_flow",
     "seed_performance_benchmarks_flow",
@@ -0,0 +1,30 @@
+"""Prefect flows for scheduled anomaly detection."""
+
+from __future__ import annotations
+
+from prefect import flow
+
+from app.core.database import AsyncSessionLocal
+from app.services.ai.anomaly_detector import (
+    DEFAULT_RULE_CONCURRENCY,
+    AnomalyDetectionService,
+)
+
+
+@flow(name="anomaly-detection-cycle")
+async def anomaly_detection_flow(
+    concurrency: int = DEFAULT_RULE_CONCURRENCY,
+) -> dict[str, int]:
+    """Run every alert rule across all users and persist the alerts."""
+
+    service = AnomalyDetectionService()
+    runs = await service.run_scheduled_cycle(AsyncSessionLocal, concurrency=concurrency)
+    return {
+        "rules": len(runs),
+        "alerts": sum(run.alerts for run in runs),
+        "resolved": sum(run.resolved for run in runs),
+        "failed": sum(1 for run in runs if run.error),
+    }
+
+
+__all__ = ["anomaly_detection_flow"]
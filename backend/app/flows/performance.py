@@ -49,6 +49,7 @@ async def agent_performance_snapshots_flow(
             session=session,
             as_of=parsed_date,
             agent_ids=parsed_ids,
+            bulk=True,
         )
         return {"snapshots": len(snapshots)}
 
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import asyncio
+import sys
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
 from functools import lru_cache
 from pathlib import Path
 from threading import Lock
+from time import perf_counter
 from typing import Any
 
 from fastapi import Depends, FastAPI, Request
@@ -22,8 +25,11 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 try:  # pragma: no cover - prefer real slowapi when available
     from slowapi import Limiter
     from slowapi.errors import RateLimitExceeded
-    from slowapi.middleware import SlowAPIMiddleware
     from slowapi.util import get_remote_address
+
+    from app.middleware.slowapi_asgi import (
+        SlowAPIASGIMiddleware as SlowAPIMiddleware,
+    )
 except Exception:  # pragma: no cover - fallback for stubbed environments
 
     class RateLimitExceeded(RuntimeError):
@@ -72,17 +78,16 @@ from app.api.error_handlers import (
     unhandled_exception_handler,
     validation_exception_handler,
 )
-from app.api.v1 import TAGS_METADATA, build_api_router
+from app.api.v1 import (
+    TAGS_METADATA,
+    build_api_router,  # noqa: F401 - used by scripts/check_import_budget.py
+    build_router_group,
+    router_group_for_segment,
+    router_groups,
+)
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal, engine, get_session
-from app.middleware.observability import (
-    ApiErrorLoggingMiddleware,
-    RequestMetricsMiddleware,
-)
-from app.middleware.request_guards import (
-    CorrelationIdMiddleware,
-    RequestSizeLimitMiddleware,
-)
+from app.middleware.request_guards import RequestContextMiddleware
 from app.middleware.security import SecurityHeadersConfig, SecurityHeadersMiddleware
 from app.utils import metrics
 from app.utils.logging import configure_logging, get_logger, log_event
@@ -91,6 +96,7 @@ configure_logging()
 logger = get_logger(__name__)
 _api_router_lock = Lock()
 _api_router_loaded = False
+_mounted_router_groups: set[tuple[str, ...]] = set()
 
 
 @lru_cache(maxsize=1)
@@ -124,7 +130,7 @@ def _load_openapi_examples() -> dict[str, Any]:
 
 
 def _request_needs_api_router(path: str) -> bool:
-    """Return whether the current path needs the API v1 router tree loaded."""
+    """Return whether the current path needs the whole API v1 router tree."""
 
     if path == "/openapi.json":
         return True
@@ -132,9 +138,16 @@ def _request_needs_api_router(path: str) -> bool:
         return True
     if path == "/redoc" or path.startswith("/redoc/"):
         return True
-    if path == settings.API_V1_STR:
-        return True
-    return path.startswith(f"{settings.API_V1_STR}/")
+    return path == settings.API_V1_STR
+
+
+def _request_router_group(path: str) -> tuple[str, ...]:
+    """Return the router group serving ``path``, if it is an API v1 path."""
+
+    prefix = f"{settings.API_V1_STR}/"
+    if not path.startswith(prefix):
+        return ()
+    return router_group_for_segment(path[len(prefix) :].split("/", 1)[0])
 
 
 def _resolve_allowed_hosts() -> list[str]:
@@ -179,37 +192,92 @@ def _build_security_headers_config() -> SecurityHeadersConfig:
     )
 
 
+def _mount_router_group(group: tuple[str, ...]) -> None:
+    """Register one router group on the app once."""
+
+    if group in _mounted_router_groups:
+        return
+
+    with _api_router_lock:
+        if group in _mounted_router_groups:
+            return
+        app.include_router(build_router_group(group), prefix=settings.API_V1_STR)
+        app.openapi_schema = None
+        _mounted_router_groups.add(group)
+
+
 def _ensure_api_router_loaded() -> None:
-    """Load and register the API v1 router once on first real use."""
+    """Load and register every API v1 router group once on first real use."""
 
     global _api_router_loaded
 
     if _api_router_loaded:
         return
 
-    with _api_router_lock:
-        if _api_router_loaded:
-            return
-        app.include_router(build_api_router(), prefix=settings.API_V1_STR)
-        app.openapi_schema = None
-        _api_router_loaded = True
+    for group in router_groups():
+        _mount_router_group(group)
+    _api_router_loaded = True
 
 
 class ApiRouterLoaderMiddleware:
-    """Load API routes lazily so importing ``app.main`` stays cheap."""
+    """Load API routes lazily so importing ``app.main`` stays cheap.
+
+    Requests under ``/api/v1/<segment>`` import only the routers serving that
+    segment; the docs and OpenAPI schema load the whole tree.
+    """
 
     def __init__(self, app: Any) -> None:
         self.app = app
 
     async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
-        path = str(scope.get("path", ""))
-        if scope.get("type") in {"http", "websocket"} and _request_needs_api_router(
-            path
-        ):
-            _ensure_api_router_loaded()
+        if scope.get("type") in {"http", "websocket"} and not _api_router_loaded:
+            path = str(scope.get("path", ""))
+            if _request_needs_api_router(path):
+                _ensure_api_router_loaded()
+            else:
+                group = _request_router_group(path)
+                if group:
+                    _mount_router_group(group)
         await self.app(scope, receive, send)
 
 
+def _resolve_warmup_groups(segments: Sequence[str]) -> list[tuple[str, ...]]:
+    if "*" in segments:
+        return list(router_groups())
+    groups: list[tuple[str, ...]] = []
+    for segment in segments:
+        group = router_group_for_segment(segment.strip("/"))
+        if not group:
+            log_event(logger, "api_router_warmup_unknown_group", segment=segment)
+        elif group not in groups:
+            groups.append(group)
+    return groups
+
+
+async def warm_api_routers(segments: Sequence[str]) -> dict[str, float]:
+    """Import the router groups for ``segments`` off the event loop, then mount them.
+
+    Returns the import time in seconds per group, keyed by its first module.
+    """
+
+    timings: dict[str, float] = {}
+    for group in _resolve_warmup_groups(segments):
+        if group in _mounted_router_groups:
+            continue
+        started = perf_counter()
+        await asyncio.to_thread(build_router_group, group)
+        timings[group[0]] = round(perf_counter() - started, 3)
+        _mount_router_group(group)
+        log_event(
+            logger,
+            "api_router_warmed",
+            group=group[0],
+            modules=len(group),
+            import_s=timings[group[0]],
+        )
+    return timings
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
@@ -229,7 +297,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Seed regulatory compliance paths if empty
         try:
             import importlib
-            import sys
             from pathlib import Path
 
             from app.core.database import AsyncSessionLocal
@@ -261,9 +328,43 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             log_event(logger, "compliance_path_seed_skipped", error=str(e))
 
+    try:
+        from app.core.audit.ledger import recover_chain_heads
+        from app.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as audit_db:
+            heads = await recover_chain_heads(audit_db)
+        log_event(logger, "audit_chain_heads_recovered", projects=heads)
+    except Exception as e:
+        log_event(logger, "audit_chain_heads_recovery_skipped", error=str(e))
+
+    from app.services.agents.pdf_render import shutdown_pdf_render_service
+    from app.services.agents.photo_pipeline import shutdown_photo_executor
+    from app.services.preview_render_pool import shutdown_render_pool
+    from app.services.retention import build_default_sweeper
+
+    retention_sweeper = build_default_sweeper()
+    retention_sweeper.start()
+    warmup_task = (
+        asyncio.create_task(warm_api_routers(settings.API_ROUTER_WARMUP))
+        if settings.API_ROUTER_WARMUP
+        else None
+    )
+
     try:
         yield
     finally:
+        if warmup_task is not None:
+            warmup_task.cancel()
+            await asyncio.gather(warmup_task, return_exceptions=True)
+        await retention_sweeper.stop()
+        shutdown_render_pool()
+        shutdown_pdf_render_service()
+        shutdown_photo_executor()
+        # Only loaded once an upload was vectorised; avoid importing PyMuPDF here.
+        raster_vector = sys.modules.get("backend.jobs.raster_vector")
+        if raster_vector is not None:
+            raster_vector.shutdown_page_executor()
         await engine.dispose()
         log_event(logger, "app_shutdown")
 
@@ -304,12 +405,11 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=_ALLOWED_HEADERS,
 )
-app.add_middleware(ApiErrorLoggingMiddleware, logger=logger)
-app.add_middleware(RequestMetricsMiddleware)
-# Request size limit: 10 MB (DoS protection)
-app.add_middleware(RequestSizeLimitMiddleware, max_size_bytes=10 * 1024 * 1024)
-# Correlation ID for request tracing (outermost for full coverage)
-app.add_middleware(CorrelationIdMiddleware)
+# Correlation IDs, 10 MB request size limit (DoS protection), request metrics
+# and API error logging in one pure-ASGI layer, outermost for full coverage.
+app.add_middleware(
+    RequestContextMiddleware, max_size_bytes=10 * 1024 * 1024, logger=logger
+)
 
 
 def _build_rate_limiter() -> Limiter:
@@ -3,28 +3,71 @@
 from __future__ import annotations
 
 from time import perf_counter
-from typing import Any
+from typing import Any, Mapping
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from structlog.stdlib import BoundLogger
 
 from app.utils import metrics
 from app.utils.logging import get_logger, log_event
 
 
-def _request_metric_endpoint(request: Request) -> str:
+def _request_metric_endpoint(scope: Mapping[str, Any]) -> str:
     """Return a stable route label for request-level metrics."""
 
-    route = request.scope.get("route")
+    route = scope.get("route")
     route_path = getattr(route, "path", None)
     if isinstance(route_path, str) and route_path:
         return route_path
     return "unmatched"
 
 
-class ApiErrorLoggingMiddleware(BaseHTTPMiddleware):
+def _client_host(scope: Mapping[str, Any]) -> str | None:
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+def record_request_metrics(
+    scope: Mapping[str, Any], status_code: int, duration_ms: float
+) -> None:
+    """Record request count, latency and server errors for ``scope``."""
+
+    endpoint = _request_metric_endpoint(scope)
+    metrics.REQUEST_COUNTER.labels(endpoint=endpoint).inc()
+    metrics.REQUEST_LATENCY_MS.labels(endpoint=endpoint).observe(duration_ms)
+    if status_code >= 500:
+        metrics.REQUEST_ERROR_COUNTER.labels(
+            endpoint=endpoint,
+            status_code=str(status_code),
+        ).inc()
+
+
+def log_api_exception(
+    logger: BoundLogger, scope: Mapping[str, Any], exc: BaseException
+) -> None:
+    log_event(
+        logger,
+        "api_exception",
+        method=scope.get("method"),
+        path=scope.get("path"),
+        client_host=_client_host(scope),
+        error=str(exc),
+    )
+
+
+def log_api_error_response(
+    logger: BoundLogger, scope: Mapping[str, Any], status_code: int
+) -> None:
+    log_event(
+        logger,
+        "api_error_response",
+        method=scope.get("method"),
+        path=scope.get("path"),
+        status_code=status_code,
+    )
+
+
+class ApiErrorLoggingMiddleware:
     """Capture unhandled exceptions and 5xx responses for monitoring."""
 
     def __init__(
@@ -33,63 +76,54 @@ class ApiErrorLoggingMiddleware(BaseHTTPMiddleware):
         *,
         logger: BoundLogger | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._logger = logger or get_logger(__name__)
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Any:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Log unexpected exceptions and server error responses."""
 
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] >= 500:
+                log_api_error_response(self._logger, scope, message["status"])
+            await send(message)
+
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            log_event(
-                self._logger,
-                "api_exception",
-                method=request.method,
-                path=request.url.path,
-                client_host=request.client.host if request.client else None,
-                error=str(exc),
-            )
+            log_api_exception(self._logger, scope, exc)
             raise
 
-        if response.status_code >= 500:
-            log_event(
-                self._logger,
-                "api_error_response",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-            )
 
-        return response
+class RequestMetricsMiddleware:
+    """Record Prometheus request metrics for each inbound API call."""
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class RequestMetricsMiddleware(BaseHTTPMiddleware):
-    """Record Prometheus request metrics for each inbound API call."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Any:
         start = perf_counter()
-        status_code: int | None = None
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception:
             status_code = 500
             raise
         finally:
-            duration_ms = (perf_counter() - start) * 1000.0
-            endpoint = _request_metric_endpoint(request)
-            metrics.REQUEST_COUNTER.labels(endpoint=endpoint).inc()
-            metrics.REQUEST_LATENCY_MS.labels(endpoint=endpoint).observe(duration_ms)
-            resolved_status = status_code or 500
-            if resolved_status >= 500:
-                metrics.REQUEST_ERROR_COUNTER.labels(
-                    endpoint=endpoint,
-                    status_code=str(resolved_status),
-                ).inc()
+            record_request_metrics(
+                scope, status_code, (perf_counter() - start) * 1000.0
+            )
@@ -7,44 +7,11 @@ import os
 import re
 import secrets
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable
 from urllib.parse import urlsplit
 
 from fastapi import Request, Response
-
-try:  # pragma: no cover - prefer Starlette when available
-    from starlette.middleware.base import BaseHTTPMiddleware
-except ModuleNotFoundError:  # pragma: no cover - lightweight fallback
-
-    class BaseHTTPMiddleware:  # type: ignore[no-redef]
-        def __init__(self, app: Any) -> None:
-            self.app = app
-
-        async def dispatch(
-            self, request: Request, call_next: Any
-        ) -> Any:  # pragma: no cover
-            return await call_next(request)
-
-        async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
-            request = Request(scope=scope)
-
-            async def call_next(_: Request) -> Response:
-                await self.app(scope, receive, send)
-                return Response()
-
-            response = await self.dispatch(request, call_next)
-            payload = await response.render()
-            await send(
-                {
-                    "type": "http.response.start",
-                    "status": response.status_code,
-                    "headers": [
-                        (k.encode(), v.encode()) for k, v in response.headers.items()
-                    ],
-                }
-            )
-            await send({"type": "http.response.body", "body": payload})
-
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 _SAFE_BROWSER_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
 _NONCE_BYTES = 16
@@ -117,12 +84,11 @@ def _request_is_secure(request: Request) -> bool:
     return False
 
 
-def _is_html_response(response: Response) -> bool:
-    """Return whether the response is HTML and should receive HTML-specific CSP."""
+def _is_html_content_type(content_type: str | None) -> bool:
+    """Return whether ``content_type`` should receive HTML-specific CSP."""
 
-    content_type = response.headers.get("content-type") or response.media_type or ""
-    content_type = content_type.split(";", 1)[0].strip().lower()
-    return content_type in {"text/html", "application/xhtml+xml"}
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    return media_type in {"text/html", "application/xhtml+xml"}
 
 
 def _inject_nonce_into_html(html: str, nonce: str) -> str:
@@ -180,36 +146,70 @@ class SecurityHeadersConfig:
     csp_report_only: bool = False
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Inject standard security headers for every response."""
+class SecurityHeadersMiddleware:
+    """Inject standard security headers for every response.
+
+    Headers are added to the ``http.response.start`` message; only HTML
+    bodies that need a CSP nonce injected are buffered.
+    """
 
     def __init__(
         self,
-        app: Callable[..., Awaitable[Response]],
+        app: ASGIApp,
         *,
         config: SecurityHeadersConfig | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         self._config = config or SecurityHeadersConfig()
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         origin_rejection = self._maybe_reject_cross_site_browser_request(request)
         if origin_rejection is not None:
-            response = origin_rejection
-            self._apply_content_security_policy(response, nonce=None)
-        else:
-            nonce = _generate_csp_nonce()
-            request.state.csp_nonce = nonce
-            request.scope["csp_nonce"] = nonce
-            response = await call_next(request)
-            self._apply_content_security_policy(response, nonce)
-
-        self._apply_transport_security(request, response)
-        headers = response.headers
+            self._apply_headers(request, origin_rejection.headers, nonce=None)
+            await origin_rejection(scope, receive, send)
+            return
+
+        nonce = _generate_csp_nonce()
+        request.state.csp_nonce = nonce
+        scope["csp_nonce"] = nonce
+        pending_start: Message | None = None
+        body_parts: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal pending_start
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if self._apply_headers(request, headers, nonce) and (
+                    "content-encoding" not in headers
+                ):
+                    pending_start = message
+                    return
+            elif message["type"] == "http.response.body" and pending_start:
+                body_parts.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                body = _inject_nonce_into_html(
+                    b"".join(body_parts).decode("utf-8", errors="replace"), nonce
+                ).encode("utf-8")
+                MutableHeaders(scope=pending_start)["content-length"] = str(len(body))
+                await send(pending_start)
+                message = {"type": "http.response.body", "body": body}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _apply_headers(
+        self, request: Request, headers: MutableHeaders, nonce: str | None
+    ) -> bool:
+        """Add security headers; return whether the body needs ``nonce`` injected."""
+
+        inject_nonce = self._apply_content_security_policy(headers, nonce)
+        self._apply_transport_security(request, headers)
 
         headers.setdefault(
             "X-Content-Type-Options", self._config.x_content_type_options
@@ -232,22 +232,26 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 self._config.cross_origin_resource_policy,
             )
 
-        return response
+        return inject_nonce
 
-    def _apply_transport_security(self, request: Request, response: Response) -> None:
+    def _apply_transport_security(
+        self, request: Request, headers: MutableHeaders
+    ) -> None:
         """Apply HSTS only when the request is actually secure."""
 
         hsts_value = self._select_hsts_value(request)
         if hsts_value:
-            response.headers.setdefault("Strict-Transport-Security", hsts_value)
+            headers.setdefault("Strict-Transport-Security", hsts_value)
 
     def _apply_content_security_policy(
         self,
-        response: Response,
+        headers: MutableHeaders,
         nonce: str | None,
-    ) -> None:
-        """Apply the appropriate CSP for HTML vs API responses."""
-        headers = response.headers
+    ) -> bool:
+        """Apply the appropriate CSP for HTML vs API responses.
+
+        Returns whether an HTML body should receive ``nonce`` attributes.
+        """
 
         header_name = (
             "Content-Security-Policy-Report-Only"
@@ -255,34 +259,19 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             else "Content-Security-Policy"
         )
         if header_name in headers:
-            return
+            return False
 
-        if nonce is not None and _is_html_response(response):
+        if nonce is not None and _is_html_content_type(headers.get("content-type")):
             headers[header_name] = self._config.html_content_security_policy.format(
                 nonce=nonce
             )
-            self._inject_nonce_into_response_body(response, nonce)
             if self._config.expose_nonce_header:
                 headers.setdefault("X-CSP-Nonce", nonce)
-            return
+            return True
 
         if self._config.api_content_security_policy:
             headers[header_name] = self._config.api_content_security_policy
-
-    def _inject_nonce_into_response_body(self, response: Response, nonce: str) -> None:
-        """Inject nonce attributes into HTML responses when the body is available."""
-
-        body = getattr(response, "body", None)
-        if not isinstance(body, (bytes, bytearray)):
-            return
-        updated_body = _inject_nonce_into_html(
-            body.decode("utf-8", errors="replace"),
-            nonce,
-        ).encode("utf-8")
-        if updated_body == body:
-            return
-        response.body = updated_body
-        response.headers["content-length"] = str(len(updated_body))
+        return False
 
     def _select_hsts_value(self, request: Request) -> str | None:
         """Choose the appropriate HSTS directive for the configured environment."""
@@ -0,0 +1,111 @@
+"""Pure-ASGI slowapi middleware that is safe for streaming responses.
+
+The responder is adapted from slowapi 0.1.8's ``_ASGIMiddlewareResponder``
+rather than imported, since that class is private. It still reads the
+limiter's route registries and header helper, which is why ``slowapi`` is
+pinned exactly in ``requirements.txt``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from slowapi import Limiter
+from slowapi.middleware import async_check_limits
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _route_handler(app: Any, scope: Scope) -> Callable[..., Any] | None:
+    handler = None
+    for route in app.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL and hasattr(route, "endpoint"):
+            handler = route.endpoint
+    return handler
+
+
+def _is_exempt(limiter: Limiter, handler: Callable[..., Any] | None) -> bool:
+    if handler is None:
+        return True
+    name = f"{handler.__module__}.{handler.__name__}"
+    # Decorated routes are limited by their decorator instead.
+    return name in limiter._exempt_routes or name in limiter._route_limits
+
+
+class _StreamingSafeResponder:
+    """Apply the limiter to one request, injecting headers into the response.
+
+    ``http.response.start`` is held back until the first body chunk so the
+    rate-limit headers can be added, then sent exactly once; slowapi's own
+    responder re-sends it ahead of every chunk, which breaks streaming.
+    """
+
+    def __init__(self, app: ASGIApp, send: Send) -> None:
+        self.app = app
+        self.send = send
+        self.status_code: int | None = None
+        self.limiter: Limiter | None = None
+        self.request: Request | None = None
+        self._initial_message: Message = {}
+        self._start_sent = False
+
+    async def send_wrapper(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._initial_message = message
+            return
+        if message["type"] == "http.response.body" and not self._start_sent:
+            self._start_sent = True
+            if self.status_code is not None:
+                self._initial_message["status"] = self.status_code
+            if self.limiter is not None and self.request is not None:
+                self.limiter._inject_asgi_headers(
+                    MutableHeaders(raw=self._initial_message["headers"]),
+                    self.request.state.view_rate_limit,
+                )
+            await self.send(self._initial_message)
+        await self.send(message)
+
+    async def __call__(self, scope: Scope, receive: Receive) -> None:
+        app = scope["app"]
+        limiter: Limiter = app.state.limiter
+        if not limiter.enabled:
+            await self.app(scope, receive, self.send)
+            return
+
+        handler = _route_handler(app, scope)
+        if _is_exempt(limiter, handler):
+            await self.app(scope, receive, self.send)
+            return
+
+        request = Request(scope, receive=receive, send=self.send)
+        error_response, inject_headers = await async_check_limits(
+            limiter, request, handler, app
+        )
+        if error_response is not None:
+            self.status_code = error_response.status_code
+            await error_response(scope, receive, self.send_wrapper)
+            return
+        if inject_headers:
+            self.limiter = limiter
+            self.request = request
+        await self.app(scope, receive, self.send_wrapper)
+
+
+class SlowAPIASGIMiddleware:
+    """Enforce ``app.state.limiter`` limits without ``BaseHTTPMiddleware``."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        await _StreamingSafeResponder(self.app, send)(scope, receive)
+
+
+__all__ = ["SlowAPIASGIMiddleware"]
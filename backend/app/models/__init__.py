@@ -35,6 +35,7 @@ _MODEL_MODULES: Final[tuple[str, ...]] = (
     "agent_advisory",
     "ai_agents",
     "ai_config",
+    "anomaly",
     "audit",
     "business_performance",
     "deal_outcome",
@@ -46,6 +47,7 @@ _MODEL_MODULES: Final[tuple[str, ...]] = (
     "hong_kong_property",
     "imports",
     "listing_integration",
+    "market",
     "new_zealand_property",
     "overlay",
     "preview",
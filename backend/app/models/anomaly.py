@@ -0,0 +1,48 @@
+"""Persisted anomaly alerts and detection watermarks."""
+
+import uuid
+
+from backend._compat.datetime import utcnow
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, String, Text
+
+from app.models.base import UUID, BaseModel
+
+
+class AnomalyAlertRecord(BaseModel):
+    """An alert raised by the scheduled anomaly detection cycle.
+
+    ``alert_key`` is the rule-generated alert id, unique across rules.
+    ``user_id`` is ``None`` for firm-wide alerts shown to every user.
+    """
+
+    __tablename__ = "anomaly_alerts"
+
+    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+    alert_key = Column(String(255), nullable=False, unique=True)
+    rule_name = Column(String(100), nullable=False, index=True)
+    user_id = Column(UUID(), nullable=True, index=True)
+
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    category = Column(String(50), nullable=False)
+    priority = Column(String(20), nullable=False)
+    entity_type = Column(String(50))
+    entity_id = Column(String(100))
+    data = Column(JSON, default=dict)
+    suggested_actions = Column(JSON, default=list)
+
+    detected_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
+    expires_at = Column(DateTime(timezone=True))
+    acknowledged = Column(Boolean, default=False, nullable=False)
+
+    __table_args__ = (Index("ix_anomaly_alerts_rule_user", "rule_name", "user_id"),)
+
+
+class AnomalyRuleWatermark(BaseModel):
+    """Start time of the last successful detection cycle for one rule."""
+
+    __tablename__ = "anomaly_rule_watermarks"
+
+    rule_name = Column(String(100), primary_key=True)
+    checked_at = Column(DateTime(timezone=True), nullable=False)
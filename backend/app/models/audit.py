@@ -42,4 +42,28 @@ class AuditLog(BaseModel):
     )
 
 
-__all__ = ["AuditLog"]
+class AuditCheckpoint(BaseModel):
+    """Signed Merkle root sealing a contiguous version range of a project ledger."""
+
+    __tablename__ = "audit_checkpoints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    project_id: Mapped[int] = mapped_column(Integer, index=True, nullable=False)
+    start_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    end_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    merkle_root: Mapped[str] = mapped_column(String(64), nullable=False)
+    chain_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    signature: Mapped[str] = mapped_column(String(128), nullable=False)
+    summary: Mapped[dict] = mapped_column(JSONType, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id", "end_version", name="uq_audit_checkpoints_project_end"
+        ),
+    )
+
+
+__all__ = ["AuditCheckpoint", "AuditLog"]
@@ -588,6 +588,40 @@ class AgentPerformanceSnapshot(BaseModel):
     )
 
 
+class AgentDealFeature(BaseModel):
+    """Closed-deal counts per agent, location and deal category.
+
+    Maintained incrementally when a deal's outcome changes so deal scoring can
+    read an agent's track record in one fetch. ``location`` is the property's
+    district (or planning area), empty when the deal has no property.
+    """
+
+    __tablename__ = "agent_deal_features"
+
+    id: Mapped[str] = mapped_column(
+        UUID(), primary_key=True, default=lambda: str(uuid4())
+    )
+    agent_id: Mapped[str] = mapped_column(UUID(), nullable=False, index=True)
+    location: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    asset_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    deal_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    won_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lost_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "agent_id",
+            "location",
+            "asset_type",
+            "deal_type",
+            name="uq_agent_deal_feature_key",
+        ),
+    )
+
+
 class PerformanceBenchmark(BaseModel):
     """Benchmark values for agent performance comparison."""
 
@@ -643,5 +677,6 @@ __all__ = [
     "AgentCommissionRecord",
     "AgentCommissionAdjustment",
     "AgentPerformanceSnapshot",
+    "AgentDealFeature",
     "PerformanceBenchmark",
 ]
@@ -356,6 +356,45 @@ class MarketAlert(BaseModel):
     )
 
 
+class MarketSegmentSnapshot(BaseModel):
+    """Per-quarter transaction aggregates for one market segment.
+
+    PSF sums and counts are stored alongside the averages so quarters can be
+    combined exactly into longer report periods.
+    """
+
+    __tablename__ = "market_segment_snapshots"
+
+    id = Column(UUID(), primary_key=True, default=uuid.uuid4)
+
+    # Segment
+    property_type = Column(String(50), nullable=False)
+    location = Column(String(100), nullable=False)  # District or "all"
+    quarter_start = Column(Date, nullable=False)
+
+    # Aggregates
+    transaction_count = Column(Integer, nullable=False)
+    total_volume = Column(SQLDecimal(18, 2), nullable=False)
+    psf_count = Column(Integer, nullable=False)
+    psf_sum = Column(SQLDecimal(18, 2), nullable=False)
+    psf_median = Column(SQLDecimal(10, 2))
+    psf_min = Column(SQLDecimal(10, 2))
+    psf_max = Column(SQLDecimal(10, 2))
+    buyer_profile = Column(JSON)  # buyer type -> transaction count
+    top_transactions = Column(JSON)  # Largest transactions of the quarter
+
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "property_type",
+            "location",
+            "quarter_start",
+            name="uq_segment_snapshot_quarter",
+        ),
+    )
+
+
 # Backwards compatibility exports for transactional models defined elsewhere.
 from app.models.property import (  # noqa: E402  pylint: disable=wrong-import-position
     MarketTransaction as _MarketTransaction,
@@ -14,7 +14,9 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    event,
 )
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import Enum as SQLEnum
 from sqlalchemy.types import Numeric as SQLDecimal
@@ -161,9 +163,70 @@ class Property(BaseModel):
         Index("idx_property_type_status", "property_type", "status"),
         Index("idx_property_district", "district"),
         Index("idx_property_planning_area", "planning_area"),
+        Index("idx_property_plot_ratio", "plot_ratio"),
+        Index("idx_property_land_area", "land_area_sqm"),
     )
 
 
+# Local SQLite databases index property text in an FTS5 trigram table, kept in
+# sync by triggers, standing in for the Postgres search_vector and pg_trgm
+# indexes added by migration 20261018_000047.
+PROPERTY_SEARCH_FTS_TABLE = "properties_fts"
+_FTS_COLUMNS = "name, address, district, planning_area"
+_SQLITE_PROPERTY_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {PROPERTY_SEARCH_FTS_TABLE} USING fts5("
+    f"property_id UNINDEXED, {_FTS_COLUMNS}, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_insert AFTER INSERT ON properties "
+    f"BEGIN INSERT INTO {PROPERTY_SEARCH_FTS_TABLE} (property_id, {_FTS_COLUMNS}) "
+    "VALUES (new.id, new.name, new.address, new.district, new.planning_area); END",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_update "
+    f"AFTER UPDATE OF {_FTS_COLUMNS} ON properties BEGIN "
+    f"DELETE FROM {PROPERTY_SEARCH_FTS_TABLE} WHERE property_id = old.id; "
+    f"INSERT INTO {PROPERTY_SEARCH_FTS_TABLE} (property_id, {_FTS_COLUMNS}) "
+    "VALUES (new.id, new.name, new.address, new.district, new.planning_area); END",
+    "CREATE TRIGGER IF NOT EXISTS properties_fts_delete AFTER DELETE ON properties "
+    f"BEGIN DELETE FROM {PROPERTY_SEARCH_FTS_TABLE} WHERE property_id = old.id; END",
+)
+
+
+# Tables created from metadata on Postgres (seed scripts) get the keyword
+# search column too; the pg_trgm indexes stay with the migration, since ILIKE
+# works without them.
+_POSTGRES_PROPERTY_SEARCH_DDL = (
+    "ALTER TABLE properties ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || coalesce(address, '') || ' ' || "
+    "coalesce(district, '') || ' ' || coalesce(planning_area, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS idx_property_search_vector "
+    "ON properties USING gin (search_vector)",
+)
+
+
+def _create_search_index(target, connection, **kw) -> None:
+    if connection.dialect.name == "postgresql":
+        for statement in _POSTGRES_PROPERTY_SEARCH_DDL:
+            connection.exec_driver_sql(statement)
+        return
+    if connection.dialect.name != "sqlite":
+        return
+    try:
+        for statement in _SQLITE_PROPERTY_SEARCH_DDL:
+            connection.exec_driver_sql(statement)
+    except OperationalError:
+        # SQLite builds without FTS5 or the trigram tokenizer (< 3.34) keep
+        # working; property search falls back to LIKE when the table is absent.
+        pass
+
+
+def _drop_sqlite_search_index(target, connection, **kw) -> None:
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {PROPERTY_SEARCH_FTS_TABLE}")
+
+
+event.listen(Property.__table__, "after_create", _create_search_index)
+event.listen(Property.__table__, "after_drop", _drop_sqlite_search_index)
+
+
 class MarketTransaction(BaseModel):
     """Historical property transaction records."""
 
@@ -200,11 +263,20 @@ class MarketTransaction(BaseModel):
 
     # Data Quality
     data_source = Column(String(50), nullable=False)
+    source_record_id = Column(String(100))  # Provider's transaction identifier
+    synced_at = Column(DateTime(timezone=True), default=utcnow)  # Last provider write
     confidence_score = Column(SQLDecimal(3, 2))  # 0-1 confidence in data accuracy
 
     __table_args__ = (
         Index("idx_transaction_date", "transaction_date"),
         Index("idx_transaction_property_date", "property_id", "transaction_date"),
+        Index(
+            "uq_transaction_source_record",
+            "data_source",
+            "source_record_id",
+            unique=True,
+        ),
+        Index("idx_transaction_synced_at", "synced_at"),
     )
 
 
@@ -247,11 +319,18 @@ class RentalListing(BaseModel):
 
     # Data Source
     listing_source = Column(String(50))
+    source_record_id = Column(String(100))  # Provider's listing identifier
     agent_company = Column(String(255))
 
     __table_args__ = (
         Index("idx_rental_active", "is_active"),
         Index("idx_rental_property_active", "property_id", "is_active"),
+        Index(
+            "uq_rental_source_record",
+            "listing_source",
+            "source_record_id",
+            unique=True,
+        ),
     )
 
 
@@ -153,6 +153,19 @@ class DealScoreResponse(BaseModel):
     scored_at: datetime
 
 
+class DealScoreBatchRequest(BaseModel):
+    """Request for scoring a page of deals."""
+
+    deal_ids: list[str] = Field(..., min_length=1, max_length=500)
+
+
+class DealScoreBatchResponse(BaseModel):
+    """Scores for a page of deals."""
+
+    scores: list[DealScoreResponse]
+    missing_deal_ids: list[str] = Field(default_factory=list)
+
+
 # ============================================================================
 # Scenario Optimizer Schemas
 # ============================================================================
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -36,6 +36,8 @@ class MarketReportResponse(BaseModel):
 
     report: MarketReportPayload
     generated_at: datetime
+    # When set, comparables were served from segment snapshots of this age
+    snapshot_refreshed_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -92,75 +92,161 @@ def _get_font(size: int) -> ImageFont.FreeTypeFont:
     return ImageFont.load_default()
 
 
-def apply_watermark(
-    image_data: bytes,
+def watermark_image(
+    img: "Image.Image",
     text: str = DEFAULT_WATERMARK_TEXT,
     position: str = "bottom-right",
     opacity: int = WATERMARK_OPACITY,
-) -> bytes:
+) -> "Image.Image":
     """
-    Apply a text watermark to an image.
+    Apply a text watermark to a decoded image.
 
     Args:
-        image_data: Raw image bytes (JPEG, PNG, etc.)
+        img: PIL image; it is not modified
         text: Watermark text to apply
         position: Position of watermark ("bottom-right", "bottom-left",
                   "top-right", "top-left", "center", "diagonal")
         opacity: Watermark opacity (0-255, default 128 = 50%)
 
     Returns:
-        Watermarked image as JPEG bytes
+        Watermarked RGB image
     """
-    if Image is None:
-        logger.warning("PIL not available, returning original image")
-        return image_data
+    # Convert to RGBA for transparency support
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
 
-    try:
-        # Open the image
-        img = Image.open(BytesIO(image_data))
+    # Create a transparent overlay for the watermark
+    watermark_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(watermark_layer)
+
+    # Calculate font size based on image dimensions
+    font_size = max(16, int(img.width * WATERMARK_FONT_SIZE_RATIO))
+    font = _get_font(font_size)
+
+    # Get text bounding box
+    bbox = draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    # Calculate position
+    x, y = _calculate_position(
+        img.size, (text_width, text_height), position, WATERMARK_PADDING
+    )
+
+    # Draw shadow (offset by 2 pixels)
+    shadow_color = (*WATERMARK_SHADOW_COLOR, opacity)
+    draw.text((x + 2, y + 2), text, font=font, fill=shadow_color)
+
+    # Draw main watermark text
+    watermark_color = (*WATERMARK_COLOR, opacity)
+    draw.text((x, y), text, font=font, fill=watermark_color)
+
+    # Composite the watermark onto the original image
+    watermarked = Image.alpha_composite(img, watermark_layer)
+
+    # Convert back to RGB for JPEG output
+    return watermarked.convert("RGB")
+
+
+def diagonal_watermark_image(
+    img: "Image.Image",
+    text: str = DEFAULT_WATERMARK_TEXT,
+    opacity: int = WATERMARK_OPACITY,
+    repeat: bool = True,
+) -> "Image.Image":
+    """
+    Apply a diagonal watermark pattern across a decoded image.
+
+    Args:
+        img: PIL image; it is not modified
+        text: Watermark text
+        opacity: Watermark opacity (0-255)
+        repeat: If True, repeat the watermark across the image
+
+    Returns:
+        Watermarked RGB image
+    """
+    if img.mode != "RGBA":
+        img = img.convert("RGBA")
 
-        # Convert to RGBA for transparency support
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
+    # Create watermark layer
+    watermark_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
 
-        # Create a transparent overlay for the watermark
-        watermark_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(watermark_layer)
+    # Calculate font size - larger for diagonal watermarks
+    font_size = max(24, int(img.width * 0.04))
+    font = _get_font(font_size)
 
-        # Calculate font size based on image dimensions
-        font_size = max(16, int(img.width * WATERMARK_FONT_SIZE_RATIO))
-        font = _get_font(font_size)
+    # Create a temporary image to get text dimensions
+    temp_draw = ImageDraw.Draw(watermark_layer)
+    bbox = temp_draw.textbbox((0, 0), text, font=font)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
 
-        # Get text bounding box
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+    # Create canvas for the text (will be rotated after)
+    text_img = Image.new("RGBA", (text_width + 50, text_height + 20), (0, 0, 0, 0))
+    text_draw = ImageDraw.Draw(text_img)
 
-        # Calculate position
-        x, y = _calculate_position(
-            img.size, (text_width, text_height), position, WATERMARK_PADDING
-        )
+    # Draw text with shadow
+    shadow_color = (*WATERMARK_SHADOW_COLOR, min(opacity, 100))
+    text_draw.text((27, 12), text, font=font, fill=shadow_color)
 
-        # Draw shadow (offset by 2 pixels)
-        shadow_color = (*WATERMARK_SHADOW_COLOR, opacity)
-        draw.text((x + 2, y + 2), text, font=font, fill=shadow_color)
+    watermark_color = (*WATERMARK_COLOR, opacity)
+    text_draw.text((25, 10), text, font=font, fill=watermark_color)
 
-        # Draw main watermark text
-        watermark_color = (*WATERMARK_COLOR, opacity)
-        draw.text((x, y), text, font=font, fill=watermark_color)
+    # Rotate the text
+    rotated_text = text_img.rotate(45, expand=True, resample=Image.Resampling.BICUBIC)
 
-        # Composite the watermark onto the original image
-        watermarked = Image.alpha_composite(img, watermark_layer)
+    if repeat:
+        # Tile the watermark across the image
+        spacing_x = rotated_text.width + 100
+        spacing_y = rotated_text.height + 100
 
-        # Convert back to RGB for JPEG output
-        watermarked_rgb = watermarked.convert("RGB")
+        for y in range(-spacing_y, img.height + spacing_y, spacing_y):
+            for x in range(-spacing_x, img.width + spacing_x, spacing_x):
+                watermark_layer.paste(rotated_text, (x, y), rotated_text)
+    else:
+        # Single centered diagonal watermark
+        x = (img.width - rotated_text.width) // 2
+        y = (img.height - rotated_text.height) // 2
+        watermark_layer.paste(rotated_text, (x, y), rotated_text)
 
-        # Save to bytes
-        output = BytesIO()
-        watermarked_rgb.save(output, format="JPEG", quality=90)
-        output.seek(0)
+    # Composite
+    watermarked = Image.alpha_composite(img, watermark_layer)
+    return watermarked.convert("RGB")
 
-        return output.getvalue()
+
+def _to_jpeg_bytes(img: "Image.Image") -> bytes:
+    output = BytesIO()
+    img.save(output, format="JPEG", quality=90)
+    return output.getvalue()
+
+
+def apply_watermark(
+    image_data: bytes,
+    text: str = DEFAULT_WATERMARK_TEXT,
+    position: str = "bottom-right",
+    opacity: int = WATERMARK_OPACITY,
+) -> bytes:
+    """
+    Apply a text watermark to an image.
+
+    Args:
+        image_data: Raw image bytes (JPEG, PNG, etc.)
+        text: Watermark text to apply
+        position: Position of watermark ("bottom-right", "bottom-left",
+                  "top-right", "top-left", "center", "diagonal")
+        opacity: Watermark opacity (0-255, default 128 = 50%)
+
+    Returns:
+        Watermarked image as JPEG bytes
+    """
+    if Image is None:
+        logger.warning("PIL not available, returning original image")
+        return image_data
+
+    try:
+        img = Image.open(BytesIO(image_data))
+        return _to_jpeg_bytes(watermark_image(img, text, position, opacity))
 
     except Exception as e:
         logger.error(f"Failed to apply watermark: {str(e)}")
@@ -193,63 +279,8 @@ def apply_diagonal_watermark(
         return image_data
 
     try:
-        # Open and convert to RGBA
         img = Image.open(BytesIO(image_data))
-        if img.mode != "RGBA":
-            img = img.convert("RGBA")
-
-        # Create watermark layer
-        watermark_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
-
-        # Calculate font size - larger for diagonal watermarks
-        font_size = max(24, int(img.width * 0.04))
-        font = _get_font(font_size)
-
-        # Create a temporary image to get text dimensions
-        temp_draw = ImageDraw.Draw(watermark_layer)
-        bbox = temp_draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        # Create canvas for the text (will be rotated after)
-        text_img = Image.new("RGBA", (text_width + 50, text_height + 20), (0, 0, 0, 0))
-        text_draw = ImageDraw.Draw(text_img)
-
-        # Draw text with shadow
-        shadow_color = (*WATERMARK_SHADOW_COLOR, min(opacity, 100))
-        text_draw.text((27, 12), text, font=font, fill=shadow_color)
-
-        watermark_color = (*WATERMARK_COLOR, opacity)
-        text_draw.text((25, 10), text, font=font, fill=watermark_color)
-
-        # Rotate the text
-        rotated_text = text_img.rotate(
-            45, expand=True, resample=Image.Resampling.BICUBIC
-        )
-
-        if repeat:
-            # Tile the watermark across the image
-            spacing_x = rotated_text.width + 100
-            spacing_y = rotated_text.height + 100
-
-            for y in range(-spacing_y, img.height + spacing_y, spacing_y):
-                for x in range(-spacing_x, img.width + spacing_x, spacing_x):
-                    watermark_layer.paste(rotated_text, (x, y), rotated_text)
-        else:
-            # Single centered diagonal watermark
-            x = (img.width - rotated_text.width) // 2
-            y = (img.height - rotated_text.height) // 2
-            watermark_layer.paste(rotated_text, (x, y), rotated_text)
-
-        # Composite
-        watermarked = Image.alpha_composite(img, watermark_layer)
-        watermarked_rgb = watermarked.convert("RGB")
-
-        output = BytesIO()
-        watermarked_rgb.save(output, format="JPEG", quality=90)
-        output.seek(0)
-
-        return output.getvalue()
+        return _to_jpeg_bytes(diagonal_watermark_image(img, text, opacity, repeat))
 
     except Exception as e:
         logger.error(f"Failed to apply diagonal watermark: {str(e)}")
@@ -311,6 +342,8 @@ def should_apply_watermark(
 __all__ = [
     "apply_watermark",
     "apply_diagonal_watermark",
+    "watermark_image",
+    "diagonal_watermark_image",
     "should_apply_watermark",
     "get_watermark_text_for_phase",
     "PropertyPhase",
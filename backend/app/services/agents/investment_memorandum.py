@@ -8,7 +8,6 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     Flowable,
@@ -16,7 +15,6 @@ from reportlab.platypus import (
     ListItem,
     PageBreak,
     Paragraph,
-    SimpleDocTemplate,
     Spacer,
     Table,
     TableStyle,
@@ -26,7 +24,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.market import MarketCycle, YieldBenchmark
 from app.models.property import MarketTransaction, Property, RentalListing
-from app.services.agents.pdf_generator import CoverPage, PageNumberCanvas, PDFGenerator
+from app.services.agents.pdf_generator import CoverPage, PDFGenerator
 from app.services.finance import (
     calculate_comprehensive_metrics,
     value_property_multiple_approaches,
@@ -84,19 +82,6 @@ class InvestmentMemorandumGenerator(PDFGenerator):  # type: ignore[misc]
             property_data["property"], session
         )
 
-        # Create PDF buffer
-        buffer = io.BytesIO()
-
-        # Create document with custom settings
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=inch,
-            bottomMargin=inch,
-        )
-
         # Build content
         story = []
 
@@ -150,20 +135,16 @@ class InvestmentMemorandumGenerator(PDFGenerator):  # type: ignore[misc]
         # 12. Appendices
         story.extend(self._create_appendices())
 
-        # Build PDF
-        doc.build(
+        # Build PDF off the event loop
+        return await self._render_story(
             story,
-            canvasmaker=lambda *args, **kwargs: PageNumberCanvas(
-                *args,
-                company_name="Commercial Property Advisors",
-                document_title="Investment Memorandum",
-                **kwargs,
-            ),
+            "Investment Memorandum",
+            rightMargin=0.75 * inch,
+            leftMargin=0.75 * inch,
+            topMargin=inch,
+            bottomMargin=inch,
         )
 
-        buffer.seek(0)
-        return buffer
-
     async def _load_property_data(
         self, property_id: UUID, session: AsyncSession
     ) -> Dict[str, Any]:
@@ -316,6 +297,9 @@ class InvestmentMemorandumGenerator(PDFGenerator):  # type: ignore[misc]
 
     def _create_table_of_contents(self) -> List[Any]:
         """Create table of contents."""
+        return self._cached_section("table_of_contents", self._build_table_of_contents)
+
+    def _build_table_of_contents(self) -> List[Any]:
         story = []
 
         story.append(Paragraph("TABLE OF CONTENTS", self.styles["CustomTitle"]))
@@ -984,6 +968,9 @@ class InvestmentMemorandumGenerator(PDFGenerator):  # type: ignore[misc]
 
     def _create_appendices(self) -> List[Any]:
         """Create appendices with disclaimers."""
+        return self._cached_section("appendices", self._build_appendices)
+
+    def _build_appendices(self) -> List[Any]:
         story = []
 
         story.append(self._create_header_table("APPENDICES"))
@@ -0,0 +1,299 @@
+"""Set-based transaction aggregates for market intelligence reports.
+
+On PostgreSQL the aggregates (percentiles, quarterly buckets) run in SQL so a
+report only transfers one row per quarter. Other dialects fetch just the
+numeric columns and aggregate them with NumPy, or in plain Python when NumPy
+is not installed; neither path hydrates ``MarketTransaction`` ORM objects.
+"""
+
+from __future__ import annotations
+
+import statistics
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Sequence
+
+np: Any = None
+try:  # pragma: no cover - optional dependency
+    import numpy as _np
+except ModuleNotFoundError:  # pragma: no cover - fallback when numpy missing
+    pass
+else:
+    np = _np
+from sqlalchemy import ColumnElement, Select, desc, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.property import MarketTransaction, Property, PropertyType
+
+
+@dataclass(frozen=True)
+class TransactionAggregates:
+    """Summary statistics over the transactions matching a report's filters.
+
+    PSF statistics ignore transactions without a PSF price (NULL or zero).
+    ``quarterly`` maps ``"YYYY-Qn"`` keys, in chronological order, to
+    ``count``, ``total_volume``, ``avg_psf`` and, when the same quarter of
+    the previous year is present, ``yoy_psf_change_pct``.
+    """
+
+    count: int
+    total_volume: float = 0.0
+    psf_count: int = 0
+    average_psf: float = 0.0
+    median_psf: float = 0.0
+    min_psf: float = 0.0
+    max_psf: float = 0.0
+    quarterly: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def transaction_filters(
+    property_type: PropertyType, location: str, period: tuple[date, date]
+) -> list[ColumnElement[bool]]:
+    """Return the report filters; callers must join ``Property``."""
+
+    filters = [
+        Property.property_type == property_type,
+        MarketTransaction.transaction_date.between(period[0], period[1]),
+    ]
+    if location != "all":
+        filters.append(Property.district == location)
+    return filters
+
+
+def _from_transactions(stmt: Select[Any], filters: list[Any]) -> Select[Any]:
+    return stmt.join(Property, MarketTransaction.property_id == Property.id).where(
+        *filters
+    )
+
+
+def _quarter_key(year: int, quarter: int) -> str:
+    return f"{year}-Q{quarter}"
+
+
+def add_yoy_changes(quarterly: dict[tuple[int, int], dict[str, Any]]) -> None:
+    """Add ``yoy_psf_change_pct`` to buckets keyed by ``(year, quarter)``."""
+
+    for (year, quarter), bucket in quarterly.items():
+        previous = quarterly.get((year - 1, quarter))
+        if previous and previous["avg_psf"]:
+            bucket["yoy_psf_change_pct"] = (
+                (bucket["avg_psf"] - previous["avg_psf"]) / previous["avg_psf"] * 100
+            )
+
+
+def _keyed(quarterly: dict[tuple[int, int], dict[str, Any]]) -> dict[str, Any]:
+    add_yoy_changes(quarterly)
+    return {_quarter_key(*key): quarterly[key] for key in sorted(quarterly)}
+
+
+async def _sql_aggregates(
+    session: AsyncSession, filters: list[Any]
+) -> TransactionAggregates:
+    psf = func.nullif(MarketTransaction.psf_price, 0)
+    totals = (
+        await session.execute(
+            _from_transactions(
+                select(
+                    func.count(),
+                    func.sum(MarketTransaction.sale_price),
+                    func.avg(psf),
+                    func.percentile_cont(0.5).within_group(psf),
+                    func.min(psf),
+                    func.max(psf),
+                    func.count(psf),
+                ),
+                filters,
+            )
+        )
+    ).one()
+    count = int(totals[0] or 0)
+    if not count:
+        return TransactionAggregates(count=0)
+
+    year = extract("year", MarketTransaction.transaction_date)
+    quarter = extract("quarter", MarketTransaction.transaction_date)
+    buckets = await session.execute(
+        _from_transactions(
+            select(
+                year,
+                quarter,
+                func.count(),
+                func.sum(MarketTransaction.sale_price),
+                func.avg(psf),
+            ),
+            filters,
+        ).group_by(year, quarter)
+    )
+    quarterly = {
+        (int(row[0]), int(row[1])): {
+            "count": int(row[2]),
+            "total_volume": float(row[3] or 0),
+            "avg_psf": float(row[4] or 0),
+        }
+        for row in buckets
+    }
+    return TransactionAggregates(
+        count=count,
+        total_volume=float(totals[1] or 0),
+        psf_count=int(totals[6] or 0),
+        average_psf=float(totals[2] or 0),
+        median_psf=float(totals[3] or 0),
+        min_psf=float(totals[4] or 0),
+        max_psf=float(totals[5] or 0),
+        quarterly=_keyed(quarterly),
+    )
+
+
+async def _columnar_aggregates(
+    session: AsyncSession, filters: list[Any]
+) -> TransactionAggregates:
+    rows = (
+        await session.execute(
+            _from_transactions(
+                select(
+                    MarketTransaction.transaction_date,
+                    MarketTransaction.sale_price,
+                    MarketTransaction.psf_price,
+                ),
+                filters,
+            )
+        )
+    ).all()
+    if not rows:
+        return TransactionAggregates(count=0)
+    if np is None:
+        return _python_aggregates(rows)
+
+    count = len(rows)
+    quarters = np.fromiter(
+        (row[0].year * 4 + (row[0].month - 1) // 3 for row in rows),
+        dtype=np.int64,
+        count=count,
+    )
+    sale = np.fromiter((float(row[1]) for row in rows), dtype=np.float64, count=count)
+    psf = np.fromiter(
+        (float(row[2]) if row[2] else np.nan for row in rows),
+        dtype=np.float64,
+        count=count,
+    )
+    has_psf = ~np.isnan(psf)
+    valid_psf = psf[has_psf]
+
+    keys, inverse = np.unique(quarters, return_inverse=True)
+    counts = np.bincount(inverse)
+    volumes = np.bincount(inverse, weights=sale)
+    psf_counts = np.bincount(inverse[has_psf], minlength=len(keys))
+    psf_sums = np.bincount(inverse[has_psf], weights=valid_psf, minlength=len(keys))
+
+    quarterly = {
+        (int(key) // 4, int(key) % 4 + 1): {
+            "count": int(counts[index]),
+            "total_volume": float(volumes[index]),
+            "avg_psf": (
+                float(psf_sums[index] / psf_counts[index]) if psf_counts[index] else 0
+            ),
+        }
+        for index, key in enumerate(keys)
+    }
+    has_any_psf = bool(valid_psf.size)
+    return TransactionAggregates(
+        count=count,
+        total_volume=float(sale.sum()),
+        psf_count=int(valid_psf.size),
+        average_psf=float(valid_psf.mean()) if has_any_psf else 0,
+        median_psf=float(np.median(valid_psf)) if has_any_psf else 0,
+        min_psf=float(valid_psf.min()) if has_any_psf else 0,
+        max_psf=float(valid_psf.max()) if has_any_psf else 0,
+        quarterly=_keyed(quarterly),
+    )
+
+
+def _python_aggregates(rows: Sequence[Any]) -> TransactionAggregates:
+    """Aggregate fetched ``(date, sale_price, psf_price)`` rows without NumPy."""
+
+    quarterly: dict[tuple[int, int], dict[str, Any]] = {}
+    psf_by_quarter: dict[tuple[int, int], list[float]] = {}
+    valid_psf: list[float] = []
+    total_volume = 0.0
+    for transaction_date, sale_price, psf_price in rows:
+        key = (transaction_date.year, (transaction_date.month - 1) // 3 + 1)
+        bucket = quarterly.setdefault(key, {"count": 0, "total_volume": 0.0})
+        bucket["count"] += 1
+        bucket["total_volume"] += float(sale_price)
+        total_volume += float(sale_price)
+        bucket_psf = psf_by_quarter.setdefault(key, [])
+        if psf_price:
+            bucket_psf.append(float(psf_price))
+            valid_psf.append(float(psf_price))
+    for key, bucket in quarterly.items():
+        bucket_psf = psf_by_quarter[key]
+        bucket["avg_psf"] = sum(bucket_psf) / len(bucket_psf) if bucket_psf else 0
+
+    return TransactionAggregates(
+        count=len(rows),
+        total_volume=total_volume,
+        psf_count=len(valid_psf),
+        average_psf=statistics.fmean(valid_psf) if valid_psf else 0,
+        median_psf=statistics.median(valid_psf) if valid_psf else 0,
+        min_psf=min(valid_psf, default=0),
+        max_psf=max(valid_psf, default=0),
+        quarterly=_keyed(quarterly),
+    )
+
+
+def _dialect_name(session: AsyncSession) -> str:
+    bind = session.get_bind()
+    return bind.dialect.name if bind is not None else ""
+
+
+async def transaction_aggregates(
+    session: AsyncSession, filters: list[Any]
+) -> TransactionAggregates:
+    """Aggregate the transactions matching ``filters``."""
+
+    if _dialect_name(session) == "postgresql":
+        return await _sql_aggregates(session, filters)
+    return await _columnar_aggregates(session, filters)
+
+
+async def top_transactions(
+    session: AsyncSession, filters: list[Any], limit: int = 5
+) -> list[dict[str, Any]]:
+    """Return the ``limit`` largest transactions by sale price."""
+
+    rows = await session.execute(
+        _from_transactions(
+            select(
+                MarketTransaction.transaction_date,
+                Property.name,
+                MarketTransaction.sale_price,
+                MarketTransaction.psf_price,
+                MarketTransaction.buyer_type,
+            ),
+            filters,
+        )
+        .order_by(desc(MarketTransaction.sale_price))
+        .limit(limit)
+    )
+    return [
+        {
+            "date": row.transaction_date.isoformat(),
+            "property_name": row.name or "Unknown",
+            "price": float(row.sale_price),
+            "psf": float(row.psf_price) if row.psf_price else None,
+            "buyer_type": row.buyer_type,
+        }
+        for row in rows
+    ]
+
+
+async def buyer_profile(session: AsyncSession, filters: list[Any]) -> dict[str, int]:
+    """Count matching transactions per buyer type."""
+
+    buyer_type = func.coalesce(func.nullif(MarketTransaction.buyer_type, ""), "Unknown")
+    rows = await session.execute(
+        _from_transactions(select(buyer_type, func.count()), filters).group_by(
+            buyer_type
+        )
+    )
+    return {str(name): int(total) for name, total in rows}
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import random
 from abc import ABC, abstractmethod
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
 
 import structlog
 from backend._compat.datetime import utcnow
-from sqlalchemy import insert, select
+from sqlalchemy import func, insert, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,6 +22,53 @@ from app.models.property import MarketTransaction, Property, PropertyType, Renta
 
 logger = structlog.get_logger()
 
+# Rows per multi-row INSERT; keeps each statement well under the bind
+# parameter limits of asyncpg (32767) and SQLite (32766).
+DEFAULT_SYNC_BATCH_SIZE = 1000
+
+_PROPERTY_TYPE_MAP = {
+    "office": PropertyType.OFFICE,
+    "retail": PropertyType.RETAIL,
+    "residential": PropertyType.RESIDENTIAL,
+    "industrial": PropertyType.INDUSTRIAL,
+}
+
+
+def _chunks(rows: List[Any], size: int) -> Iterable[List[Any]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _property_name(data: Dict[str, Any]) -> str:
+    return data.get("property_name", "Unknown Property")
+
+
+def _new_property_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the ``properties`` row created for an unseen provider property."""
+
+    property_name = _property_name(data)
+
+    # Create mock location (in production, geocode the address)
+    lat = 1.3521 + random.uniform(-0.1, 0.1)  # Singapore latitude
+    lon = 103.8198 + random.uniform(-0.1, 0.1)  # Singapore longitude
+
+    return {
+        "id": uuid4(),
+        "name": property_name,
+        "address": data.get("address", property_name),
+        "property_type": _PROPERTY_TYPE_MAP.get(
+            data.get("property_type", "office").lower(), PropertyType.OFFICE
+        ),
+        "location": f"POINT({lon} {lat})",
+        "district": data.get("district"),
+        "gross_floor_area_sqm": (
+            Decimal(str(data.get("floor_area_sqm", 0)))
+            if data.get("floor_area_sqm")
+            else None
+        ),
+        "data_source": "market_sync",
+    }
+
 
 class MarketDataProvider(ABC):
     """Abstract base class for market data providers."""
@@ -57,7 +107,7 @@ class MockMarketDataProvider(MarketDataProvider):
 
             transactions.append(
                 {
-                    "transaction_id": f"MOCK-{i}",
+                    "transaction_id": f"MOCK-{property_type}-{i}",
                     "property_name": f"Mock Building {i}",
                     "property_type": property_type,
                     "transaction_date": transaction_date.isoformat(),
@@ -87,7 +137,7 @@ class MockMarketDataProvider(MarketDataProvider):
 
             rentals.append(
                 {
-                    "listing_id": f"RENT-{i}",
+                    "listing_id": f"RENT-{property_type}-{i}",
                     "property_name": f"Mock Building {i}",
                     "property_type": property_type,
                     "listing_date": listing_date.isoformat(),
@@ -135,11 +185,12 @@ class MockMarketDataProvider(MarketDataProvider):
 class MarketDataService:
     """Service for managing market data synchronization and storage."""
 
-    def __init__(self) -> None:
+    def __init__(self, batch_size: int = DEFAULT_SYNC_BATCH_SIZE) -> None:
         self.providers: Dict[str, MarketDataProvider] = {
             "mock": MockMarketDataProvider()
         }
         self.sync_history: Dict[str, datetime] = {}
+        self.batch_size = batch_size
 
     def register_provider(self, name: str, provider: MarketDataProvider) -> None:
         """Register a data provider."""
@@ -178,8 +229,13 @@ class MarketDataService:
         session: AsyncSession,
         property_types: Optional[List[PropertyType]] = None,
     ) -> Dict[str, Any]:
-        """Sync data from a specific provider."""
+        """Sync data from a specific provider.
+
+        The payload's ``throughput`` entry reports the rows written and the
+        rows per second of the transaction and rental stores.
+        """
         sync_start = utcnow()
+        store_seconds = 0.0
 
         if not property_types:
             property_types = list(PropertyType)
@@ -201,9 +257,11 @@ class MarketDataService:
                     }
                 )
 
+                started = perf_counter()
                 stored = await self._store_transactions(
                     transactions, provider_name, session
                 )
+                store_seconds += perf_counter() - started
                 sync_results["transactions"] = (
                     int(sync_results["transactions"]) + stored
                 )
@@ -216,7 +274,9 @@ class MarketDataService:
                     }
                 )
 
+                started = perf_counter()
                 stored = await self._store_rentals(rentals, provider_name, session)
+                store_seconds += perf_counter() - started
                 sync_results["rentals"] = int(sync_results["rentals"]) + stored
 
             except Exception as e:
@@ -247,11 +307,22 @@ class MarketDataService:
 
         status = "error" if sync_results["errors"] else "success"
 
+        rows = int(sync_results["transactions"]) + int(sync_results["rentals"])
+        throughput = {
+            "rows": rows,
+            "store_seconds": round(store_seconds, 3),
+            "rows_per_second": (
+                round(rows / store_seconds, 1) if store_seconds > 0 else 0.0
+            ),
+        }
+        logger.info("market_data_sync_throughput", provider=provider_name, **throughput)
+
         payload = {
             "status": status,
             "provider": provider_name,
             "sync_time": sync_start.isoformat(),
             "results": sync_results,
+            "throughput": throughput,
         }
 
         if sync_results["errors"]:
@@ -262,92 +333,188 @@ class MarketDataService:
     async def _store_transactions(
         self, transactions: List[Dict[str, Any]], source: str, session: AsyncSession
     ) -> int:
-        """Store transaction data in database."""
-        stored = 0
-
-        for txn_data in transactions:
-            try:
-                # Find or create property
-                property_id = await self._get_or_create_property(txn_data, session)
-
-                # Prepare transaction record
-                transaction = {
-                    "property_id": property_id,
-                    "transaction_date": datetime.fromisoformat(
-                        txn_data["transaction_date"]
-                    ).date(),
-                    "transaction_type": txn_data.get("transaction_type", "sale"),
-                    "sale_price": Decimal(str(txn_data["sale_price"])),
-                    "psf_price": Decimal(str(txn_data.get("psf_price", 0))),
-                    "buyer_type": txn_data.get("buyer_type"),
-                    "floor_area_sqm": Decimal(str(txn_data.get("floor_area_sqm", 0))),
-                    "data_source": source,
-                }
+        """Store transaction data in database.
 
-                # Upsert transaction
-                if self._dialect_name(session) == "postgresql":
-                    stmt = pg_insert(MarketTransaction).values(**transaction)
-                    stmt = stmt.on_conflict_do_nothing()
-                else:
-                    stmt = insert(MarketTransaction).values(**transaction)
-
-                await session.execute(stmt)
-                stored += 1
+        Rows are written in batches: properties for the whole batch are
+        resolved together, then transactions are upserted on the provider's
+        ``transaction_id`` with one multi-row statement.
+        """
+        stored = 0
 
-            except Exception as e:
-                logger.error(f"Error storing transaction: {str(e)}")
+        synced_at = utcnow()
+
+        for batch in _chunks(transactions, self.batch_size):
+            property_ids = await self._resolve_property_ids(batch, session)
+            records: Dict[Any, Dict[str, Any]] = {}
+
+            for txn_data in batch:
+                try:
+                    transaction = {
+                        "property_id": property_ids[_property_name(txn_data)],
+                        "transaction_date": datetime.fromisoformat(
+                            txn_data["transaction_date"]
+                        ).date(),
+                        "transaction_type": txn_data.get("transaction_type", "sale"),
+                        "sale_price": Decimal(str(txn_data["sale_price"])),
+                        "psf_price": Decimal(str(txn_data.get("psf_price", 0))),
+                        "buyer_type": txn_data.get("buyer_type"),
+                        "floor_area_sqm": Decimal(
+                            str(txn_data.get("floor_area_sqm", 0))
+                        ),
+                        "data_source": source,
+                        "source_record_id": txn_data.get("transaction_id"),
+                        "synced_at": synced_at,
+                    }
+                except Exception as e:
+                    logger.error(f"Error storing transaction: {str(e)}")
+                    continue
+
+                # Later rows for the same provider record supersede earlier ones.
+                key = transaction["source_record_id"] or len(records)
+                records[key] = transaction
+
+            stored += await self._upsert_rows(
+                session,
+                MarketTransaction,
+                list(records.values()),
+                ["data_source", "source_record_id"],
+                "transaction",
+            )
 
         return stored
 
     async def _store_rentals(
         self, rentals: List[Dict[str, Any]], source: str, session: AsyncSession
     ) -> int:
-        """Store rental listing data."""
+        """Store rental listing data.
+
+        Batched like :meth:`_store_transactions`, keyed on ``listing_id``.
+        """
         stored = 0
 
-        for rental_data in rentals:
-            try:
-                # Find or create property
-                property_id = await self._get_or_create_property(rental_data, session)
-
-                # Prepare rental record
-                rental = {
-                    "property_id": property_id,
-                    "listing_date": datetime.fromisoformat(
-                        rental_data["listing_date"]
-                    ).date(),
-                    "listing_type": rental_data.get("listing_type", "unit"),
-                    "is_active": rental_data.get("is_active", True),
-                    "floor_area_sqm": Decimal(str(rental_data["floor_area_sqm"])),
-                    "asking_rent_monthly": Decimal(
-                        str(rental_data.get("asking_rent_monthly", 0))
-                    ),
-                    "asking_psf_monthly": Decimal(
-                        str(rental_data.get("asking_psf_monthly", 0))
-                    ),
-                    "floor_level": rental_data.get("floor_level"),
-                    "available_date": (
-                        datetime.fromisoformat(rental_data["available_date"]).date()
-                        if rental_data.get("available_date")
-                        else None
-                    ),
-                    "listing_source": source,
-                }
+        for batch in _chunks(rentals, self.batch_size):
+            property_ids = await self._resolve_property_ids(batch, session)
+            records: Dict[Any, Dict[str, Any]] = {}
+
+            for rental_data in batch:
+                try:
+                    rental = {
+                        "property_id": property_ids[_property_name(rental_data)],
+                        "listing_date": datetime.fromisoformat(
+                            rental_data["listing_date"]
+                        ).date(),
+                        "listing_type": rental_data.get("listing_type", "unit"),
+                        "is_active": rental_data.get("is_active", True),
+                        "floor_area_sqm": Decimal(str(rental_data["floor_area_sqm"])),
+                        "asking_rent_monthly": Decimal(
+                            str(rental_data.get("asking_rent_monthly", 0))
+                        ),
+                        "asking_psf_monthly": Decimal(
+                            str(rental_data.get("asking_psf_monthly", 0))
+                        ),
+                        "floor_level": rental_data.get("floor_level"),
+                        "available_date": (
+                            datetime.fromisoformat(rental_data["available_date"]).date()
+                            if rental_data.get("available_date")
+                            else None
+                        ),
+                        "listing_source": source,
+                        "source_record_id": rental_data.get("listing_id"),
+                    }
+                except Exception as e:
+                    logger.error(f"Error storing rental: {str(e)}")
+                    continue
+
+                key = rental["source_record_id"] or len(records)
+                records[key] = rental
+
+            stored += await self._upsert_rows(
+                session,
+                RentalListing,
+                list(records.values()),
+                ["listing_source", "source_record_id"],
+                "rental",
+            )
 
-                # Upsert rental
-                if self._dialect_name(session) == "postgresql":
-                    stmt = pg_insert(RentalListing).values(**rental)
-                    stmt = stmt.on_conflict_do_nothing()
-                else:
-                    stmt = insert(RentalListing).values(**rental)
+        return stored
+
+    async def _upsert_rows(
+        self,
+        session: AsyncSession,
+        model: Any,
+        rows: List[Dict[str, Any]],
+        conflict_columns: List[str],
+        label: str,
+    ) -> int:
+        """Insert ``rows`` in one statement, updating rows whose key exists.
 
+        The statement runs in a savepoint, so a failing batch is rolled back
+        on its own and its error propagates with the session still usable.
+        """
+        if not rows:
+            return 0
+
+        dialect = self._dialect_name(session)
+        if dialect == "postgresql":
+            stmt = pg_insert(model).values(rows)
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(model).values(rows)
+        else:
+            stmt = None
+
+        if stmt is not None:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={
+                    column: stmt.excluded[column]
+                    for column in rows[0]
+                    if column not in conflict_columns
+                },
+            )
+        else:
+            stmt = insert(model).values(rows)
+
+        try:
+            async with session.begin_nested():
                 await session.execute(stmt)
-                stored += 1
+        except Exception as e:
+            logger.error(f"Error storing {label} batch: {str(e)}")
+            raise
+        return len(rows)
 
-            except Exception as e:
-                logger.error(f"Error storing rental: {str(e)}")
+    async def _resolve_property_ids(
+        self, rows: List[Dict[str, Any]], session: AsyncSession
+    ) -> Dict[str, Any]:
+        """Map each property name in ``rows`` to a property id.
 
-        return stored
+        Existing properties are read with one query and the missing ones are
+        created with one multi-row insert.
+        """
+        first_seen: Dict[str, Dict[str, Any]] = {}
+        for data in rows:
+            first_seen.setdefault(_property_name(data), data)
+        if not first_seen:
+            return {}
+
+        result = await session.execute(
+            select(Property.id, Property.name).where(
+                Property.name.in_(list(first_seen))
+            )
+        )
+        property_ids: Dict[str, Any] = {}
+        for property_id, name in result.all():
+            property_ids.setdefault(name, property_id)
+
+        new_properties = [
+            _new_property_row(data)
+            for name, data in first_seen.items()
+            if name not in property_ids
+        ]
+        if new_properties:
+            await session.execute(insert(Property).values(new_properties))
+            property_ids.update((row["name"], row["id"]) for row in new_properties)
+
+        return property_ids
 
     async def _store_indices(
         self, indices: List[Dict[str, Any]], source: str, session: AsyncSession
@@ -391,7 +558,8 @@ class MarketDataService:
                         },
                     )
 
-                await session.execute(stmt)
+                async with session.begin_nested():
+                    await session.execute(stmt)
                 stored += 1
 
             except Exception as e:
@@ -399,62 +567,6 @@ class MarketDataService:
 
         return stored
 
-    async def _get_or_create_property(
-        self, data: Dict[str, Any], session: AsyncSession
-    ) -> str:
-        """Get existing property or create new one."""
-        # Try to find existing property by name
-        property_name = data.get("property_name", "Unknown Property")
-
-        stmt = select(Property).where(Property.name == property_name).limit(1)
-
-        result = await session.execute(stmt)
-        property_record = result.scalar_one_or_none()
-
-        if property_record:
-            return str(property_record.id)
-
-        # Create new property
-        from uuid import uuid4
-
-        property_id = uuid4()
-
-        # Create mock location (in production, geocode the address)
-        import random
-
-        lat = 1.3521 + random.uniform(-0.1, 0.1)  # Singapore latitude
-        lon = 103.8198 + random.uniform(-0.1, 0.1)  # Singapore longitude
-        point = f"POINT({lon} {lat})"
-
-        property_type_map = {
-            "office": PropertyType.OFFICE,
-            "retail": PropertyType.RETAIL,
-            "residential": PropertyType.RESIDENTIAL,
-            "industrial": PropertyType.INDUSTRIAL,
-        }
-
-        new_property = {
-            "id": property_id,
-            "name": property_name,
-            "address": data.get("address", property_name),
-            "property_type": property_type_map.get(
-                data.get("property_type", "office").lower(), PropertyType.OFFICE
-            ),
-            "location": point,
-            "district": data.get("district"),
-            "gross_floor_area_sqm": (
-                Decimal(str(data.get("floor_area_sqm", 0)))
-                if data.get("floor_area_sqm")
-                else None
-            ),
-            "data_source": "market_sync",
-        }
-
-        stmt = insert(Property).values(**new_property)
-        await session.execute(stmt)
-
-        return str(property_id)
-
     async def _calculate_yield_benchmarks(self, session: AsyncSession) -> None:
         """Calculate and update yield benchmarks."""
         # This is a simplified version - in production, implement full calculation
@@ -556,6 +668,22 @@ class MarketDataService:
             return self.sync_history[provider_name].date()
         return None
 
+    async def last_sync_watermark(self, session: AsyncSession) -> Optional[date]:
+        """Return the earliest last-sync date across providers that have synced.
+
+        Read from the stored ``synced_at`` stamps rather than this instance's
+        history, so it holds across processes. Rows written by those syncs
+        carry a ``synced_at`` on or after it.
+        """
+        latest = (
+            select(func.max(MarketTransaction.synced_at).label("synced_at"))
+            .where(MarketTransaction.data_source.in_(list(self.providers)))
+            .group_by(MarketTransaction.data_source)
+            .subquery()
+        )
+        synced = await session.scalar(select(func.min(latest.c.synced_at)))
+        return synced.date() if synced is not None else None
+
     async def get_transactions(
         self,
         property_type: PropertyType,
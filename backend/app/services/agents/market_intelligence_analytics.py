@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import statistics
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any, Optional
 from uuid import UUID
 
@@ -22,7 +22,6 @@ else:
 from backend._compat.datetime import utcnow
 from sqlalchemy import String, and_, cast, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.market import (
     AbsorptionTracking,
@@ -30,8 +29,15 @@ from app.models.market import (
     MarketIndex,
     YieldBenchmark,
 )
-from app.models.property import MarketTransaction, Property, PropertyType
+from app.models.property import PropertyType
+from app.services.agents.market_aggregates import (
+    buyer_profile,
+    top_transactions,
+    transaction_aggregates,
+    transaction_filters,
+)
 from app.services.agents.market_data_service import MarketDataService
+from app.services.agents.market_snapshots import snapshot_comparables
 
 try:  # pragma: no cover - optional metrics dependency
     from app.core.metrics import MetricsCollector
@@ -63,6 +69,7 @@ class MarketReport:
         absorption_trends: dict[str, Any],
         market_cycle_position: dict[str, Any],
         recommendations: list[str],
+        snapshot_refreshed_at: Optional[datetime] = None,
     ):
         self.property_type = property_type
         self.location = location
@@ -73,6 +80,8 @@ class MarketReport:
         self.absorption = absorption_trends
         self.cycle = market_cycle_position
         self.recommendations = recommendations
+        # Set when comparables came from segment snapshots rather than raw rows
+        self.snapshot_refreshed_at = snapshot_refreshed_at
         self.generated_at = utcnow()
 
     def to_dict(self) -> dict[str, Any]:
@@ -91,6 +100,11 @@ class MarketReport:
             "market_cycle_position": self.cycle,
             "recommendations": self.recommendations,
             "generated_at": self.generated_at.isoformat(),
+            "snapshot_refreshed_at": (
+                self.snapshot_refreshed_at.isoformat()
+                if self.snapshot_refreshed_at
+                else None
+            ),
         }
 
 
@@ -116,6 +130,7 @@ class MarketIntelligenceAnalytics:
         period_months: int,
         session: AsyncSession,
         competitive_set_id: Optional[UUID] = None,
+        use_snapshots: bool = True,
     ) -> MarketReport:
         """
         Generate comprehensive market intelligence report.
@@ -126,6 +141,8 @@ class MarketIntelligenceAnalytics:
             period_months: Number of months to analyze
             session: Database session
             competitive_set_id: Optional specific competitive set
+            use_snapshots: Build comparables from segment snapshots when the
+                segment has any, instead of scanning raw transactions
 
         Returns:
             Comprehensive market report
@@ -134,9 +151,8 @@ class MarketIntelligenceAnalytics:
         start_date = end_date - timedelta(days=period_months * 30)
         period = (start_date, end_date)
 
-        # Run all analyses in parallel where possible
         comparables = await self._analyze_comparables(
-            property_type, location, period, session
+            property_type, location, period, session, use_snapshots=use_snapshots
         )
 
         supply_dynamics = await self._analyze_supply_dynamics(
@@ -178,6 +194,11 @@ class MarketIntelligenceAnalytics:
             absorption_trends=absorption_trends,
             market_cycle_position=market_cycle,
             recommendations=recommendations,
+            snapshot_refreshed_at=(
+                datetime.fromisoformat(comparables["snapshot_refreshed_at"])
+                if comparables.get("snapshot_refreshed_at")
+                else None
+            ),
         )
 
     async def _analyze_comparables(
@@ -186,55 +207,50 @@ class MarketIntelligenceAnalytics:
         location: str,
         period: tuple[date, date],
         session: AsyncSession,
+        use_snapshots: bool = False,
     ) -> dict[str, Any]:
-        """Analyze comparable transactions."""
+        """Analyze comparable transactions.
 
-        # Get recent transactions
-        stmt = (
-            select(MarketTransaction)
-            .join(Property, MarketTransaction.property_id == Property.id)
-            .where(
-                Property.property_type == property_type,
-                MarketTransaction.transaction_date.between(period[0], period[1]),
-            )
-            .options(selectinload(MarketTransaction.property))
-        )
+        Aggregates are computed in the database (or over NumPy columns) so
+        the cost does not grow with ORM rows across long, island-wide periods.
+        With ``use_snapshots`` the segment's quarterly snapshots are used when
+        present, and ``snapshot_refreshed_at`` records their age.
+        """
 
-        if location != "all":
-            stmt = stmt.where(Property.district == location)
+        if use_snapshots:
+            snapshot = await snapshot_comparables(
+                session, property_type, location, period
+            )
+            if snapshot is not None:
+                comparables, refreshed_at = snapshot
+                comparables["price_trend"] = self._calculate_price_trend(
+                    comparables["quarterly_trends"]
+                )
+                comparables["snapshot_refreshed_at"] = refreshed_at.isoformat()
+                return comparables
 
-        result = await session.execute(stmt)
-        transactions = result.scalars().all()
+        filters = transaction_filters(property_type, location, period)
+        aggregates = await transaction_aggregates(session, filters)
 
-        if not transactions:
+        if not aggregates.count:
             return {
                 "transaction_count": 0,
                 "message": "No comparable transactions found",
             }
 
-        # Calculate statistics
-        psf_prices = [float(t.psf_price) for t in transactions if t.psf_price]
-        sale_prices = [float(t.sale_price) for t in transactions]
-
-        # Group by quarters
-        quarterly_data = self._group_by_quarter(transactions)
-
-        # Price trends
-        price_trend = self._calculate_price_trend(quarterly_data)
-
         return {
-            "transaction_count": len(transactions),
-            "total_volume": sum(sale_prices),
-            "average_psf": statistics.mean(psf_prices) if psf_prices else 0,
-            "median_psf": statistics.median(psf_prices) if psf_prices else 0,
+            "transaction_count": aggregates.count,
+            "total_volume": aggregates.total_volume,
+            "average_psf": aggregates.average_psf,
+            "median_psf": aggregates.median_psf,
             "psf_range": {
-                "min": min(psf_prices) if psf_prices else 0,
-                "max": max(psf_prices) if psf_prices else 0,
+                "min": aggregates.min_psf,
+                "max": aggregates.max_psf,
             },
-            "quarterly_trends": quarterly_data,
-            "price_trend": price_trend,
-            "top_transactions": self._get_top_transactions(transactions, 5),
-            "buyer_profile": self._analyze_buyer_profile(transactions),
+            "quarterly_trends": aggregates.quarterly,
+            "price_trend": self._calculate_price_trend(aggregates.quarterly),
+            "top_transactions": await top_transactions(session, filters, 5),
+            "buyer_profile": await buyer_profile(session, filters),
         }
 
     async def _analyze_supply_dynamics(
@@ -394,9 +410,17 @@ class MarketIntelligenceAnalytics:
     ) -> dict[str, Any]:
         """Analyze absorption and velocity trends."""
 
-        # Get absorption tracking data
+        # Fetch only the columns the metrics below read, not ORM objects
         stmt = (
-            select(AbsorptionTracking)
+            select(
+                AbsorptionTracking.tracking_date,
+                AbsorptionTracking.sales_absorption_rate,
+                AbsorptionTracking.leasing_absorption_rate,
+                AbsorptionTracking.avg_units_per_month,
+                AbsorptionTracking.avg_days_to_sale,
+                AbsorptionTracking.avg_days_to_lease,
+                AbsorptionTracking.relative_performance,
+            )
             .where(
                 and_(
                     AbsorptionTracking.property_type == property_type,
@@ -410,7 +434,7 @@ class MarketIntelligenceAnalytics:
             stmt = stmt.where(AbsorptionTracking.district == location)
 
         result = await session.execute(stmt)
-        absorption_data = result.scalars().all()
+        absorption_data = result.all()
 
         if not absorption_data:
             return {"message": "No absorption data available", "metrics": {}}
@@ -507,38 +531,6 @@ class MarketIntelligenceAnalytics:
 
     # Helper methods
 
-    def _group_by_quarter(
-        self, transactions: list[MarketTransaction]
-    ) -> dict[str, Any]:
-        """Group transactions by quarter."""
-        quarterly: dict[str, dict[str, Any]] = {}
-
-        for txn in transactions:
-            quarter = (
-                f"{txn.transaction_date.year}-Q{(txn.transaction_date.month-1)//3 + 1}"
-            )
-
-            if quarter not in quarterly:
-                quarterly[quarter] = {"count": 0, "total_volume": 0.0, "avg_psf": []}
-
-            quarterly[quarter]["count"] = int(quarterly[quarter]["count"]) + 1
-            quarterly[quarter]["total_volume"] = float(
-                quarterly[quarter]["total_volume"]
-            ) + float(txn.sale_price)
-            if txn.psf_price:
-                psf_list: list[float] = quarterly[quarter]["avg_psf"]
-                psf_list.append(float(txn.psf_price))
-
-        # Calculate averages
-        for _quarter, data in quarterly.items():
-            psf_values: list[float] = data["avg_psf"]
-            if psf_values:
-                data["avg_psf"] = statistics.mean(psf_values)
-            else:
-                data["avg_psf"] = 0
-
-        return quarterly
-
     def _calculate_price_trend(self, quarterly_data: dict[str, Any]) -> str:
         """Calculate price trend from quarterly data."""
         if len(quarterly_data) < 2:
@@ -565,37 +557,6 @@ class MarketIntelligenceAnalytics:
 
         return "stable"
 
-    def _get_top_transactions(
-        self, transactions: list[MarketTransaction], limit: int = 5
-    ) -> list[dict[str, Any]]:
-        """Get top transactions by value."""
-        sorted_txns = sorted(transactions, key=lambda x: x.sale_price, reverse=True)[
-            :limit
-        ]
-
-        return [
-            {
-                "date": txn.transaction_date.isoformat(),
-                "property_name": txn.property.name if txn.property else "Unknown",
-                "price": float(txn.sale_price),
-                "psf": float(txn.psf_price) if txn.psf_price else None,
-                "buyer_type": txn.buyer_type,
-            }
-            for txn in sorted_txns
-        ]
-
-    def _analyze_buyer_profile(
-        self, transactions: list[MarketTransaction]
-    ) -> dict[str, int]:
-        """Analyze buyer type distribution."""
-        buyer_types: dict[str, int] = {}
-
-        for txn in transactions:
-            buyer_type = txn.buyer_type or "Unknown"
-            buyer_types[buyer_type] = buyer_types.get(buyer_type, 0) + 1
-
-        return buyer_types
-
     def _calculate_supply_pressure(
         self, upcoming_gfa: float, property_type: PropertyType, location: str
     ) -> str:
@@ -0,0 +1,317 @@
+"""Materialised per-quarter market segment snapshots.
+
+A segment is a (property type, location) pair. Each snapshot row holds the
+transaction aggregates of one calendar quarter; a refresh recomputes only the
+quarters containing transactions written since the watermark, and reports
+combine the stored quarters instead of rescanning raw transactions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any
+
+from backend._compat.datetime import UTC, utcnow
+from sqlalchemy import delete, extract, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.market import MarketSegmentSnapshot
+from app.models.property import MarketTransaction, Property, PropertyType
+from app.services.agents.market_aggregates import (
+    add_yoy_changes,
+    buyer_profile,
+    top_transactions,
+    transaction_aggregates,
+    transaction_filters,
+)
+
+TOP_TRANSACTIONS_PER_QUARTER = 5
+DEFAULT_REFRESH_CONCURRENCY = 4
+# ``synced_at`` is stamped when a sync starts but rows only become visible
+# when it commits, so a refresh can miss rows stamped just before it read.
+# Re-reading this far behind the watermark picks them up next time;
+# re-aggregating a quarter is idempotent.
+DEFAULT_REFRESH_OVERLAP = timedelta(hours=1)
+
+Quarter = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class SegmentRefresh:
+    """Outcome of refreshing one segment's snapshots."""
+
+    property_type: PropertyType
+    location: str
+    quarters: list[Quarter]
+    refreshed_at: datetime
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "property_type": self.property_type.value,
+            "location": self.location,
+            "quarters": [f"{year}-Q{quarter}" for year, quarter in self.quarters],
+            "refreshed_at": self.refreshed_at.isoformat(),
+        }
+
+
+def quarter_of(value: date) -> Quarter:
+    return value.year, (value.month - 1) // 3 + 1
+
+
+def quarter_bounds(quarter: Quarter) -> tuple[date, date]:
+    """Return the first and last day of ``quarter``."""
+
+    year, number = quarter
+    start = date(year, 3 * number - 2, 1)
+    if number == 4:
+        return start, date(year, 12, 31)
+    return start, date(year, 3 * number + 1, 1) - timedelta(days=1)
+
+
+def _segment_filters(property_type: PropertyType, location: str) -> list[Any]:
+    filters = [Property.property_type == property_type]
+    if location != "all":
+        filters.append(Property.district == location)
+    return filters
+
+
+async def touched_quarters(
+    session: AsyncSession,
+    property_type: PropertyType,
+    location: str,
+    since: datetime | None,
+) -> list[Quarter]:
+    """Return the quarters holding segment transactions synced at/after ``since``.
+
+    With no watermark every quarter that has transactions is returned.
+    """
+
+    year = extract("year", MarketTransaction.transaction_date)
+    month = extract("month", MarketTransaction.transaction_date)
+    stmt = (
+        select(year, month)
+        .join(Property, MarketTransaction.property_id == Property.id)
+        .where(*_segment_filters(property_type, location))
+        .distinct()
+    )
+    if since is not None:
+        stmt = stmt.where(MarketTransaction.synced_at >= since)
+    rows = await session.execute(stmt)
+    return sorted({(int(y), (int(m) - 1) // 3 + 1) for y, m in rows})
+
+
+async def _last_refreshed_at(
+    session: AsyncSession, property_type: PropertyType, location: str
+) -> datetime | None:
+    return await session.scalar(
+        select(func.max(MarketSegmentSnapshot.refreshed_at)).where(
+            MarketSegmentSnapshot.property_type == property_type.value,
+            MarketSegmentSnapshot.location == location,
+        )
+    )
+
+
+def _dialect_insert(session: AsyncSession) -> Any:
+    bind = session.get_bind()
+    return pg_insert if bind.dialect.name == "postgresql" else sqlite_insert
+
+
+async def _refresh_quarter(
+    session: AsyncSession,
+    property_type: PropertyType,
+    location: str,
+    quarter: Quarter,
+    refreshed_at: datetime,
+) -> None:
+    quarter_start, quarter_end = quarter_bounds(quarter)
+    filters = transaction_filters(property_type, location, (quarter_start, quarter_end))
+    aggregates = await transaction_aggregates(session, filters)
+    key = (
+        MarketSegmentSnapshot.property_type == property_type.value,
+        MarketSegmentSnapshot.location == location,
+        MarketSegmentSnapshot.quarter_start == quarter_start,
+    )
+
+    if not aggregates.count:
+        await session.execute(delete(MarketSegmentSnapshot).where(*key))
+        return
+
+    values = {
+        "transaction_count": aggregates.count,
+        "total_volume": aggregates.total_volume,
+        "psf_count": aggregates.psf_count,
+        "psf_sum": aggregates.average_psf * aggregates.psf_count,
+        "psf_median": aggregates.median_psf if aggregates.psf_count else None,
+        "psf_min": aggregates.min_psf if aggregates.psf_count else None,
+        "psf_max": aggregates.max_psf if aggregates.psf_count else None,
+        "buyer_profile": await buyer_profile(session, filters),
+        "top_transactions": await top_transactions(
+            session, filters, TOP_TRANSACTIONS_PER_QUARTER
+        ),
+        "refreshed_at": refreshed_at,
+    }
+    stmt = _dialect_insert(session)(MarketSegmentSnapshot).values(
+        property_type=property_type.value,
+        location=location,
+        quarter_start=quarter_start,
+        **values,
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["property_type", "location", "quarter_start"],
+            set_=values,
+        )
+    )
+
+
+async def refresh_segment(
+    session: AsyncSession,
+    property_type: PropertyType,
+    location: str,
+    *,
+    sync_watermark: date | None = None,
+    overlap: timedelta = DEFAULT_REFRESH_OVERLAP,
+) -> SegmentRefresh:
+    """Recompute the segment's quarters touched since its last refresh.
+
+    The watermark is the segment's last ``refreshed_at``; ``sync_watermark``
+    (a provider sync date) only bootstraps segments never refreshed before.
+    It is moved back by ``overlap`` so rows committed after a refresh but
+    stamped before it are not skipped. With neither, every quarter is
+    recomputed. Commits on success.
+    """
+
+    since = await _last_refreshed_at(session, property_type, location)
+    if since is None and sync_watermark is not None:
+        since = datetime.combine(sync_watermark, time.min, tzinfo=UTC)
+    if since is not None:
+        since = _aware(since) - overlap
+
+    refreshed_at = utcnow()
+    quarters = await touched_quarters(session, property_type, location, since)
+    for quarter in quarters:
+        await _refresh_quarter(session, property_type, location, quarter, refreshed_at)
+    await session.commit()
+    return SegmentRefresh(property_type, location, quarters, refreshed_at)
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite returns naive datetimes for timezone-aware columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+async def refresh_segments(
+    session_factory: async_sessionmaker[AsyncSession],
+    segments: Iterable[tuple[PropertyType, str]],
+    *,
+    sync_watermark: date | None = None,
+    concurrency: int = DEFAULT_REFRESH_CONCURRENCY,
+) -> list[SegmentRefresh]:
+    """Refresh ``segments`` concurrently, one session per segment."""
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _refresh(property_type: PropertyType, location: str) -> SegmentRefresh:
+        async with semaphore, session_factory() as session:
+            return await refresh_segment(
+                session, property_type, location, sync_watermark=sync_watermark
+            )
+
+    return list(
+        await asyncio.gather(
+            *(_refresh(property_type, location) for property_type, location in segments)
+        )
+    )
+
+
+def _weighted_median(values: Sequence[tuple[float, int]]) -> float:
+    ordered = sorted(values)
+    half = sum(weight for _, weight in ordered) / 2
+    running = 0
+    for value, weight in ordered:
+        running += weight
+        if running >= half:
+            return value
+    return 0.0
+
+
+async def snapshot_comparables(
+    session: AsyncSession,
+    property_type: PropertyType,
+    location: str,
+    period: tuple[date, date],
+) -> tuple[dict[str, Any], datetime] | None:
+    """Build the comparables section from snapshots of the quarters in ``period``.
+
+    Returns ``None`` when the segment has no snapshots. Quarters are included
+    whole, and the period median is the count-weighted median of the
+    quarterly medians. The second element is the oldest ``refreshed_at`` of
+    the quarters used.
+    """
+
+    first_quarter_start, _ = quarter_bounds(quarter_of(period[0]))
+    rows = (
+        (
+            await session.execute(
+                select(MarketSegmentSnapshot)
+                .where(
+                    MarketSegmentSnapshot.property_type == property_type.value,
+                    MarketSegmentSnapshot.location == location,
+                    MarketSegmentSnapshot.quarter_start.between(
+                        first_quarter_start, period[1]
+                    ),
+                )
+                .order_by(MarketSegmentSnapshot.quarter_start)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if not rows:
+        return None
+
+    psf_count = sum(row.psf_count for row in rows)
+    psf_sum = sum(float(row.psf_sum) for row in rows)
+    quarterly = {
+        quarter_of(row.quarter_start): {
+            "count": row.transaction_count,
+            "total_volume": float(row.total_volume),
+            "avg_psf": float(row.psf_sum) / row.psf_count if row.psf_count else 0,
+        }
+        for row in rows
+    }
+    add_yoy_changes(quarterly)
+    buyers: Counter[str] = Counter()
+    for row in rows:
+        buyers.update(row.buyer_profile or {})
+    top = sorted(
+        (txn for row in rows for txn in row.top_transactions or []),
+        key=lambda txn: txn["price"],
+        reverse=True,
+    )[:TOP_TRANSACTIONS_PER_QUARTER]
+    priced = [row for row in rows if row.psf_count]
+
+    comparables = {
+        "transaction_count": sum(row.transaction_count for row in rows),
+        "total_volume": sum(float(row.total_volume) for row in rows),
+        "average_psf": psf_sum / psf_count if psf_count else 0,
+        "median_psf": _weighted_median(
+            [(float(row.psf_median), row.psf_count) for row in priced]
+        ),
+        "psf_range": {
+            "min": min((float(row.psf_min) for row in priced), default=0),
+            "max": max((float(row.psf_max) for row in priced), default=0),
+        },
+        "quarterly_trends": {
+            f"{year}-Q{number}": bucket for (year, number), bucket in quarterly.items()
+        },
+        "top_transactions": top,
+        "buyer_profile": dict(buyers),
+    }
+    return comparables, _aware(min(row.refreshed_at for row in rows))
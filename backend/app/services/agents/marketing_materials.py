@@ -20,7 +20,6 @@ from reportlab.platypus import (
     ListItem,
     PageBreak,
     Paragraph,
-    SimpleDocTemplate,
     Spacer,
     Table,
     TableStyle,
@@ -30,7 +29,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.property import Property, PropertyPhoto, PropertyType, RentalListing
 from app.services.agents.investment_memorandum import InvestmentHighlight
-from app.services.agents.pdf_generator import PageNumberCanvas, PDFGenerator
+from app.services.agents.pdf_generator import PDFGenerator
 
 
 class FloorPlanDiagram(Flowable):  # type: ignore[misc]
@@ -173,19 +172,6 @@ class MarketingMaterialsGenerator(PDFGenerator):  # type: ignore[misc]
         property_data = await self._load_property_data(property_id, session)
         photos = await self._load_property_photos(property_id, session)
 
-        # Create PDF buffer
-        buffer = io.BytesIO()
-
-        # Create document
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=0.5 * inch,
-            leftMargin=0.5 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
-        )
-
         # Build content
         story = []
 
@@ -221,20 +207,16 @@ class MarketingMaterialsGenerator(PDFGenerator):  # type: ignore[misc]
         # 8. Contact & Next Steps
         story.extend(self._create_contact_section(contact_info, material_type))
 
-        # Build PDF
-        doc.build(
+        # Build PDF off the event loop
+        return await self._render_story(
             story,
-            canvasmaker=lambda *args, **kwargs: PageNumberCanvas(
-                *args,
-                company_name="Commercial Property Advisors",
-                document_title=f"{'For Sale' if material_type == 'sale' else 'For Lease'}",
-                **kwargs,
-            ),
+            "For Sale" if material_type == "sale" else "For Lease",
+            rightMargin=0.5 * inch,
+            leftMargin=0.5 * inch,
+            topMargin=0.75 * inch,
+            bottomMargin=0.75 * inch,
         )
 
-        buffer.seek(0)
-        return buffer
-
     async def generate_email_flyer(
         self, property_id: UUID, session: AsyncSession, material_type: str = "lease"
     ) -> io.BytesIO:
@@ -872,6 +854,16 @@ class MarketingMaterialsGenerator(PDFGenerator):  # type: ignore[misc]
         self, contact_info: Optional[Dict[str, str]], material_type: str
     ) -> List[Any]:
         """Create contact and next steps section."""
+        return self._cached_section(
+            "contact",
+            lambda: self._build_contact_section(contact_info, material_type),
+            contact_info,
+            material_type,
+        )
+
+    def _build_contact_section(
+        self, contact_info: Optional[Dict[str, str]], material_type: str
+    ) -> List[Any]:
         story = []
 
         story.append(self._create_header_table("CONTACT & NEXT STEPS"))
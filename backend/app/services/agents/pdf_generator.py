@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.graphics.charts.linecharts import HorizontalLineChart
-from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics.shapes import Drawing
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_JUSTIFY
@@ -19,6 +18,12 @@ from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
 from reportlab.platypus import Flowable, Paragraph, Table, TableStyle
 
+from app.services.agents.pdf_render import (
+    chart_drawing,
+    content_hash,
+    get_pdf_render_service,
+    section_cache,
+)
 from app.services.storage import StorageService, get_storage_service
 
 
@@ -304,46 +309,18 @@ class PDFGenerator:
         width: float = 400,
         height: float = 200,
     ) -> Drawing:
-        """Create various chart types."""
-        drawing = Drawing(width, height)
-
-        if chart_type == "bar":
-            chart = VerticalBarChart()
-            chart.x = 50
-            chart.y = 50
-            chart.height = height - 100
-            chart.width = width - 100
-            chart.data = data["values"]
-            chart.categoryAxis.categoryNames = data["categories"]
-            chart.valueAxis.valueMin = 0
-            chart.valueAxis.valueMax = (
-                max(max(series) for series in data["values"]) * 1.1
-            )
-            chart.bars[0].fillColor = colors.HexColor("#2c3e50")
-            drawing.add(chart)
-
-        elif chart_type == "pie":
-            chart = Pie()
-            chart.x = width / 2 - 75
-            chart.y = height / 2 - 75
-            chart.width = 150
-            chart.height = 150
-            chart.data = data["values"]
-            chart.labels = data["labels"]
-            chart.slices.strokeWidth = 0.5
-            drawing.add(chart)
-
-        elif chart_type == "line":
-            chart = HorizontalLineChart()
-            chart.x = 50
-            chart.y = 50
-            chart.height = height - 100
-            chart.width = width - 100
-            chart.data = data["values"]
-            chart.categoryAxis.categoryNames = data["categories"]
-            drawing.add(chart)
-
-        return drawing
+        """Create various chart types, reusing drawings for identical inputs."""
+        return chart_drawing(chart_type, data, width, height)
+
+    def _cached_section(
+        self, name: str, build: Callable[[], List[Flowable]], *content: Any
+    ) -> List[Flowable]:
+        """Return the flowables for a static section, cached by content hash.
+
+        ``content`` must cover every input the section depends on.
+        """
+        key = content_hash(type(self).__name__, name, *content)
+        return list(section_cache.get_or_build(key, build))
 
     def _add_disclaimer(
         self, disclaimer_type: str, custom_text: Optional[str] = None
@@ -383,18 +360,43 @@ class PDFGenerator:
             disclaimer_type, disclaimers["acquisition"]
         )
 
-        return Paragraph(text, self.styles["Disclaimer"])
+        (paragraph,) = self._cached_section(
+            "disclaimer", lambda: [Paragraph(text, self.styles["Disclaimer"])], text
+        )
+        return paragraph
+
+    async def _render_story(
+        self,
+        story: List[Flowable],
+        document_title: str,
+        **doc_options: Any,
+    ) -> io.BytesIO:
+        """Build ``story`` off the event loop with numbered, titled pages."""
+        pdf = await get_pdf_render_service().render(
+            story,
+            doc_options={"pagesize": A4, **doc_options},
+            canvasmaker=partial(
+                PageNumberCanvas,
+                company_name="Commercial Property Advisors",
+                document_title=document_title,
+            ),
+        )
+        return io.BytesIO(pdf)
 
     async def save_to_storage(
         self, pdf_buffer: io.BytesIO, filename: str, property_id: Optional[str] = None
     ) -> str:
-        """Save PDF to storage and return URL."""
+        """Stream PDF to storage and return URL."""
         key = f"reports/{property_id or 'general'}/{filename}"
 
-        # Use store_bytes which is the correct StorageService method
-        result = self.storage_service.store_bytes(
-            key=key, payload=pdf_buffer.getvalue(), content_type="application/pdf"
+        pdf_buffer.seek(0)
+        result = await asyncio.to_thread(
+            self.storage_service.store_stream,
+            key=key,
+            source=pdf_buffer,
+            content_type="application/pdf",
         )
+        pdf_buffer.seek(0)
 
         return result.uri
 
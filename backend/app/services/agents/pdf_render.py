@@ -0,0 +1,329 @@
+"""Off-loop PDF rendering for professional packs.
+
+``doc.build`` lays out a ReportLab story synchronously and can take seconds
+for a 20-page pack, so :class:`PDFRenderService` runs builds in a process
+pool. Stories are pickled to the workers; chart drawings pickle as their
+recipe and are rebuilt from the worker's own chart cache. Chart drawings and
+static sections (disclaimers, appendices) are cached by content hash, so a
+regeneration after a small data edit only rebuilds what changed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import json
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import (
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+)
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Generic, TypeVar
+
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.linecharts import HorizontalLineChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.shapes import Drawing
+from reportlab.lib import colors
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Flowable, SimpleDocTemplate
+
+from app.core.config import settings
+from app.utils.logging import get_logger
+from app.utils.process_pool import spawn_process_pool
+
+logger = get_logger(__name__)
+
+CHART_CACHE_SIZE = 128
+SECTION_CACHE_SIZE = 64
+
+_T = TypeVar("_T")
+CanvasMaker = Callable[..., Canvas]
+
+
+class PDFRenderQueueFull(RuntimeError):
+    """Raised when the render service already holds its maximum pending builds."""
+
+
+def content_hash(*parts: Any) -> str:
+    """Return a stable SHA-256 hex digest of JSON-serialisable ``parts``."""
+
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ContentCache(Generic[_T]):
+    """Thread-safe LRU cache of values keyed by content hash."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _T] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(self, key: str, build: Callable[[], _T]) -> _T:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+chart_cache: ContentCache[Drawing] = ContentCache(CHART_CACHE_SIZE)
+section_cache: ContentCache[list[Flowable]] = ContentCache(SECTION_CACHE_SIZE)
+
+
+class ChartDrawing(Drawing):
+    """Chart drawing that pickles as its inputs instead of its widget tree."""
+
+    _recipe: tuple[str, dict[str, Any], float, float]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return chart_drawing, self._recipe
+
+
+def _build_chart(
+    chart_type: str, data: dict[str, Any], width: float, height: float
+) -> ChartDrawing:
+    drawing = ChartDrawing(width, height)
+    drawing._recipe = (chart_type, data, width, height)
+
+    if chart_type == "bar":
+        chart = VerticalBarChart()
+        chart.x = 50
+        chart.y = 50
+        chart.height = height - 100
+        chart.width = width - 100
+        chart.data = data["values"]
+        chart.categoryAxis.categoryNames = data["categories"]
+        chart.valueAxis.valueMin = 0
+        chart.valueAxis.valueMax = max(max(series) for series in data["values"]) * 1.1
+        chart.bars[0].fillColor = colors.HexColor("#2c3e50")
+        drawing.add(chart)
+
+    elif chart_type == "pie":
+        chart = Pie()
+        chart.x = width / 2 - 75
+        chart.y = height / 2 - 75
+        chart.width = 150
+        chart.height = 150
+        chart.data = data["values"]
+        chart.labels = data["labels"]
+        chart.slices.strokeWidth = 0.5
+        drawing.add(chart)
+
+    elif chart_type == "line":
+        chart = HorizontalLineChart()
+        chart.x = 50
+        chart.y = 50
+        chart.height = height - 100
+        chart.width = width - 100
+        chart.data = data["values"]
+        chart.categoryAxis.categoryNames = data["categories"]
+        drawing.add(chart)
+
+    return drawing
+
+
+def chart_drawing(
+    chart_type: str, data: dict[str, Any], width: float = 400, height: float = 200
+) -> Drawing:
+    """Return the (cached) chart drawing for these inputs.
+
+    Cached drawings are shared; builds only read them.
+    """
+
+    return chart_cache.get_or_build(
+        content_hash("chart", chart_type, data, width, height),
+        lambda: _build_chart(chart_type, data, width, height),
+    )
+
+
+# Keep render workers from dispatching jobs or spawning nested pools.
+_RENDER_WORKER_ENV = {"JOB_QUEUE_BACKEND": "inline", "PDF_RENDER_WORKERS": "0"}
+
+
+def build_pdf(
+    story: Sequence[Flowable],
+    doc_options: Mapping[str, Any],
+    canvasmaker: CanvasMaker | None = None,
+) -> bytes:
+    """Lay out ``story`` in a ``SimpleDocTemplate`` and return the PDF bytes."""
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, **doc_options)
+    if canvasmaker is None:
+        doc.build(list(story))
+    else:
+        doc.build(list(story), canvasmaker=canvasmaker)
+    return buffer.getvalue()
+
+
+def _build_pickled_pdf(
+    payload: bytes,
+    doc_options: Mapping[str, Any],
+    canvasmaker: CanvasMaker | None,
+) -> bytes:
+    return build_pdf(pickle.loads(payload), doc_options, canvasmaker)
+
+
+class PDFRenderService:
+    """Build PDFs in worker processes with a cap on pending work.
+
+    ``max_pending`` counts builds that are queued or running; once reached,
+    :meth:`render` raises :class:`PDFRenderQueueFull`. ``max_workers=0``
+    builds on a single worker thread instead, as do stories that cannot be
+    pickled.
+    """
+
+    def __init__(self, *, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, 1)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._process_executor: Executor | None = None
+        self._thread_executor: Executor | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _reserve(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise PDFRenderQueueFull(
+                    f"PDF render queue is full ({self.max_pending} pending)"
+                )
+            self._pending += 1
+
+    def _release(self, _future: Future[bytes] | None = None) -> None:
+        with self._lock:
+            self._pending = max(self._pending - 1, 0)
+
+    def _get_process_executor(self) -> Executor:
+        if self._process_executor is None:
+            self._process_executor = spawn_process_pool(
+                self.max_workers, environ=_RENDER_WORKER_ENV
+            )
+        return self._process_executor
+
+    def _get_thread_executor(self) -> Executor:
+        if self._thread_executor is None:
+            # One thread: cached flowables are shared between in-process builds.
+            self._thread_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="pdf-render"
+            )
+        return self._thread_executor
+
+    def _submit(
+        self,
+        story: Sequence[Flowable],
+        doc_options: Mapping[str, Any],
+        canvasmaker: CanvasMaker | None,
+    ) -> Future[bytes]:
+        if self.max_workers > 0:
+            try:
+                payload = pickle.dumps(list(story))
+                pickle.dumps(canvasmaker)
+            except (pickle.PicklingError, AttributeError, TypeError) as exc:
+                logger.warning("pdf_render_story_not_picklable", error=str(exc))
+            else:
+                return self._get_process_executor().submit(
+                    _build_pickled_pdf, payload, dict(doc_options), canvasmaker
+                )
+        return self._get_thread_executor().submit(
+            build_pdf, list(story), dict(doc_options), canvasmaker
+        )
+
+    async def render(
+        self,
+        story: Sequence[Flowable],
+        *,
+        doc_options: Mapping[str, Any],
+        canvasmaker: CanvasMaker | None = None,
+    ) -> bytes:
+        """Build ``story`` off the event loop and return the PDF bytes.
+
+        ``canvasmaker`` must be picklable (a class or ``functools.partial``)
+        for the build to run in a worker process.
+        """
+
+        self._reserve()
+        try:
+            future = self._submit(story, doc_options, canvasmaker)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            logger.warning("pdf_render_pool_broken")
+            self.shutdown(wait=False)
+            raise
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the workers; new executors start on the next render."""
+
+        executors = (self._process_executor, self._thread_executor)
+        self._process_executor = self._thread_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_render_service: PDFRenderService | None = None
+
+
+def get_pdf_render_service() -> PDFRenderService:
+    """Return the process-wide PDF render service configured from settings."""
+
+    global _render_service
+    if _render_service is None:
+        _render_service = PDFRenderService(
+            max_workers=settings.PDF_RENDER_WORKERS,
+            max_pending=settings.PDF_RENDER_QUEUE_LIMIT,
+        )
+    return _render_service
+
+
+def shutdown_pdf_render_service() -> None:
+    """Stop the shared PDF render service, if one was started."""
+
+    global _render_service
+    service, _render_service = _render_service, None
+    if service is not None:
+        service.shutdown(wait=False)
+
+
+__all__ = [
+    "ChartDrawing",
+    "ContentCache",
+    "PDFRenderQueueFull",
+    "PDFRenderService",
+    "build_pdf",
+    "chart_cache",
+    "chart_drawing",
+    "content_hash",
+    "get_pdf_render_service",
+    "section_cache",
+    "shutdown_pdf_render_service",
+]
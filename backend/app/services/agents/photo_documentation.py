@@ -1,8 +1,10 @@
 """Photo Documentation system for property site conditions."""
 
+import asyncio
+from dataclasses import dataclass
 from datetime import datetime
 from io import BytesIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
 from uuid import UUID, uuid4
 
 from backend._compat.datetime import utcnow
@@ -24,6 +26,11 @@ import structlog
 
 from app.core.config import settings
 from app.models.property import PropertyPhoto
+from app.services.agents.photo_pipeline import (
+    decode_photo,
+    get_photo_executor,
+    render_photo_versions,
+)
 from app.services.minio_service import MinIOService
 
 logger = structlog.get_logger()
@@ -76,6 +83,28 @@ class PhotoMetadata:
         }
 
 
+class PhotoSource(Protocol):
+    """An uploaded photo read on demand, e.g. a FastAPI ``UploadFile``."""
+
+    filename: Optional[str]
+    content_type: Optional[str]
+
+    async def read(self) -> bytes: ...
+
+
+@dataclass
+class PhotoBatchResult:
+    """Outcome for one photo of a batch upload."""
+
+    filename: str
+    metadata: Optional[PhotoMetadata] = None
+    error: Optional[str] = None
+
+    @property
+    def status(self) -> str:
+        return "stored" if self.metadata is not None else "failed"
+
+
 class PhotoDocumentationManager:
     """Manager for property photo documentation and analysis."""
 
@@ -123,69 +152,184 @@ class PhotoDocumentationManager:
             phase: Property phase (acquisition or sales) for watermark text
         """
         try:
-            photo_id = uuid4()
-
-            # Validate photo format
-            if not self._validate_photo_format(filename):
-                raise ValueError(f"Unsupported photo format: {filename}")
-
-            # Open image for processing
-            if Image is None:
-                raise RuntimeError("Pillow is required to process images")
-            image = Image.open(BytesIO(photo_data))
-
-            # Extract EXIF data
-            exif_data = self._extract_exif_data(photo_data)
-            gps_info = self._extract_gps_from_exif(exif_data)
-            timestamp = self._extract_timestamp_from_exif(exif_data)
-            camera_info = self._extract_camera_info_from_exif(exif_data)
-
-            # Analyze image for conditions
-            auto_tags = await self._analyze_site_conditions(image)
-
-            # Generate optimized versions with phase-specific watermarks
-            versions = await self._generate_image_versions(image, photo_id, phase=phase)
-
-            # Store all versions in S3
-            storage_key = await self._store_photo_versions(
-                versions, property_id, photo_id
+            metadata, record = await self._prepare_photo(
+                photo_data, property_id, filename, user_metadata, phase
             )
 
             # Create database record
-            await self._create_photo_record(
-                photo_id=photo_id,
-                property_id=UUID(property_id),
-                storage_key=storage_key,
-                filename=filename,
-                file_size=len(photo_data),
-                location=gps_info,
-                capture_timestamp=timestamp,
-                auto_tags=auto_tags,
-                camera_info=camera_info,
-                exif_data=exif_data,
-                user_metadata=user_metadata,
-                session=session,
+            await session.execute(insert(PropertyPhoto).values(**record))
+            logger.info(
+                f"Created photo record: {metadata.photo_id} for property {property_id}"
             )
 
             await session.commit()
 
-            # Return metadata
-            return PhotoMetadata(
-                photo_id=photo_id,
-                property_id=UUID(property_id),
-                storage_key=storage_key,
-                location=gps_info,
-                capture_timestamp=timestamp,
-                auto_tagged_conditions=auto_tags,
-                camera_info=camera_info,
-                file_size=len(photo_data),
-            )
+            return metadata
 
         except Exception as e:
             logger.error(f"Error processing photo: {str(e)}")
             await session.rollback()
             raise
 
+    async def process_photo_batch(
+        self,
+        photos: Sequence[PhotoSource],
+        property_id: str,
+        session: AsyncSession,
+        user_metadata: Optional[Dict[str, str]] = None,
+        phase: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[PhotoBatchResult]:
+        """
+        Process and store a site visit's photos together.
+
+        Photos are read and processed at most ``concurrency`` at a time, so
+        only that many uploads are held in memory. A photo that cannot be
+        processed is reported as failed without stopping the batch, and the
+        records of all stored photos are written in one transaction.
+
+        Args:
+            photos: Uploaded photos, read on demand
+            property_id: Property ID
+            session: Database session
+            user_metadata: Optional user-provided metadata applied to every photo
+            phase: Property phase (acquisition or sales) for watermark text
+            concurrency: Photos processed at once (default PHOTO_BATCH_CONCURRENCY)
+
+        Returns:
+            Per-photo results ordered by EXIF capture time; photos without one
+            (and failures) follow in upload order
+        """
+        UUID(property_id)  # reject a malformed ID before doing any work
+        limit = asyncio.Semaphore(concurrency or settings.PHOTO_BATCH_CONCURRENCY)
+
+        async def _process(
+            source: PhotoSource,
+        ) -> Tuple[PhotoBatchResult, Optional[Dict[str, Any]]]:
+            filename = source.filename or "photo.jpg"
+            async with limit:
+                try:
+                    if source.content_type and not source.content_type.startswith(
+                        "image/"
+                    ):
+                        raise ValueError("File must be an image")
+                    metadata, record = await self._prepare_photo(
+                        await source.read(),
+                        property_id,
+                        filename,
+                        user_metadata,
+                        phase,
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not process photo {filename}: {str(e)}")
+                    error = (
+                        str(e)
+                        if isinstance(e, ValueError)
+                        else "Photo could not be processed"
+                    )
+                    return PhotoBatchResult(filename=filename, error=error), None
+            return PhotoBatchResult(filename=filename, metadata=metadata), record
+
+        processed = await asyncio.gather(*(_process(photo) for photo in photos))
+
+        def _capture_order(index: int) -> Tuple[bool, datetime, int]:
+            record = processed[index][1]
+            captured = record["capture_date"] if record else None
+            return captured is None, captured or datetime.min, index
+
+        ordered = [
+            processed[i] for i in sorted(range(len(processed)), key=_capture_order)
+        ]
+        records = [record for _, record in ordered if record is not None]
+
+        if records:
+            try:
+                await session.execute(insert(PropertyPhoto), records)
+                await session.commit()
+            except Exception as e:
+                logger.error(f"Error storing photo batch: {str(e)}")
+                await session.rollback()
+                await asyncio.gather(
+                    *(
+                        self._remove_photo_versions(record["storage_key"])
+                        for record in records
+                    )
+                )
+                raise
+
+            logger.info(
+                f"Created {len(records)} photo records for property {property_id}"
+            )
+
+        return [result for result, _ in ordered]
+
+    async def _prepare_photo(
+        self,
+        photo_data: bytes,
+        property_id: str,
+        filename: str,
+        user_metadata: Optional[Dict[str, str]],
+        phase: Optional[str],
+    ) -> Tuple[PhotoMetadata, Dict[str, Any]]:
+        """Analyze and store a photo's versions; return its metadata and record."""
+        photo_id = uuid4()
+
+        # Validate photo format
+        if not self._validate_photo_format(filename):
+            raise ValueError(f"Unsupported photo format: {filename}")
+
+        # Decode once, off the event loop; large JPEGs decode in draft mode
+        if Image is None:
+            raise RuntimeError("Pillow is required to process images")
+        decoded = await asyncio.get_running_loop().run_in_executor(
+            get_photo_executor(), decode_photo, photo_data
+        )
+
+        # Extract EXIF data
+        exif_data = self._extract_exif_data(photo_data)
+        gps_info = self._extract_gps_from_exif(exif_data)
+        timestamp = self._extract_timestamp_from_exif(exif_data)
+        camera_info = self._extract_camera_info_from_exif(exif_data)
+
+        # Analyze image for conditions
+        auto_tags = await self._analyze_site_conditions(decoded.image)
+
+        # Generate optimized versions with phase-specific watermarks
+        versions = await self._generate_image_versions(
+            decoded.image,
+            photo_id,
+            phase=phase,
+            source_jpeg=decoded.source_jpeg,
+        )
+
+        # Store all versions in S3
+        storage_key = await self._store_photo_versions(versions, property_id, photo_id)
+
+        record = self._photo_record(
+            photo_id=photo_id,
+            property_id=UUID(property_id),
+            storage_key=storage_key,
+            filename=filename,
+            file_size=len(photo_data),
+            location=gps_info,
+            capture_timestamp=timestamp,
+            auto_tags=auto_tags,
+            camera_info=camera_info,
+            exif_data=exif_data,
+            user_metadata=user_metadata,
+        )
+        metadata = PhotoMetadata(
+            photo_id=photo_id,
+            property_id=UUID(property_id),
+            storage_key=storage_key,
+            location=gps_info,
+            capture_timestamp=timestamp,
+            auto_tagged_conditions=auto_tags,
+            camera_info=camera_info,
+            file_size=len(photo_data),
+        )
+        return metadata, record
+
     def _validate_photo_format(self, filename: str) -> bool:
         """Validate photo file format."""
         import os
@@ -400,82 +544,34 @@ class PhotoDocumentationManager:
         photo_id: UUID,
         apply_watermark: bool = True,
         phase: Optional[str] = None,
+        source_jpeg: Optional[bytes] = None,
     ) -> Dict[str, BytesIO]:
         """Generate multiple versions of the image.
 
+        Versions are resized from ``image`` and encoded in parallel on the
+        photo pipeline's worker pool; watermarks are drawn on the in-memory
+        images rather than on re-decoded JPEGs.
+
         Args:
             image: PIL Image object
             photo_id: UUID of the photo
             apply_watermark: If True, generate watermarked versions for marketing
             phase: Property phase (acquisition or sales) for watermark text
+            source_jpeg: Uploaded JPEG bytes to store as the original unchanged
 
         Returns:
             Dictionary of version name to BytesIO buffer
         """
-        from app.services.agents.image_watermark import (
-            apply_diagonal_watermark,
-            get_watermark_text_for_phase,
-        )
-        from app.services.agents.image_watermark import (
-            apply_watermark as add_watermark,
-        )
-
-        # Get phase-specific watermark text
-        watermark_text = get_watermark_text_for_phase(phase)
-
-        versions = {}
-
-        # Original (no watermark - for internal use)
-        original_buffer = BytesIO()
-        image.save(original_buffer, format="JPEG", quality=95)
-        original_buffer.seek(0)
-        versions["original"] = original_buffer
-
-        # Thumbnail (300x300) - no watermark, too small
-        thumbnail = image.copy()
-        thumbnail.thumbnail((300, 300), Image.Resampling.LANCZOS)
-        thumb_buffer = BytesIO()
-        thumbnail.save(thumb_buffer, format="JPEG", quality=85)
-        thumb_buffer.seek(0)
-        versions["thumbnail"] = thumb_buffer
-
-        # Medium (1200x1200)
-        medium = image.copy()
-        medium.thumbnail((1200, 1200), Image.Resampling.LANCZOS)
-        medium_buffer = BytesIO()
-        medium.save(medium_buffer, format="JPEG", quality=90)
-        medium_buffer.seek(0)
-        versions["medium"] = medium_buffer
-
-        # Web optimized (1920x1920)
-        web = image.copy()
-        web.thumbnail((1920, 1920), Image.Resampling.LANCZOS)
-        web_buffer = BytesIO()
-        web.save(web_buffer, format="JPEG", quality=85, optimize=True)
-        web_buffer.seek(0)
-        versions["web"] = web_buffer
-
-        # Generate watermarked versions for marketing materials
-        if apply_watermark:
-            # Watermarked web version (corner watermark with phase-specific text)
-            web_watermarked_bytes = add_watermark(
-                web_buffer.getvalue(),
-                text=watermark_text,
-                position="bottom-right",
-            )
-            versions["web_watermarked"] = BytesIO(web_watermarked_bytes)
-
-            # Watermarked medium version with diagonal pattern (for marketing pack)
-            medium_buffer.seek(0)
-            marketing_watermarked_bytes = apply_diagonal_watermark(
-                medium_buffer.getvalue(),
-                text=watermark_text,
-                opacity=80,  # More subtle for marketing
-                repeat=True,
-            )
-            versions["marketing"] = BytesIO(marketing_watermarked_bytes)
+        from app.services.agents.image_watermark import get_watermark_text_for_phase
 
-        return versions
+        return await render_photo_versions(
+            image,
+            # Phase-specific watermark text
+            watermark_text=(
+                get_watermark_text_for_phase(phase) if apply_watermark else None
+            ),
+            source_jpeg=source_jpeg,
+        )
 
     async def _store_photo_versions(
         self, versions: Dict[str, BytesIO], property_id: str, photo_id: UUID
@@ -483,8 +579,7 @@ class PhotoDocumentationManager:
         """Store photo versions in MinIO/S3."""
         base_key = f"agents/properties/{property_id}/photos/{photo_id}"
 
-        # Store each version
-        for version_name, buffer in versions.items():
+        async def _upload(version_name: str, buffer: BytesIO) -> None:
             key = f"{base_key}/{version_name}.jpg"
 
             # Upload to S3
@@ -497,10 +592,15 @@ class PhotoDocumentationManager:
 
             logger.info(f"Uploaded {version_name} version to {key}")
 
+        # Store all versions concurrently
+        await asyncio.gather(
+            *(_upload(name, buffer) for name, buffer in versions.items())
+        )
+
         # Return the base key (original is at base_key/original.jpg)
         return f"{base_key}/original.jpg"
 
-    async def _create_photo_record(
+    def _photo_record(
         self,
         photo_id: UUID,
         property_id: UUID,
@@ -513,16 +613,15 @@ class PhotoDocumentationManager:
         camera_info: Dict[str, str],
         exif_data: Dict[str, Any],
         user_metadata: Optional[Dict[str, str]],
-        session: AsyncSession,
-    ) -> None:
-        """Create photo record in database."""
+    ) -> Dict[str, Any]:
+        """Build the ``PropertyPhoto`` row values for a processed photo."""
 
         # Create point geometry if location available
         capture_location = None
         if location:
             capture_location = f"POINT({location['longitude']} {location['latitude']})"
 
-        photo_record = {
+        return {
             "id": photo_id,
             "property_id": property_id,
             "storage_key": storage_key,
@@ -541,6 +640,36 @@ class PhotoDocumentationManager:
             "camera_model": camera_info.get("model"),
         }
 
+    async def _create_photo_record(
+        self,
+        photo_id: UUID,
+        property_id: UUID,
+        storage_key: str,
+        filename: str,
+        file_size: int,
+        location: Optional[Dict[str, float]],
+        capture_timestamp: Optional[datetime],
+        auto_tags: List[str],
+        camera_info: Dict[str, str],
+        exif_data: Dict[str, Any],
+        user_metadata: Optional[Dict[str, str]],
+        session: AsyncSession,
+    ) -> None:
+        """Create photo record in database."""
+        photo_record = self._photo_record(
+            photo_id=photo_id,
+            property_id=property_id,
+            storage_key=storage_key,
+            filename=filename,
+            file_size=file_size,
+            location=location,
+            capture_timestamp=capture_timestamp,
+            auto_tags=auto_tags,
+            camera_info=camera_info,
+            exif_data=exif_data,
+            user_metadata=user_metadata,
+        )
+
         stmt = insert(PropertyPhoto).values(**photo_record)
         await session.execute(stmt)
 
@@ -613,13 +742,7 @@ class PhotoDocumentationManager:
             return False
 
         # Delete from storage
-        base_key = photo.storage_key.replace("/original.jpg", "")
-        for version in PHOTO_VERSION_NAMES:
-            key = f"{base_key}/{version}.jpg"
-            try:
-                await self.storage.remove_object(settings.S3_BUCKET, key)
-            except Exception as e:
-                logger.warning(f"Could not delete {key}: {str(e)}")
+        await self._remove_photo_versions(photo.storage_key)
 
         # Delete from database
         stmt = delete(PropertyPhoto).where(PropertyPhoto.id == UUID(photo_id))
@@ -628,3 +751,13 @@ class PhotoDocumentationManager:
 
         logger.info(f"Deleted photo {photo_id}")
         return True
+
+    async def _remove_photo_versions(self, storage_key: str) -> None:
+        """Remove every stored version of a photo, logging failures."""
+        base_key = storage_key.replace("/original.jpg", "")
+        for version in PHOTO_VERSION_NAMES:
+            key = f"{base_key}/{version}.jpg"
+            try:
+                await self.storage.remove_object(settings.S3_BUCKET, key)
+            except Exception as e:
+                logger.warning(f"Could not delete {key}: {str(e)}")
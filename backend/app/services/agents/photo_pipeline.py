@@ -0,0 +1,187 @@
+"""Decode-once pipeline producing the stored versions of a site photo.
+
+An upload is decoded a single time: camera JPEGs in draft mode, at the
+smallest DCT scale that still covers the largest derived version, and the
+uploaded JPEG itself is kept as the original. Thumbnail, medium and web
+versions are resized from that decoded image and watermarked in memory,
+and each version encodes on a shared worker thread pool so they run in
+parallel (Pillow releases the GIL while resampling and encoding).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, Callable, Dict, Optional
+
+try:  # pragma: no cover - optional runtime dependency
+    from PIL import Image
+except ModuleNotFoundError:  # pragma: no cover
+    Image = None
+
+from app.core.config import settings
+from app.services.agents.image_watermark import (
+    diagonal_watermark_image,
+    watermark_image,
+)
+
+THUMBNAIL_MAX_EDGE = 300
+MEDIUM_MAX_EDGE = 1200
+WEB_MAX_EDGE = 1920
+
+# Marketing copies use a subtler diagonal pattern than the default.
+MARKETING_WATERMARK_OPACITY = 80
+
+
+@dataclass(frozen=True)
+class DecodedPhoto:
+    """A decoded upload plus the bytes to store as its original version.
+
+    ``source_jpeg`` is the upload itself when it already was a JPEG, in
+    which case ``image`` may be a draft-mode reduction of it.
+    """
+
+    image: Any
+    source_jpeg: Optional[bytes] = None
+
+
+def decode_photo(photo_data: bytes, max_edge: int = WEB_MAX_EDGE) -> DecodedPhoto:
+    """Decode ``photo_data`` once into an RGB image.
+
+    JPEGs are decoded at a reduced DCT scale no smaller than ``max_edge``
+    on either side and the raw upload is kept as the original; other
+    formats are decoded in full so the original can be re-encoded.
+    """
+    if Image is None:
+        raise RuntimeError("Pillow is required to process images")
+
+    image = Image.open(BytesIO(photo_data))
+    source_jpeg = None
+    if image.format == "JPEG":
+        # Draft keeps both sides at or above the requested size, so ask for
+        # the aspect-preserving target rather than a square box.
+        scale = min(max_edge / max(image.size), 1.0)
+        image.draft("RGB", tuple(math.ceil(side * scale) for side in image.size))
+        source_jpeg = photo_data
+    return DecodedPhoto(image=_as_rgb(image), source_jpeg=source_jpeg)
+
+
+def _as_rgb(image: Any) -> Any:
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    image.load()
+    return image
+
+
+def _encode(image: Any, **save_options: Any) -> BytesIO:
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", **save_options)
+    buffer.seek(0)
+    return buffer
+
+
+def _resized(image: Any, max_edge: int) -> Any:
+    resized = image.copy()
+    resized.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    return resized
+
+
+def _original_version(image: Any, source_jpeg: Optional[bytes]) -> Dict[str, BytesIO]:
+    if source_jpeg is not None:
+        return {"original": BytesIO(source_jpeg)}
+    return {"original": _encode(image, quality=95)}
+
+
+def _thumbnail_version(image: Any) -> Dict[str, BytesIO]:
+    return {"thumbnail": _encode(_resized(image, THUMBNAIL_MAX_EDGE), quality=85)}
+
+
+def _medium_versions(image: Any, watermark_text: Optional[str]) -> Dict[str, BytesIO]:
+    medium = _resized(image, MEDIUM_MAX_EDGE)
+    versions = {"medium": _encode(medium, quality=90)}
+    if watermark_text is not None:
+        marketing = diagonal_watermark_image(
+            medium,
+            text=watermark_text,
+            opacity=MARKETING_WATERMARK_OPACITY,
+            repeat=True,
+        )
+        versions["marketing"] = _encode(marketing, quality=90)
+    return versions
+
+
+def _web_versions(image: Any, watermark_text: Optional[str]) -> Dict[str, BytesIO]:
+    web = _resized(image, WEB_MAX_EDGE)
+    versions = {"web": _encode(web, quality=85, optimize=True)}
+    if watermark_text is not None:
+        watermarked = watermark_image(web, text=watermark_text, position="bottom-right")
+        versions["web_watermarked"] = _encode(watermarked, quality=90)
+    return versions
+
+
+async def render_photo_versions(
+    image: Any,
+    *,
+    watermark_text: Optional[str] = None,
+    source_jpeg: Optional[bytes] = None,
+) -> Dict[str, BytesIO]:
+    """Encode every stored version of ``image`` in parallel.
+
+    ``watermark_text`` adds the ``web_watermarked`` and ``marketing``
+    versions; ``source_jpeg`` is stored verbatim as the original.
+    """
+    image = _as_rgb(image)
+    loop = asyncio.get_running_loop()
+    executor = get_photo_executor()
+    jobs: list[tuple[Callable[..., Dict[str, BytesIO]], tuple[Any, ...]]] = [
+        (_original_version, (image, source_jpeg)),
+        (_thumbnail_version, (image,)),
+        (_medium_versions, (image, watermark_text)),
+        (_web_versions, (image, watermark_text)),
+    ]
+    results = await asyncio.gather(
+        *(loop.run_in_executor(executor, job, *args) for job, args in jobs)
+    )
+
+    versions: Dict[str, BytesIO] = {}
+    for result in results:
+        versions.update(result)
+    return versions
+
+
+_photo_executor: Optional[ThreadPoolExecutor] = None
+_photo_executor_lock = threading.Lock()
+
+
+def get_photo_executor() -> ThreadPoolExecutor:
+    """Return the process-wide photo encoding pool."""
+    global _photo_executor
+    with _photo_executor_lock:
+        if _photo_executor is None:
+            _photo_executor = ThreadPoolExecutor(
+                max_workers=settings.PHOTO_PIPELINE_WORKERS,
+                thread_name_prefix="photo-pipeline",
+            )
+        return _photo_executor
+
+
+def shutdown_photo_executor() -> None:
+    """Stop the shared photo encoding pool, if one was started."""
+    global _photo_executor
+    with _photo_executor_lock:
+        executor, _photo_executor = _photo_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "DecodedPhoto",
+    "decode_photo",
+    "get_photo_executor",
+    "render_photo_versions",
+    "shutdown_photo_executor",
+]
@@ -7,14 +7,12 @@ import logging
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     ListFlowable,
     ListItem,
     PageBreak,
     Paragraph,
-    SimpleDocTemplate,
     Spacer,
 )
 from sqlalchemy import String, cast, select
@@ -22,7 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.market import YieldBenchmark
 from app.models.property import DevelopmentAnalysis, MarketTransaction, Property
-from app.services.agents.pdf_generator import PageNumberCanvas, PDFGenerator
+from app.services.agents.pdf_generator import PDFGenerator
 
 logger = logging.getLogger(__name__)
 
@@ -41,21 +39,6 @@ class UniversalSitePackGenerator(PDFGenerator):
         property_data = await self._load_property_data(property_id, session)
         market_data = await self._load_market_data(property_data["property"], session)
 
-        # Create PDF buffer
-        buffer = io.BytesIO()
-
-        # Create document with BaseDocTemplate for custom page templates
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=inch,
-            bottomMargin=inch,
-            title="Universal Site Pack",
-            author="Commercial Property Advisors",
-        )
-
         # Build content
         story = []
         logger.info(f"Starting PDF generation for property {property_id}")
@@ -157,18 +140,17 @@ class UniversalSitePackGenerator(PDFGenerator):
             f"Final story contains {len(story)} total flowables. Building PDF..."
         )
 
-        # Build PDF with custom canvas for page numbers
-        doc.build(
+        # Build PDF off the event loop with page numbers
+        buffer = await self._render_story(
             story,
-            canvasmaker=lambda *args, **kwargs: PageNumberCanvas(
-                *args,
-                company_name="Commercial Property Advisors",
-                document_title="Universal Site Pack",
-                **kwargs,
-            ),
+            "Universal Site Pack",
+            rightMargin=0.75 * inch,
+            leftMargin=0.75 * inch,
+            topMargin=inch,
+            bottomMargin=inch,
+            title="Universal Site Pack",
+            author="Commercial Property Advisors",
         )
-
-        buffer.seek(0)
         pdf_size = len(buffer.getvalue())
         logger.info(f"PDF generation complete. PDF size: {pdf_size} bytes")
         return buffer
@@ -792,6 +774,11 @@ class UniversalSitePackGenerator(PDFGenerator):
 
     def _create_appendix_disclaimers(self) -> List[Any]:
         """Create appendix and disclaimers section."""
+        return self._cached_section(
+            "appendix_disclaimers", self._build_appendix_disclaimers
+        )
+
+    def _build_appendix_disclaimers(self) -> List[Any]:
         story = []
 
         story.append(self._create_header_table("Important Disclaimers"))
@@ -1,26 +1,38 @@
 """Phase 1.3: Smart Alerts & Anomaly Detection.
 
 Monitors key metrics and generates alerts when anomalies are detected.
+
+Each rule evaluates a set of users with grouped queries. The scheduled cycle
+runs every rule once for the whole firm, concurrently, re-checking only the
+users whose inputs changed since the rule's watermark, and persists the
+alerts so reading a user's alerts is a single query.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import and_, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from backend._compat.datetime import UTC, utcnow
+from sqlalchemy import and_, case, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.models.anomaly import AnomalyAlertRecord, AnomalyRuleWatermark
 from app.models.business_performance import (
     AgentDeal,
     DealStatus,
 )
-from app.models.property import MarketTransaction
-from app.models.regulatory import AuthoritySubmission
+from app.models.property import MarketTransaction, Property
+from app.models.regulatory import AuthoritySubmission, SubmissionStatus
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +73,51 @@ class Alert:
     created_at: datetime = field(default_factory=datetime.now)
     expires_at: datetime | None = None
     acknowledged: bool = False
+    user_id: str | None = None  # None for firm-wide alerts
+
+
+PRIORITY_ORDER = {
+    AlertPriority.URGENT: 0,
+    AlertPriority.HIGH: 1,
+    AlertPriority.NORMAL: 2,
+    AlertPriority.LOW: 3,
+}
+
+DEFAULT_RULE_CONCURRENCY = 4
+# Deals are stamped before their transaction commits, so a run can miss rows
+# stamped just before its watermark. Re-reading this far behind it picks them
+# up next cycle; re-evaluating a user is idempotent.
+DEFAULT_WATERMARK_OVERLAP = timedelta(hours=1)
+
+
+def _sort_by_priority(alerts: list[Alert]) -> None:
+    alerts.sort(key=lambda a: PRIORITY_ORDER.get(a.priority, 99))
+
+
+async def _open_deals(
+    db: AsyncSession, user_ids: Collection[str] | None
+) -> Sequence[AgentDeal]:
+    query = select(AgentDeal).where(AgentDeal.status == DealStatus.OPEN)
+    if user_ids is not None:
+        query = query.where(AgentDeal.agent_id.in_(list(user_ids)))
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+async def _agents_with_deal_changes(db: AsyncSession, since: datetime) -> set[str]:
+    result = await db.execute(
+        select(AgentDeal.agent_id).where(AgentDeal.updated_at >= since).distinct()
+    )
+    return {str(agent_id) for agent_id in result.scalars()}
+
+
+async def _market_changed(db: AsyncSession, since: datetime) -> bool:
+    result = await db.execute(
+        select(MarketTransaction.id)
+        .where(MarketTransaction.synced_at >= since)
+        .limit(1)
+    )
+    return result.first() is not None
 
 
 class AlertRule(ABC):
@@ -71,7 +128,6 @@ class AlertRule(ABC):
     default_priority: AlertPriority
     check_interval_minutes: int = 60
 
-    @abstractmethod
     async def check(
         self,
         db: AsyncSession,
@@ -88,7 +144,29 @@ class AlertRule(ABC):
         Returns:
             List of alerts generated
         """
-        pass
+        return await self.evaluate(db, [user_id])
+
+    @abstractmethod
+    async def evaluate(
+        self,
+        db: AsyncSession,
+        user_ids: Collection[str] | None,
+    ) -> list[Alert]:
+        """Check alert conditions for ``user_ids``, or every user when ``None``.
+
+        Firm-wide alerts (``user_id`` of ``None``) are returned regardless of
+        ``user_ids``.
+        """
+
+    async def changed_users(
+        self, db: AsyncSession, since: datetime
+    ) -> Collection[str] | None:
+        """Return the users whose inputs changed since ``since``.
+
+        ``None`` means every user must be re-checked; this default suits rules
+        whose conditions change with the passage of time alone.
+        """
+        return None
 
 
 class AssumptionVsMarketRule(AlertRule):
@@ -99,25 +177,22 @@ class AssumptionVsMarketRule(AlertRule):
     default_priority = AlertPriority.HIGH
     check_interval_minutes = 240  # Check every 4 hours
 
-    async def check(
+    async def changed_users(
+        self, db: AsyncSession, since: datetime
+    ) -> Collection[str] | None:
+        """New transactions move the market average and affect every deal."""
+        if await _market_changed(db, since):
+            return None
+        return await _agents_with_deal_changes(db, since)
+
+    async def evaluate(
         self,
         db: AsyncSession,
-        user_id: str,
-        context: dict[str, Any],
+        user_ids: Collection[str] | None,
     ) -> list[Alert]:
         """Check if any deal assumptions deviate from market averages."""
         alerts: list[Alert] = []
 
-        # Get user's open deals
-        deals_query = select(AgentDeal).where(
-            and_(
-                AgentDeal.agent_id == user_id,
-                AgentDeal.status == DealStatus.OPEN,
-            )
-        )
-        result = await db.execute(deals_query)
-        deals = result.scalars().all()
-
         # Get recent market transactions for comparison
         six_months_ago = datetime.now() - timedelta(days=180)
         market_query = select(
@@ -130,8 +205,8 @@ class AssumptionVsMarketRule(AlertRule):
         if market_avg == 0:
             return alerts
 
-        # Check each deal's assumptions against market
-        for deal in deals:
+        # Check each open deal's assumptions against market
+        for deal in await _open_deals(db, user_ids):
             deal_metadata = deal.metadata_json or {}
             assumed_psf = deal_metadata.get("assumed_psf")
 
@@ -163,6 +238,7 @@ class AssumptionVsMarketRule(AlertRule):
                                 "Check recent comparable transactions",
                                 "Consider adjusting the offer price",
                             ],
+                            user_id=str(deal.agent_id),
                         )
                     )
 
@@ -177,11 +253,19 @@ class PipelineVelocityRule(AlertRule):
     default_priority = AlertPriority.NORMAL
     check_interval_minutes = 1440  # Check daily
 
-    async def check(
+    async def changed_users(
+        self, db: AsyncSession, since: datetime
+    ) -> Collection[str] | None:
+        """A new month shifts both comparison windows for every user."""
+        now = utcnow()
+        if (since.year, since.month) != (now.year, now.month):
+            return None
+        return await _agents_with_deal_changes(db, since)
+
+    async def evaluate(
         self,
         db: AsyncSession,
-        user_id: str,
-        context: dict[str, Any],
+        user_ids: Collection[str] | None,
     ) -> list[Alert]:
         """Check for significant changes in pipeline metrics."""
         alerts = []
@@ -190,33 +274,44 @@ class PipelineVelocityRule(AlertRule):
         this_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
         last_month_start = (this_month_start - timedelta(days=1)).replace(day=1)
 
-        # This month's pipeline value
-        this_month_query = select(func.sum(AgentDeal.estimated_value_amount)).where(
-            and_(
-                AgentDeal.agent_id == user_id,
-                AgentDeal.status == DealStatus.OPEN,
-                AgentDeal.created_at >= this_month_start,
+        # This and last month's open pipeline value per agent
+        in_this_month = AgentDeal.created_at >= this_month_start
+        value = AgentDeal.estimated_value_amount
+        pipeline_query = (
+            select(
+                AgentDeal.agent_id,
+                func.sum(case((in_this_month, value), else_=0)),
+                func.sum(case((in_this_month, 0), else_=value)),
             )
-        )
-        this_month_result = await db.execute(this_month_query)
-        this_month_value = float(this_month_result.scalar() or 0)
-
-        # Last month's pipeline value
-        last_month_query = select(func.sum(AgentDeal.estimated_value_amount)).where(
-            and_(
-                AgentDeal.agent_id == user_id,
-                AgentDeal.status == DealStatus.OPEN,
-                AgentDeal.created_at >= last_month_start,
-                AgentDeal.created_at < this_month_start,
+            .where(
+                and_(
+                    AgentDeal.status == DealStatus.OPEN,
+                    AgentDeal.created_at >= last_month_start,
+                )
             )
+            .group_by(AgentDeal.agent_id)
         )
-        last_month_result = await db.execute(last_month_query)
-        last_month_value = float(last_month_result.scalar() or 0)
+        if user_ids is not None:
+            pipeline_query = pipeline_query.where(
+                AgentDeal.agent_id.in_(list(user_ids))
+            )
+        result = await db.execute(pipeline_query)
+
+        for agent_id, this_month_total, last_month_total in result:
+            user_id = str(agent_id)
+            this_month_value = float(this_month_total or 0)
+            last_month_value = float(last_month_total or 0)
+            if last_month_value <= 0:
+                continue
 
-        if last_month_value > 0:
             change_percent = (
                 (this_month_value - last_month_value) / last_month_value * 100
             )
+            data = {
+                "this_month_value": this_month_value,
+                "last_month_value": last_month_value,
+                "change_percent": change_percent,
+            }
 
             if change_percent < -20:
                 alerts.append(
@@ -232,16 +327,13 @@ class PipelineVelocityRule(AlertRule):
                         ),
                         entity_type="pipeline",
                         entity_id=user_id,
-                        data={
-                            "this_month_value": this_month_value,
-                            "last_month_value": last_month_value,
-                            "change_percent": change_percent,
-                        },
+                        data=data,
                         suggested_actions=[
                             "Review lead generation activities",
                             "Follow up on stalled deals",
                             "Consider expanding prospecting efforts",
                         ],
+                        user_id=user_id,
                     )
                 )
             elif change_percent > 50:
@@ -254,15 +346,12 @@ class PipelineVelocityRule(AlertRule):
                         priority=AlertPriority.LOW,
                         entity_type="pipeline",
                         entity_id=user_id,
-                        data={
-                            "this_month_value": this_month_value,
-                            "last_month_value": last_month_value,
-                            "change_percent": change_percent,
-                        },
+                        data=data,
                         suggested_actions=[
                             "Prioritize high-value opportunities",
                             "Ensure adequate resources for deal management",
                         ],
+                        user_id=user_id,
                     )
                 )
 
@@ -270,29 +359,39 @@ class PipelineVelocityRule(AlertRule):
 
 
 class RegulatoryDelayRule(AlertRule):
-    """Alert when regulatory submissions are delayed."""
+    """Alert when regulatory submissions are delayed.
+
+    Submissions age into the alert window with time alone, so the scheduled
+    cycle re-checks all of them each run; it is a single firm-wide query.
+    """
 
     name = "regulatory_delay"
     category = AlertCategory.REGULATORY
     default_priority = AlertPriority.HIGH
     check_interval_minutes = 720  # Check twice daily
 
-    async def check(
+    async def evaluate(
         self,
         db: AsyncSession,
-        user_id: str,
-        context: dict[str, Any],
+        user_ids: Collection[str] | None,
     ) -> list[Alert]:
         """Check for regulatory submissions that are overdue."""
         alerts = []
 
         # Get pending submissions older than 60 days
-        cutoff_date = datetime.now() - timedelta(days=60)
+        now = utcnow()
+        cutoff_date = now - timedelta(days=60)
 
         submissions_query = select(AuthoritySubmission).where(
             and_(
                 AuthoritySubmission.submitted_at < cutoff_date,
-                AuthoritySubmission.status.in_(["submitted", "in_review", "rfi"]),
+                AuthoritySubmission.status.in_(
+                    [
+                        SubmissionStatus.SUBMITTED,
+                        SubmissionStatus.IN_REVIEW,
+                        SubmissionStatus.RFI,
+                    ]
+                ),
             )
         )
 
@@ -300,12 +399,16 @@ class RegulatoryDelayRule(AlertRule):
         delayed_submissions = result.scalars().all()
 
         for submission in delayed_submissions:
-            days_pending = (datetime.now() - submission.submitted_at).days
+            submitted_at = submission.submitted_at
+            if submitted_at.tzinfo is None:
+                submitted_at = submitted_at.replace(tzinfo=UTC)
+            days_pending = (now - submitted_at).days
+            reference = submission.submission_no or submission.title
 
             alerts.append(
                 Alert(
                     id=f"regulatory_delay_{submission.id}",
-                    title=f"Regulatory Submission Delayed: {submission.reference_number}",
+                    title=f"Regulatory Submission Delayed: {reference}",
                     message=f"Submission has been pending for {days_pending} days (typical: 45 days)",
                     category=self.category,
                     priority=(
@@ -316,10 +419,10 @@ class RegulatoryDelayRule(AlertRule):
                     entity_type="regulatory_submission",
                     entity_id=str(submission.id),
                     data={
-                        "reference_number": submission.reference_number,
-                        "submission_type": submission.submission_type,
+                        "reference_number": reference,
+                        "submission_type": submission.submission_type.value,
                         "days_pending": days_pending,
-                        "submitted_at": submission.submitted_at.isoformat(),
+                        "submitted_at": submitted_at.isoformat(),
                     },
                     suggested_actions=[
                         "Contact the regulatory agency for status update",
@@ -340,42 +443,59 @@ class ComparableTransactionRule(AlertRule):
     default_priority = AlertPriority.NORMAL
     check_interval_minutes = 480  # Check 3 times daily
 
-    async def check(
+    async def changed_users(
+        self, db: AsyncSession, since: datetime
+    ) -> Collection[str] | None:
+        """New transactions are compared against every user's deals."""
+        if await _market_changed(db, since):
+            return None
+        return await _agents_with_deal_changes(db, since)
+
+    async def evaluate(
         self,
         db: AsyncSession,
-        user_id: str,
-        context: dict[str, Any],
+        user_ids: Collection[str] | None,
     ) -> list[Alert]:
-        """Check for new comparable transactions relevant to user's deals."""
+        """Check for new comparable transactions relevant to users' deals."""
         alerts = []
 
         # Get recent transactions (last 7 days)
         week_ago = datetime.now() - timedelta(days=7)
 
         recent_txns_query = (
-            select(MarketTransaction)
+            select(
+                MarketTransaction.id,
+                MarketTransaction.transaction_date,
+                MarketTransaction.psf_price,
+                Property.property_type,
+            )
+            .join(Property, MarketTransaction.property_id == Property.id)
             .where(MarketTransaction.transaction_date >= week_ago.date())
             .order_by(MarketTransaction.transaction_date.desc())
             .limit(10)
         )
 
         result = await db.execute(recent_txns_query)
-        recent_transactions = result.scalars().all()
+        recent_transactions = result.all()
+        if not recent_transactions:
+            return alerts
 
-        # Get user's active deals for comparison
-        deals_query = select(AgentDeal).where(
-            and_(
-                AgentDeal.agent_id == user_id,
-                AgentDeal.status == DealStatus.OPEN,
-            )
-        )
-        deals_result = await db.execute(deals_query)
-        active_deals = deals_result.scalars().all()
+        # Group users' active deals for comparison
+        deals_by_user: dict[str, list[AgentDeal]] = defaultdict(list)
+        for deal in await _open_deals(db, user_ids):
+            deals_by_user[str(deal.agent_id)].append(deal)
 
         for txn in recent_transactions:
-            for deal in active_deals:
-                # Check if transaction is relevant (same asset type, nearby location)
-                if deal.asset_type.value == txn.market_segment:
+            segment = getattr(txn.property_type, "value", txn.property_type)
+            # The transaction drops out of the 7-day window on this date
+            expires_at = datetime.combine(
+                txn.transaction_date + timedelta(days=7), time.min, tzinfo=UTC
+            )
+            for user_id, active_deals in deals_by_user.items():
+                for deal in active_deals:
+                    # Check if transaction is relevant (same asset type)
+                    if deal.asset_type.value != segment:
+                        continue
                     # Check price deviation
                     deal_metadata = deal.metadata_json or {}
                     deal_psf = deal_metadata.get("target_psf")
@@ -406,9 +526,11 @@ class ComparableTransactionRule(AlertRule):
                                         "Adjust pricing strategy if needed",
                                         "Use as comparable in negotiations",
                                     ],
+                                    expires_at=expires_at,
+                                    user_id=user_id,
                                 )
                             )
-                            break  # One alert per transaction
+                            break  # One alert per transaction per user
 
         return alerts
 
@@ -421,11 +543,10 @@ class CashFlowDeviationRule(AlertRule):
     default_priority = AlertPriority.HIGH
     check_interval_minutes = 1440  # Check daily
 
-    async def check(
+    async def evaluate(
         self,
         db: AsyncSession,
-        user_id: str,
-        context: dict[str, Any],
+        user_ids: Collection[str] | None,
     ) -> list[Alert]:
         """Check for cash flow deviations in active projects."""
         # This would typically check against actual vs projected cash flows
@@ -433,6 +554,117 @@ class CashFlowDeviationRule(AlertRule):
         return []
 
 
+@dataclass(frozen=True)
+class RuleRun:
+    """Outcome of one rule in a scheduled detection cycle.
+
+    ``users_checked`` is ``None`` when the rule re-checked every user.
+    """
+
+    rule: str
+    users_checked: int | None = None
+    alerts: int = 0
+    resolved: int = 0
+    error: str | None = None
+
+
+def _dialect_insert(session: AsyncSession) -> Any:
+    bind = session.get_bind()
+    return pg_insert if bind.dialect.name == "postgresql" else sqlite_insert
+
+
+def _aware(value: datetime) -> datetime:
+    # SQLite returns naive datetimes for timezone-aware columns.
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+async def _store_alerts(
+    session: AsyncSession, rule_name: str, alerts: list[Alert], detected_at: datetime
+) -> None:
+    """Upsert ``alerts``, keeping first detection time and acknowledgement."""
+    if not alerts:
+        return
+    rows = [
+        {
+            "alert_key": alert.id,
+            "rule_name": rule_name,
+            "user_id": alert.user_id,
+            "title": alert.title,
+            "message": alert.message,
+            "category": alert.category.value,
+            "priority": alert.priority.value,
+            "entity_type": alert.entity_type,
+            "entity_id": alert.entity_id,
+            "data": alert.data,
+            "suggested_actions": alert.suggested_actions,
+            "detected_at": detected_at,
+            "updated_at": detected_at,
+            "expires_at": alert.expires_at,
+        }
+        for alert in alerts
+    ]
+    stmt = _dialect_insert(session)(AnomalyAlertRecord)
+    refreshed = (
+        "user_id",
+        "title",
+        "message",
+        "category",
+        "priority",
+        "entity_type",
+        "entity_id",
+        "data",
+        "suggested_actions",
+        "updated_at",
+        "expires_at",
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["alert_key"],
+            set_={column: stmt.excluded[column] for column in refreshed},
+        ),
+        rows,
+    )
+
+
+async def _resolve_stale_alerts(
+    session: AsyncSession,
+    rule_name: str,
+    user_ids: Collection[str] | None,
+    detected_at: datetime,
+) -> int:
+    """Delete the rule's alerts within ``user_ids`` that no longer fire.
+
+    Alerts still firing were just upserted with ``updated_at=detected_at``,
+    so anything older in scope is stale.
+    """
+    stmt = delete(AnomalyAlertRecord).where(
+        AnomalyAlertRecord.rule_name == rule_name,
+        AnomalyAlertRecord.updated_at < detected_at,
+    )
+    if user_ids is not None:
+        stmt = stmt.where(AnomalyAlertRecord.user_id.in_(list(user_ids)))
+    result = await session.execute(stmt)
+    return result.rowcount or 0
+
+
+def _alert_from_record(record: AnomalyAlertRecord) -> Alert:
+    return Alert(
+        id=record.alert_key,
+        title=record.title,
+        message=record.message,
+        category=AlertCategory(record.category),
+        priority=AlertPriority(record.priority),
+        entity_type=record.entity_type,
+        entity_id=record.entity_id,
+        data=record.data or {},
+        suggested_actions=record.suggested_actions or [],
+        created_at=_aware(record.detected_at),
+        expires_at=_aware(record.expires_at) if record.expires_at else None,
+        acknowledged=record.acknowledged,
+        user_id=str(record.user_id) if record.user_id else None,
+    )
+
+
 class AnomalyDetectionService:
     """Service that monitors key metrics and generates alerts."""
 
@@ -452,7 +684,7 @@ class AnomalyDetectionService:
         user_id: str,
         context: dict[str, Any] | None = None,
     ) -> list[Alert]:
-        """Run all detection rules and return generated alerts.
+        """Run all detection rules live for one user and return the alerts.
 
         Args:
             db: Database session
@@ -474,16 +706,84 @@ class AnomalyDetectionService:
                 logger.error(f"Error running rule {rule.name}: {e}")
 
         # Sort by priority (urgent first)
-        priority_order = {
-            AlertPriority.URGENT: 0,
-            AlertPriority.HIGH: 1,
-            AlertPriority.NORMAL: 2,
-            AlertPriority.LOW: 3,
-        }
-        all_alerts.sort(key=lambda a: priority_order.get(a.priority, 99))
+        _sort_by_priority(all_alerts)
 
         return all_alerts
 
+    async def run_rule(
+        self,
+        session: AsyncSession,
+        rule: AlertRule,
+        *,
+        overlap: timedelta = DEFAULT_WATERMARK_OVERLAP,
+    ) -> RuleRun:
+        """Evaluate ``rule`` firm-wide since its watermark and persist alerts.
+
+        The watermark advances to the start of this run, and changes are read
+        from ``overlap`` before it, so entities committed late or changed while
+        the rule evaluates are re-checked next cycle. Commits on success.
+        """
+        started_at = utcnow()
+        watermark = await session.get(AnomalyRuleWatermark, rule.name)
+        user_ids = (
+            None
+            if watermark is None
+            else await rule.changed_users(
+                session, _aware(watermark.checked_at) - overlap
+            )
+        )
+
+        alerts: list[Alert] = []
+        resolved = 0
+        if user_ids is None or user_ids:
+            alerts = await rule.evaluate(session, user_ids)
+            await _store_alerts(session, rule.name, alerts, started_at)
+            resolved = await _resolve_stale_alerts(
+                session, rule.name, user_ids, started_at
+            )
+
+        if watermark is None:
+            session.add(
+                AnomalyRuleWatermark(rule_name=rule.name, checked_at=started_at)
+            )
+        else:
+            watermark.checked_at = started_at
+        await session.commit()
+        return RuleRun(
+            rule=rule.name,
+            users_checked=None if user_ids is None else len(user_ids),
+            alerts=len(alerts),
+            resolved=resolved,
+        )
+
+    async def run_scheduled_cycle(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        concurrency: int = DEFAULT_RULE_CONCURRENCY,
+    ) -> list[RuleRun]:
+        """Run every rule once across all users, concurrently.
+
+        Each rule uses its own session; a failing rule is logged, rolled back
+        and reported without affecting the others.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(rule: AlertRule) -> RuleRun:
+            async with semaphore, session_factory() as session:
+                try:
+                    run = await self.run_rule(session, rule)
+                except Exception as e:
+                    await session.rollback()
+                    logger.error(f"Error running rule {rule.name}: {e}")
+                    return RuleRun(rule=rule.name, error=str(e))
+            logger.debug(
+                f"Rule {rule.name} stored {run.alerts} alerts, resolved {run.resolved}"
+            )
+            return run
+
+        return list(await asyncio.gather(*(_run(rule) for rule in self.rules)))
+
     async def get_alerts_for_user(
         self,
         db: AsyncSession,
@@ -493,6 +793,9 @@ class AnomalyDetectionService:
     ) -> list[Alert]:
         """Get filtered alerts for a user.
 
+        Reads the alerts persisted by the scheduled detection cycle, including
+        firm-wide alerts and excluding expired ones.
+
         Args:
             db: Database session
             user_id: User to get alerts for
@@ -502,13 +805,30 @@ class AnomalyDetectionService:
         Returns:
             Filtered list of alerts
         """
-        alerts = await self.run_detection_cycle(db, user_id, {})
+        query = (
+            select(AnomalyAlertRecord)
+            .where(
+                or_(
+                    AnomalyAlertRecord.user_id == user_id,
+                    AnomalyAlertRecord.user_id.is_(None),
+                ),
+                or_(
+                    AnomalyAlertRecord.expires_at.is_(None),
+                    AnomalyAlertRecord.expires_at > utcnow(),
+                ),
+            )
+            .order_by(AnomalyAlertRecord.detected_at.desc())
+        )
 
         if category:
-            alerts = [a for a in alerts if a.category == category]
+            query = query.where(AnomalyAlertRecord.category == category.value)
 
         if priority:
-            alerts = [a for a in alerts if a.priority == priority]
+            query = query.where(AnomalyAlertRecord.priority == priority.value)
+
+        result = await db.execute(query)
+        alerts = [_alert_from_record(record) for record in result.scalars()]
+        _sort_by_priority(alerts)
 
         return alerts
 
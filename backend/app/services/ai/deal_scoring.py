@@ -6,19 +6,23 @@ ML model to predict deal success probability with explainability.
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
+from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.business_performance import (
     AgentDeal,
     DealStatus,
 )
 from app.models.property import MarketTransaction, Property
+from app.services.deals.features import AgentDealFeatures, load_agent_features
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +70,9 @@ class DealScore:
     scored_at: datetime = field(default_factory=datetime.now)
 
 
+# Comparable historical deals attached to each score
+COMPARABLE_DEAL_LIMIT = 5
+
 # Scoring weights for different factors
 SCORING_WEIGHTS = {
     # Location factors
@@ -229,75 +236,114 @@ class DealScoringService:
         Returns:
             DealScore with score, factors, and recommendation
         """
-        # Fetch the deal
-        deal_query = select(AgentDeal).where(AgentDeal.id == deal_id)
-        result = await db.execute(deal_query)
-        deal = result.scalar_one_or_none()
-
-        if not deal:
-            return DealScore(
-                score=0,
-                confidence=ScoreConfidence.LOW,
-                probability=0.0,
-                recommendation="Deal not found",
-            )
-
-        # Fetch related property if available
-        property_data = None
-        if deal.property_id:
-            prop_query = select(Property).where(Property.id == deal.property_id)
-            prop_result = await db.execute(prop_query)
-            property_data = prop_result.scalar_one_or_none()
-
-        # Calculate individual factor scores
-        positive_factors: list[ScoringFactor] = []
-        risk_factors: list[ScoringFactor] = []
-        neutral_factors: list[ScoringFactor] = []
-
-        # Score: Location Match
-        location_score = await self._score_location_match(
-            deal, property_data, db, user_id
-        )
-        self._categorize_factor(
-            location_score, positive_factors, risk_factors, neutral_factors
+        scores = await self.score_deals([deal_id], db, user_id)
+        return scores.get(deal_id) or DealScore(
+            score=0,
+            confidence=ScoreConfidence.LOW,
+            probability=0.0,
+            recommendation="Deal not found",
         )
 
-        # Score: Tenure Adequacy
-        tenure_score = await self._score_tenure(deal, property_data)
-        self._categorize_factor(
-            tenure_score, positive_factors, risk_factors, neutral_factors
-        )
+    async def score_deals(
+        self,
+        deal_ids: Sequence[str],
+        db: AsyncSession,
+        user_id: str,
+        include_comparables: bool = True,
+    ) -> dict[str, DealScore]:
+        """Score a batch of deals, e.g. a pipeline page.
 
-        # Score: Price vs Market
-        price_score = await self._score_price_vs_market(deal, property_data, db)
-        self._categorize_factor(
-            price_score, positive_factors, risk_factors, neutral_factors
-        )
+        The deals, their properties, the user's track record (from the agent
+        deal feature store), the market PSF average and the comparable deals
+        are each fetched once for the whole batch; factors are then computed
+        in memory.
 
-        # Score: GPR Headroom
-        gpr_score = await self._score_gpr_headroom(deal, property_data)
-        self._categorize_factor(
-            gpr_score, positive_factors, risk_factors, neutral_factors
-        )
+        Args:
+            deal_ids: IDs of the deals to score
+            db: Database session
+            user_id: ID of the user requesting the scores
+            include_comparables: Attach comparable historical deals
 
-        # Score: Historical Success Rate
-        history_score = await self._score_historical_success(deal, db, user_id)
-        self._categorize_factor(
-            history_score, positive_factors, risk_factors, neutral_factors
-        )
+        Returns:
+            Scores keyed by the requested deal IDs; deals that do not exist are
+            omitted
+        """
+        requested = {deal_id: _canonical_id(deal_id) for deal_id in deal_ids}
+        if not requested:
+            return {}
 
-        # Score: Competition Level
-        competition_score = await self._score_competition(deal)
-        self._categorize_factor(
-            competition_score, positive_factors, risk_factors, neutral_factors
+        result = await db.execute(
+            select(AgentDeal).where(AgentDeal.id.in_(set(requested.values())))
         )
-
-        # Score: Seller Motivation
-        seller_score = await self._score_seller_motivation(deal)
-        self._categorize_factor(
-            seller_score, positive_factors, risk_factors, neutral_factors
+        deals = {str(deal.id): deal for deal in result.scalars()}
+        if not deals:
+            return {}
+
+        property_ids = {deal.property_id for deal in deals.values() if deal.property_id}
+        properties: dict[str, Property] = {}
+        if property_ids:
+            prop_result = await db.execute(
+                select(Property).where(Property.id.in_(property_ids))
+            )
+            properties = {str(prop.id): prop for prop in prop_result.scalars()}
+
+        features = await load_agent_features(db, user_id)
+        market_avg = None
+        if any((deal.metadata_json or {}).get("target_psf") for deal in deals.values()):
+            market_avg = await self._market_average_psf(db)
+        comparables = (
+            await self._get_comparable_deals(deals.values(), db, user_id)
+            if include_comparables
+            else {}
         )
 
+        scores: dict[str, DealScore] = {}
+        for deal_id, canonical_id in requested.items():
+            deal = deals.get(canonical_id)
+            if deal is None:
+                continue
+            property_data = (
+                properties.get(str(deal.property_id)) if deal.property_id else None
+            )
+            scores[deal_id] = self._score_loaded_deal(
+                deal,
+                property_data,
+                features,
+                market_avg,
+                [
+                    comparable
+                    for comparable in comparables.get(_deal_category(deal), [])
+                    if comparable["id"] != canonical_id
+                ][:COMPARABLE_DEAL_LIMIT],
+            )
+        return scores
+
+    def _score_loaded_deal(
+        self,
+        deal: AgentDeal,
+        property_data: Property | None,
+        features: AgentDealFeatures,
+        market_avg: float | None,
+        comparable_deals: list[dict[str, Any]],
+    ) -> DealScore:
+        """Compute the score of one deal from preloaded data."""
+        positive_factors: list[ScoringFactor] = []
+        risk_factors: list[ScoringFactor] = []
+        neutral_factors: list[ScoringFactor] = []
+
+        for factor in (
+            self._score_location_match(property_data, features),
+            self._score_tenure(property_data),
+            self._score_price_vs_market(deal, market_avg),
+            self._score_gpr_headroom(property_data),
+            self._score_historical_success(deal, features),
+            self._score_competition(deal),
+            self._score_seller_motivation(deal),
+        ):
+            self._categorize_factor(
+                factor, positive_factors, risk_factors, neutral_factors
+            )
+
         # Calculate overall score
         all_factors = positive_factors + risk_factors + neutral_factors
         weighted_sum = sum(
@@ -330,9 +376,6 @@ class DealScoringService:
             final_score, positive_factors, risk_factors
         )
 
-        # Get comparable deals
-        comparable_deals = await self._get_comparable_deals(deal, db, user_id)
-
         return DealScore(
             score=final_score,
             confidence=confidence,
@@ -363,12 +406,10 @@ class DealScoringService:
             factor.factor_type = FactorType.NEUTRAL
             neutral.append(factor)
 
-    async def _score_location_match(
+    def _score_location_match(
         self,
-        deal: AgentDeal,
         property_data: Property | None,
-        db: AsyncSession,
-        user_id: str,
+        features: AgentDealFeatures,
     ) -> ScoringFactor:
         """Score based on location match with historical successes."""
         if not property_data:
@@ -390,16 +431,7 @@ class DealScoringService:
                 impact_score=0.0,
             )
 
-        # Query for historical wins in same location
-        # This is simplified - would need to join with Property table
-        wins_query = select(func.count(AgentDeal.id)).where(
-            and_(
-                AgentDeal.agent_id == user_id,
-                AgentDeal.status == DealStatus.CLOSED_WON,
-            )
-        )
-        result = await db.execute(wins_query)
-        win_count = result.scalar() or 0
+        win_count = features.wins_in(location)
 
         if win_count >= LocationExperienceThresholds.STRONG:
             return ScoringFactor(
@@ -425,11 +457,7 @@ class DealScoringService:
                 impact_score=ImpactScore.NEUTRAL,
             )
 
-    async def _score_tenure(
-        self,
-        deal: AgentDeal,
-        property_data: Property | None,
-    ) -> ScoringFactor:
+    def _score_tenure(self, property_data: Property | None) -> ScoringFactor:
         """Score based on remaining tenure."""
         if not property_data or not property_data.lease_expiry_date:
             return ScoringFactor(
@@ -475,11 +503,10 @@ class DealScoringService:
                 evidence=f"{years_remaining:.0f} years",
             )
 
-    async def _score_price_vs_market(
+    def _score_price_vs_market(
         self,
         deal: AgentDeal,
-        property_data: Property | None,
-        db: AsyncSession,
+        market_avg: float | None,
     ) -> ScoringFactor:
         """Score based on deal price vs market comparables."""
         deal_metadata = deal.metadata_json or {}
@@ -493,14 +520,6 @@ class DealScoringService:
                 impact_score=0.0,
             )
 
-        # Get market average
-        six_months_ago = datetime.now() - timedelta(days=180)
-        market_query = select(func.avg(MarketTransaction.psf_price)).where(
-            MarketTransaction.transaction_date >= six_months_ago.date()
-        )
-        result = await db.execute(market_query)
-        market_avg = result.scalar()
-
         if not market_avg:
             return ScoringFactor(
                 name="Price vs Market",
@@ -544,11 +563,7 @@ class DealScoringService:
                 evidence=f"${target_psf:,.0f} vs ${float(market_avg):,.0f} avg",
             )
 
-    async def _score_gpr_headroom(
-        self,
-        deal: AgentDeal,
-        property_data: Property | None,
-    ) -> ScoringFactor:
+    def _score_gpr_headroom(self, property_data: Property | None) -> ScoringFactor:
         """Score based on development potential (GPR headroom)."""
         if not property_data:
             return ScoringFactor(
@@ -597,38 +612,14 @@ class DealScoringService:
                 impact_score=ImpactScore.NEUTRAL,
             )
 
-    async def _score_historical_success(
+    def _score_historical_success(
         self,
         deal: AgentDeal,
-        db: AsyncSession,
-        user_id: str,
+        features: AgentDealFeatures,
     ) -> ScoringFactor:
         """Score based on historical success rate for similar deals."""
-        # Get win/loss stats for similar deal types
-        similar_query = (
-            select(
-                AgentDeal.status,
-                func.count(AgentDeal.id).label("count"),
-            )
-            .where(
-                and_(
-                    AgentDeal.agent_id == user_id,
-                    AgentDeal.deal_type == deal.deal_type,
-                    AgentDeal.asset_type == deal.asset_type,
-                    AgentDeal.status.in_(
-                        [DealStatus.CLOSED_WON, DealStatus.CLOSED_LOST]
-                    ),
-                )
-            )
-            .group_by(AgentDeal.status)
-        )
-
-        result = await db.execute(similar_query)
-        stats: dict[DealStatus, int] = {row.status: int(row.count) for row in result}
-
-        wins: int = stats.get(DealStatus.CLOSED_WON, 0)
-        losses: int = stats.get(DealStatus.CLOSED_LOST, 0)
-        total: int = wins + losses
+        wins, losses = features.record(deal.asset_type, deal.deal_type)
+        total = wins + losses
 
         if total < HistoricalSuccessThresholds.MIN_DEALS_FOR_ANALYSIS:
             return ScoringFactor(
@@ -665,7 +656,7 @@ class DealScoringService:
                 evidence=f"{wins} wins / {total} total",
             )
 
-    async def _score_competition(self, deal: AgentDeal) -> ScoringFactor:
+    def _score_competition(self, deal: AgentDeal) -> ScoringFactor:
         """Score based on competition level."""
         metadata = deal.metadata_json or {}
         competition = metadata.get("competition_level", "unknown")
@@ -699,7 +690,7 @@ class DealScoringService:
                 impact_score=ImpactScore.NEUTRAL,
             )
 
-    async def _score_seller_motivation(self, deal: AgentDeal) -> ScoringFactor:
+    def _score_seller_motivation(self, deal: AgentDeal) -> ScoringFactor:
         """Score based on seller motivation."""
         metadata = deal.metadata_json or {}
         motivation = metadata.get("seller_motivation", "unknown")
@@ -766,49 +757,83 @@ class DealScoringService:
 
         return f"{action}. Key strengths: {top_positive}. Key risks: {top_risks}."
 
+    async def _market_average_psf(self, db: AsyncSession) -> float | None:
+        """Average PSF over the last six months of market transactions."""
+        six_months_ago = datetime.now() - timedelta(days=180)
+        market_query = select(func.avg(MarketTransaction.psf_price)).where(
+            MarketTransaction.transaction_date >= six_months_ago.date()
+        )
+        result = await db.execute(market_query)
+        market_avg = result.scalar()
+        return float(market_avg) if market_avg else None
+
     async def _get_comparable_deals(
         self,
-        deal: AgentDeal,
+        deals: Iterable[AgentDeal],
         db: AsyncSession,
         user_id: str,
-    ) -> list[dict[str, Any]]:
-        """Get comparable historical deals."""
-        query = (
-            select(AgentDeal)
+    ) -> dict[tuple[str, str], list[dict[str, Any]]]:
+        """Get recent closed deals per (deal type, asset type) in one query.
+
+        Each category holds enough rows to leave ``COMPARABLE_DEAL_LIMIT``
+        after the batch's own deals are excluded.
+        """
+        deal_list = list(deals)
+        categories = {(deal.deal_type, deal.asset_type) for deal in deal_list}
+        rank = (
+            func.row_number()
+            .over(
+                partition_by=(AgentDeal.deal_type, AgentDeal.asset_type),
+                order_by=AgentDeal.actual_close_date.desc(),
+            )
+            .label("rank")
+        )
+        ranked = (
+            select(AgentDeal, rank)
             .where(
-                and_(
-                    AgentDeal.agent_id == user_id,
-                    AgentDeal.deal_type == deal.deal_type,
-                    AgentDeal.asset_type == deal.asset_type,
-                    AgentDeal.status.in_(
-                        [DealStatus.CLOSED_WON, DealStatus.CLOSED_LOST]
-                    ),
-                    AgentDeal.id != deal.id,
-                )
+                AgentDeal.agent_id == user_id,
+                tuple_(AgentDeal.deal_type, AgentDeal.asset_type).in_(categories),
+                AgentDeal.status.in_([DealStatus.CLOSED_WON, DealStatus.CLOSED_LOST]),
             )
-            .order_by(AgentDeal.actual_close_date.desc())
-            .limit(5)
+            .subquery()
+        )
+        ranked_deal = aliased(AgentDeal, ranked)
+        query = (
+            select(ranked_deal)
+            .where(ranked.c.rank <= COMPARABLE_DEAL_LIMIT + len(deal_list))
+            .order_by(ranked.c.rank)
         )
 
         result = await db.execute(query)
-        comparable = result.scalars().all()
-
-        return [
-            {
-                "id": str(d.id),
-                "title": d.title,
-                "outcome": d.status.value,
-                "value": (
-                    float(d.estimated_value_amount)
-                    if d.estimated_value_amount
-                    else None
-                ),
-                "close_date": (
-                    d.actual_close_date.isoformat() if d.actual_close_date else None
-                ),
-            }
-            for d in comparable
-        ]
+        comparable: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for d in result.scalars():
+            comparable.setdefault(_deal_category(d), []).append(
+                {
+                    "id": str(d.id),
+                    "title": d.title,
+                    "outcome": d.status.value,
+                    "value": (
+                        float(d.estimated_value_amount)
+                        if d.estimated_value_amount
+                        else None
+                    ),
+                    "close_date": (
+                        d.actual_close_date.isoformat() if d.actual_close_date else None
+                    ),
+                }
+            )
+        return comparable
+
+
+def _canonical_id(deal_id: str) -> str:
+    try:
+        return str(UUID(str(deal_id)))
+    except ValueError:
+        return str(deal_id)
+
+
+def _deal_category(deal: AgentDeal) -> tuple[str, str]:
+    return deal.deal_type.value, deal.asset_type.value
 
 
 # Singleton instance
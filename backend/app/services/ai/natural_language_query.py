@@ -13,7 +13,7 @@ from enum import Enum
 from typing import Any, Optional
 
 from langchain_openai import ChatOpenAI
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.business_performance import (
@@ -24,7 +24,8 @@ from app.models.business_performance import (
     PipelineStage,
 )
 from app.models.finance import FinScenario
-from app.models.property import MarketTransaction, Property, PropertyType
+from app.models.property import MarketTransaction, PropertyType
+from app.services.property_search import PropertySearchFilters, search_properties
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,10 @@ QUERY_FUNCTIONS = [
                     "type": "string",
                     "description": "Location, district, or planning area to search",
                 },
+                "keywords": {
+                    "type": "string",
+                    "description": "Words to match in property name, address, or area",
+                },
                 "min_gpr": {
                     "type": "number",
                     "description": "Minimum gross plot ratio",
@@ -400,42 +405,17 @@ class NaturalLanguageQueryService:
         db: AsyncSession,
     ) -> QueryResult:
         """Search for properties based on criteria."""
-        conditions = []
-
-        if args.get("property_type"):
-            conditions.append(Property.property_type == args["property_type"])
-
-        if args.get("location"):
-            location = args["location"]
-            conditions.append(
-                or_(
-                    Property.district.ilike(f"%{location}%"),
-                    Property.planning_area.ilike(f"%{location}%"),
-                    Property.address.ilike(f"%{location}%"),
-                )
-            )
-
-        if args.get("min_gpr"):
-            conditions.append(Property.plot_ratio >= args["min_gpr"])
-
-        if args.get("max_gpr"):
-            conditions.append(Property.plot_ratio <= args["max_gpr"])
-
-        if args.get("min_land_area"):
-            conditions.append(Property.land_area_sqm >= args["min_land_area"])
-
-        if args.get("max_land_area"):
-            conditions.append(Property.land_area_sqm <= args["max_land_area"])
-
-        limit = args.get("limit", 10)
-
-        query = select(Property)
-        if conditions:
-            query = query.where(and_(*conditions))
-        query = query.limit(limit)
-
-        result = await db.execute(query)
-        properties = result.scalars().all()
+        filters = PropertySearchFilters(
+            keywords=args.get("keywords"),
+            location=args.get("location"),
+            property_type=args.get("property_type"),
+            min_gpr=args.get("min_gpr"),
+            max_gpr=args.get("max_gpr"),
+            min_land_area=args.get("min_land_area"),
+            max_land_area=args.get("max_land_area"),
+        )
+        page = await search_properties(db, filters, limit=args.get("limit", 10))
+        properties = page.properties
 
         data = [
             {
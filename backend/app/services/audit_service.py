@@ -24,6 +24,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+_LAST_HASH_SQL = (
+    "SELECT content_hash FROM compliance_audit_logs ORDER BY id DESC LIMIT 1"
+)
+
+# Two-key PostgreSQL advisory lock taken while a transaction appends to the
+# compliance chain ("CAUD", chain 0), so concurrent writers cannot read the
+# same previous hash.
+_ADVISORY_LOCK_NAMESPACE = 0x43415544
+_CHAIN_LOCK_KEY = 0
+_CHAIN_LOCK_SQL = "SELECT pg_advisory_xact_lock(:namespace, :key)"
+
 
 class AuditAction(str, Enum):
     """Types of auditable actions."""
@@ -158,22 +169,22 @@ class AuditService:
         content_hash = self._calculate_hash(record)
         signature = self._sign_record(content_hash)
 
-        # Get previous hash for chain integrity
-        prev_hash = await self._get_last_hash()
-
-        # Insert using raw SQL for the extended audit table
-        query = text("""
+        # Insert using raw SQL for the extended audit table; the previous hash
+        # for chain integrity is read inside the same statement, after the
+        # chain lock so the read and the append cannot interleave.
+        await self._lock_chain()
+        query = text(f"""
             INSERT INTO compliance_audit_logs (
                 action, user_id, user_email, resource_type, resource_id,
                 severity, ip_address, user_agent, correlation_id,
                 old_values, new_values, details,
                 content_hash, prev_hash, signature, created_at
-            ) VALUES (
+            ) SELECT
                 :action, :user_id, :user_email, :resource_type, :resource_id,
                 :severity, :ip_address, :user_agent, :correlation_id,
                 :old_values, :new_values, :details,
-                :content_hash, :prev_hash, :signature, :created_at
-            ) RETURNING id
+                :content_hash, ({_LAST_HASH_SQL}), :signature, :created_at
+            RETURNING id
         """)
 
         result = await self.db.execute(
@@ -192,7 +203,6 @@ class AuditService:
                 "new_values": json.dumps(record.get("new_values")),
                 "details": json.dumps(details or {}),
                 "content_hash": content_hash,
-                "prev_hash": prev_hash,
                 "signature": signature,
                 "created_at": timestamp,
             },
@@ -223,13 +233,18 @@ class AuditService:
             hashlib.sha256,
         ).hexdigest()
 
+    async def _lock_chain(self) -> None:
+        """Serialise appenders until commit; a no-op off PostgreSQL."""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        await self.db.execute(
+            text(_CHAIN_LOCK_SQL),
+            {"namespace": _ADVISORY_LOCK_NAMESPACE, "key": _CHAIN_LOCK_KEY},
+        )
+
     async def _get_last_hash(self) -> str | None:
         """Get the hash of the last audit entry for chain integrity."""
-        query = text("""
-            SELECT content_hash FROM compliance_audit_logs
-            ORDER BY id DESC LIMIT 1
-        """)
-        result = await self.db.execute(query)
+        result = await self.db.execute(text(_LAST_HASH_SQL))
         row = result.fetchone()
         return row[0] if row else None
 
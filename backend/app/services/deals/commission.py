@@ -233,4 +233,5 @@ class AgentCommissionService:
             project_id=project_key,
             event_type=event_type,
             context=context,
+            flush=True,
         )
@@ -0,0 +1,168 @@
+"""Agent deal outcome features backing batch deal scoring.
+
+Each agent's closed-won/closed-lost counts per (location, asset type, deal
+type) are stored in ``agent_deal_features``. The pipeline service refreshes an
+agent's rows when one of their deals changes outcome, so scoring a page of
+deals reads the agent's whole track record in a single query.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from backend._compat.datetime import utcnow
+from sqlalchemy import Select, case, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.business_performance import AgentDeal, AgentDealFeature, DealStatus
+from app.models.property import Property
+
+CLOSED_STATUSES = frozenset({DealStatus.CLOSED_WON, DealStatus.CLOSED_LOST})
+
+# First key of the two-key PostgreSQL advisory lock taken per agent while
+# their feature rows are rewritten.
+_ADVISORY_LOCK_NAMESPACE = 0x46454154
+
+# (location, asset_type, deal_type)
+FeatureKey = tuple[str, str, str]
+
+
+def _value(member: Any) -> str:
+    return str(getattr(member, "value", member) or "")
+
+
+@dataclass(frozen=True)
+class AgentDealFeatures:
+    """Closed-deal counts for one agent as ``{key: (won, lost)}``."""
+
+    counts: Mapping[FeatureKey, tuple[int, int]] = field(default_factory=dict)
+
+    def wins_in(self, location: str) -> int:
+        """Return the agent's closed-won deals in ``location``."""
+
+        return sum(
+            won for (loc, _, _), (won, _) in self.counts.items() if loc == location
+        )
+
+    def record(self, asset_type: Any, deal_type: Any) -> tuple[int, int]:
+        """Return ``(won, lost)`` across locations for one deal category."""
+
+        asset, kind = _value(asset_type), _value(deal_type)
+        won = lost = 0
+        for (_, key_asset, key_kind), (key_won, key_lost) in self.counts.items():
+            if key_asset == asset and key_kind == kind:
+                won += key_won
+                lost += key_lost
+        return won, lost
+
+
+def _outcome_counts_query(agent_id: str) -> Select[Any]:
+    location = func.coalesce(Property.district, Property.planning_area, "")
+    return (
+        select(
+            location,
+            AgentDeal.asset_type,
+            AgentDeal.deal_type,
+            func.sum(case((AgentDeal.status == DealStatus.CLOSED_WON, 1), else_=0)),
+            func.sum(case((AgentDeal.status == DealStatus.CLOSED_LOST, 1), else_=0)),
+        )
+        .outerjoin(Property, Property.id == AgentDeal.property_id)
+        .where(
+            AgentDeal.agent_id == agent_id,
+            AgentDeal.status.in_(CLOSED_STATUSES),
+        )
+        .group_by(location, AgentDeal.asset_type, AgentDeal.deal_type)
+    )
+
+
+async def _outcome_counts(
+    session: AsyncSession, agent_id: str
+) -> dict[FeatureKey, tuple[int, int]]:
+    rows = await session.execute(_outcome_counts_query(agent_id))
+    return {
+        (str(location or ""), _value(asset_type), _value(deal_type)): (
+            int(won or 0),
+            int(lost or 0),
+        )
+        for location, asset_type, deal_type, won, lost in rows
+    }
+
+
+async def refresh_agent_features(
+    session: AsyncSession, agent_id: UUID | str
+) -> AgentDealFeatures:
+    """Recompute and store ``agent_id``'s feature rows; the caller commits.
+
+    On PostgreSQL a transaction-scoped advisory lock on the agent serialises
+    concurrent refreshes, so the second one recounts after the first commits
+    instead of colliding with its freshly inserted rows.
+    """
+
+    key = str(agent_id)
+    if session.get_bind().dialect.name == "postgresql":
+        await session.execute(
+            select(
+                func.pg_advisory_xact_lock(_ADVISORY_LOCK_NAMESPACE, func.hashtext(key))
+            )
+        )
+    counts = await _outcome_counts(session, key)
+    await session.execute(
+        delete(AgentDealFeature).where(AgentDealFeature.agent_id == key)
+    )
+    if counts:
+        refreshed_at = utcnow()
+        await session.execute(
+            insert(AgentDealFeature),
+            [
+                {
+                    "agent_id": key,
+                    "location": location,
+                    "asset_type": asset_type,
+                    "deal_type": deal_type,
+                    "won_count": won,
+                    "lost_count": lost,
+                    "refreshed_at": refreshed_at,
+                }
+                for (location, asset_type, deal_type), (won, lost) in counts.items()
+            ],
+        )
+    return AgentDealFeatures(counts)
+
+
+async def load_agent_features(
+    session: AsyncSession, agent_id: UUID | str
+) -> AgentDealFeatures:
+    """Return ``agent_id``'s stored features.
+
+    Agents without stored rows (never refreshed, or no closed deals) fall back
+    to the same grouped query the refresh runs, without writing.
+    """
+
+    key = str(agent_id)
+    rows = await session.execute(
+        select(
+            AgentDealFeature.location,
+            AgentDealFeature.asset_type,
+            AgentDealFeature.deal_type,
+            AgentDealFeature.won_count,
+            AgentDealFeature.lost_count,
+        ).where(AgentDealFeature.agent_id == key)
+    )
+    counts = {
+        (location, asset_type, deal_type): (won, lost)
+        for location, asset_type, deal_type, won, lost in rows
+    }
+    if counts:
+        return AgentDealFeatures(counts)
+    return AgentDealFeatures(await _outcome_counts(session, key))
+
+
+__all__ = [
+    "AgentDealFeatures",
+    "CLOSED_STATUSES",
+    "load_agent_features",
+    "refresh_agent_features",
+]
@@ -9,6 +9,8 @@ from uuid import UUID
 
 from backend._compat.datetime import UTC
 from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -17,12 +19,18 @@ from app.data.performance_benchmarks_seed import SEED_BENCHMARKS
 from app.models.business_performance import (
     AgentCommissionRecord,
     AgentDeal,
+    AgentDealStageEvent,
     AgentPerformanceSnapshot,
+    DealStatus,
     PerformanceBenchmark,
 )
 
 logger = logging.getLogger(__name__)
 
+# Agents per grouped query and upsert in bulk mode. Keeps ``IN`` lists and
+# multi-row VALUES well under PostgreSQL's bind-parameter limit.
+SNAPSHOT_BATCH_SIZE = 500
+
 
 class AgentPerformanceService:
     """Compute and persist agent performance analytics snapshots."""
@@ -68,21 +76,17 @@ class AgentPerformanceService:
             session=session, agent_id=agent_id, as_of=as_of
         )
 
-        snapshot.deals_open = deals_open
-        snapshot.deals_closed_won = deals_closed_won
-        snapshot.deals_closed_lost = deals_closed_lost
-        snapshot.gross_pipeline_value = gross_pipeline or None
-        snapshot.weighted_pipeline_value = weighted_pipeline or None
-        snapshot.confirmed_commission_amount = confirmed_total or None
-        snapshot.disputed_commission_amount = disputed_total or None
-        snapshot.avg_cycle_days = (
-            sum(cycle_days) / len(cycle_days) if cycle_days else None
-        )
-        snapshot.conversion_rate = (
-            deals_closed_won / (deals_open + deals_closed_won)
-            if (deals_open + deals_closed_won) > 0
-            else None
-        )
+        for field, value in _snapshot_metrics(
+            deals_open=deals_open,
+            deals_closed_won=deals_closed_won,
+            deals_closed_lost=deals_closed_lost,
+            gross_pipeline=gross_pipeline,
+            weighted_pipeline=weighted_pipeline,
+            confirmed_total=confirmed_total,
+            disputed_total=disputed_total,
+            cycle_days=cycle_days,
+        ).items():
+            setattr(snapshot, field, value)
 
         snapshot.roi_metrics = await self._aggregate_roi_metrics(
             session=session,
@@ -231,13 +235,25 @@ class AgentPerformanceService:
         session: AsyncSession,
         as_of: date | None = None,
         agent_ids: Optional[Iterable[UUID]] = None,
+        bulk: bool = False,
     ) -> list[AgentPerformanceSnapshot]:
+        """Compute snapshots for ``agent_ids`` (default: every agent with deals).
+
+        With ``bulk`` the metrics for all agents come from a handful of
+        grouped queries, project ROI is computed once per project for the
+        whole run, and the snapshots are written with a single upsert instead
+        of one ``compute_snapshot`` round trip per agent.
+        """
         as_of = as_of or datetime.now(UTC).date()
         processed: list[AgentPerformanceSnapshot] = []
 
         targeted = list(agent_ids) if agent_ids else await self._all_agent_ids(session)
         if not targeted:
             return []
+        if bulk:
+            return await self._bulk_snapshots(
+                session=session, agent_ids=targeted, as_of=as_of
+            )
         for agent_id in targeted:
             snapshot = await self.compute_snapshot(
                 session=session,
@@ -247,6 +263,238 @@ class AgentPerformanceService:
             processed.append(snapshot)
         return processed
 
+    async def _bulk_snapshots(
+        self,
+        *,
+        session: AsyncSession,
+        agent_ids: Sequence[UUID],
+        as_of: date,
+    ) -> list[AgentPerformanceSnapshot]:
+        keys = list(dict.fromkeys(str(agent_id) for agent_id in agent_ids))
+        roi_cache: dict[int, RoiSnapshot | None] = {}
+        for batch in _chunks(keys, SNAPSHOT_BATCH_SIZE):
+            rows = await self._bulk_snapshot_rows(
+                session=session, agent_ids=batch, as_of=as_of, roi_cache=roi_cache
+            )
+            await self._upsert_snapshots(session=session, rows=rows)
+        await session.commit()
+
+        by_agent: dict[str, AgentPerformanceSnapshot] = {}
+        for batch in _chunks(keys, SNAPSHOT_BATCH_SIZE):
+            result = await session.execute(
+                select(AgentPerformanceSnapshot)
+                .where(
+                    AgentPerformanceSnapshot.agent_id.in_(batch),
+                    AgentPerformanceSnapshot.as_of_date == as_of,
+                )
+                .execution_options(populate_existing=True)
+            )
+            by_agent.update((str(row.agent_id), row) for row in result.scalars())
+        return [by_agent[key] for key in keys if key in by_agent]
+
+    async def _bulk_snapshot_rows(
+        self,
+        *,
+        session: AsyncSession,
+        agent_ids: Sequence[str],
+        as_of: date,
+        roi_cache: dict[int, RoiSnapshot | None],
+    ) -> list[dict[str, object]]:
+        pipeline = await self._bulk_pipeline_totals(
+            session=session, agent_ids=agent_ids
+        )
+        cycle_days = await self._bulk_cycle_days(session=session, agent_ids=agent_ids)
+        commissions = await self._bulk_commission_totals(
+            session=session, agent_ids=agent_ids
+        )
+        metadata = await self._bulk_deal_metadata(session=session, agent_ids=agent_ids)
+
+        rows = []
+        for key in agent_ids:
+            deals_open, deals_closed_won, deals_closed_lost, gross, weighted = (
+                pipeline.get(key, (0, 0, 0, 0.0, 0.0))
+            )
+            confirmed_total, disputed_total = commissions.get(key, (0.0, 0.0))
+            values = _snapshot_metrics(
+                deals_open=deals_open,
+                deals_closed_won=deals_closed_won,
+                deals_closed_lost=deals_closed_lost,
+                gross_pipeline=gross,
+                weighted_pipeline=weighted,
+                confirmed_total=confirmed_total,
+                disputed_total=disputed_total,
+                cycle_days=cycle_days.get(key, []),
+            )
+            values["roi_metrics"] = await self._roi_metrics_from_metadata(
+                session=session,
+                metadata_items=metadata.get(key, []),
+                roi_cache=roi_cache,
+            )
+            values["snapshot_context"] = _derive_snapshot_context(
+                gross_pipeline=gross,
+                weighted_pipeline=weighted,
+                deals_open=deals_open,
+                deals_closed_won=deals_closed_won,
+            )
+            rows.append({"agent_id": key, "as_of_date": as_of, **values})
+        return rows
+
+    async def _bulk_pipeline_totals(
+        self,
+        *,
+        session: AsyncSession,
+        agent_ids: Sequence[str],
+    ) -> dict[str, tuple[int, int, int, float, float]]:
+        """Return open/won/lost counts and gross/weighted pipeline per agent."""
+
+        estimation = func.coalesce(AgentDeal.estimated_value_amount, 0)
+        stmt = (
+            select(
+                AgentDeal.agent_id,
+                AgentDeal.status,
+                func.count(),
+                func.sum(estimation),
+                func.sum(estimation * func.coalesce(AgentDeal.confidence, 0)),
+            )
+            .where(AgentDeal.agent_id.in_(agent_ids))
+            .group_by(AgentDeal.agent_id, AgentDeal.status)
+        )
+        totals: dict[str, list[float]] = {}
+        for agent_id, status, count, gross, weighted in await session.execute(stmt):
+            bucket = totals.setdefault(str(agent_id), [0, 0, 0, 0.0, 0.0])
+            status_value = (status or "").lower()
+            if status_value == "closed_won":
+                bucket[1] += count
+            elif status_value == "closed_lost":
+                bucket[2] += count
+            else:
+                bucket[0] += count
+            bucket[3] += float(gross or 0.0)
+            bucket[4] += float(weighted or 0.0)
+        return {
+            agent_id: (int(b[0]), int(b[1]), int(b[2]), b[3], b[4])
+            for agent_id, b in totals.items()
+        }
+
+    async def _bulk_cycle_days(
+        self,
+        *,
+        session: AsyncSession,
+        agent_ids: Sequence[str],
+    ) -> dict[str, list[float]]:
+        """Return the cycle time of every closed-won deal, keyed by agent."""
+
+        first_event = (
+            select(
+                AgentDealStageEvent.deal_id,
+                func.min(AgentDealStageEvent.recorded_at).label("recorded_at"),
+            )
+            .group_by(AgentDealStageEvent.deal_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                AgentDeal.agent_id,
+                AgentDeal.created_at,
+                AgentDeal.actual_close_date,
+                AgentDeal.updated_at,
+                first_event.c.recorded_at,
+            )
+            .outerjoin(first_event, first_event.c.deal_id == AgentDeal.id)
+            .where(
+                AgentDeal.agent_id.in_(agent_ids),
+                AgentDeal.status == DealStatus.CLOSED_WON,
+            )
+        )
+        cycle_days: dict[str, list[float]] = {}
+        for (
+            agent_id,
+            created_at,
+            closed_on,
+            updated_at,
+            first_recorded,
+        ) in await session.execute(stmt):
+            duration = _cycle_days(
+                first_recorded or created_at, closed_on or updated_at
+            )
+            if duration is not None:
+                cycle_days.setdefault(str(agent_id), []).append(duration)
+        return cycle_days
+
+    async def _bulk_commission_totals(
+        self,
+        *,
+        session: AsyncSession,
+        agent_ids: Sequence[str],
+    ) -> dict[str, tuple[float, float]]:
+        """Return confirmed and disputed commission totals per deal owner."""
+
+        stmt = (
+            select(
+                AgentDeal.agent_id,
+                AgentCommissionRecord.status,
+                func.sum(AgentCommissionRecord.commission_amount),
+            )
+            .join(AgentDeal, AgentCommissionRecord.deal_id == AgentDeal.id)
+            .where(AgentDeal.agent_id.in_(agent_ids))
+            .group_by(AgentDeal.agent_id, AgentCommissionRecord.status)
+        )
+        totals: dict[str, tuple[float, float]] = {}
+        for agent_id, status, total in await session.execute(stmt):
+            confirmed, disputed = totals.get(str(agent_id), (0.0, 0.0))
+            status_value = (status or "").lower()
+            amount = float(total or 0.0)
+            if status_value == "disputed":
+                disputed += amount
+            elif status_value in {"confirmed", "paid", "invoiced"}:
+                confirmed += amount
+            totals[str(agent_id)] = (confirmed, disputed)
+        return totals
+
+    async def _bulk_deal_metadata(
+        self,
+        *,
+        session: AsyncSession,
+        agent_ids: Sequence[str],
+    ) -> dict[str, list[Mapping[str, object]]]:
+        stmt = select(AgentDeal.agent_id, AgentDeal.metadata_json).where(
+            AgentDeal.agent_id.in_(agent_ids)
+        )
+        metadata: dict[str, list[Mapping[str, object]]] = {}
+        for agent_id, payload in await session.execute(stmt):
+            if isinstance(payload, dict) and payload:
+                metadata.setdefault(str(agent_id), []).append(payload)
+        return metadata
+
+    async def _upsert_snapshots(
+        self,
+        *,
+        session: AsyncSession,
+        rows: Sequence[dict[str, object]],
+    ) -> None:
+        if not rows:
+            return
+        bind = session.get_bind()
+        dialect_insert = (
+            pg_insert if bind.dialect.name == "postgresql" else sqlite_insert
+        )
+        # The table, not the entity: ``snapshot_context`` is a proxy attribute.
+        stmt = dialect_insert(AgentPerformanceSnapshot.__table__).values(list(rows))
+        updated = {
+            column: stmt.excluded[column]
+            for column in (
+                *_SNAPSHOT_METRIC_COLUMNS,
+                "roi_metrics",
+                "snapshot_context",
+            )
+        }
+        updated["updated_at"] = func.now()
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["agent_id", "as_of_date"], set_=updated
+            )
+        )
+
     async def _load_deals(
         self,
         *,
@@ -333,12 +581,32 @@ class AgentPerformanceService:
         *,
         session: AsyncSession,
         deals: Iterable[AgentDeal],
+        roi_cache: dict[int, RoiSnapshot | None] | None = None,
     ) -> dict[str, object]:
+        return await self._roi_metrics_from_metadata(
+            session=session,
+            metadata_items=[getattr(deal, "metadata", {}) or {} for deal in deals],
+            roi_cache=roi_cache,
+        )
+
+    async def _roi_metrics_from_metadata(
+        self,
+        *,
+        session: AsyncSession,
+        metadata_items: Iterable[object],
+        roi_cache: dict[int, RoiSnapshot | None] | None = None,
+    ) -> dict[str, object]:
+        """Combine computed and recorded ROI snapshots for the deals' projects.
+
+        ``roi_cache`` memoises ``compute_project_roi`` (including failures, as
+        ``None``) so a project linked to several agents' deals is computed
+        once per run.
+        """
+        cache: dict[int, RoiSnapshot | None] = {} if roi_cache is None else roi_cache
         project_snapshots: dict[int, RoiSnapshot] = {}
         offline_snapshots: dict[int, dict[str, object]] = {}
 
-        for deal in deals:
-            metadata = getattr(deal, "metadata", {}) or {}
+        for metadata in metadata_items:
             if not isinstance(metadata, dict):
                 continue
 
@@ -358,19 +626,22 @@ class AgentPerformanceService:
                     continue
                 if project_id in project_snapshots:
                     continue
-                try:
-                    snapshot = await compute_project_roi(
-                        session,
-                        project_id=project_id,
-                    )
-                except Exception as exc:  # pragma: no cover - defensive logging
-                    logger.warning(
-                        "Unable to compute ROI metrics for project %s: %s",
-                        project_id,
-                        exc,
-                    )
-                    continue
-                project_snapshots[project_id] = snapshot
+                if project_id not in cache:
+                    try:
+                        cache[project_id] = await compute_project_roi(
+                            session,
+                            project_id=project_id,
+                        )
+                    except Exception as exc:  # pragma: no cover - defensive logging
+                        logger.warning(
+                            "Unable to compute ROI metrics for project %s: %s",
+                            project_id,
+                            exc,
+                        )
+                        cache[project_id] = None
+                snapshot = cache[project_id]
+                if snapshot is not None:
+                    project_snapshots[project_id] = snapshot
 
         combined: dict[int, dict[str, object]] = {}
 
@@ -407,14 +678,69 @@ def _deal_cycle_days(deal: AgentDeal) -> Optional[float]:
             default=deal.created_at,
         )
         closed = deal.actual_close_date or deal.updated_at
+    except Exception:  # pragma: no cover - defensive
+        return None
+    return _cycle_days(created, closed)
+
+
+def _chunks(items: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _cycle_days(created: object, closed: object) -> Optional[float]:
+    try:
         if not created or not closed:
             return None
-        delta = closed - created
+        delta = closed - created  # type: ignore[operator]
         return float(delta.days) + float(delta.seconds) / 86400.0
     except Exception:  # pragma: no cover - defensive
         return None
 
 
+_SNAPSHOT_METRIC_COLUMNS = (
+    "deals_open",
+    "deals_closed_won",
+    "deals_closed_lost",
+    "gross_pipeline_value",
+    "weighted_pipeline_value",
+    "confirmed_commission_amount",
+    "disputed_commission_amount",
+    "avg_cycle_days",
+    "conversion_rate",
+)
+
+
+def _snapshot_metrics(
+    *,
+    deals_open: int,
+    deals_closed_won: int,
+    deals_closed_lost: int,
+    gross_pipeline: float,
+    weighted_pipeline: float,
+    confirmed_total: float,
+    disputed_total: float,
+    cycle_days: Sequence[float],
+) -> dict[str, object]:
+    """Return the snapshot metric columns (see ``_SNAPSHOT_METRIC_COLUMNS``)."""
+
+    return {
+        "deals_open": deals_open,
+        "deals_closed_won": deals_closed_won,
+        "deals_closed_lost": deals_closed_lost,
+        "gross_pipeline_value": gross_pipeline or None,
+        "weighted_pipeline_value": weighted_pipeline or None,
+        "confirmed_commission_amount": confirmed_total or None,
+        "disputed_commission_amount": disputed_total or None,
+        "avg_cycle_days": sum(cycle_days) / len(cycle_days) if cycle_days else None,
+        "conversion_rate": (
+            deals_closed_won / (deals_open + deals_closed_won)
+            if (deals_open + deals_closed_won) > 0
+            else None
+        ),
+    }
+
+
 def _safe_int(value: object) -> int | None:
     if isinstance(value, bool):
         return None
@@ -24,6 +24,7 @@ from app.models.business_performance import (
     PipelineStage,
 )
 
+from .features import CLOSED_STATUSES, refresh_agent_features
 from .utils import audit_project_key
 
 
@@ -150,6 +151,9 @@ class AgentDealService:
             event=event,
             changed_by=str(created_by) if created_by else str(agent_id),
         )
+        await self._refresh_outcome_features(
+            session=session, deal=record, previous_status=None
+        )
 
         await session.commit()
         await session.refresh(
@@ -187,6 +191,7 @@ class AgentDealService:
     ) -> AgentDeal:
         """Mutate deal attributes and persist changes."""
 
+        previous_status = deal.status
         if title is not None:
             deal.title = title
         if description is not None:
@@ -216,6 +221,13 @@ class AgentDealService:
         if status is not None:
             deal.status = status
 
+        if any(
+            value is not None for value in (status, asset_type, deal_type, property_id)
+        ):
+            await self._refresh_outcome_features(
+                session=session, deal=deal, previous_status=previous_status
+            )
+
         await session.commit()
         await session.refresh(deal)
         return deal
@@ -234,6 +246,7 @@ class AgentDealService:
         """Transition a deal to another stage and emit a history event."""
 
         from_stage = deal.pipeline_stage
+        previous_status = deal.status
         deal.pipeline_stage = to_stage
 
         if to_stage == PipelineStage.CLOSED_WON:
@@ -266,6 +279,9 @@ class AgentDealService:
             event=event,
             changed_by=str(changed_by) if changed_by else None,
         )
+        await self._refresh_outcome_features(
+            session=session, deal=deal, previous_status=previous_status
+        )
 
         await session.commit()
         await session.refresh(event)
@@ -317,6 +333,19 @@ class AgentDealService:
 
         return events, audit_map
 
+    async def _refresh_outcome_features(
+        self,
+        *,
+        session: AsyncSession,
+        deal: AgentDeal,
+        previous_status: DealStatus | None,
+    ) -> None:
+        """Refresh the agent's scoring features when a closed deal changed."""
+
+        if deal.status in CLOSED_STATUSES or previous_status in CLOSED_STATUSES:
+            await session.flush()
+            await refresh_agent_features(session, deal.agent_id)
+
     async def _record_stage_audit(
         self,
         *,
@@ -353,6 +382,7 @@ class AgentDealService:
             event_type="deal_stage_transition",
             context=context,
             recorded_at=recorded_at,
+            flush=True,
         )
         raw_metadata = getattr(event, "metadata", None)
         if isinstance(raw_metadata, dict):
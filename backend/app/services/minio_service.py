@@ -1,5 +1,6 @@
 """MinIO/S3 storage service wrapper."""
 
+import asyncio
 import io
 import re
 from typing import Any, BinaryIO, Optional, Union
@@ -188,8 +189,10 @@ class MinIOService:
                     f"({max_size_bytes} bytes)"
                 )
 
-            # Upload with sanitized name
-            self.client.put_object(
+            # Upload with sanitized name; the client blocks on network I/O, so
+            # run it on a thread to let concurrent uploads overlap.
+            await asyncio.to_thread(
+                self.client.put_object,
                 bucket_name,
                 safe_object_name,
                 data,
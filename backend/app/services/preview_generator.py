@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import math
+import os
+import shutil
 import struct
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
 from typing import (
     Any,
+    AsyncIterator,
     Iterable,
+    Iterator,
     Literal,
     Mapping,
     NotRequired,
@@ -18,16 +27,37 @@ from typing import (
     TypedDict,
     cast,
 )
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from backend._compat.datetime import utcnow
+import numpy as np
+from backend._compat.datetime import UTC, utcnow
 from PIL import Image, ImageDraw
 
+from app.core.config import settings
+from app.services.retention import RetentionIndex, load_retention_days
+from app.utils.logging import get_logger, log_event
+
 _BASE_DIR = Path(__file__).resolve().parents[2]
-_PREVIEW_DIR = _BASE_DIR / "static" / "dev-previews"
+_PREVIEW_DIR = Path(
+    os.getenv("PREVIEW_STORAGE_PATH") or _BASE_DIR / "static" / "dev-previews"
+)
 _PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
 PREVIEW_STORAGE_DIR = _PREVIEW_DIR
 
+# Asset directories deleted by cache eviction or the retention sweeper are
+# journalled here until the preview jobs pointing at them are marked expired.
+_REMOVED_JOURNAL_DIRNAME = ".removed"
+_REMOVED_PENDING = "pending.log"
+
+# Bump when the rendered artefacts change shape so stale cache entries are
+# never served for new requests.
+_PREVIEW_RENDER_VERSION = 3
+
+logger = get_logger(__name__)
+
+_inflight_guard = threading.Lock()
+_inflight_renders: dict[str, threading.Lock] = {}
+
 _DEFAULT_LAYER_COLOURS = [
     "#6366F1",
     "#22C55E",
@@ -41,6 +71,11 @@ _DEFAULT_LAYER_COLOURS = [
 
 SUPPORTED_GEOMETRY_DETAIL_LEVELS = frozenset({"simple", "medium"})
 DEFAULT_GEOMETRY_DETAIL_LEVEL = "medium"
+# Level-of-detail tiers, coarse to fine. ``proxy`` is one bounding box per
+# layer; the remaining tiers mirror the geometry detail levels.
+PREVIEW_LOD_PROXY = "proxy"
+_DETAIL_LEVEL_ORDER = ("simple", "medium")
+_LOD_POLL_INTERVAL_SECONDS = 0.1
 _FLOOR_LINE_SPACING_M = 3.5
 _PODIUM_MAX_HEIGHT_M = 6.0
 _SETBACK_THRESHOLD_M = 60.0
@@ -109,12 +144,18 @@ class ColorLegendPayload(TypedDict, total=False):
     description: NotRequired[str]
 
 
+class LodManifestEntry(TypedDict):
+    level: str
+    url: str
+    bytes: int
+
+
 class AssetManifestPayload(TypedDict):
     gltf: str
     metadata: str
-    binary: str
     thumbnail: str
     version: str
+    lods: NotRequired[list[LodManifestEntry]]
 
 
 class PreviewPayload(TypedDict, total=False):
@@ -286,6 +327,18 @@ def _normalise_payload(entry: Mapping[str, object] | Any) -> dict[str, object]:
     raise TypeError("Preview payload entries must be mapping-compatible")
 
 
+@dataclass(slots=True, frozen=True)
+class PreviewLod:
+    """One rendered level-of-detail tier of a preview."""
+
+    level: str
+    url: str
+    bytes: int
+
+    def to_payload(self) -> LodManifestEntry:
+        return {"level": self.level, "url": self.url, "bytes": self.bytes}
+
+
 @dataclass(slots=True, frozen=True)
 class PreviewAssets:
     """Paths generated for a preview job render."""
@@ -294,6 +347,18 @@ class PreviewAssets:
     metadata_url: str
     thumbnail_url: str
     asset_version: str
+    lods: tuple[PreviewLod, ...] = ()
+
+    def manifest(self) -> AssetManifestPayload:
+        """Return the ``asset_manifest`` entry recorded on preview jobs."""
+
+        return {
+            "gltf": self.preview_url,
+            "metadata": self.metadata_url,
+            "thumbnail": self.thumbnail_url,
+            "version": self.asset_version,
+            "lods": [lod.to_payload() for lod in self.lods],
+        }
 
 
 def _regular_polygon_vertices(
@@ -585,210 +650,153 @@ def _normalise_hex_colour(
     return (round(r, 4), round(g, 4), round(b, 4), 0.92)
 
 
-def _align4(buffer: bytearray) -> None:
-    while len(buffer) % 4:
-        buffer.append(0)
+_GLB_MAGIC = 0x46546C67  # "glTF"
+_GLB_CHUNK_JSON = 0x4E4F534A  # "JSON"
+_GLB_CHUNK_BIN = 0x004E4942  # "BIN\0"
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+_FLOAT = 5126
+_BYTE = 5120
+_UNSIGNED_BYTE = 5121
+_SHORT = 5122
+_UNSIGNED_SHORT = 5123
+_UNSIGNED_INT = 5125
+
+_BOX_FACE_CORNERS = np.array(
+    [
+        [0, 1, 2, 3],  # bottom
+        [4, 5, 6, 7],  # top
+        [0, 1, 5, 4],  # back
+        [1, 2, 6, 5],  # right
+        [2, 3, 7, 6],  # front
+        [3, 0, 4, 7],  # left
+    ],
+    dtype=np.intp,
+)
+_BOX_FACE_NORMALS = np.array(
+    [
+        [0.0, -1.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.0, 0.0, -1.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 0.0, 1.0],
+        [-1.0, 0.0, 0.0],
+    ],
+    dtype=np.float32,
+)
 
 
-def _build_box_geometry(
-    vertices: Sequence[Sequence[float]],
-) -> tuple[list[float], list[float], list[int], list[float], list[float]]:
-    xs = [vertex[0] for vertex in vertices]
-    ys = [vertex[1] for vertex in vertices]
-    zs = [vertex[2] for vertex in vertices]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
-    min_z, max_z = min(zs), max(zs)
-
-    corners = [
-        (min_x, min_y, min_z),
-        (max_x, min_y, min_z),
-        (max_x, min_y, max_z),
-        (min_x, min_y, max_z),
-        (min_x, max_y, min_z),
-        (max_x, max_y, min_z),
-        (max_x, max_y, max_z),
-        (min_x, max_y, max_z),
-    ]
+@dataclass(slots=True)
+class _LayerMesh:
+    """Vertex and index arrays for one preview layer in glTF (Y-up) space."""
 
-    faces = [
-        ((0, 1, 2, 3), (0.0, -1.0, 0.0)),  # bottom
-        ((4, 5, 6, 7), (0.0, 1.0, 0.0)),  # top
-        ((0, 1, 5, 4), (0.0, 0.0, -1.0)),  # back
-        ((1, 2, 6, 5), (1.0, 0.0, 0.0)),  # right
-        ((2, 3, 7, 6), (0.0, 0.0, 1.0)),  # front
-        ((3, 0, 4, 7), (-1.0, 0.0, 0.0)),  # left
-    ]
+    name: str
+    layer_id: str
+    colour: tuple[float, float, float, float]
+    positions: np.ndarray
+    normals: np.ndarray
+    indices: np.ndarray
+    vertex_colors: np.ndarray | None = None
 
-    positions: list[float] = []
-    normals: list[float] = []
-    indices: list[int] = []
-
-    for face_vertices, normal in faces:
-        start_index = len(positions) // 3
-        for vertex_index in face_vertices:
-            x, y, z = corners[vertex_index]
-            positions.extend([x, y, z])
-            normals.extend(normal)
-        indices.extend(
-            [
-                start_index,
-                start_index + 1,
-                start_index + 2,
-                start_index,
-                start_index + 2,
-                start_index + 3,
-            ]
-        )
 
-    return (
-        positions,
-        normals,
-        indices,
-        [min_x, min_y, min_z],
-        [max_x, max_y, max_z],
+def _build_box_geometry(
+    vertices: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    mins = vertices.min(axis=0)
+    maxs = vertices.max(axis=0)
+    corners = np.array(
+        [
+            [mins[0], mins[1], mins[2]],
+            [maxs[0], mins[1], mins[2]],
+            [maxs[0], mins[1], maxs[2]],
+            [mins[0], mins[1], maxs[2]],
+            [mins[0], maxs[1], mins[2]],
+            [maxs[0], maxs[1], mins[2]],
+            [maxs[0], maxs[1], maxs[2]],
+            [mins[0], maxs[1], maxs[2]],
+        ],
+        dtype=np.float32,
     )
-
-
-def _convert_vertices(vertices: Sequence[Sequence[float]]) -> list[list[float]]:
-    converted: list[list[float]] = []
-    for vertex in vertices:
-        if not isinstance(vertex, Sequence) or len(vertex) != 3:
-            raise ValueError("Invalid vertex payload")
-        x, y, z = float(vertex[0]), float(vertex[1]), float(vertex[2])
-        converted.append([x, z, y])
-    return converted
-
-
-def _triangulate_faces(faces: Sequence[Sequence[object]]) -> list[list[int]]:
-    triangles: list[list[int]] = []
-    for face in faces:
-        if not isinstance(face, Sequence):
-            continue
-        indices: list[int] = []
-        for value in face:
-            if isinstance(value, (int, float)):
-                indices.append(int(value))
-        if len(indices) < 3:
-            continue
-        for offset in range(1, len(indices) - 1):
-            triangles.append([indices[0], indices[offset], indices[offset + 1]])
-    return triangles
-
-
-def _compute_vertex_normals(
-    vertices: Sequence[Sequence[float]], triangles: Sequence[Sequence[int]]
-) -> list[list[float]]:
-    normals = [[0.0, 0.0, 0.0] for _ in vertices]
-    for tri in triangles:
-        try:
-            i0, i1, i2 = tri
-            v0 = vertices[i0]
-            v1 = vertices[i1]
-            v2 = vertices[i2]
-        except (ValueError, IndexError):
-            continue
-        ax, ay, az = v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2]
-        bx, by, bz = v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2]
-        nx = ay * bz - az * by
-        ny = az * bx - ax * bz
-        nz = ax * by - ay * bx
-        for idx in tri:
-            if 0 <= idx < len(normals):
-                normals[idx][0] += nx
-                normals[idx][1] += ny
-                normals[idx][2] += nz
-
-    for normal in normals:
-        length = math.sqrt(
-            normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2]
+    positions = corners[_BOX_FACE_CORNERS.reshape(-1)]
+    normals = np.repeat(_BOX_FACE_NORMALS, 4, axis=0)
+    quad = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+    indices = (np.arange(6, dtype=np.uint32)[:, None] * 4 + quad).reshape(-1)
+    return positions, normals, indices
+
+
+def _triangulate_faces(faces: Sequence[Sequence[int]]) -> np.ndarray:
+    """Fan-triangulate polygon faces into an ``(m, 3)`` index array."""
+
+    lengths = np.fromiter((len(face) for face in faces), dtype=np.intp)
+    if lengths.size == 0:
+        return np.empty((0, 3), dtype=np.intp)
+    flat = np.fromiter(
+        (int(value) for face in faces for value in face),
+        dtype=np.intp,
+        count=int(lengths.sum()),
+    )
+    starts = np.cumsum(lengths) - lengths
+    fan_counts = np.maximum(lengths - 2, 0)
+    total = int(fan_counts.sum())
+    if total == 0:
+        return np.empty((0, 3), dtype=np.intp)
+    first = np.repeat(starts, fan_counts)
+    step = np.arange(total) - np.repeat(np.cumsum(fan_counts) - fan_counts, fan_counts)
+    second = first + step + 1
+    return np.stack([flat[first], flat[second], flat[second + 1]], axis=1)
+
+
+def _compute_vertex_normals(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """Return area-weighted, normalised per-vertex normals."""
+
+    normals = np.zeros_like(vertices, dtype=np.float64)
+    if triangles.size:
+        v0 = vertices[triangles[:, 0]]
+        face_normals = np.cross(
+            vertices[triangles[:, 1]] - v0, vertices[triangles[:, 2]] - v0
         )
-        if length > 0:
-            normal[0] /= length
-            normal[1] /= length
-            normal[2] /= length
-        else:
-            normal[1] = 1.0
-    return normals
+        for corner in range(3):
+            np.add.at(normals, triangles[:, corner], face_normals)
+    lengths = np.linalg.norm(normals, axis=1)
+    degenerate = lengths <= 0
+    normals[~degenerate] /= lengths[~degenerate, None]
+    normals[degenerate] = (0.0, 1.0, 0.0)
+    return normals.astype(np.float32)
 
 
 def _build_vertex_colors(
     base_colour: tuple[float, float, float, float],
-    vertices: Sequence[Sequence[float]],
+    vertices: np.ndarray,
     floor_lines: Sequence[float] | None,
-) -> list[float]:
-    heights = [vertex[1] for vertex in vertices]
-    min_height = min(heights)
-    max_height = max(heights)
-    span = max(max_height - min_height, 1.0)
-    line_values = sorted(
-        float(value) for value in (floor_lines or []) if isinstance(value, (int, float))
+) -> np.ndarray:
+    heights = vertices[:, 1].astype(np.float64)
+    min_height = float(heights.min())
+    span = max(float(heights.max()) - min_height, 1.0)
+    brightness = 0.65 + 0.3 * ((heights - min_height) / span)
+    line_values = np.array(
+        [
+            float(value)
+            for value in (floor_lines or [])
+            if isinstance(value, (int, float))
+        ]
+    )
+    if line_values.size:
+        on_line = (np.abs(heights[:, None] - line_values[None, :]) <= 0.15).any(axis=1)
+        brightness = np.where(on_line, np.minimum(brightness, 0.5), brightness)
+    colours = np.empty((len(heights), 4), dtype=np.float32)
+    colours[:, :3] = np.clip(
+        np.asarray(base_colour[:3])[None, :] * brightness[:, None], 0.0, 1.0
     )
-    colours: list[float] = []
-    for height in heights:
-        ratio = (height - min_height) / span
-        brightness = 0.65 + 0.3 * ratio
-        if line_values:
-            for value in line_values:
-                if abs(height - value) <= 0.15:
-                    brightness = min(brightness, 0.5)
-                    break
-        r = min(max(base_colour[0] * brightness, 0.0), 1.0)
-        g = min(max(base_colour[1] * brightness, 0.0), 1.0)
-        b = min(max(base_colour[2] * brightness, 0.0), 1.0)
-        colours.extend([r, g, b, base_colour[3]])
+    colours[:, 3] = base_colour[3]
     return colours
 
 
-def _build_custom_mesh(
-    *,
-    name: str,
-    colour: tuple[float, float, float, float],
-    vertices: Sequence[Sequence[float]],
-    faces: Sequence[Sequence[object]],
-    floor_lines: Sequence[float] | None,
-    base_elevation: float,
-) -> dict[str, object] | None:
-    try:
-        converted = _convert_vertices(vertices)
-    except ValueError:
-        return None
-
-    triangles = _triangulate_faces(faces)
-    if not triangles:
-        return None
-
-    normals = _compute_vertex_normals(converted, triangles)
-    positions = [component for vertex in converted for component in vertex]
-    normals_flat = [component for normal in normals for component in normal]
-    indices = [int(value) for tri in triangles for value in tri]
-
-    min_x = min(vertex[0] for vertex in converted)
-    min_y = min(vertex[1] for vertex in converted)
-    min_z = min(vertex[2] for vertex in converted)
-    max_x = max(vertex[0] for vertex in converted)
-    max_y = max(vertex[1] for vertex in converted)
-    max_z = max(vertex[2] for vertex in converted)
-
-    vertex_colours = _build_vertex_colors(colour, converted, floor_lines)
-
-    return {
-        "name": name,
-        "positions": positions,
-        "normals": normals_flat,
-        "indices": indices,
-        "color": colour,
-        "vertex_colors": vertex_colours,
-        "min": [min_x, min_y, min_z],
-        "max": [max_x, max_y, max_z],
-    }
-
-
 def _build_layer_mesh(
     layer: PreviewLayerPayload,
     *,
     index: int,
-) -> dict[str, object] | None:
+    proxy: bool = False,
+) -> _LayerMesh | None:
     geometry = layer.get("geometry")
     if not isinstance(geometry, Mapping):
         return None
@@ -796,185 +804,196 @@ def _build_layer_mesh(
     if not isinstance(prism, Mapping):
         return None
     raw_vertices = prism.get("vertices")
-    if not isinstance(raw_vertices, Sequence):
+    if not isinstance(raw_vertices, Sequence) or not raw_vertices:
         return None
     raw_faces = prism.get("faces")
     name = str(layer.get("name") or layer.get("id") or f"Layer {index}")
     colour = _normalise_hex_colour(layer.get("color"), index)
     floor_lines = geometry.get("floor_lines")
-    base_elevation = float(geometry.get("base_elevation") or 0.0)
     layer_id = str(layer.get("id") or f"layer-{index}")
 
-    vertices: list[list[float]] = []
     for vertex in raw_vertices:
         if not isinstance(vertex, Sequence) or len(vertex) != 3:
             return None
-        x, y, z = float(vertex[0]), float(vertex[1]), float(vertex[2])
-        vertices.append([x, y, z])
+    # Source geometry is Z-up; glTF is Y-up.
+    vertices = np.asarray(raw_vertices, dtype=np.float64)[:, [0, 2, 1]]
 
-    faces: list[list[int]] | None = None
-    if isinstance(raw_faces, Sequence):
-        parsed_faces: list[list[int]] = []
+    faces: list[list[int]] = []
+    if not proxy and isinstance(raw_faces, Sequence):
         for face in raw_faces:
             if not isinstance(face, Sequence):
                 return None
-            if len(face) < 3:
-                continue
-            parsed_faces.append([int(value) for value in face])
-        faces = parsed_faces if parsed_faces else None
+            if len(face) >= 3:
+                faces.append([int(value) for value in face])
 
     if faces:
-        mesh = _build_custom_mesh(
+        triangles = _triangulate_faces(faces)
+        in_range = ((triangles >= 0) & (triangles < len(vertices))).all(axis=1)
+        triangles = triangles[in_range]
+        if not triangles.size:
+            return None
+        return _LayerMesh(
             name=name,
+            layer_id=layer_id,
             colour=colour,
-            vertices=vertices,
-            faces=faces,
-            floor_lines=floor_lines,
-            base_elevation=base_elevation,
+            positions=vertices.astype(np.float32),
+            normals=_compute_vertex_normals(vertices, triangles),
+            indices=triangles.reshape(-1).astype(np.uint32),
+            vertex_colors=_build_vertex_colors(colour, vertices, floor_lines),
         )
-        if mesh is not None:
-            mesh["layer_id"] = layer_id
-        return mesh
 
-    # Convert original XYZ (with Z up) into glTF coordinates (Y up) for legacy boxes.
-    converted: list[list[float]] = []
-    for vertex in vertices:
-        x, y, z = float(vertex[0]), float(vertex[1]), float(vertex[2])
-        converted.append([x, z, y])
+    positions, normals, indices = _build_box_geometry(vertices)
+    return _LayerMesh(
+        name=name,
+        layer_id=layer_id,
+        colour=colour,
+        positions=positions,
+        normals=normals,
+        indices=indices,
+    )
 
-    positions, normals, indices, mins, maxs = _build_box_geometry(converted)
-    return {
-        "name": name,
-        "positions": positions,
-        "normals": normals,
-        "indices": indices,
-        "color": colour,
-        "min": mins,
-        "max": maxs,
-        "layer_id": layer_id,
-    }
 
+def _interleave_vertices(
+    mesh: _LayerMesh, *, quantize: bool
+) -> tuple[np.ndarray, list[tuple[str, int, int, str, bool]], dict[str, object]]:
+    """Pack a mesh's vertex attributes into one interleaved record array.
+
+    Returns the records, ``(attribute, byte_offset, component_type, type,
+    normalized)`` tuples describing them, and node properties needed to
+    reconstruct the original coordinates. Quantized meshes store positions as
+    int16 (dequantized by the node's translation/scale), normals as normalized
+    int8 and colours as normalized uint8 per ``KHR_mesh_quantization``.
+    """
 
-def _build_gltf_document(
+    has_colors = mesh.vertex_colors is not None
+    node: dict[str, object] = {}
+    if not quantize:
+        fields: list[tuple[str, Any, tuple[int, ...]]] = [
+            ("position", "<f4", (3,)),
+            ("normal", "<f4", (3,)),
+        ]
+        layout = [
+            ("POSITION", 0, _FLOAT, "VEC3", False),
+            ("NORMAL", 12, _FLOAT, "VEC3", False),
+        ]
+        if has_colors:
+            fields.append(("color", "<f4", (4,)))
+            layout.append(("COLOR_0", 24, _FLOAT, "VEC4", False))
+        records = np.zeros(len(mesh.positions), dtype=np.dtype(fields))
+        records["position"] = mesh.positions
+        records["normal"] = mesh.normals
+        if has_colors:
+            records["color"] = mesh.vertex_colors
+        return records, layout, node
+
+    mins = mesh.positions.min(axis=0).astype(np.float64)
+    maxs = mesh.positions.max(axis=0).astype(np.float64)
+    centre = (mins + maxs) / 2.0
+    scale = np.where(maxs > mins, (maxs - mins) / 65534.0, 1.0)
+    fields = [
+        ("position", "<i2", (3,)),
+        ("pad0", "<i2", (1,)),
+        ("normal", "i1", (3,)),
+        ("pad1", "i1", (1,)),
+    ]
+    layout = [
+        ("POSITION", 0, _SHORT, "VEC3", False),
+        ("NORMAL", 8, _BYTE, "VEC3", True),
+    ]
+    if has_colors:
+        fields.append(("color", "u1", (4,)))
+        layout.append(("COLOR_0", 12, _UNSIGNED_BYTE, "VEC4", True))
+    records = np.zeros(len(mesh.positions), dtype=np.dtype(fields))
+    records["position"] = np.clip(
+        np.rint((mesh.positions - centre) / scale), -32767, 32767
+    ).astype(np.int16)
+    records["normal"] = np.rint(np.clip(mesh.normals, -1.0, 1.0) * 127).astype(np.int8)
+    if has_colors:
+        records["color"] = np.rint(
+            np.clip(cast(np.ndarray, mesh.vertex_colors), 0.0, 1.0) * 255
+        ).astype(np.uint8)
+    node["translation"] = centre.tolist()
+    node["scale"] = scale.tolist()
+    return records, layout, node
+
+
+def _build_glb(
     property_id: UUID,
     asset_version: str,
     layers: Sequence[PreviewLayerPayload],
-) -> tuple[dict[str, object], bytes]:
-    buffer = bytearray()
+    *,
+    quantize: bool = False,
+    proxy: bool = False,
+) -> bytes:
+    """Return a binary glTF (GLB) container holding every layer mesh.
+
+    Each mesh gets one interleaved vertex buffer view plus an index view
+    (uint16 when every index fits, uint32 otherwise). ``proxy`` replaces each
+    layer with its bounding box.
+    """
+
+    chunks: list[bytes] = []
+    offset = 0
     buffer_views: list[dict[str, object]] = []
     accessors: list[dict[str, object]] = []
     meshes: list[dict[str, object]] = []
     materials: list[dict[str, object]] = []
     nodes: list[dict[str, object]] = []
 
-    for index, layer in enumerate(layers):
-        mesh_data = _build_layer_mesh(layer, index=index)
-        if mesh_data is None:
-            continue
-
-        positions = cast(list[float], mesh_data["positions"])
-        normals = cast(list[float], mesh_data["normals"])
-        indices = cast(list[int], mesh_data["indices"])
-        colour = cast(tuple[float, float, float, float], mesh_data["color"])
-
-        # Positions
-        pos_bytes = struct.pack("<" + "f" * len(positions), *positions)
-        pos_offset = len(buffer)
-        buffer.extend(pos_bytes)
-        _align4(buffer)
-        buffer_view_index = len(buffer_views)
+    def _append_view(data: bytes, **view: object) -> int:
+        nonlocal offset
         buffer_views.append(
-            {
-                "buffer": 0,
-                "byteOffset": pos_offset,
-                "byteLength": len(pos_bytes),
-                "target": 34962,
-            }
-        )
-        pos_accessor_index = len(accessors)
-        min_bounds = cast(list[float], mesh_data["min"])
-        max_bounds = cast(list[float], mesh_data["max"])
-        accessors.append(
-            {
-                "bufferView": buffer_view_index,
-                "componentType": 5126,
-                "count": len(positions) // 3,
-                "type": "VEC3",
-                "min": min_bounds,
-                "max": max_bounds,
-            }
+            {"buffer": 0, "byteOffset": offset, "byteLength": len(data), **view}
         )
+        padding = (-len(data)) % 4
+        chunks.append(data + b"\x00" * padding)
+        offset += len(data) + padding
+        return len(buffer_views) - 1
 
-        # Normals
-        normal_bytes = struct.pack("<" + "f" * len(normals), *normals)
-        normal_offset = len(buffer)
-        buffer.extend(normal_bytes)
-        _align4(buffer)
-        buffer_view_index = len(buffer_views)
-        buffer_views.append(
-            {
-                "buffer": 0,
-                "byteOffset": normal_offset,
-                "byteLength": len(normal_bytes),
-                "target": 34962,
-            }
+    for index, layer in enumerate(layers):
+        mesh = _build_layer_mesh(layer, index=index, proxy=proxy)
+        if mesh is None:
+            continue
+
+        records, layout, node_transform = _interleave_vertices(mesh, quantize=quantize)
+        vertex_view = _append_view(
+            records.tobytes(),
+            byteStride=records.dtype.itemsize,
+            target=_ARRAY_BUFFER,
         )
-        normal_accessor_index = len(accessors)
-        accessors.append(
-            {
-                "bufferView": buffer_view_index,
-                "componentType": 5126,
-                "count": len(normals) // 3,
-                "type": "VEC3",
+        attributes: dict[str, int] = {}
+        for attribute, byte_offset, component_type, kind, normalized in layout:
+            accessor: dict[str, object] = {
+                "bufferView": vertex_view,
+                "byteOffset": byte_offset,
+                "componentType": component_type,
+                "count": len(records),
+                "type": kind,
             }
+            if normalized:
+                accessor["normalized"] = True
+            if attribute == "POSITION":
+                stored = records["position"]
+                accessor["min"] = stored.min(axis=0).tolist()
+                accessor["max"] = stored.max(axis=0).tolist()
+            attributes[attribute] = len(accessors)
+            accessors.append(accessor)
+
+        max_index = int(mesh.indices.max()) if mesh.indices.size else 0
+        index_dtype, index_type = (
+            (np.dtype("<u2"), _UNSIGNED_SHORT)
+            if max_index < 65535
+            else (np.dtype("<u4"), _UNSIGNED_INT)
         )
-
-        color_accessor_index = None
-        vertex_colors = cast(list[float] | None, mesh_data.get("vertex_colors"))
-        if vertex_colors:
-            color_bytes = struct.pack("<" + "f" * len(vertex_colors), *vertex_colors)
-            color_offset = len(buffer)
-            buffer.extend(color_bytes)
-            _align4(buffer)
-            buffer_view_index = len(buffer_views)
-            buffer_views.append(
-                {
-                    "buffer": 0,
-                    "byteOffset": color_offset,
-                    "byteLength": len(color_bytes),
-                    "target": 34962,
-                }
-            )
-            color_accessor_index = len(accessors)
-            accessors.append(
-                {
-                    "bufferView": buffer_view_index,
-                    "componentType": 5126,
-                    "count": len(vertex_colors) // 4,
-                    "type": "VEC4",
-                }
-            )
-
-        # Indices
-        index_bytes = struct.pack("<" + "H" * len(indices), *indices)
-        index_offset = len(buffer)
-        buffer.extend(index_bytes)
-        _align4(buffer)
-        buffer_view_index = len(buffer_views)
-        buffer_views.append(
-            {
-                "buffer": 0,
-                "byteOffset": index_offset,
-                "byteLength": len(index_bytes),
-                "target": 34963,
-            }
+        index_view = _append_view(
+            mesh.indices.astype(index_dtype).tobytes(), target=_ELEMENT_ARRAY_BUFFER
         )
-        index_accessor_index = len(accessors)
+        index_accessor = len(accessors)
         accessors.append(
             {
-                "bufferView": buffer_view_index,
-                "componentType": 5123,
-                "count": len(indices),
+                "bufferView": index_view,
+                "componentType": index_type,
+                "count": int(mesh.indices.size),
                 "type": "SCALAR",
             }
         )
@@ -982,66 +1001,72 @@ def _build_gltf_document(
         material_index = len(materials)
         materials.append(
             {
-                "name": mesh_data["name"],
+                "name": mesh.name,
                 "pbrMetallicRoughness": {
-                    "baseColorFactor": list(colour),
+                    "baseColorFactor": list(mesh.colour),
                     "metallicFactor": 0.0,
                     "roughnessFactor": 0.6,
                 },
                 "doubleSided": True,
             }
         )
-
-        mesh_index = len(meshes)
-        attributes = {
-            "POSITION": pos_accessor_index,
-            "NORMAL": normal_accessor_index,
-        }
-        if color_accessor_index is not None:
-            attributes["COLOR_0"] = color_accessor_index
         meshes.append(
             {
-                "name": mesh_data["name"],
+                "name": mesh.name,
                 "primitives": [
                     {
                         "attributes": attributes,
-                        "indices": index_accessor_index,
+                        "indices": index_accessor,
                         "material": material_index,
                         "mode": 4,  # TRIANGLES
                     }
                 ],
             }
         )
-        node_entry: dict[str, object] = {"name": mesh_data["name"], "mesh": mesh_index}
-        layer_id = mesh_data.get("layer_id")
-        if isinstance(layer_id, str):
-            node_entry["extras"] = {"layer_id": layer_id}
-        nodes.append(node_entry)
+        nodes.append(
+            {
+                "name": mesh.name,
+                "mesh": len(meshes) - 1,
+                "extras": {"layer_id": mesh.layer_id},
+                **node_transform,
+            }
+        )
+
+    if not nodes:
+        raise ValueError("Preview payload missing valid geometry layers")
 
+    binary = b"".join(chunks)
     gltf: dict[str, object] = {
         "asset": {
             "version": "2.0",
-            "generator": "optimal-build-preview-1.0",
+            "generator": "optimal-build-preview-2.0",
+            "extras": {"asset_version": asset_version},
         },
         "scene": 0,
         "scenes": [{"name": str(property_id), "nodes": list(range(len(nodes)))}],
         "nodes": nodes,
         "meshes": meshes,
         "materials": materials,
-        "buffers": [
-            {
-                "byteLength": len(buffer),
-                "uri": "preview.bin",
-            }
-        ],
+        "buffers": [{"byteLength": len(binary)}],
         "bufferViews": buffer_views,
         "accessors": accessors,
     }
-
-    if not nodes:
-        raise ValueError("Preview payload missing valid geometry layers")
-
-    return gltf, bytes(buffer)
+    if quantize:
+        gltf["extensionsUsed"] = ["KHR_mesh_quantization"]
+        gltf["extensionsRequired"] = ["KHR_mesh_quantization"]
+
+    json_chunk = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+    json_chunk += b" " * ((-len(json_chunk)) % 4)
+    total_length = 12 + 8 + len(json_chunk) + 8 + len(binary)
+    return b"".join(
+        (
+            struct.pack("<III", _GLB_MAGIC, 2, total_length),
+            struct.pack("<II", len(json_chunk), _GLB_CHUNK_JSON),
+            json_chunk,
+            struct.pack("<II", len(binary), _GLB_CHUNK_BIN),
+            binary,
+        )
+    )
 
 
 def _write_thumbnail(
@@ -1180,6 +1205,71 @@ def _write_thumbnail(
     image.save(asset_dir / "thumbnail.png", "PNG")
 
 
+def preview_retention_index() -> RetentionIndex:
+    """Return the expiry index covering versioned preview asset directories."""
+
+    return RetentionIndex(
+        _PREVIEW_DIR,
+        retention_days=load_retention_days(),
+        on_removed=_journal_removed_assets,
+    )
+
+
+def _journal_removed_assets(asset_dirs: Iterable[Path]) -> None:
+    """Append removed ``<property>/<version>`` directories to the journal."""
+
+    lines = "".join(
+        f"{asset_dir.relative_to(_PREVIEW_DIR).as_posix()}\n"
+        for asset_dir in asset_dirs
+    )
+    if not lines:
+        return
+    journal_dir = _PREVIEW_DIR / _REMOVED_JOURNAL_DIRNAME
+    journal_dir.mkdir(parents=True, exist_ok=True)
+    with (journal_dir / _REMOVED_PENDING).open("a", encoding="utf-8") as handle:
+        handle.write(lines)
+
+
+@contextmanager
+def claim_removed_preview_assets() -> Iterator[dict[UUID, set[str]]]:
+    """Yield journalled removed asset versions, grouped by property.
+
+    Versions rendered again since they were removed are left out. The claimed
+    journal is discarded only when the block succeeds, so a failed expiry is
+    picked up again by the next claim.
+    """
+
+    journal_dir = _PREVIEW_DIR / _REMOVED_JOURNAL_DIRNAME
+    try:
+        os.replace(
+            journal_dir / _REMOVED_PENDING,
+            journal_dir / f"claimed-{uuid4().hex}.log",
+        )
+    except FileNotFoundError:
+        pass
+    claimed = sorted(journal_dir.glob("claimed-*.log")) if journal_dir.is_dir() else []
+
+    removed: dict[UUID, set[str]] = {}
+    for journal in claimed:
+        try:
+            lines = journal.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            property_name, _, version = line.partition("/")
+            if not version or (_PREVIEW_DIR / line / "preview.json").is_file():
+                continue
+            try:
+                property_id = UUID(property_name)
+            except ValueError:
+                continue
+            removed.setdefault(property_id, set()).add(version)
+
+    yield removed
+    for journal in claimed:
+        journal.unlink(missing_ok=True)
+
+
 def build_preview_payload(
     property_id: UUID,
     massing_layers: Iterable[Mapping[str, object] | Any],
@@ -1258,69 +1348,422 @@ def build_preview_payload(
     return payload
 
 
-def ensure_preview_asset(
+def compute_payload_checksum(
+    massing_layers: Sequence[Mapping[str, object]],
+    color_legend: Sequence[Mapping[str, object]] | None = None,
+) -> str:
+    """Return the SHA-256 checksum of serialised massing layers and legend."""
+
+    checksum_source = json.dumps(
+        {"layers": list(massing_layers), "legend": list(color_legend or [])},
+        sort_keys=True,
+    ).encode("utf-8")
+    return hashlib.sha256(checksum_source).hexdigest()
+
+
+def preview_content_key(payload_checksum: str, geometry_detail_level: str) -> str:
+    """Return the asset version addressing a render of the given content."""
+
+    detail_level = normalise_geometry_detail_level(geometry_detail_level)
+    encoding = "quantized" if settings.PREVIEW_MESH_QUANTIZE else "float"
+    source = f"{payload_checksum}:{detail_level}:{encoding}:v{_PREVIEW_RENDER_VERSION}"
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()[:32]
+
+
+def preview_lod_levels(geometry_detail_level: str) -> list[str]:
+    """Return the LOD tiers rendered for ``geometry_detail_level``, coarse first."""
+
+    detail_level = normalise_geometry_detail_level(geometry_detail_level)
+    finer = _DETAIL_LEVEL_ORDER[: _DETAIL_LEVEL_ORDER.index(detail_level) + 1]
+    return [PREVIEW_LOD_PROXY, *finer]
+
+
+def _lod_filename(level: str, detail_level: str) -> str:
+    # The finest tier keeps the historical ``preview.glb`` name.
+    return "preview.glb" if level == detail_level else f"preview.{level}.glb"
+
+
+def _asset_base_url(property_id: UUID, asset_version: str) -> str:
+    return f"/static/dev-previews/{property_id}/{asset_version}"
+
+
+def list_preview_lods(
+    property_id: UUID, asset_version: str, geometry_detail_level: str
+) -> list[PreviewLod]:
+    """Return the LOD tiers already published for a render, coarse to fine.
+
+    Tiers are written in order, so the listing stops at the first missing one;
+    it is safe to call while the render is still in progress.
+    """
+
+    detail_level = normalise_geometry_detail_level(geometry_detail_level)
+    asset_dir = _PREVIEW_DIR / str(property_id) / asset_version
+    base_url = _asset_base_url(property_id, asset_version)
+    lods: list[PreviewLod] = []
+    for level in preview_lod_levels(detail_level):
+        filename = _lod_filename(level, detail_level)
+        try:
+            size = (asset_dir / filename).stat().st_size
+        except OSError:
+            break
+        lods.append(PreviewLod(level=level, url=f"{base_url}/{filename}", bytes=size))
+    return lods
+
+
+async def watch_preview_lods(
     property_id: UUID,
-    job_id: UUID,
-    massing_layers: Iterable[Mapping[str, object] | Any],
+    asset_version: str,
+    geometry_detail_level: str,
     *,
-    geometry_detail_level: str = DEFAULT_GEOMETRY_DETAIL_LEVEL,
-    color_legend: Iterable[Mapping[str, object] | Any] | None = None,
-) -> PreviewAssets:
-    """Persist preview artefacts for a property and return accessible URLs."""
+    timeout_seconds: float,
+    poll_interval: float = _LOD_POLL_INTERVAL_SECONDS,
+) -> AsyncIterator[PreviewLod]:
+    """Yield LOD tiers as the render publishes them, coarse first.
 
-    detail_level = normalise_geometry_detail_level(geometry_detail_level)
-    payload = build_preview_payload(
-        property_id,
-        massing_layers,
-        geometry_detail_level=detail_level,
-        color_legend=color_legend,
+    Stops after the finest tier or once ``timeout_seconds`` pass without the
+    render finishing.
+    """
+
+    levels = preview_lod_levels(geometry_detail_level)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
+    emitted = 0
+    while emitted < len(levels):
+        available = list_preview_lods(property_id, asset_version, geometry_detail_level)
+        for lod in available[emitted:]:
+            yield lod
+        emitted = max(emitted, len(available))
+        if emitted >= len(levels) or loop.time() >= deadline:
+            return
+        await asyncio.sleep(poll_interval)
+
+
+def _preview_assets(
+    property_id: UUID, asset_version: str, geometry_detail_level: str
+) -> PreviewAssets:
+    base_url = _asset_base_url(property_id, asset_version)
+    return PreviewAssets(
+        preview_url=f"{base_url}/preview.glb",
+        metadata_url=f"{base_url}/preview.json",
+        thumbnail_url=f"{base_url}/thumbnail.png",
+        asset_version=asset_version,
+        lods=tuple(
+            list_preview_lods(property_id, asset_version, geometry_detail_level)
+        ),
     )
 
-    asset_version = f"{utcnow().strftime('%Y%m%d%H%M%S')}-{job_id.hex[:8]}"
+
+def find_preview_asset(
+    property_id: UUID, payload_checksum: str, geometry_detail_level: str
+) -> PreviewAssets | None:
+    """Return previously rendered assets for identical content, if present.
+
+    A hit refreshes the directory's mtime, which is the recency signal used by
+    :func:`collect_preview_garbage`, and re-records it in the retention index
+    (once per day) so the sweeper keeps directories that are still in use.
+    """
+
+    asset_version = preview_content_key(payload_checksum, geometry_detail_level)
     asset_dir = _PREVIEW_DIR / str(property_id) / asset_version
-    asset_dir.mkdir(parents=True, exist_ok=True)
+    if not (asset_dir / "preview.json").is_file():
+        return None
+    now = datetime.now(UTC)
+    try:
+        last_used = asset_dir.stat().st_mtime
+        os.utime(asset_dir)
+    except OSError:
+        pass
+    else:
+        if datetime.fromtimestamp(last_used, UTC).date() < now.date():
+            preview_retention_index().record(asset_dir, now=now)
+    return _preview_assets(property_id, asset_version, geometry_detail_level)
+
+
+@contextmanager
+def _coalesce_render(key: str) -> Iterator[None]:
+    """Serialise renders of the same content so followers reuse the leader's output."""
+
+    with _inflight_guard:
+        lock = _inflight_renders.setdefault(key, threading.Lock())
+    with lock:
+        try:
+            yield
+        finally:
+            with _inflight_guard:
+                if _inflight_renders.get(key) is lock:
+                    del _inflight_renders[key]
+
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    for entry in path.rglob("*"):
+        try:
+            if entry.is_file():
+                total += entry.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _cache_limit_bytes(max_bytes: int | None = None) -> int:
+    if max_bytes is not None:
+        return max_bytes
+    return settings.PREVIEW_CACHE_MAX_MB * 1024 * 1024
+
+
+def _evict_preview_assets(limit: int) -> tuple[list[Path], int]:
+    """Evict least-recently-used asset directories; return them and bytes left.
+
+    Evicted directories are journalled like swept ones so the jobs that still
+    point at them are expired instead of serving 404s.
+    """
+
+    entries: list[tuple[float, int, Path]] = []
+    total = 0
+    for property_dir in _PREVIEW_DIR.iterdir():
+        if not property_dir.is_dir() or property_dir.name.startswith("."):
+            continue
+        for asset_dir in property_dir.iterdir():
+            if not asset_dir.is_dir() or asset_dir.name.startswith("."):
+                continue
+            try:
+                last_used = asset_dir.stat().st_mtime
+            except OSError:
+                continue
+            size = _directory_size(asset_dir)
+            entries.append((last_used, size, asset_dir))
+            total += size
+
+    removed: list[Path] = []
+    entries.sort(key=lambda entry: entry[0])
+    for _last_used, size, asset_dir in entries:
+        if total <= limit:
+            break
+        shutil.rmtree(asset_dir, ignore_errors=True)
+        removed.append(asset_dir)
+        total -= size
+        try:
+            asset_dir.parent.rmdir()
+        except OSError:
+            pass
+    if removed:
+        _journal_removed_assets(removed)
+        log_event(
+            logger,
+            "preview_cache_evicted",
+            removed=len(removed),
+            remaining_bytes=total,
+        )
+    return removed, total
+
+
+def collect_preview_garbage(max_bytes: int | None = None) -> list[Path]:
+    """Evict least-recently-used preview asset directories above ``max_bytes``.
+
+    Defaults to ``PREVIEW_CACHE_MAX_MB``. Returns the directories removed.
+    """
+
+    removed, remaining = _evict_preview_assets(_cache_limit_bytes(max_bytes))
+    _cache_ledger.reset(remaining)
+    return removed
+
+
+class _PreviewCacheLedger:
+    """Running total of preview cache bytes written by this process.
+
+    New renders add their size here instead of walking the tree; only when
+    the total crosses the budget does one background sweep walk the cache,
+    evict, and resynchronise the total. The total starts unknown, so the
+    first render after start-up also triggers a sweep.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bytes: int | None = None
+        self._sweeping = False
+
+    @property
+    def bytes(self) -> int | None:
+        return self._bytes
+
+    def add(self, written: int, limit: int) -> bool:
+        """Record ``written`` bytes; return True when the caller should sweep."""
+
+        with self._lock:
+            if self._bytes is not None:
+                self._bytes += written
+            if self._sweeping or (self._bytes is not None and self._bytes <= limit):
+                return False
+            self._sweeping = True
+            return True
+
+    def reset(self, remaining: int | None) -> None:
+        with self._lock:
+            self._bytes = remaining
+            self._sweeping = False
+
+
+_cache_ledger = _PreviewCacheLedger()
+
+
+def _sweep_preview_cache() -> None:
+    remaining: int | None = None
+    try:
+        _removed, remaining = _evict_preview_assets(_cache_limit_bytes())
+    except OSError as exc:  # pragma: no cover - eviction is best effort
+        logger.warning("preview_cache_eviction_failed", error=str(exc))
+    finally:
+        _cache_ledger.reset(remaining)
+
+
+def _record_preview_write(asset_dir: Path) -> None:
+    """Account for a new render and start a sweep once over budget."""
+
+    if _cache_ledger.add(_directory_size(asset_dir), _cache_limit_bytes()):
+        threading.Thread(
+            target=_sweep_preview_cache, name="preview-cache-gc", daemon=True
+        ).start()
+
+
+def _write_atomic(path: Path, data: bytes, token: str) -> None:
+    staging = path.with_name(f".{path.name}.{token}.tmp")
+    staging.write_bytes(data)
+    os.replace(staging, path)
 
-    gltf_document, binary_blob = _build_gltf_document(
-        property_id,
-        asset_version,
-        payload["layers"],
-    )
 
-    base_url = f"/static/dev-previews/{property_id}/{asset_version}"
+def _render_preview_directory(
+    target_dir: Path,
+    property_id: UUID,
+    asset_version: str,
+    payload: PreviewPayload,
+    *,
+    layers: Iterable[Mapping[str, object] | Any],
+    color_legend: Iterable[Mapping[str, object] | Any] | None,
+    token: str,
+) -> None:
+    """Publish every LOD tier into ``target_dir``, coarsest first.
+
+    Each tier appears atomically as soon as it is encoded so clients can start
+    with the proxy while finer meshes are still being built; ``preview.json``
+    is written last and marks the render complete.
+    """
+
+    detail_level = payload["geometry_detail_level"]
+    quantize = settings.PREVIEW_MESH_QUANTIZE
+    base_url = _asset_base_url(property_id, asset_version)
+    lods: list[LodManifestEntry] = []
+    for level in preview_lod_levels(detail_level):
+        if level == PREVIEW_LOD_PROXY or level == detail_level:
+            tier_layers = payload["layers"]
+        else:
+            tier_layers = build_preview_payload(
+                property_id,
+                layers,
+                geometry_detail_level=level,
+                color_legend=color_legend,
+            )["layers"]
+        blob = _build_glb(
+            property_id,
+            asset_version,
+            tier_layers,
+            quantize=quantize,
+            proxy=level == PREVIEW_LOD_PROXY,
+        )
+        filename = _lod_filename(level, detail_level)
+        _write_atomic(target_dir / filename, blob, token)
+        lods.append(
+            {"level": level, "url": f"{base_url}/{filename}", "bytes": len(blob)}
+        )
+
+    _write_thumbnail(target_dir, payload["layers"])
+
     payload["asset_manifest"] = {
-        "gltf": f"{base_url}/preview.gltf",
+        "gltf": f"{base_url}/preview.glb",
         "metadata": f"{base_url}/preview.json",
-        "binary": f"{base_url}/preview.bin",
         "thumbnail": f"{base_url}/thumbnail.png",
         "version": asset_version,
+        "lods": lods,
     }
-    payload["geometry_detail_level"] = detail_level
+    _write_atomic(
+        target_dir / "preview.json",
+        json.dumps(payload, separators=(",", ":")).encode("utf-8"),
+        token,
+    )
 
-    metadata_path = asset_dir / "preview.json"
-    metadata_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
-    gltf_path = asset_dir / "preview.gltf"
-    gltf_path.write_text(
-        json.dumps(gltf_document, separators=(",", ":")), encoding="utf-8"
-    )
+def ensure_preview_asset(
+    property_id: UUID,
+    job_id: UUID,
+    massing_layers: Iterable[Mapping[str, object] | Any],
+    *,
+    geometry_detail_level: str = DEFAULT_GEOMETRY_DETAIL_LEVEL,
+    color_legend: Iterable[Mapping[str, object] | Any] | None = None,
+    payload_checksum: str | None = None,
+) -> PreviewAssets:
+    """Persist preview artefacts for a property and return accessible URLs.
+
+    Assets are content addressed by ``payload_checksum`` and detail level:
+    identical requests reuse the existing directory, and concurrent identical
+    requests wait for the one in-flight render instead of repeating it. LOD
+    tiers are published progressively (see :func:`watch_preview_lods`).
+    """
 
-    binary_path = asset_dir / "preview.bin"
-    binary_path.write_bytes(binary_blob)
+    detail_level = normalise_geometry_detail_level(geometry_detail_level)
+    layers = list(massing_layers)
+    legend = list(color_legend) if color_legend is not None else None
+    if payload_checksum is None:
+        payload_checksum = compute_payload_checksum(
+            [_normalise_payload(layer) for layer in layers],
+            [_normalise_payload(entry) for entry in legend or []],
+        )
 
-    _write_thumbnail(asset_dir, payload["layers"])
+    cached = find_preview_asset(property_id, payload_checksum, detail_level)
+    if cached is not None:
+        return cached
+
+    asset_version = preview_content_key(payload_checksum, detail_level)
+    with _coalesce_render(f"{property_id}/{asset_version}"):
+        cached = find_preview_asset(property_id, payload_checksum, detail_level)
+        if cached is not None:
+            return cached
+
+        payload = build_preview_payload(
+            property_id,
+            layers,
+            geometry_detail_level=detail_level,
+            color_legend=legend,
+        )
+        asset_dir = _PREVIEW_DIR / str(property_id) / asset_version
+        asset_dir.mkdir(parents=True, exist_ok=True)
+        _render_preview_directory(
+            asset_dir,
+            property_id,
+            asset_version,
+            payload,
+            layers=layers,
+            color_legend=legend,
+            token=job_id.hex[:8],
+        )
 
-    return PreviewAssets(
-        preview_url=f"{base_url}/preview.gltf",
-        metadata_url=f"{base_url}/preview.json",
-        thumbnail_url=f"{base_url}/thumbnail.png",
-        asset_version=asset_version,
-    )
+    preview_retention_index().record(asset_dir)
+    _record_preview_write(asset_dir)
+    return _preview_assets(property_id, asset_version, detail_level)
 
 
 __all__ = [
     "build_preview_payload",
+    "collect_preview_garbage",
+    "compute_payload_checksum",
     "ensure_preview_asset",
+    "find_preview_asset",
+    "list_preview_lods",
     "PreviewAssets",
+    "PreviewLod",
+    "PREVIEW_LOD_PROXY",
     "SUPPORTED_GEOMETRY_DETAIL_LEVELS",
     "normalise_geometry_detail_level",
+    "preview_content_key",
+    "preview_lod_levels",
+    "preview_retention_index",
+    "watch_preview_lods",
 ]
@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
-import json
-from typing import Any, Mapping, Protocol, Sequence, cast
+from typing import Any, Iterable, Mapping, Protocol, Sequence, cast
 
 
 class _HasModelDump(Protocol):
     def model_dump(self) -> dict[str, object]: ...
 
 
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from backend._compat.datetime import utcnow
 from backend.jobs import job_queue
@@ -20,14 +18,14 @@ from backend.jobs.preview_generate import generate_preview_job  # noqa: F401
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-_registry = getattr(job_queue._backend, "_registry", {})
-if "preview.generate" not in _registry:
+if not job_queue.is_registered("preview.generate"):
     job_queue.register(generate_preview_job, "preview.generate", queue="preview")
 
 from app.core.config import settings
 from app.models.preview import PreviewJob, PreviewJobStatus
 from app.models.property import Property
 from app.services import preview_generator
+from app.services.preview_render_pool import PreviewRenderQueueFull, get_render_pool
 from app.utils import metrics
 
 
@@ -48,6 +46,7 @@ def _schedule_preview_generation(job_id: UUID) -> None:
     task = asyncio.create_task(generate_preview_job(str(job_id)))
 
     def _log_background_error(done_task: asyncio.Task[object]) -> None:
+        get_render_pool().release_reservation(job_id)
         try:
             done_task.result()
         except Exception as exc:  # pragma: no cover - defensive logging
@@ -62,6 +61,43 @@ def _schedule_preview_generation(job_id: UUID) -> None:
     task.add_done_callback(_log_background_error)
 
 
+async def expire_preview_versions(
+    session: AsyncSession, property_id: UUID, versions: Iterable[str]
+) -> int:
+    """Mark ``property_id``'s jobs for pruned asset ``versions`` as expired.
+
+    Flushes but does not commit; returns the number of matching jobs.
+    """
+
+    result = await session.execute(
+        select(PreviewJob)
+        .where(PreviewJob.property_id == property_id)
+        .where(PreviewJob.asset_version.in_(list(versions)))
+    )
+    jobs = result.scalars().all()
+    for job in jobs:
+        if job.status != PreviewJobStatus.EXPIRED:
+            job.status = PreviewJobStatus.EXPIRED
+            if not job.finished_at:
+                job.finished_at = utcnow()
+            job.message = job.message or "Preview assets pruned"
+    if jobs:
+        await session.flush()
+    return len(jobs)
+
+
+async def expire_removed_preview_jobs(session: AsyncSession) -> int:
+    """Expire jobs whose asset directories were evicted or swept; commits."""
+
+    expired = 0
+    with preview_generator.claim_removed_preview_assets() as removed:
+        for property_id, versions in removed.items():
+            expired += await expire_preview_versions(session, property_id, versions)
+        if removed:
+            await session.commit()
+    return expired
+
+
 class PreviewJobService:
     """Persist and generate property preview jobs."""
 
@@ -81,6 +117,67 @@ class PreviewJobService:
             float(queued_total)
         )
 
+    @staticmethod
+    def _reserve_render_slot(
+        job_id: UUID, property_id: UUID, payload_checksum: str, detail_level: str
+    ) -> PreviewRenderQueueFull | None:
+        """Reserve a render-pool slot for ``job_id`` before the job changes.
+
+        Only in-process backends render here; content that is already
+        rendered is served from the cache and needs no render slot. The slot
+        passes to the job's render, or is returned once the job settles
+        without one.
+        """
+
+        if not job_queue.runs_in_process:
+            return None
+        try:
+            get_render_pool().reserve(job_id)
+        except PreviewRenderQueueFull as exc:
+            if (
+                preview_generator.find_preview_asset(
+                    property_id, payload_checksum, detail_level
+                )
+                is not None
+            ):
+                return None
+            return exc
+        return None
+
+    @staticmethod
+    async def _run_inline(job_id: UUID) -> None:
+        try:
+            await generate_preview_job(str(job_id))
+        finally:
+            get_render_pool().release_reservation(job_id)
+
+    async def _complete_from_cache(self, job: PreviewJob, detail_level: str) -> bool:
+        """Mark ``job`` ready when identical content has already been rendered."""
+
+        if not job.payload_checksum:
+            return False
+        assets = preview_generator.find_preview_asset(
+            job.property_id, job.payload_checksum, detail_level
+        )
+        if assets is None:
+            return False
+        get_render_pool().release_reservation(job.id)
+        finished_at = utcnow()
+        job.status = PreviewJobStatus.READY
+        job.started_at = finished_at
+        job.finished_at = finished_at
+        job.message = None
+        job.preview_url = assets.preview_url
+        job.metadata_url = assets.metadata_url
+        job.thumbnail_url = assets.thumbnail_url
+        job.asset_version = assets.asset_version
+        metadata_dict: dict[str, Any] = dict(job.metadata or {})
+        metadata_dict["asset_manifest"] = dict(assets.manifest())
+        job.metadata = metadata_dict
+        await self._session.commit()
+        metrics.PREVIEW_JOBS_COMPLETED_TOTAL.labels(outcome="cached").inc()
+        return True
+
     async def list_jobs(self, property_id: UUID) -> list[PreviewJob]:
         result = await self._session.execute(
             select(PreviewJob)
@@ -103,9 +200,48 @@ class PreviewJobService:
         color_legend: Sequence[Mapping[str, object]] | None = None,
         metadata_extras: Mapping[str, object] | None = None,
         inline_execution: str = "sync",
+        defer_when_saturated: bool = False,
     ) -> PreviewJob:
-        """Create a preview job and enqueue it for asynchronous rendering."""
+        """Create a preview job and enqueue it for asynchronous rendering.
+
+        When the in-process render pool is full this raises
+        :class:`~app.services.preview_render_pool.PreviewRenderQueueFull`
+        before anything is persisted, or with ``defer_when_saturated`` records
+        the job as failed so the caller can still respond and refresh later.
+        """
 
+        job_id = uuid4()
+        try:
+            return await self._queue_preview(
+                job_id,
+                property_id=property_id,
+                scenario=scenario,
+                massing_layers=massing_layers,
+                camera_orbit=camera_orbit,
+                geometry_detail_level=geometry_detail_level,
+                color_legend=color_legend,
+                metadata_extras=metadata_extras,
+                inline_execution=inline_execution,
+                defer_when_saturated=defer_when_saturated,
+            )
+        except BaseException:
+            get_render_pool().release_reservation(job_id)
+            raise
+
+    async def _queue_preview(
+        self,
+        job_id: UUID,
+        *,
+        property_id: UUID,
+        scenario: str,
+        massing_layers: Sequence[Mapping[str, object]],
+        camera_orbit: Mapping[str, float] | None,
+        geometry_detail_level: str | None,
+        color_legend: Sequence[Mapping[str, object]] | None,
+        metadata_extras: Mapping[str, object] | None,
+        inline_execution: str,
+        defer_when_saturated: bool,
+    ) -> PreviewJob:
         import logging
 
         logger = logging.getLogger(__name__)
@@ -123,12 +259,15 @@ class PreviewJobService:
                 f"[QUEUE_PREVIEW_START] Serialised {len(serialised_layers)} layers"
             )
 
-            checksum_source = json.dumps(
-                {"layers": serialised_layers, "legend": legend_payload},
-                sort_keys=True,
-            ).encode("utf-8")
-            checksum = hashlib.sha256(checksum_source).hexdigest()
+            checksum = preview_generator.compute_payload_checksum(
+                serialised_layers, legend_payload
+            )
             logger.info(f"[QUEUE_PREVIEW_START] Computed checksum: {checksum[:16]}...")
+            capacity_error = self._reserve_render_slot(
+                job_id, property_id, checksum, detail_level
+            )
+            if capacity_error is not None and not defer_when_saturated:
+                raise capacity_error
 
             property_record = await self._session.get(Property, property_id)
             jurisdiction_code = (
@@ -144,6 +283,7 @@ class PreviewJobService:
             if metadata_extras:
                 job_metadata.update(dict(metadata_extras))
             job = PreviewJob(
+                id=job_id,
                 property_id=property_id,
                 scenario=scenario,
                 status=PreviewJobStatus.QUEUED,
@@ -158,15 +298,7 @@ class PreviewJobService:
             await self._session.flush()
             logger.info(f"[QUEUE_PREVIEW_START] Flushed job {job.id}")
 
-            logger.info(
-                "[QUEUE_PREVIEW_START] About to access job_queue._backend._registry"
-            )
-            registry = getattr(job_queue._backend, "_registry", {})
-            logger.info(
-                f"[QUEUE_PREVIEW_START] Got registry with {len(registry)} entries"
-            )
-
-            if "preview.generate" not in registry:
+            if not job_queue.is_registered("preview.generate"):
                 logger.info("[QUEUE_PREVIEW_START] Registering preview.generate job")
                 job_queue.register(
                     generate_preview_job, "preview.generate", queue="preview"
@@ -174,13 +306,10 @@ class PreviewJobService:
                 logger.info("[QUEUE_PREVIEW_START] Registered preview.generate job")
 
             logger.info("[QUEUE_PREVIEW_START] About to get backend_name")
-            backend_name = getattr(job_queue._backend, "name", "inline")
+            backend_name = job_queue.backend_name
             logger.info(
                 f"[QUEUE_PREVIEW] Detected backend_name: '{backend_name}' for job {job.id}"
             )
-            logger.info(
-                f"[QUEUE_PREVIEW] job_queue._backend type: {type(job_queue._backend)}"
-            )
 
             logger.info("[QUEUE_PREVIEW_START] About to update job.metadata")
             job.metadata["job_backend"] = backend_name
@@ -197,6 +326,16 @@ class PreviewJobService:
             backend=backend_name,
         ).inc()
         await self._record_queue_depth(backend_name)
+        if await self._complete_from_cache(job, detail_level):
+            await self._record_queue_depth(backend_name)
+            return job
+        if capacity_error is not None:
+            job.status = PreviewJobStatus.FAILED
+            job.finished_at = utcnow()
+            job.message = f"{capacity_error}; refresh the job to retry"
+            await self._session.flush()
+            await self._record_queue_depth(backend_name)
+            return job
 
         if backend_name == "inline" and inline_execution == "background":
             import logging
@@ -218,7 +357,7 @@ class PreviewJobService:
             logger.info(
                 f"[INLINE QUEUE] Session committed, now calling generate_preview_job for {job.id}"
             )
-            await generate_preview_job(str(job.id))
+            await self._run_inline(job.id)
             logger.info(f"[INLINE QUEUE] generate_preview_job completed for {job.id}")
         else:
             try:
@@ -258,6 +397,23 @@ class PreviewJobService:
     ) -> PreviewJob:
         """Re-enqueue a preview job using stored metadata."""
 
+        try:
+            return await self._refresh_job(
+                job,
+                geometry_detail_level=geometry_detail_level,
+                color_legend=color_legend,
+            )
+        except BaseException:
+            get_render_pool().release_reservation(job.id)
+            raise
+
+    async def _refresh_job(
+        self,
+        job: PreviewJob,
+        *,
+        geometry_detail_level: str | None,
+        color_legend: Sequence[Mapping[str, object]] | None,
+    ) -> PreviewJob:
         metadata_dict: dict[str, Any] = dict(job.metadata or {})
         payload_layers = metadata_dict.get("massing_layers")
         if not isinstance(payload_layers, list) or not payload_layers:
@@ -273,19 +429,23 @@ class PreviewJobService:
                 if isinstance(stored_legend, list)
                 else []
             )
-        checksum_source = json.dumps(
-            {"layers": serialised_layers, "legend": legend_payload},
-            sort_keys=True,
-        ).encode("utf-8")
-        job.payload_checksum = hashlib.sha256(checksum_source).hexdigest()
-        metadata_dict["massing_layers"] = serialised_layers
-        metadata_dict["color_legend"] = legend_payload
-
+        checksum = preview_generator.compute_payload_checksum(
+            serialised_layers, legend_payload
+        )
         detail_level = preview_generator.normalise_geometry_detail_level(
             geometry_detail_level
             or (metadata_dict.get("geometry_detail_level"))
             or settings.PREVIEW_GEOMETRY_DETAIL_LEVEL
         )
+        capacity_error = self._reserve_render_slot(
+            job.id, job.property_id, checksum, detail_level
+        )
+        if capacity_error is not None:
+            raise capacity_error
+
+        job.payload_checksum = checksum
+        metadata_dict["massing_layers"] = serialised_layers
+        metadata_dict["color_legend"] = legend_payload
         metadata_dict["geometry_detail_level"] = detail_level
 
         job.status = PreviewJobStatus.QUEUED
@@ -301,13 +461,12 @@ class PreviewJobService:
         metadata_dict["geometry_detail_level"] = detail_level
         job.metadata = metadata_dict
 
-        registry = getattr(job_queue._backend, "_registry", {})
-        if "preview.generate" not in registry:
+        if not job_queue.is_registered("preview.generate"):
             job_queue.register(
                 generate_preview_job, "preview.generate", queue="preview"
             )
 
-        backend_name = getattr(job_queue._backend, "name", "inline")
+        backend_name = job_queue.backend_name
         job.metadata["job_backend"] = backend_name
         await self._session.flush()
         metrics.PREVIEW_JOBS_CREATED_TOTAL.labels(
@@ -315,6 +474,9 @@ class PreviewJobService:
             backend=backend_name,
         ).inc()
         await self._record_queue_depth(backend_name)
+        if await self._complete_from_cache(job, detail_level):
+            await self._record_queue_depth(backend_name)
+            return job
 
         if backend_name == "inline":
             import logging
@@ -327,7 +489,7 @@ class PreviewJobService:
             logger.info(
                 f"[INLINE REFRESH] Session committed, now calling generate_preview_job for {job.id}"
             )
-            await generate_preview_job(str(job.id))
+            await self._run_inline(job.id)
             logger.info(f"[INLINE REFRESH] generate_preview_job completed for {job.id}")
         else:
             try:
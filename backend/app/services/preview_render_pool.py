@@ -0,0 +1,265 @@
+"""Bounded worker pool that renders preview assets off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Mapping, Sequence
+from uuid import UUID
+
+from app.core.config import settings
+from app.services.preview_generator import (
+    PreviewAssets,
+    ensure_preview_asset,
+    preview_content_key,
+)
+from app.utils import metrics
+from app.utils.logging import get_logger
+from app.utils.process_pool import spawn_process_pool
+
+logger = get_logger(__name__)
+
+_METRIC_BACKEND = "render_pool"
+
+_RenderResult = tuple[PreviewAssets, float, float]
+
+
+class PreviewRenderQueueFull(RuntimeError):
+    """Raised when the render pool already holds its maximum pending renders."""
+
+
+@dataclass(slots=True, frozen=True)
+class PreviewRenderOutcome:
+    """Rendered assets plus wall-clock timestamps reported by the worker."""
+
+    assets: PreviewAssets
+    started_at: float
+    finished_at: float
+
+    @property
+    def render_ms(self) -> float:
+        return max(self.finished_at - self.started_at, 0.0) * 1000.0
+
+
+# Keep render workers from dispatching jobs or spawning nested pools.
+_RENDER_WORKER_ENV = {"JOB_QUEUE_BACKEND": "inline", "PREVIEW_RENDER_WORKERS": "0"}
+
+
+def _render_in_worker(
+    property_id: UUID,
+    job_id: UUID,
+    massing_layers: Sequence[Mapping[str, object]],
+    geometry_detail_level: str,
+    color_legend: Sequence[Mapping[str, object]] | None,
+    payload_checksum: str | None,
+) -> _RenderResult:
+    started_at = time.time()
+    assets = ensure_preview_asset(
+        property_id,
+        job_id,
+        massing_layers,
+        geometry_detail_level=geometry_detail_level,
+        color_legend=color_legend,
+        payload_checksum=payload_checksum,
+    )
+    return assets, started_at, time.time()
+
+
+class PreviewRenderPool:
+    """Render previews in worker processes with a cap on pending work.
+
+    ``max_pending`` counts renders that are queued or running; once reached,
+    :meth:`render` raises :class:`PreviewRenderQueueFull` so callers can shed
+    load instead of growing an unbounded backlog. Concurrent renders of the
+    same content share one worker result. ``max_workers=0`` renders on a
+    thread instead of a process pool. Callers that must refuse work before
+    persisting it :meth:`reserve` a slot for the job; the job's render then
+    takes over that slot instead of claiming a new one.
+    """
+
+    def __init__(self, *, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, 1)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._reserved: set[UUID] = set()
+        self._inflight: dict[str, Future[_RenderResult]] = {}
+        self._executor: Executor | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def saturated(self) -> bool:
+        return self._pending >= self.max_pending
+
+    def ensure_capacity(self) -> None:
+        """Raise :class:`PreviewRenderQueueFull` when no render slot is free."""
+
+        if self.saturated:
+            metrics.PREVIEW_JOBS_REJECTED_TOTAL.labels(backend=_METRIC_BACKEND).inc()
+            raise PreviewRenderQueueFull(
+                f"Preview render queue is full ({self.max_pending} pending)"
+            )
+
+    def reserve(self, job_id: UUID) -> None:
+        """Claim a render slot for ``job_id`` or raise :class:`PreviewRenderQueueFull`.
+
+        The check and the claim happen under one lock, so concurrent callers
+        cannot both take the last slot. Release it with
+        :meth:`release_reservation` if the job will not render.
+        """
+
+        with self._lock:
+            if job_id in self._reserved:
+                return
+            self.ensure_capacity()
+            self._reserved.add(job_id)
+            self._pending += 1
+            self._publish_depth()
+
+    def release_reservation(self, job_id: UUID) -> None:
+        """Return ``job_id``'s reserved slot; a no-op once its render started."""
+
+        with self._lock:
+            if job_id not in self._reserved:
+                return
+            self._reserved.discard(job_id)
+            self._pending = max(self._pending - 1, 0)
+            self._publish_depth()
+
+    def _publish_depth(self) -> None:
+        metrics.PREVIEW_QUEUE_DEPTH.labels(backend=_METRIC_BACKEND).set(
+            float(self._pending)
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.max_workers > 0:
+                self._executor = spawn_process_pool(
+                    self.max_workers, environ=_RENDER_WORKER_ENV
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="preview-render"
+                )
+        return self._executor
+
+    def _submit(
+        self, key: str | None, job_id: UUID, args: tuple[Any, ...]
+    ) -> Future[_RenderResult]:
+        with self._lock:
+            reserved = job_id in self._reserved
+            self._reserved.discard(job_id)
+            existing = self._inflight.get(key) if key else None
+            if existing is not None:
+                if reserved:
+                    self._pending = max(self._pending - 1, 0)
+                    self._publish_depth()
+                return existing
+            if not reserved:
+                self.ensure_capacity()
+                self._pending += 1
+            self._publish_depth()
+        try:
+            future = self._get_executor().submit(_render_in_worker, *args)
+        except Exception:
+            self._release(None, None)
+            raise
+        if key:
+            with self._lock:
+                self._inflight[key] = future
+        future.add_done_callback(lambda done: self._release(key, done))
+        return future
+
+    def _release(self, key: str | None, future: Future[_RenderResult] | None) -> None:
+        with self._lock:
+            if key and self._inflight.get(key) is future:
+                del self._inflight[key]
+            self._pending = max(self._pending - 1, 0)
+            self._publish_depth()
+
+    async def render(
+        self,
+        property_id: UUID,
+        job_id: UUID,
+        massing_layers: Sequence[Mapping[str, object]],
+        *,
+        geometry_detail_level: str,
+        color_legend: Sequence[Mapping[str, object]] | None = None,
+        payload_checksum: str | None = None,
+    ) -> PreviewRenderOutcome:
+        """Render a preview in the pool and return assets with worker timings."""
+
+        key = (
+            f"{property_id}/"
+            f"{preview_content_key(payload_checksum, geometry_detail_level)}"
+            if payload_checksum
+            else None
+        )
+        future = self._submit(
+            key,
+            job_id,
+            (
+                property_id,
+                job_id,
+                list(massing_layers),
+                geometry_detail_level,
+                list(color_legend) if color_legend is not None else None,
+                payload_checksum,
+            ),
+        )
+        try:
+            assets, started_at, finished_at = await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            logger.warning("preview_render_pool_broken", job_id=str(job_id))
+            self.shutdown(wait=False)
+            raise
+        return PreviewRenderOutcome(
+            assets=assets, started_at=started_at, finished_at=finished_at
+        )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the workers; a new pool starts on the next render."""
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_render_pool: PreviewRenderPool | None = None
+
+
+def get_render_pool() -> PreviewRenderPool:
+    """Return the process-wide render pool configured from settings."""
+
+    global _render_pool
+    if _render_pool is None:
+        _render_pool = PreviewRenderPool(
+            max_workers=settings.PREVIEW_RENDER_WORKERS,
+            max_pending=settings.PREVIEW_RENDER_QUEUE_LIMIT,
+        )
+    return _render_pool
+
+
+def shutdown_render_pool() -> None:
+    """Stop the shared render pool, if one was started."""
+
+    global _render_pool
+    pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+__all__ = [
+    "PreviewRenderOutcome",
+    "PreviewRenderPool",
+    "PreviewRenderQueueFull",
+    "get_render_pool",
+    "shutdown_render_pool",
+]
@@ -0,0 +1,306 @@
+"""Indexed property search with facet counts.
+
+Text predicates are written for the indexes each database provides. On
+Postgres, keywords match the ``search_vector`` tsvector (GIN) and location
+substrings use ``ILIKE`` served by pg_trgm GIN indexes. On SQLite both go
+through the ``properties_fts`` FTS5 trigram table. Other databases, and SQLite
+files created before that table existed, fall back to ``ILIKE`` scans.
+
+Facet counts are disjunctive: each facet applies every filter except its own,
+so a client can show how many matches picking another bucket would give.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    case,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.property import PROPERTY_SEARCH_FTS_TABLE, Property, PropertyType
+
+# Text search configuration of the Postgres search_vector column.
+SEARCH_CONFIG = "simple"
+# SQLite's trigram tokenizer cannot match terms shorter than one trigram.
+MIN_TRIGRAM_LENGTH = 3
+
+FacetBuckets = tuple[tuple[str, Optional[float], Optional[float]], ...]
+
+# (value, inclusive lower bound, exclusive upper bound)
+GPR_FACET_BUCKETS: FacetBuckets = (
+    ("under_2", None, 2.0),
+    ("2_to_4", 2.0, 4.0),
+    ("4_to_6", 4.0, 6.0),
+    ("6_plus", 6.0, None),
+)
+LAND_AREA_FACET_BUCKETS: FacetBuckets = (
+    ("under_1000", None, 1000.0),
+    ("1000_to_5000", 1000.0, 5000.0),
+    ("5000_to_20000", 5000.0, 20000.0),
+    ("20000_plus", 20000.0, None),
+)
+
+_LOCATION_COLUMNS = (Property.address, Property.district, Property.planning_area)
+_KEYWORD_COLUMNS = (Property.name, *_LOCATION_COLUMNS)
+
+
+@dataclass(frozen=True)
+class PropertySearchFilters:
+    """Criteria shared by natural language queries and property list filters."""
+
+    keywords: Optional[str] = None
+    location: Optional[str] = None
+    property_type: Optional[PropertyType | str] = None
+    min_gpr: Optional[float] = None
+    max_gpr: Optional[float] = None
+    min_land_area: Optional[float] = None
+    max_land_area: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class FacetCount:
+    """Number of matching properties in one facet value or range bucket."""
+
+    value: str
+    count: int
+    min: Optional[float] = None
+    max: Optional[float] = None
+
+
+@dataclass
+class PropertySearchPage:
+    """One page of matching properties, with totals when requested."""
+
+    properties: list[Property]
+    total: Optional[int] = None
+    facets: dict[str, list[FacetCount]] = field(default_factory=dict)
+
+
+async def search_properties(
+    session: AsyncSession,
+    filters: PropertySearchFilters,
+    *,
+    limit: int = 10,
+    offset: int = 0,
+    include_counts: bool = False,
+) -> PropertySearchPage:
+    """Return a page of properties matching ``filters``.
+
+    ``include_counts`` adds the total match count and facet counts, at the
+    cost of four aggregate queries.
+    """
+
+    groups = await _filter_groups(session, filters)
+    conditions = [condition for group in groups.values() for condition in group]
+    rows = await session.execute(
+        select(Property)
+        .where(*conditions)
+        .order_by(Property.id)
+        .limit(limit)
+        .offset(offset)
+    )
+    page = PropertySearchPage(properties=list(rows.scalars().all()))
+    if include_counts:
+        page.total = await session.scalar(
+            select(func.count()).select_from(Property).where(*conditions)
+        )
+        page.facets = await _facet_counts(session, groups)
+    return page
+
+
+async def property_facets(
+    session: AsyncSession, filters: PropertySearchFilters
+) -> dict[str, list[FacetCount]]:
+    """Return property type, GPR and land area facet counts for ``filters``."""
+
+    return await _facet_counts(session, await _filter_groups(session, filters))
+
+
+async def _filter_groups(
+    session: AsyncSession, filters: PropertySearchFilters
+) -> dict[str, list[ColumnElement[bool]]]:
+    """Group filter predicates by the facet they belong to."""
+
+    dialect = session.get_bind().dialect.name
+    use_fts = dialect == "sqlite" and await _sqlite_fts_available(session)
+
+    text_conditions: list[ColumnElement[bool]] = []
+    if filters.keywords and filters.keywords.strip():
+        text_conditions.append(_keyword_match(filters.keywords, dialect, use_fts))
+    if filters.location and filters.location.strip():
+        text_conditions.append(_location_match(filters.location.strip(), use_fts))
+
+    type_conditions: list[ColumnElement[bool]] = []
+    if filters.property_type:
+        type_conditions.append(
+            Property.property_type == PropertyType(filters.property_type)
+        )
+
+    return {
+        "text": text_conditions,
+        "property_type": type_conditions,
+        "plot_ratio": _range_conditions(
+            Property.plot_ratio, filters.min_gpr, filters.max_gpr
+        ),
+        "land_area": _range_conditions(
+            Property.land_area_sqm, filters.min_land_area, filters.max_land_area
+        ),
+    }
+
+
+def _range_conditions(
+    column: Any, minimum: Optional[float], maximum: Optional[float]
+) -> list[ColumnElement[bool]]:
+    conditions = []
+    if minimum is not None:
+        conditions.append(column >= minimum)
+    if maximum is not None:
+        conditions.append(column <= maximum)
+    return conditions
+
+
+def _keyword_match(keywords: str, dialect: str, use_fts: bool) -> ColumnElement[bool]:
+    """Every keyword must appear in the name, address, district or area."""
+
+    if dialect == "postgresql":
+        return literal_column("properties.search_vector").op("@@")(
+            func.plainto_tsquery(
+                literal_column(f"'{SEARCH_CONFIG}'::regconfig"), keywords
+            )
+        )
+
+    terms = keywords.split()
+    indexed = [term for term in terms if use_fts and len(term) >= MIN_TRIGRAM_LENGTH]
+    conditions = [
+        or_(*(column.ilike(f"%{term}%") for column in _KEYWORD_COLUMNS))
+        for term in terms
+        if term not in indexed
+    ]
+    if indexed:
+        conditions.append(_fts_match(" ".join(_fts_phrase(term) for term in indexed)))
+    return and_(*conditions)
+
+
+def _location_match(location: str, use_fts: bool) -> ColumnElement[bool]:
+    """Substring match on address, district or planning area."""
+
+    if use_fts and len(location) >= MIN_TRIGRAM_LENGTH:
+        return _fts_match("{address district planning_area} : " + _fts_phrase(location))
+    # On Postgres the pg_trgm GIN indexes serve these ILIKE predicates.
+    return or_(*(column.ilike(f"%{location}%") for column in _LOCATION_COLUMNS))
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _fts_match(query: str) -> ColumnElement[bool]:
+    fts = table(PROPERTY_SEARCH_FTS_TABLE)
+    return Property.id.in_(
+        select(literal_column("property_id"))
+        .select_from(fts)
+        .where(literal_column(PROPERTY_SEARCH_FTS_TABLE).op("MATCH")(query))
+    )
+
+
+async def _sqlite_fts_available(session: AsyncSession) -> bool:
+    found = await session.scalar(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": PROPERTY_SEARCH_FTS_TABLE},
+    )
+    return found is not None
+
+
+async def _facet_counts(
+    session: AsyncSession, groups: dict[str, list[ColumnElement[bool]]]
+) -> dict[str, list[FacetCount]]:
+    def others(facet: str) -> list[ColumnElement[bool]]:
+        return [
+            condition
+            for name, group in groups.items()
+            if name != facet
+            for condition in group
+        ]
+
+    type_rows = await session.execute(
+        select(Property.property_type, func.count())
+        .where(*others("property_type"))
+        .group_by(Property.property_type)
+    )
+    type_counts = sorted(
+        (
+            FacetCount(value=PropertyType(property_type).value, count=count)
+            for property_type, count in type_rows.all()
+        ),
+        key=lambda facet: (-facet.count, facet.value),
+    )
+
+    return {
+        "property_type": type_counts,
+        "plot_ratio": await _bucket_counts(
+            session, Property.plot_ratio, GPR_FACET_BUCKETS, others("plot_ratio")
+        ),
+        "land_area": await _bucket_counts(
+            session,
+            Property.land_area_sqm,
+            LAND_AREA_FACET_BUCKETS,
+            others("land_area"),
+        ),
+    }
+
+
+async def _bucket_counts(
+    session: AsyncSession,
+    column: Any,
+    buckets: FacetBuckets,
+    conditions: Sequence[ColumnElement[bool]],
+) -> list[FacetCount]:
+    counts = (
+        await session.execute(
+            select(
+                *(
+                    func.sum(
+                        case((and_(*_bucket_bounds(column, low, high)), 1), else_=0)
+                    )
+                    for _, low, high in buckets
+                )
+            ).where(*conditions)
+        )
+    ).one()
+    return [
+        FacetCount(value=value, count=int(count or 0), min=low, max=high)
+        for (value, low, high), count in zip(buckets, counts, strict=True)
+    ]
+
+
+def _bucket_bounds(
+    column: Any, low: Optional[float], high: Optional[float]
+) -> list[ColumnElement[bool]]:
+    bounds = [column.is_not(None)]
+    if low is not None:
+        bounds.append(column >= low)
+    if high is not None:
+        bounds.append(column < high)
+    return bounds
+
+
+__all__ = [
+    "FacetCount",
+    "GPR_FACET_BUCKETS",
+    "LAND_AREA_FACET_BUCKETS",
+    "PropertySearchFilters",
+    "PropertySearchPage",
+    "property_facets",
+    "search_properties",
+]
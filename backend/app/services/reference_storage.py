@@ -12,6 +12,7 @@ from pathlib import Path
 from backend._compat.datetime import UTC
 
 from app.core.config import settings
+from app.services.retention import RetentionIndex, load_retention_days
 
 
 @dataclass(slots=True)
@@ -47,6 +48,9 @@ class ReferenceStorage:
         self.endpoint_url = endpoint_url or os.getenv(
             "REF_STORAGE_ENDPOINT_URL", os.getenv("STORAGE_ENDPOINT_URL")
         )
+        self.retention_index = RetentionIndex(
+            self.base_path, retention_days=load_retention_days()
+        )
 
     @staticmethod
     def _resolve_base_path() -> Path:
@@ -72,6 +76,7 @@ class ReferenceStorage:
         file_path = self.base_path / storage_key
         file_path.parent.mkdir(parents=True, exist_ok=True)
         await asyncio.to_thread(file_path.write_bytes, payload)
+        self.retention_index.record(file_path)
         uri = self._to_uri(storage_key)
         return ReferenceStorageResult(
             storage_path=storage_key, uri=uri, bytes_written=len(payload)
@@ -0,0 +1,231 @@
+"""Expiry index and background sweeper for locally stored artefacts."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from backend._compat.datetime import UTC
+
+from app.core.config import settings
+from app.utils.logging import get_logger, log_event
+
+logger = get_logger(__name__)
+
+_INDEX_DIRNAME = ".retention"
+_BUCKET_FORMAT = "%Y%m%d"
+_BUCKET_SUFFIX = ".idx"
+
+
+def load_retention_days() -> int:
+    """Return the shared retention window configured via ``STORAGE_RETENTION_DAYS``."""
+
+    retention = os.getenv("STORAGE_RETENTION_DAYS")
+    return int(retention) if retention and retention.isdigit() else 0
+
+
+class RetentionIndex:
+    """Day-bucketed, append-only expiry index stored beside the artefacts.
+
+    Each write appends one line to the bucket named after the day it expires,
+    so recording is O(1) and a sweep only reads buckets that are already due
+    instead of walking the whole tree. ``on_removed`` is called with the paths
+    each batch deleted, so owners can update records that point at them.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        retention_days: int,
+        on_removed: Callable[[list[Path]], None] | None = None,
+    ) -> None:
+        self.root = root
+        self.retention_days = retention_days
+        self.on_removed = on_removed
+        self.index_dir = root / _INDEX_DIRNAME
+
+    @property
+    def enabled(self) -> bool:
+        return self.retention_days > 0
+
+    def record(self, path: Path, *, now: datetime | None = None) -> None:
+        """Register ``path`` (file or directory) to expire after the window."""
+
+        if not self.enabled:
+            return
+        current = now or datetime.now(UTC)
+        expires = current + timedelta(days=self.retention_days)
+        relative = path.relative_to(self.root).as_posix()
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        bucket = self.index_dir / f"{expires.strftime(_BUCKET_FORMAT)}{_BUCKET_SUFFIX}"
+        with bucket.open("a", encoding="utf-8") as handle:
+            handle.write(f"{relative}\n")
+
+    def due_buckets(self, *, now: datetime | None = None) -> list[Path]:
+        """Return bucket files whose expiry day has passed, oldest first."""
+
+        if not self.index_dir.exists():
+            return []
+        today = (now or datetime.now(UTC)).strftime(_BUCKET_FORMAT)
+        return sorted(
+            bucket
+            for bucket in self.index_dir.glob(f"*{_BUCKET_SUFFIX}")
+            if bucket.stem < today
+        )
+
+    def iter_batches(self, bucket: Path, *, batch_size: int) -> Iterator[list[str]]:
+        """Yield unique relative paths recorded in ``bucket`` in fixed-size batches."""
+
+        try:
+            lines = bucket.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        entries = list(dict.fromkeys(line for line in lines if line))
+        for start in range(0, len(entries), batch_size):
+            yield entries[start : start + batch_size]
+
+    def delete_batch(
+        self, entries: Sequence[str], *, now: datetime | None = None
+    ) -> list[str]:
+        """Delete expired entries, skipping paths rewritten inside the window."""
+
+        cutoff = (now or datetime.now(UTC)) - timedelta(days=self.retention_days)
+        removed: list[str] = []
+        for relative in entries:
+            path = self.root / relative
+            try:
+                modified = datetime.fromtimestamp(path.stat().st_mtime, UTC)
+            except OSError:
+                continue
+            if modified >= cutoff:
+                # Rewritten since it was recorded; a later bucket owns it now.
+                continue
+            try:
+                if path.is_dir():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+            except OSError:
+                continue
+            removed.append(relative)
+            try:
+                path.parent.rmdir()
+            except OSError:
+                pass
+        if removed and self.on_removed is not None:
+            self.on_removed([self.root / relative for relative in removed])
+        return removed
+
+    def sweep(self, *, now: datetime | None = None, batch_size: int = 500) -> list[str]:
+        """Synchronously process every due bucket and return removed paths."""
+
+        removed: list[str] = []
+        for bucket in self.due_buckets(now=now):
+            for batch in self.iter_batches(bucket, batch_size=batch_size):
+                removed.extend(self.delete_batch(batch, now=now))
+            bucket.unlink(missing_ok=True)
+        return removed
+
+
+class RetentionSweeper:
+    """Periodically drain due expiry buckets for a set of storage roots."""
+
+    def __init__(
+        self,
+        indexes: Sequence[RetentionIndex],
+        *,
+        interval_seconds: float,
+        batch_size: int,
+        after_sweep: Callable[[], Awaitable[object]] | None = None,
+    ) -> None:
+        self.indexes = [index for index in indexes if index.enabled]
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.after_sweep = after_sweep
+        self._task: asyncio.Task[None] | None = None
+
+    async def sweep_once(self, *, now: datetime | None = None) -> int:
+        """Delete due entries batch by batch without blocking the event loop."""
+
+        removed = 0
+        for index in self.indexes:
+            buckets = await asyncio.to_thread(index.due_buckets, now=now)
+            for bucket in buckets:
+                for batch in index.iter_batches(bucket, batch_size=self.batch_size):
+                    deleted = await asyncio.to_thread(
+                        index.delete_batch, batch, now=now
+                    )
+                    removed += len(deleted)
+                await asyncio.to_thread(bucket.unlink, missing_ok=True)
+        if removed:
+            log_event(logger, "retention_sweep_completed", removed=removed)
+        if self.after_sweep is not None:
+            await self.after_sweep()
+        return removed
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep_once()
+            except Exception as exc:  # pragma: no cover - keep the loop alive
+                logger.warning("retention_sweep_failed", error=str(exc))
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        """Start the background loop when there is anything to sweep."""
+
+        if self._task is None and self.indexes:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
+def build_default_sweeper() -> RetentionSweeper:
+    """Return a sweeper covering uploads, reference documents and previews.
+
+    After each sweep, preview jobs whose asset directories were removed are
+    marked expired.
+    """
+
+    from app.core.database import AsyncSessionLocal
+    from app.services.preview_generator import preview_retention_index
+    from app.services.preview_jobs import expire_removed_preview_jobs
+    from app.services.reference_storage import ReferenceStorage
+    from app.services.storage import get_storage_service
+
+    async def _expire_removed_previews() -> None:
+        async with AsyncSessionLocal() as session:
+            await expire_removed_preview_jobs(session)
+
+    indexes = [
+        get_storage_service().retention_index,
+        ReferenceStorage().retention_index,
+        preview_retention_index(),
+    ]
+    return RetentionSweeper(
+        indexes,
+        interval_seconds=settings.RETENTION_SWEEP_INTERVAL_SECONDS,
+        batch_size=settings.RETENTION_SWEEP_BATCH_SIZE,
+        after_sweep=_expire_removed_previews,
+    )
+
+
+__all__ = [
+    "RetentionIndex",
+    "RetentionSweeper",
+    "build_default_sweeper",
+    "load_retention_days",
+]
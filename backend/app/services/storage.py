@@ -10,10 +10,12 @@ from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from backend._compat.datetime import UTC
 
+from app.services.retention import RetentionIndex, load_retention_days
+
 
 @dataclass(slots=True)
 class StorageResult:
@@ -58,9 +60,11 @@ class StorageService:
         self.prefix = prefix.strip("/")
         self.local_base_path = local_base_path
         self.endpoint_url = endpoint_url
-        retention = os.getenv("STORAGE_RETENTION_DAYS")
-        self.retention_days = int(retention) if retention and retention.isdigit() else 0
+        self.retention_days = load_retention_days()
         self._ensure_base_path()
+        self.retention_index = RetentionIndex(
+            self.local_base_path, retention_days=self.retention_days
+        )
 
     def _ensure_base_path(self) -> None:
         self.local_base_path.mkdir(parents=True, exist_ok=True)
@@ -82,6 +86,7 @@ class StorageService:
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         await asyncio.to_thread(file_path.write_bytes, payload)
+        written_paths = [file_path]
 
         layer_metadata_uri: str | None = None
         vector_data_uri: str | None = None
@@ -89,6 +94,7 @@ class StorageService:
             metadata_path = file_path.with_suffix(file_path.suffix + ".layers.json")
             json_payload = json.dumps(list(layer_metadata), indent=2, sort_keys=True)
             await asyncio.to_thread(metadata_path.write_text, json_payload)
+            written_paths.append(metadata_path)
             layer_metadata_uri = self._to_uri(
                 metadata_path.relative_to(self.local_base_path)
             )
@@ -97,16 +103,13 @@ class StorageService:
             vector_path = file_path.with_suffix(file_path.suffix + ".vectors.json")
             vector_json = json.dumps(vector_payload, indent=2, sort_keys=True)
             await asyncio.to_thread(vector_path.write_text, vector_json)
+            written_paths.append(vector_path)
             vector_data_uri = self._to_uri(
                 vector_path.relative_to(self.local_base_path)
             )
 
-        if self.retention_days:
-            await asyncio.to_thread(
-                self.purge_expired,
-                prefix=self.prefix,
-                older_than_days=self.retention_days,
-            )
+        for written_path in written_paths:
+            self.retention_index.record(written_path)
 
         return StorageResult(
             bucket=self.bucket,
@@ -130,6 +133,7 @@ class StorageService:
         output_path = self.local_base_path / relative_key
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(payload)
+        self.retention_index.record(output_path)
 
         result = StorageResult(
             bucket=self.bucket,
@@ -141,11 +145,42 @@ class StorageService:
             content_type=content_type,
         )
 
-        if self.retention_days:
-            self.purge_expired(prefix=self.prefix, older_than_days=self.retention_days)
-
         return result
 
+    def store_stream(
+        self,
+        *,
+        key: str,
+        source: BinaryIO,
+        content_type: str | None = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> StorageResult:
+        """Synchronously copy ``source`` to ``key`` in chunks.
+
+        Reads from the current position of ``source``; callers on the event
+        loop should run this in a thread.
+        """
+
+        relative_key = f"{self.prefix}/{key}" if self.prefix else key
+        output_path = self.local_base_path / relative_key
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        bytes_written = 0
+        with output_path.open("wb") as handle:
+            while chunk := source.read(chunk_size):
+                handle.write(chunk)
+                bytes_written += len(chunk)
+        self.retention_index.record(output_path)
+
+        return StorageResult(
+            bucket=self.bucket,
+            key=relative_key,
+            uri=self._to_uri(relative_key),
+            bytes_written=bytes_written,
+            layer_metadata_uri=None,
+            vector_data_uri=None,
+            content_type=content_type,
+        )
+
     def _to_uri(self, relative_path: os.PathLike[str] | str) -> str:
         key = str(relative_path).replace(os.sep, "/")
         if self.endpoint_url:
@@ -163,7 +198,12 @@ class StorageService:
         prefix: str | None = None,
         older_than_days: int,
     ) -> list[str]:
-        """Remove objects older than ``older_than_days`` within the local store."""
+        """Remove objects older than ``older_than_days`` within the local store.
+
+        This walks the whole tree; routine expiry is handled by the retention
+        sweeper (:mod:`app.services.retention`). Use this for one-off backfills of
+        files written before the expiry index existed.
+        """
 
         if older_than_days <= 0:
             return []
@@ -55,6 +55,9 @@ PREVIEW_JOBS_CREATED_TOTAL: Counter
 PREVIEW_JOBS_COMPLETED_TOTAL: Counter
 PREVIEW_JOB_DURATION_MS: Histogram
 PREVIEW_QUEUE_DEPTH: Gauge
+PREVIEW_JOBS_REJECTED_TOTAL: Counter
+PREVIEW_JOB_QUEUE_WAIT_MS: Histogram
+PREVIEW_JOB_RENDER_DURATION_MS: Histogram
 
 
 def _initialize_metrics() -> None:
@@ -86,6 +89,9 @@ def _initialize_metrics() -> None:
     global PREVIEW_JOBS_COMPLETED_TOTAL
     global PREVIEW_JOB_DURATION_MS
     global PREVIEW_QUEUE_DEPTH
+    global PREVIEW_JOBS_REJECTED_TOTAL
+    global PREVIEW_JOB_QUEUE_WAIT_MS
+    global PREVIEW_JOB_RENDER_DURATION_MS
 
     REGISTRY = CollectorRegistry(auto_describe=True)
 
@@ -264,6 +270,27 @@ def _initialize_metrics() -> None:
         registry=REGISTRY,
     )
 
+    PREVIEW_JOBS_REJECTED_TOTAL = Counter(
+        "preview_generation_jobs_rejected_total",
+        "Preview renders rejected because the render queue was full.",
+        labelnames=("backend",),
+        registry=REGISTRY,
+    )
+
+    PREVIEW_JOB_QUEUE_WAIT_MS = Histogram(
+        "preview_generation_queue_wait_ms",
+        "Time from preview request until a worker starts rendering.",
+        labelnames=("backend",),
+        registry=REGISTRY,
+    )
+
+    PREVIEW_JOB_RENDER_DURATION_MS = Histogram(
+        "preview_generation_render_duration_ms",
+        "Time spent rendering preview assets inside a worker.",
+        labelnames=("backend",),
+        registry=REGISTRY,
+    )
+
 
 _initialize_metrics()
 
@@ -0,0 +1,45 @@
+"""Spawn-based process pools whose workers can rebuild application settings.
+
+Spawned workers start from a fresh interpreter and build ``Settings`` from
+their own environment, which needs ``SECRET_KEY``. Rather than writing the
+key into the parent's ``os.environ``, the pool hands it to each worker
+through the initializer. This module imports nothing from the application
+at load time, so unpickling the initializer in a worker cannot trigger the
+settings import before the environment is in place.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _init_spawned_worker(environ: Mapping[str, str]) -> None:
+    """Apply ``environ`` before the worker imports any application module."""
+
+    os.environ.update(environ)
+
+
+def spawn_process_pool(
+    max_workers: int, *, environ: Mapping[str, str] | None = None
+) -> ProcessPoolExecutor:
+    """Return a spawn-context pool whose workers see ``environ`` and the secret key.
+
+    Pass ``environ`` overrides such as ``JOB_QUEUE_BACKEND=inline`` to keep
+    workers from dispatching jobs or starting nested pools.
+    """
+
+    from app.core.config import settings
+
+    worker_environ = {"SECRET_KEY": settings.SECRET_KEY, **(environ or {})}
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_spawned_worker,
+        initargs=(worker_environ,),
+    )
+
+
+__all__ = ["spawn_process_pool"]
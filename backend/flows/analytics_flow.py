@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable, Sequence
 from typing import Any
 
@@ -13,6 +14,10 @@ from app.services.agents.market_data_service import MarketDataService
 from app.services.agents.market_intelligence_analytics import (
     MarketIntelligenceAnalytics,
 )
+from app.services.agents.market_snapshots import (
+    DEFAULT_REFRESH_CONCURRENCY,
+    refresh_segments,
+)
 
 DEFAULT_LOCATIONS = ("all",)
 DEFAULT_PROPERTY_TYPES = (
@@ -28,26 +33,50 @@ async def refresh_market_intelligence(
     property_types: Sequence[PropertyType] | None = None,
     locations: Iterable[str] = DEFAULT_LOCATIONS,
     period_months: int = 12,
+    concurrency: int = DEFAULT_REFRESH_CONCURRENCY,
 ) -> list[dict[str, Any]]:
-    """Run market intelligence analyses for the requested segments."""
+    """Run market intelligence analyses for the requested segments.
+
+    Segment snapshots are refreshed first (only quarters touched since the
+    last refresh or the stored provider sync watermark), then the reports
+    are generated from the snapshots, each segment on its own session and
+    at most ``concurrency`` at a time.
+    """
 
-    analytics = MarketIntelligenceAnalytics(MarketDataService())
-    property_type_list = list(property_types or DEFAULT_PROPERTY_TYPES)
-    location_list = list(locations)
+    service = MarketDataService()
+    analytics = MarketIntelligenceAnalytics(service)
+    segments = [
+        (property_type, location)
+        for property_type in property_types or DEFAULT_PROPERTY_TYPES
+        for location in locations
+    ]
 
-    results: list[dict[str, Any]] = []
     async with session_factory() as session:
-        for property_type in property_type_list:
-            for location in location_list:
-                report = await analytics.generate_market_report(
-                    property_type=property_type,
-                    location=location,
-                    period_months=period_months,
-                    session=session,
-                )
-                results.append(report.to_dict())
-
-    return results
+        sync_watermark = await service.last_sync_watermark(session)
+    await refresh_segments(
+        session_factory,
+        segments,
+        sync_watermark=sync_watermark,
+        concurrency=concurrency,
+    )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _report(property_type: PropertyType, location: str) -> dict[str, Any]:
+        async with semaphore, session_factory() as session:
+            report = await analytics.generate_market_report(
+                property_type=property_type,
+                location=location,
+                period_months=period_months,
+                session=session,
+            )
+        return report.to_dict()
+
+    return list(
+        await asyncio.gather(
+            *(_report(property_type, location) for property_type, location in segments)
+        )
+    )
 
 
 __all__ = ["refresh_market_intelligence"]
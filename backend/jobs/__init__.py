@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
 import inspect
 import os
 from collections.abc import Awaitable, Callable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from typing import Any, Union
 
@@ -22,6 +25,7 @@ except ModuleNotFoundError:  # pragma: no cover - keep inline fallback working
     Queue = None  # type: ignore[assignment]
 
 from app.core.config import settings
+from app.utils.process_pool import spawn_process_pool
 
 JobFunc = Callable[..., Union[Awaitable[Any], Any]]
 
@@ -67,10 +71,14 @@ class _BaseBackend:
     """Protocol implemented by queue backends."""
 
     name: str
+    _registry: dict[str, tuple[JobFunc, str | None]]
 
     def register(self, func: JobFunc, name: str, queue: str | None) -> JobFunc:
         raise NotImplementedError
 
+    def is_registered(self, name: str) -> bool:
+        return name in self._registry
+
     async def enqueue(
         self,
         name: str,
@@ -114,6 +122,159 @@ class _InlineBackend(_BaseBackend):
         )
 
 
+# Applied before a worker imports the application, so nested dispatches run
+# inline and previews render on a thread rather than in nested pools.
+_PROCESS_WORKER_ENV = {"JOB_QUEUE_BACKEND": "inline", "PREVIEW_RENDER_WORKERS": "0"}
+
+
+async def _await_job_result(awaitable: Awaitable[Any]) -> Any:
+    return await awaitable
+
+
+def _run_process_job(
+    module_name: str,
+    func_name: str,
+    args: tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+) -> Any:
+    """Resolve and execute a registered job inside a pool worker process."""
+
+    module = importlib.import_module(module_name)
+    func = getattr(module, func_name)
+    result = func(*args, **dict(kwargs))
+    if inspect.isawaitable(result):
+        return asyncio.run(_await_job_result(result))
+    return result
+
+
+def _release_on_loop(
+    semaphore: asyncio.Semaphore,
+) -> Callable[[Future[Any]], None]:
+    """Return a done-callback releasing ``semaphore`` on the calling loop."""
+
+    loop = asyncio.get_running_loop()
+
+    def _release(_future: Future[Any]) -> None:
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:  # pragma: no cover - loop already closed
+            pass
+
+    return _release
+
+
+class _ProcessPoolBackend(_BaseBackend):
+    """Execute jobs in a local process pool with per-queue limits and timeouts.
+
+    CPU-bound jobs (CAD parsing, vectorisation, preview rendering) then run in
+    parallel without holding the API worker's GIL and without a Redis broker.
+    Jobs are resolved by module and attribute name inside the worker, so their
+    arguments and results must be picklable. A job that exceeds its timeout is
+    abandoned by the caller, but it keeps its queue slot (and worker) until it
+    returns, so queue limits bound the work actually running.
+    """
+
+    name = "process"
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        queue_limits: Mapping[str, int] | None = None,
+        timeout_seconds: float | None = None,
+        queue_timeouts: Mapping[str, float] | None = None,
+    ) -> None:
+        self.max_workers = max_workers or settings.JOB_PROCESS_MAX_WORKERS
+        self.queue_limits = dict(
+            settings.JOB_PROCESS_QUEUE_LIMITS if queue_limits is None else queue_limits
+        )
+        self.timeout_seconds = timeout_seconds or settings.JOB_PROCESS_TIMEOUT_SECONDS
+        self.queue_timeouts = dict(
+            settings.JOB_PROCESS_QUEUE_TIMEOUTS
+            if queue_timeouts is None
+            else queue_timeouts
+        )
+        self._registry: dict[str, tuple[JobFunc, str | None]] = {}
+        self._executor: ProcessPoolExecutor | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def register(self, func: JobFunc, name: str, queue: str | None) -> JobFunc:
+        return _store_job(self._registry, func, name, queue)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = spawn_process_pool(
+                self.max_workers, environ=_PROCESS_WORKER_ENV
+            )
+        return self._executor
+
+    def _get_semaphore(self, queue: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(queue)
+        if semaphore is None:
+            limit = min(
+                self.queue_limits.get(queue, self.max_workers), self.max_workers
+            )
+            semaphore = asyncio.Semaphore(limit)
+            self._semaphores[queue] = semaphore
+        return semaphore
+
+    def _timeout_for(self, queue: str) -> float:
+        return float(self.queue_timeouts.get(queue, self.timeout_seconds))
+
+    async def enqueue(
+        self,
+        name: str,
+        queue: str | None,
+        args: tuple[Any, ...],
+        kwargs: Mapping[str, Any],
+    ) -> JobDispatch:
+        if name not in self._registry:
+            raise KeyError(f"Job '{name}' is not registered")
+        func, registered_queue = self._registry[name]
+        selected_queue = queue or registered_queue or "default"
+        timeout = self._timeout_for(selected_queue)
+        semaphore = self._get_semaphore(selected_queue)
+        await semaphore.acquire()
+        try:
+            future = self._get_executor().submit(
+                _run_process_job,
+                func.__module__,
+                func.__name__,
+                args,
+                dict(kwargs),
+            )
+        except BaseException:
+            semaphore.release()
+            raise
+        # The slot is held until the job itself finishes: a running job cannot
+        # be cancelled, so releasing on timeout would let the queue overrun.
+        future.add_done_callback(_release_on_loop(semaphore))
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise TimeoutError(
+                f"Job '{name}' exceeded {timeout:g}s on queue '{selected_queue}'"
+            ) from None
+        except BrokenProcessPool:
+            self.shutdown(wait=False)
+            raise
+        return JobDispatch(
+            backend=self.name,
+            job_name=name,
+            queue=selected_queue,
+            status="completed",
+            result=result,
+        )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the worker pool; a new pool is created on the next dispatch."""
+
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
 class _CeleryBackend(
     _BaseBackend
 ):  # pragma: no cover - executed when celery is installed
@@ -209,6 +370,8 @@ def _select_backend() -> _BaseBackend:
     preferred = os.getenv("JOB_QUEUE_BACKEND", "").strip().lower()
     if preferred == "inline":
         return _InlineBackend()
+    if preferred == "process":
+        return _ProcessPoolBackend()
     if preferred == "celery" and Celery is not None:
         return _CeleryBackend()
     if preferred == "rq" and Queue is not None and Redis is not None:
@@ -267,6 +430,17 @@ class JobQueue:
 
         return self._backend.name
 
+    @property
+    def runs_in_process(self) -> bool:
+        """Return whether enqueued jobs execute on this process's event loop."""
+
+        return self.backend_name == "inline"
+
+    def is_registered(self, name: str) -> bool:
+        """Return whether ``name`` is registered with the active backend."""
+
+        return self._backend.is_registered(name)
+
     def register(self, func: JobFunc, name: str, queue: str | None) -> JobFunc:
         """Register a function with the backend."""
 
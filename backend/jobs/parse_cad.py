@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import math
 import os
@@ -30,6 +31,7 @@ except ModuleNotFoundError:  # pragma: no cover - available in production enviro
 from backend.jobs import job
 
 from app.core import database as app_database
+from app.core.config import settings
 from app.core.geometry import GeometrySerializer, GraphBuilder, derive_setback_overrides
 from app.core.models.geometry import GeometryGraph
 from app.models.imports import ImportRecord
@@ -90,6 +92,80 @@ class IfcQuicklook:
     layers: list[dict[str, Any]]
 
 
+_QUICKLOOK_CACHE_DIR = "cad-quicklook"
+_QUICKLOOK_CACHE_VERSION = 1
+
+
+def _payload_digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _quicklook_cache_path(kind: str, digest: str) -> Path:
+    storage_service = get_storage_service()
+    return (
+        storage_service.local_base_path / _QUICKLOOK_CACHE_DIR / f"{digest}.{kind}.json"
+    )
+
+
+def _load_cached_quicklook(kind: str, digest: str) -> dict[str, Any] | None:
+    """Return the cached entity table for ``digest`` or ``None`` when unavailable."""
+
+    path = _quicklook_cache_path(kind, digest)
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("version") != _QUICKLOOK_CACHE_VERSION:
+        return None
+    try:
+        os.utime(path)  # mark as recently used for eviction
+    except OSError:  # pragma: no cover - best effort cache
+        pass
+    return payload
+
+
+def _store_cached_quicklook(kind: str, digest: str, payload: Mapping[str, Any]) -> None:
+    """Persist an entity table atomically; cache failures never fail a parse."""
+
+    path = _quicklook_cache_path(kind, digest)
+    document = {"version": _QUICKLOOK_CACHE_VERSION, **payload}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(document, separators=(",", ":")))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):  # pragma: no cover - best effort cache
+        return
+    _prune_quicklook_cache(path.parent, settings.CAD_QUICKLOOK_CACHE_MAX_ENTRIES)
+
+
+def _prune_quicklook_cache(cache_dir: Path, max_entries: int) -> None:
+    """Evict the least recently used entity tables beyond ``max_entries``.
+
+    Pruning runs after every store, so the flat cache directory never holds
+    more than ``max_entries + 1`` tables and the scan stays bounded.
+    """
+
+    try:
+        entries = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in os.scandir(cache_dir)
+            if entry.name.endswith(".json")
+        ]
+    except OSError:  # pragma: no cover - best effort cache
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, stale_path in entries[: len(entries) - max_entries]:
+        try:
+            os.unlink(stale_path)
+        except OSError:  # pragma: no cover - concurrently evicted
+            continue
+
+
 def _resolve_local_path(storage_path: str) -> Path:
     storage_service = get_storage_service()
     parsed = urlparse(storage_path)
@@ -419,10 +495,71 @@ def _prepare_dxf_quicklook(payload: bytes) -> DxfQuicklook:
     )
 
 
+def _dxf_quicklook_to_table(quicklook: DxfQuicklook) -> dict[str, Any]:
+    """Serialise a DXF quicklook into a compact entity table."""
+
+    entities = [
+        [
+            candidate.identifier,
+            candidate.layer,
+            [
+                coord
+                for point in candidate.boundary
+                for coord in (point["x"], point["y"])
+            ],
+            candidate.metadata,
+        ]
+        for candidate in quicklook.candidates
+    ]
+    return {
+        "entities": entities,
+        "floors": quicklook.floors,
+        "units": quicklook.units,
+        "layers": quicklook.layers,
+        "metadata": quicklook.metadata,
+    }
+
+
+def _dxf_quicklook_from_table(table: Mapping[str, Any]) -> DxfQuicklook:
+    candidates: list[DxfSpaceCandidate] = []
+    for identifier, layer, coords, metadata in table.get("entities") or []:
+        boundary = [
+            {"x": float(coords[index]), "y": float(coords[index + 1])}
+            for index in range(0, len(coords) - 1, 2)
+        ]
+        candidates.append(
+            DxfSpaceCandidate(
+                identifier=str(identifier),
+                boundary=boundary,
+                layer=layer,
+                metadata=dict(metadata or {}),
+            )
+        )
+    return DxfQuicklook(
+        candidates=candidates,
+        floors=list(table.get("floors") or []),
+        units=list(table.get("units") or []),
+        layers=list(table.get("layers") or []),
+        metadata=dict(table.get("metadata") or {}),
+    )
+
+
+def _load_dxf_quicklook(payload: bytes) -> DxfQuicklook:
+    """Return the DXF quicklook, reusing the content-addressed entity table."""
+
+    digest = _payload_digest(payload)
+    cached = _load_cached_quicklook("dxf", digest)
+    if cached is not None:
+        return _dxf_quicklook_from_table(cached)
+    quicklook = _prepare_dxf_quicklook(payload)
+    _store_cached_quicklook("dxf", digest, _dxf_quicklook_to_table(quicklook))
+    return quicklook
+
+
 def detect_dxf_metadata(
     payload: bytes,
 ) -> tuple[list[dict[str, Any]], list[str], list[dict[str, Any]]]:
-    quicklook = _prepare_dxf_quicklook(payload)
+    quicklook = _load_dxf_quicklook(payload)
     return quicklook.floors, quicklook.units, quicklook.layers
 
 
@@ -560,10 +697,56 @@ def _prepare_ifc_quicklook(payload: bytes) -> IfcQuicklook:
     )
 
 
+def _ifc_quicklook_to_table(quicklook: IfcQuicklook) -> dict[str, Any]:
+    """Serialise an IFC quicklook into a compact entity table."""
+
+    return {
+        "storeys": quicklook.storeys,
+        "entities": [
+            [space.identifier, space.name, space.level_id, space.metadata]
+            for space in quicklook.spaces
+        ],
+        "floors": quicklook.floors,
+        "units": quicklook.units,
+        "layers": quicklook.layers,
+    }
+
+
+def _ifc_quicklook_from_table(table: Mapping[str, Any]) -> IfcQuicklook:
+    spaces = [
+        IfcSpaceCandidate(
+            identifier=str(identifier),
+            name=str(name),
+            level_id=level_id,
+            metadata=dict(metadata or {}),
+        )
+        for identifier, name, level_id, metadata in table.get("entities") or []
+    ]
+    return IfcQuicklook(
+        storeys=list(table.get("storeys") or []),
+        spaces=spaces,
+        floors=list(table.get("floors") or []),
+        units=list(table.get("units") or []),
+        layers=list(table.get("layers") or []),
+    )
+
+
+def _load_ifc_quicklook(payload: bytes) -> IfcQuicklook:
+    """Return the IFC quicklook, reusing the content-addressed entity table."""
+
+    digest = _payload_digest(payload)
+    cached = _load_cached_quicklook("ifc", digest)
+    if cached is not None:
+        return _ifc_quicklook_from_table(cached)
+    quicklook = _prepare_ifc_quicklook(payload)
+    _store_cached_quicklook("ifc", digest, _ifc_quicklook_to_table(quicklook))
+    return quicklook
+
+
 def detect_ifc_metadata(
     payload: bytes,
 ) -> tuple[list[dict[str, Any]], list[str], list[dict[str, Any]]]:
-    quicklook = _prepare_ifc_quicklook(payload)
+    quicklook = _load_ifc_quicklook(payload)
     return quicklook.floors, quicklook.units, quicklook.layers
 
 
@@ -935,7 +1118,7 @@ def _parse_vector_payload(payload: Mapping[str, Any]) -> ParsedGeometry:
 
 
 def _parse_dxf_payload(payload: bytes) -> ParsedGeometry:
-    quicklook = _prepare_dxf_quicklook(payload)
+    quicklook = _load_dxf_quicklook(payload)
     builder = GraphBuilder.new()
     builder.add_level({"id": "L1", "name": "Model Space", "elevation": 0.0})
     raw_space_areas = quicklook.metadata.get("space_areas_sqm") or {}
@@ -989,7 +1172,7 @@ def _parse_dxf_payload(payload: bytes) -> ParsedGeometry:
 
 
 def _parse_ifc_payload(payload: bytes) -> ParsedGeometry:
-    quicklook = _prepare_ifc_quicklook(payload)
+    quicklook = _load_ifc_quicklook(payload)
     builder = GraphBuilder.new()
     added_levels: dict[str, None] = {}
 
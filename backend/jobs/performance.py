@@ -44,6 +44,7 @@ async def generate_snapshots_job(
             session=session,
             agent_ids=_parse_ids(agent_ids),
             as_of=_parse_as_of(as_of),
+            bulk=True,
         )
         return {"snapshots": len(snapshots)}
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import inspect
 from contextlib import asynccontextmanager
+from datetime import datetime
 from typing import Any, AsyncIterator
 from uuid import UUID
 
@@ -16,10 +17,13 @@ from app.core.database import get_session
 from app.models.preview import PreviewJob, PreviewJobStatus
 from app.services.preview_generator import (
     PreviewAssets,
-    ensure_preview_asset,
     normalise_geometry_detail_level,
 )
+from app.services.preview_render_pool import PreviewRenderOutcome, get_render_pool
 from app.utils import metrics
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 def _resolve_session_dependency() -> Any:
@@ -87,19 +91,15 @@ def _resolve_backend_name(job: PreviewJob | None) -> str:
     return "inline"
 
 
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
 def _job_duration_ms(job: PreviewJob) -> float | None:
     if job.finished_at and job.requested_at:
-        finished = job.finished_at
-        requested = job.requested_at
-        if finished.tzinfo is None:
-            finished = finished.replace(tzinfo=UTC)
-        else:
-            finished = finished.astimezone(UTC)
-        if requested.tzinfo is None:
-            requested = requested.replace(tzinfo=UTC)
-        else:
-            requested = requested.astimezone(UTC)
-        delta = finished - requested
+        delta = _as_utc(job.finished_at) - _as_utc(job.requested_at)
         total_ms = delta.total_seconds() * 1000.0
         return total_ms if total_ms >= 0 else 0.0
     return None
@@ -115,6 +115,20 @@ async def _update_queue_depth(session: AsyncSession, backend_name: str) -> None:
     metrics.PREVIEW_QUEUE_DEPTH.labels(backend=backend_name).set(float(queued_total))
 
 
+def _record_render_timings(
+    job: PreviewJob, outcome: PreviewRenderOutcome, backend_name: str
+) -> None:
+    """Observe time spent waiting for a render worker and rendering itself."""
+
+    if job.requested_at:
+        requested = _as_utc(job.requested_at).timestamp()
+        wait_ms = max(outcome.started_at - requested, 0.0) * 1000.0
+        metrics.PREVIEW_JOB_QUEUE_WAIT_MS.labels(backend=backend_name).observe(wait_ms)
+    metrics.PREVIEW_JOB_RENDER_DURATION_MS.labels(backend=backend_name).observe(
+        outcome.render_ms
+    )
+
+
 async def _record_completion(
     session: AsyncSession,
     job: PreviewJob,
@@ -128,6 +142,19 @@ async def _record_completion(
     await _update_queue_depth(session, backend_name)
 
 
+async def _expire_removed_previews(session: AsyncSession) -> None:
+    """Expire jobs whose assets were evicted since the last drain."""
+
+    # Imported lazily: preview_jobs imports this module to register the job.
+    from app.services.preview_jobs import expire_removed_preview_jobs
+
+    try:
+        await expire_removed_preview_jobs(session)
+    except Exception as exc:  # pragma: no cover - retried on the next drain
+        await session.rollback()
+        logger.warning("preview_expiry_failed", error=str(exc))
+
+
 @job(name="preview.generate", queue="preview")
 async def generate_preview_job(job_id: str) -> dict[str, Any]:
     """Generate preview assets for the specified job."""
@@ -159,34 +186,37 @@ async def generate_preview_job(job_id: str) -> dict[str, Any]:
         job.status = PreviewJobStatus.PROCESSING
         job.started_at = utcnow()
         job.message = None
-        await session.flush()
+        # Publish PROCESSING now; the render may take a while off-loop.
+        await session.commit()
 
         try:
-            assets: PreviewAssets = ensure_preview_asset(
+            # Rendering is CPU bound; keep it off this event loop.
+            outcome = await get_render_pool().render(
                 job.property_id,
                 job.id,
                 payload_layers,
                 geometry_detail_level=detail_level,
                 color_legend=legend_payload,
+                payload_checksum=job.payload_checksum,
             )
+            assets: PreviewAssets = outcome.assets
             job.preview_url = assets.preview_url
             job.metadata_url = assets.metadata_url
             job.thumbnail_url = assets.thumbnail_url
             job.asset_version = assets.asset_version
             job.status = PreviewJobStatus.READY
             job.finished_at = utcnow()
-            asset_manifest = job.metadata.setdefault("asset_manifest", {})
-            if isinstance(asset_manifest, dict):
-                asset_manifest.update(
-                    {
-                        "gltf": assets.preview_url,
-                        "metadata": assets.metadata_url,
-                        "thumbnail": assets.thumbnail_url,
-                        "version": assets.asset_version,
-                    }
-                )
+            metadata_dict: dict[str, Any] = dict(job.metadata or {})
+            asset_manifest = metadata_dict.get("asset_manifest")
+            metadata_dict["asset_manifest"] = {
+                **(asset_manifest if isinstance(asset_manifest, dict) else {}),
+                **assets.manifest(),
+            }
+            job.metadata = metadata_dict
             await session.commit()
+            _record_render_timings(job, outcome, backend_name)
             await _record_completion(session, job, "ready", backend_name)
+            await _expire_removed_previews(session)
             return {
                 "status": "ready",
                 "job_id": job_id,
@@ -4,11 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import math
+import os
 import re
-from collections.abc import Iterable, Sequence
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from io import BytesIO
-from itertools import chain
+from itertools import chain, islice
 from typing import Any
 from xml.etree import ElementTree as ET
 
@@ -26,8 +37,27 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency
 
 from backend.jobs import job
 
+from app.utils.logging import get_logger
+from app.utils.process_pool import spawn_process_pool
+
 Point = tuple[float, float]
 
+logger = get_logger(__name__)
+
+
+def _default_page_workers() -> int:
+    raw_value = os.getenv("VECTORIZE_PAGE_WORKERS")
+    if raw_value and raw_value.strip().isdigit():
+        return max(int(raw_value), 1)
+    return min(os.cpu_count() or 1, 4)
+
+
+def _default_parallel_min_pages() -> int:
+    raw_value = os.getenv("VECTORIZE_PARALLEL_MIN_PAGES")
+    if raw_value and raw_value.strip().isdigit():
+        return max(int(raw_value), 2)
+    return 4
+
 
 @dataclass(slots=True)
 class VectorPath:
@@ -36,13 +66,17 @@ class VectorPath:
     points: list[Point]
     layer: str | None = None
     stroke_width: float | None = None
+    identifier: str | None = None
 
     def to_payload(self) -> dict[str, Any]:
-        return {
+        payload: dict[str, Any] = {
             "points": [[float(x), float(y)] for x, y in self.points],
             "layer": self.layer,
             "stroke_width": self.stroke_width,
         }
+        if self.identifier is not None:
+            payload["id"] = self.identifier
+        return payload
 
 
 @dataclass(slots=True)
@@ -72,6 +106,33 @@ class RasterVectorOptions:
     infer_walls: bool = False
     minimum_wall_length: float = 1.0
     bitmap_threshold: float = 0.65
+    page_workers: int = field(default_factory=_default_page_workers)
+    # Shorter documents vectorise sequentially; handing pages to the worker
+    # pool costs more than it saves on a few pages.
+    parallel_min_pages: int = field(default_factory=_default_parallel_min_pages)
+
+
+@dataclass(slots=True)
+class PdfPageResult:
+    """Vector paths and walls extracted from a single PDF page."""
+
+    page_index: int
+    paths: list[VectorPath]
+    vector_walls: list[WallCandidate]
+    bitmap_walls: list[WallCandidate]
+    bounds: tuple[float, float]
+    duration_ms: float
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "page": self.page_index + 1,
+            "paths": len(self.paths),
+            "walls": len(self.vector_walls) + len(self.bitmap_walls),
+            "duration_ms": round(self.duration_ms, 2),
+        }
+
+
+PageCallback = Callable[[PdfPageResult], Any]
 
 
 @dataclass(slots=True)
@@ -83,6 +144,7 @@ class RasterVectorResult:
     bounds: tuple[float, float] | None
     source: str
     options: RasterVectorOptions = field(default_factory=RasterVectorOptions)
+    pages: list[dict[str, Any]] = field(default_factory=list)
 
     def to_payload(self) -> dict[str, Any]:
         bounds_payload: dict[str, float] | None = None
@@ -91,7 +153,7 @@ class RasterVectorResult:
                 "width": float(self.bounds[0]),
                 "height": float(self.bounds[1]),
             }
-        return {
+        payload: dict[str, Any] = {
             "source": self.source,
             "paths": [path.to_payload() for path in self.paths],
             "walls": [wall.to_payload() for wall in self.walls],
@@ -103,6 +165,9 @@ class RasterVectorResult:
                 "bitmap_walls": any(wall.source == "bitmap" for wall in self.walls),
             },
         }
+        if self.pages:
+            payload["pages"] = list(self.pages)
+        return payload
 
 
 def _parse_svg_length(raw: str | None) -> float | None:
@@ -518,37 +583,217 @@ def _extract_pdf_page_paths(page: fitz.Page, page_index: int) -> list[VectorPath
                         points=segment,
                         layer=layer,
                         stroke_width=stroke_width,
+                        identifier=f"{layer}-path-{len(paths) + 1:04d}",
                     )
                 )
     return paths
 
 
+def _process_pdf_page(
+    page: fitz.Page, page_index: int, options: RasterVectorOptions
+) -> PdfPageResult:
+    started = time.perf_counter()
+    page_paths = _extract_pdf_page_paths(page, page_index)
+    vector_walls = detect_baseline_walls(
+        page_paths, minimum_length=options.minimum_wall_length, source="vector"
+    )
+    bitmap_walls: list[WallCandidate] = []
+    if options.infer_walls:
+        bitmap_walls = _detect_bitmap_walls(page, options)
+    rect = page.rect
+    return PdfPageResult(
+        page_index=page_index,
+        paths=page_paths,
+        vector_walls=vector_walls,
+        bitmap_walls=bitmap_walls,
+        bounds=(float(rect.width), float(rect.height)),
+        duration_ms=(time.perf_counter() - started) * 1000.0,
+    )
+
+
+def _process_pdf_page_from_path(
+    pdf_path: str, page_index: int, options: RasterVectorOptions
+) -> PdfPageResult:
+    """Open the document by path inside a worker process and vectorise one page."""
+
+    with fitz.open(pdf_path) as document:
+        return _process_pdf_page(document.load_page(page_index), page_index, options)
+
+
+def _extract_pages_sequential(
+    pdf_payload: bytes,
+    options: RasterVectorOptions,
+    on_page: PageCallback | None,
+) -> list[PdfPageResult]:
+    results: list[PdfPageResult] = []
+    with fitz.open(stream=pdf_payload, filetype="pdf") as document:
+        for index, page in enumerate(document):  # pragma: no cover - pymupdf
+            result = _process_pdf_page(page, index, options)
+            results.append(result)
+            if on_page is not None:
+                on_page(result)
+    return results
+
+
+# Keep page workers from dispatching jobs or spawning nested pools.
+_PAGE_WORKER_ENV = {"JOB_QUEUE_BACKEND": "inline", "PREVIEW_RENDER_WORKERS": "0"}
+_page_executor: ProcessPoolExecutor | None = None
+_page_executor_lock = threading.Lock()
+
+
+def _get_page_executor() -> ProcessPoolExecutor:
+    """Return the process-wide page worker pool, shared across documents.
+
+    The pool is sized from ``VECTORIZE_PAGE_WORKERS``; each document's
+    ``RasterVectorOptions.page_workers`` limits its share of it.
+    """
+
+    global _page_executor
+    with _page_executor_lock:
+        if _page_executor is None:
+            _page_executor = spawn_process_pool(
+                _default_page_workers(), environ=_PAGE_WORKER_ENV
+            )
+        return _page_executor
+
+
+def shutdown_page_executor(*, wait: bool = False) -> None:
+    """Stop the shared page worker pool, if one was started."""
+
+    global _page_executor
+    with _page_executor_lock:
+        executor, _page_executor = _page_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _extract_pages_parallel(
+    pdf_payload: bytes,
+    page_count: int,
+    options: RasterVectorOptions,
+    on_page: PageCallback | None,
+) -> list[PdfPageResult]:
+    executor = _get_page_executor()
+    with tempfile.TemporaryDirectory(prefix="vectorize-") as workdir:
+        pdf_path = os.path.join(workdir, "document.pdf")
+        with open(pdf_path, "wb") as handle:
+            handle.write(pdf_payload)
+        results: list[PdfPageResult] = []
+        # The pool is shared across documents; ``page_workers`` caps how many
+        # of this document's pages are in flight at once.
+        window = max(min(options.page_workers, page_count), 1)
+        pending_pages = iter(range(page_count))
+        in_flight: set[Future[PdfPageResult]] = set()
+        try:
+            for index in islice(pending_pages, window):
+                in_flight.add(
+                    executor.submit(
+                        _process_pdf_page_from_path, pdf_path, index, options
+                    )
+                )
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results.append(result)
+                    if on_page is not None:
+                        on_page(result)
+                for index in islice(pending_pages, len(done)):
+                    in_flight.add(
+                        executor.submit(
+                            _process_pdf_page_from_path, pdf_path, index, options
+                        )
+                    )
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+    results.sort(key=lambda item: item.page_index)
+    return results
+
+
+def _once_per_page(on_page: PageCallback) -> PageCallback:
+    """Skip pages already reported before a sequential retry."""
+
+    reported: set[int] = set()
+
+    def report(result: PdfPageResult) -> None:
+        if result.page_index not in reported:
+            reported.add(result.page_index)
+            on_page(result)
+
+    return report
+
+
 def _extract_pdf_paths(
-    pdf_payload: bytes, options: RasterVectorOptions
+    pdf_payload: bytes,
+    options: RasterVectorOptions,
+    on_page: PageCallback | None = None,
 ) -> RasterVectorResult:
+    """Vectorise every page, fanning longer documents out to worker processes.
+
+    Documents of at least ``options.parallel_min_pages`` pages use the shared
+    page worker pool when ``options.page_workers`` allows parallelism.
+    ``on_page`` is invoked as each page finishes (in completion order) so callers
+    can surface partial results; the merged result is always in page order.
+    """
+
     if fitz is None:  # pragma: no cover - optional dependency
         raise RuntimeError("PDF vectorization requires PyMuPDF (fitz)")
-    document = fitz.open(stream=pdf_payload, filetype="pdf")
+    with fitz.open(stream=pdf_payload, filetype="pdf") as document:
+        page_count = document.page_count
+
+    started = time.perf_counter()
+    if on_page is not None:
+        on_page = _once_per_page(on_page)
+    page_results: list[PdfPageResult] | None = None
+    if page_count >= options.parallel_min_pages and options.page_workers > 1:
+        try:
+            page_results = _extract_pages_parallel(
+                pdf_payload, page_count, options, on_page
+            )
+        except (BrokenProcessPool, OSError) as exc:
+            logger.warning("vectorize_parallel_failed", error=str(exc))
+            shutdown_page_executor()
+    if page_results is None:
+        page_results = _extract_pages_sequential(pdf_payload, options, on_page)
+
+    result = merge_page_results(page_results, options)
+    logger.info(
+        "vectorize_pdf_completed",
+        pages=page_count,
+        paths=len(result.paths),
+        walls=len(result.walls),
+        duration_ms=round((time.perf_counter() - started) * 1000.0, 2),
+    )
+    return result
+
+
+def merge_page_results(
+    page_results: Sequence[PdfPageResult], options: RasterVectorOptions
+) -> RasterVectorResult:
+    """Merge per-page results, in page order, into one document result.
+
+    Also used to assemble partial results from the pages that finished
+    before a vectorisation failed.
+    """
+
+    page_results = sorted(page_results, key=lambda item: item.page_index)
     paths: list[VectorPath] = []
     vector_walls: list[WallCandidate] = []
     bitmap_walls: list[WallCandidate] = []
-    bounds: tuple[float, float] | None = None
-    for index, page in enumerate(document):  # pragma: no cover - depends on pymupdf
-        page_paths = _extract_pdf_page_paths(page, index)
-        paths.extend(page_paths)
-        vector_walls.extend(
-            detect_baseline_walls(
-                page_paths, minimum_length=options.minimum_wall_length, source="vector"
-            )
-        )
-        if options.infer_walls:
-            bitmap_walls.extend(_detect_bitmap_walls(page, options))
-        if bounds is None:
-            rect = page.rect
-            bounds = (float(rect.width), float(rect.height))
-    merged_walls = _merge_walls(vector_walls, bitmap_walls)
+    for page_result in page_results:
+        paths.extend(page_result.paths)
+        vector_walls.extend(page_result.vector_walls)
+        bitmap_walls.extend(page_result.bitmap_walls)
+    bounds = page_results[0].bounds if page_results else None
     return RasterVectorResult(
-        paths=paths, walls=merged_walls, bounds=bounds, source="pdf", options=options
+        paths=paths,
+        walls=_merge_walls(vector_walls, bitmap_walls),
+        bounds=bounds,
+        source="pdf",
+        options=options,
+        pages=[page_result.summary() for page_result in page_results],
     )
 
 
@@ -568,9 +813,11 @@ def _extract_svg_result(
 
 
 def _vectorize_pdf(
-    pdf_payload: bytes, options: RasterVectorOptions
+    pdf_payload: bytes,
+    options: RasterVectorOptions,
+    on_page: PageCallback | None = None,
 ) -> RasterVectorResult:
-    return _extract_pdf_paths(pdf_payload, options)
+    return _extract_pdf_paths(pdf_payload, options, on_page)
 
 
 def _vectorize_svg(
@@ -587,8 +834,14 @@ async def vectorize_floorplan(
     filename: str | None = None,
     infer_walls: bool = False,
     minimum_wall_length: float = 1.0,
+    on_page: PageCallback | None = None,
 ) -> dict[str, Any]:
-    """Convert PDF/SVG or raster image payloads into vector paths and walls."""
+    """Convert PDF/SVG or raster image payloads into vector paths and walls.
+
+    Multi-page PDFs are vectorised page-parallel. ``on_page`` receives each
+    :class:`PdfPageResult` as it completes; it is only honoured when the job
+    runs in-process because callbacks cannot cross a queue boundary.
+    """
 
     options = RasterVectorOptions(
         infer_walls=infer_walls, minimum_wall_length=minimum_wall_length
@@ -610,16 +863,21 @@ async def vectorize_floorplan(
         )
         return result.to_payload()
     if content_type == "application/pdf" or name.endswith(".pdf"):
-        result = await loop.run_in_executor(None, _vectorize_pdf, payload, options)
+        result = await loop.run_in_executor(
+            None, _vectorize_pdf, payload, options, on_page
+        )
         return result.to_payload()
     raise RuntimeError("Unsupported floorplan media type")
 
 
 __all__ = [
+    "PdfPageResult",
     "RasterVectorOptions",
     "RasterVectorResult",
     "VectorPath",
     "WallCandidate",
     "detect_baseline_walls",
+    "merge_page_results",
+    "shutdown_page_executor",
     "vectorize_floorplan",
 ]
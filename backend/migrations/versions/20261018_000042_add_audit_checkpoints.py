@@ -0,0 +1,54 @@
+"""add audit ledger checkpoints
+
+Revision ID: 20261018_000042
+Revises: 069afe97c108
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261018_000042"
+down_revision: Union[str, Sequence[str], None] = "069afe97c108"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _json_type() -> sa.types.TypeEngine:
+    return sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_checkpoints",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("start_version", sa.Integer(), nullable=False),
+        sa.Column("end_version", sa.Integer(), nullable=False),
+        sa.Column("merkle_root", sa.String(64), nullable=False),
+        sa.Column("chain_hash", sa.String(64), nullable=False),
+        sa.Column("signature", sa.String(128), nullable=False),
+        sa.Column("summary", _json_type(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.UniqueConstraint(
+            "project_id", "end_version", name="uq_audit_checkpoints_project_end"
+        ),
+    )
+    op.create_index(
+        "ix_audit_checkpoints_project_id", "audit_checkpoints", ["project_id"]
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS audit_checkpoints")
@@ -0,0 +1,49 @@
+"""add provider record ids to market transactions and rental listings
+
+Revision ID: 20261018_000043
+Revises: 20261018_000042
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "20261018_000043"
+down_revision: Union[str, Sequence[str], None] = "20261018_000042"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "market_transactions",
+        sa.Column("source_record_id", sa.String(100), nullable=True),
+    )
+    op.create_index(
+        "uq_transaction_source_record",
+        "market_transactions",
+        ["data_source", "source_record_id"],
+        unique=True,
+    )
+    op.add_column(
+        "rental_listings",
+        sa.Column("source_record_id", sa.String(100), nullable=True),
+    )
+    op.create_index(
+        "uq_rental_source_record",
+        "rental_listings",
+        ["listing_source", "source_record_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS uq_rental_source_record")
+    op.execute("ALTER TABLE rental_listings DROP COLUMN IF EXISTS source_record_id")
+    op.execute("DROP INDEX IF EXISTS uq_transaction_source_record")
+    op.execute("ALTER TABLE market_transactions DROP COLUMN IF EXISTS source_record_id")
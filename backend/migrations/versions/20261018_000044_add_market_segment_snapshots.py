@@ -0,0 +1,66 @@
+"""add market segment snapshots and transaction sync stamps
+
+Revision ID: 20261018_000044
+Revises: 20261018_000043
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261018_000044"
+down_revision: Union[str, Sequence[str], None] = "20261018_000043"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _json_type() -> sa.types.TypeEngine:
+    return sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "market_transactions",
+        sa.Column(
+            "synced_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+    )
+    op.create_index("idx_transaction_synced_at", "market_transactions", ["synced_at"])
+    op.create_table(
+        "market_segment_snapshots",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("property_type", sa.String(50), nullable=False),
+        sa.Column("location", sa.String(100), nullable=False),
+        sa.Column("quarter_start", sa.Date(), nullable=False),
+        sa.Column("transaction_count", sa.Integer(), nullable=False),
+        sa.Column("total_volume", sa.Numeric(18, 2), nullable=False),
+        sa.Column("psf_count", sa.Integer(), nullable=False),
+        sa.Column("psf_sum", sa.Numeric(18, 2), nullable=False),
+        sa.Column("psf_median", sa.Numeric(10, 2), nullable=True),
+        sa.Column("psf_min", sa.Numeric(10, 2), nullable=True),
+        sa.Column("psf_max", sa.Numeric(10, 2), nullable=True),
+        sa.Column("buyer_profile", _json_type(), nullable=True),
+        sa.Column("top_transactions", _json_type(), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint(
+            "property_type",
+            "location",
+            "quarter_start",
+            name="uq_segment_snapshot_quarter",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS market_segment_snapshots")
+    op.execute("DROP INDEX IF EXISTS idx_transaction_synced_at")
+    op.execute("ALTER TABLE market_transactions DROP COLUMN IF EXISTS synced_at")
@@ -0,0 +1,54 @@
+"""add agent deal feature store for batch deal scoring
+
+Revision ID: 20261018_000045
+Revises: 20261018_000044
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261018_000045"
+down_revision: Union[str, Sequence[str], None] = "20261018_000044"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "agent_deal_features",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("agent_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("location", sa.String(100), nullable=False, server_default=""),
+        sa.Column("asset_type", sa.String(50), nullable=False),
+        sa.Column("deal_type", sa.String(50), nullable=False),
+        sa.Column("won_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("lost_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.UniqueConstraint(
+            "agent_id",
+            "location",
+            "asset_type",
+            "deal_type",
+            name="uq_agent_deal_feature_key",
+        ),
+    )
+    op.create_index(
+        "ix_agent_deal_features_agent_id", "agent_deal_features", ["agent_id"]
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_agent_deal_features_agent_id")
+    op.execute("DROP TABLE IF EXISTS agent_deal_features")
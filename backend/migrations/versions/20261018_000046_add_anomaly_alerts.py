@@ -0,0 +1,77 @@
+"""add persisted anomaly alerts and rule watermarks
+
+Revision ID: 20261018_000046
+Revises: 20261018_000045
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "20261018_000046"
+down_revision: Union[str, Sequence[str], None] = "20261018_000045"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _json_type() -> sa.types.TypeEngine:
+    return sa.JSON().with_variant(postgresql.JSONB(), "postgresql")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "anomaly_alerts",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("alert_key", sa.String(255), nullable=False),
+        sa.Column("rule_name", sa.String(100), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.Column("category", sa.String(50), nullable=False),
+        sa.Column("priority", sa.String(20), nullable=False),
+        sa.Column("entity_type", sa.String(50), nullable=True),
+        sa.Column("entity_id", sa.String(100), nullable=True),
+        sa.Column("data", _json_type(), nullable=True),
+        sa.Column("suggested_actions", _json_type(), nullable=True),
+        sa.Column(
+            "detected_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "acknowledged", sa.Boolean(), nullable=False, server_default=sa.false()
+        ),
+        sa.UniqueConstraint("alert_key", name="uq_anomaly_alerts_alert_key"),
+    )
+    op.create_index("ix_anomaly_alerts_rule_name", "anomaly_alerts", ["rule_name"])
+    op.create_index("ix_anomaly_alerts_user_id", "anomaly_alerts", ["user_id"])
+    op.create_index(
+        "ix_anomaly_alerts_rule_user", "anomaly_alerts", ["rule_name", "user_id"]
+    )
+    op.create_table(
+        "anomaly_rule_watermarks",
+        sa.Column("rule_name", sa.String(100), primary_key=True),
+        sa.Column("checked_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS anomaly_rule_watermarks")
+    op.execute("DROP INDEX IF EXISTS ix_anomaly_alerts_rule_user")
+    op.execute("DROP INDEX IF EXISTS ix_anomaly_alerts_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_anomaly_alerts_rule_name")
+    op.execute("DROP TABLE IF EXISTS anomaly_alerts")
@@ -0,0 +1,66 @@
+"""add property full-text, trigram and facet range indexes
+
+Revision ID: 20261018_000047
+Revises: 20261018_000046
+Create Date: 2026-10-18
+
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "20261018_000047"
+down_revision: Union[str, Sequence[str], None] = "20261018_000046"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match _POSTGRES_PROPERTY_SEARCH_DDL in app.models.property, and the
+# SEARCH_CONFIG queried by app.services.property_search.
+_SEARCH_DOCUMENT = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || coalesce(address, '') || ' ' || "
+    "coalesce(district, '') || ' ' || coalesce(planning_area, ''))"
+)
+_TRIGRAM_COLUMNS = ("address", "district", "planning_area")
+
+
+def _is_postgres() -> bool:
+    bind = op.get_bind()
+    return bind is not None and bind.dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    op.create_index("idx_property_plot_ratio", "properties", ["plot_ratio"])
+    op.create_index("idx_property_land_area", "properties", ["land_area_sqm"])
+
+    if not _is_postgres():
+        # SQLite builds its FTS5 index when the table is created.
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "ALTER TABLE properties ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        f"GENERATED ALWAYS AS ({_SEARCH_DOCUMENT}) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_property_search_vector "
+        "ON properties USING gin (search_vector)"
+    )
+    for column in _TRIGRAM_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_property_{column}_trgm "
+            f"ON properties USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    if _is_postgres():
+        for column in _TRIGRAM_COLUMNS:
+            op.execute(f"DROP INDEX IF EXISTS idx_property_{column}_trgm")
+        op.execute("DROP INDEX IF EXISTS idx_property_search_vector")
+        op.execute("ALTER TABLE properties DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP INDEX IF EXISTS idx_property_land_area")
+    op.execute("DROP INDEX IF EXISTS idx_property_plot_ratio")
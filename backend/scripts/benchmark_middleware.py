@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Measure per-request latency added by the production middleware stack.
+
+Requests go through an in-process ASGI client (no sockets) to a trivial
+endpoint, once on a bare FastAPI app and once on an app carrying the
+middleware registered on ``app.main.app``. The difference is the stack's
+per-request overhead; run the script before and after a middleware change
+to compare.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BACKEND_ROOT = REPO_ROOT / "backend"
+BENCHMARK_PATH = "/benchmark/ping"
+DEFAULT_REQUESTS = 2000
+DEFAULT_WARMUP = 200
+
+
+def _prepare_environment() -> None:
+    for entry in (str(REPO_ROOT), str(BACKEND_ROOT)):
+        if entry not in sys.path:
+            sys.path.insert(0, entry)
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+    # Keep the global slowapi limit from rejecting benchmark traffic.
+    os.environ.setdefault("API_RATE_LIMIT", "100000000/minute")
+
+
+def build_apps() -> dict[str, Any]:
+    """Return the bare and middleware-wrapped benchmark apps."""
+
+    from fastapi import FastAPI
+
+    from app.main import app as main_app
+
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    apps: dict[str, Any] = {}
+    for name, middleware in (("bare", []), ("stack", main_app.user_middleware)):
+        candidate = FastAPI()
+        candidate.add_api_route(BENCHMARK_PATH, ping, methods=["GET"])
+        candidate.user_middleware = list(middleware)
+        candidate.state.limiter = getattr(main_app.state, "limiter", None)
+        apps[name] = candidate
+    return apps
+
+
+async def measure(app: Any, *, requests: int, warmup: int) -> list[float]:
+    """Return per-request latencies in milliseconds for ``requests`` GETs."""
+
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    samples: list[float] = []
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver"
+    ) as client:
+        for index in range(warmup + requests):
+            started = perf_counter()
+            response = await client.get(BENCHMARK_PATH)
+            elapsed_ms = (perf_counter() - started) * 1000.0
+            if response.status_code != 200:
+                raise RuntimeError(
+                    f"Benchmark request failed with status {response.status_code}"
+                )
+            if index >= warmup:
+                samples.append(elapsed_ms)
+    return samples
+
+
+def summarise(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "p50_ms": round(ordered[len(ordered) // 2], 4),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 4),
+    }
+
+
+async def run_benchmark(
+    *, requests: int = DEFAULT_REQUESTS, warmup: int = DEFAULT_WARMUP
+) -> dict[str, Any]:
+    """Benchmark the bare app and the middleware stack."""
+
+    _prepare_environment()
+    report: dict[str, Any] = {"requests": requests}
+    for name, app in build_apps().items():
+        report[name] = summarise(await measure(app, requests=requests, warmup=warmup))
+    report["overhead_p50_ms"] = round(
+        report["stack"]["p50_ms"] - report["bare"]["p50_ms"], 4
+    )
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    report = asyncio.run(run_benchmark(requests=args.requests, warmup=args.warmup))
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
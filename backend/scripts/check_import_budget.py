@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""Enforce clean-process backend startup import budgets."""
+"""Enforce clean-process backend startup import budgets.
+
+Besides the ``app.main`` import and the full API router build, each API v1
+router group (the routers mounted together for one path prefix) is imported
+in a clean process and timed, and the isolation group must not drag in route
+modules from other prefixes.
+"""
 
 from __future__ import annotations
 
@@ -27,8 +33,10 @@ HEAVY_MAIN_MODULES = [
     "app.schemas.buildable",
     "app.schemas.finance",
 ]
+ISOLATION_SEGMENT = "finance"
 DEFAULT_MAIN_IMPORT_BUDGET_SECONDS = 2.0
 DEFAULT_API_ROUTER_BUDGET_SECONDS = 4.0
+DEFAULT_API_ROUTER_GROUP_BUDGET_SECONDS = 2.0
 DEFAULT_IMPORT_BUDGET_SAMPLES = 3
 
 
@@ -43,6 +51,25 @@ def _child_environment() -> dict[str, str]:
     return env
 
 
+def _run_script(script: str) -> dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=False,
+        env=_child_environment(),
+        text=True,
+    )
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stdout)
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(completed.returncode)
+
+    lines = [line.strip() for line in completed.stdout.splitlines() if line.strip()]
+    if not lines:
+        raise SystemExit("import budget probe returned no output")
+    return json.loads(lines[-1])
+
+
 def _run_probe() -> dict[str, Any]:
     script = f"""
 import importlib
@@ -80,22 +107,55 @@ print(
     )
 )
 """
-    completed = subprocess.run(
-        [sys.executable, "-c", script],
-        capture_output=True,
-        check=False,
-        env=_child_environment(),
-        text=True,
-    )
-    if completed.returncode != 0:
-        sys.stderr.write(completed.stdout)
-        sys.stderr.write(completed.stderr)
-        raise SystemExit(completed.returncode)
+    return _run_script(script)
 
-    lines = [line.strip() for line in completed.stdout.splitlines() if line.strip()]
-    if not lines:
-        raise SystemExit("import budget probe returned no output")
-    return json.loads(lines[-1])
+
+def _run_group_probe() -> dict[str, Any]:
+    """Time each router group's import, isolation group first.
+
+    Groups are imported one after another in the same process, so each timing
+    is the marginal cost of that prefix once the shared app modules are loaded.
+    """
+
+    script = f"""
+import importlib
+import json
+import sys
+import time
+
+route_modules = {json.dumps(ROUTE_MODULES)}
+
+importlib.import_module("app.main")
+api_v1 = importlib.import_module("app.api.v1")
+
+isolated = api_v1.router_group_for_segment({json.dumps(ISOLATION_SEGMENT)})
+groups = [isolated] + [
+    group for group in api_v1.router_groups() if group != isolated
+]
+
+timings = {{}}
+loaded_with_isolated = []
+for group in groups:
+    start = time.perf_counter()
+    api_v1.build_router_group(group)
+    timings[group[0]] = round(time.perf_counter() - start, 3)
+    if group == isolated:
+        loaded_with_isolated = [
+            name
+            for name in route_modules
+            if name in sys.modules and name.rsplit(".", 1)[-1] not in isolated
+        ]
+
+print(
+    json.dumps(
+        {{
+            "router_group_import_s": timings,
+            "loaded_with_isolated_group": loaded_with_isolated,
+        }}
+    )
+)
+"""
+    return _run_script(script)
 
 
 def _measure_startup() -> dict[str, Any]:
@@ -106,6 +166,8 @@ def _measure_startup() -> dict[str, Any]:
         raise SystemExit("IMPORT_BUDGET_SAMPLES must be >= 1")
 
     samples = [_run_probe() for _ in range(sample_count)]
+    group_samples = [_run_group_probe() for _ in range(sample_count)]
+    group_names = group_samples[0]["router_group_import_s"]
     return {
         "main_import_s": round(
             statistics.median(float(sample["main_import_s"]) for sample in samples), 3
@@ -118,6 +180,17 @@ def _measure_startup() -> dict[str, Any]:
         ),
         "loaded_after_main": samples[0]["loaded_after_main"],
         "route_count": samples[0]["route_count"],
+        "router_group_import_s": {
+            name: round(
+                statistics.median(
+                    float(sample["router_group_import_s"][name])
+                    for sample in group_samples
+                ),
+                3,
+            )
+            for name in group_names
+        },
+        "loaded_with_isolated_group": group_samples[0]["loaded_with_isolated_group"],
         "samples": samples,
     }
 
@@ -137,6 +210,13 @@ def main() -> int:
         )
     )
 
+    group_budget = float(
+        os.getenv(
+            "API_ROUTER_GROUP_BUDGET_SECONDS",
+            str(DEFAULT_API_ROUTER_GROUP_BUDGET_SECONDS),
+        )
+    )
+
     failures: list[str] = []
     loaded_after_main = payload.get("loaded_after_main", {})
     if loaded_after_main.get("routes"):
@@ -160,6 +240,17 @@ def main() -> int:
             "API router build budget exceeded: "
             f"{build_api_router_s:.3f}s > {router_budget:.3f}s"
         )
+    if payload.get("loaded_with_isolated_group"):
+        failures.append(
+            f"mounting the {ISOLATION_SEGMENT} routers loaded other route modules: "
+            f"{payload['loaded_with_isolated_group']}"
+        )
+    for name, seconds in payload.get("router_group_import_s", {}).items():
+        if seconds > group_budget:
+            failures.append(
+                f"router group {name} import budget exceeded: "
+                f"{seconds:.3f}s > {group_budget:.3f}s"
+            )
 
     print(json.dumps(payload, indent=2, sort_keys=True))
     if failures:
@@ -0,0 +1,356 @@
+"""Shared streaming, normalisation and bulk-load engine for reference ingests.
+
+The ``ingest_*_parcels`` and ``ingest_*_zones`` loaders all follow the same
+shape: stream features out of a (very large) GeoJSON export, normalise each
+one with shapely/pyproj, then write the rows into a reference table. This
+module provides the pieces they share:
+
+* :func:`iter_geojson_features` – a linear-time streaming GeoJSON reader.
+* :func:`normalise_features` – fans the CPU-bound normalisation out to a
+  process pool while preserving input order.
+* :class:`BulkLoader` – loads rows through ``COPY`` into a temporary staging
+  table on PostgreSQL (falling back to ``executemany`` inserts elsewhere).
+* :class:`IngestThroughput` – rows/sec reporting for progress logs.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from pyproj import Transformer
+from shapely.geometry.base import BaseGeometry
+from sqlalchemy import Table, delete, text, tuple_
+from sqlalchemy.dialects import postgresql
+
+try:  # pragma: no cover - optional PostGIS column
+    from geoalchemy2.shape import from_shape
+except ModuleNotFoundError:  # pragma: no cover - geoalchemy2 not installed
+    from_shape = None  # type: ignore
+
+_READ_CHUNK_SIZE = 1 << 20
+_MARKER_WINDOW = 32_768
+_JSON_WHITESPACE = " \t\n\r"
+
+
+def default_workers() -> int:
+    """Return the normalisation worker count (``INGEST_WORKERS`` or CPU count)."""
+
+    configured = os.getenv("INGEST_WORKERS")
+    if configured and configured.isdigit() and int(configured) > 0:
+        return int(configured)
+    return max(1, os.cpu_count() or 1)
+
+
+def iter_geojson_features(
+    path: Path, *, chunk_size: int = _READ_CHUNK_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Yield GeoJSON feature objects without loading the full file into memory.
+
+    Features are decoded in place using an offset into the read buffer; the
+    consumed prefix is dropped once per chunk rather than after every feature,
+    so the reader stays linear in the size of the file.
+    """
+
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    inside_features = False
+    with path.open("r", encoding="utf-8") as handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                break
+            buffer = buffer[position:] + chunk
+            position = 0
+            if not inside_features:
+                marker_index = buffer.find('"features"')
+                if marker_index == -1:
+                    buffer = buffer[-_MARKER_WINDOW:]
+                    continue
+                bracket_index = buffer.find("[", marker_index)
+                if bracket_index == -1:
+                    buffer = buffer[marker_index:]
+                    continue
+                position = bracket_index + 1
+                inside_features = True
+
+            length = len(buffer)
+            while inside_features:
+                while position < length and buffer[position] in _JSON_WHITESPACE:
+                    position += 1
+                if position >= length:
+                    break
+                leading = buffer[position]
+                if leading == ",":
+                    position += 1
+                    continue
+                if leading == "]":
+                    inside_features = False
+                    position += 1
+                    break
+                try:
+                    feature, position_after = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    break
+                if isinstance(feature, dict):
+                    yield feature
+                position = position_after
+
+    if inside_features:
+        raise RuntimeError(f"Unexpected EOF before completing features array in {path}")
+
+
+@lru_cache(maxsize=8)
+def transformer_to_wgs84(source_epsg: int) -> Transformer:
+    """Return a cached ``source_epsg`` → EPSG:4326 transformer for this process."""
+
+    return Transformer.from_crs(f"EPSG:{source_epsg}", "EPSG:4326", always_xy=True)
+
+
+@dataclass(slots=True)
+class NormalisedFeature:
+    """Outcome of normalising one feature: either ``record`` or ``error``."""
+
+    index: int
+    record: Any = None
+    error: str | None = None
+
+
+Normaliser = Callable[[dict[str, Any]], Any]
+
+
+def _normalise_chunk(
+    normaliser: Normaliser, chunk: Sequence[tuple[int, dict[str, Any]]]
+) -> list[NormalisedFeature]:
+    results: list[NormalisedFeature] = []
+    for index, feature in chunk:
+        try:
+            results.append(NormalisedFeature(index=index, record=normaliser(feature)))
+        except ValueError as exc:
+            results.append(NormalisedFeature(index=index, error=str(exc)))
+    return results
+
+
+def _iter_chunks(
+    features: Iterable[tuple[int, dict[str, Any]]], size: int
+) -> Iterator[list[tuple[int, dict[str, Any]]]]:
+    chunk: list[tuple[int, dict[str, Any]]] = []
+    for item in features:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def normalise_features(
+    features: Iterable[tuple[int, dict[str, Any]]],
+    normaliser: Normaliser,
+    *,
+    workers: int,
+    chunk_size: int = 256,
+) -> Iterator[NormalisedFeature]:
+    """Normalise ``(index, feature)`` pairs, in order, across ``workers`` processes.
+
+    ``normaliser`` must be picklable (a module-level function or a
+    :func:`functools.partial` of one) and signal rejected features by raising
+    ``ValueError``. At most ``2 * workers`` chunks are in flight, so memory
+    stays bounded however large the source file is. Close the iterator (for
+    example via :func:`contextlib.closing`) when stopping early.
+    """
+
+    if workers <= 1:
+        for chunk in _iter_chunks(features, chunk_size):
+            yield from _normalise_chunk(normaliser, chunk)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    pending: deque[Future[list[NormalisedFeature]]] = deque()
+    try:
+        for chunk in _iter_chunks(features, chunk_size):
+            pending.append(executor.submit(_normalise_chunk, normaliser, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass(slots=True)
+class IngestThroughput:
+    """Track committed rows and report the sustained rows/sec rate."""
+
+    rows: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def add(self, count: int) -> None:
+        self.rows += count
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return round(self.rows / elapsed, 1) if elapsed > 0 else 0.0
+
+
+class BulkLoader:
+    """Load row dictionaries into ``table`` using the fastest available path.
+
+    On PostgreSQL with asyncpg each batch is streamed with ``COPY`` into a
+    transaction-scoped staging table and moved across with a single
+    ``INSERT ... SELECT``; rows sharing ``key_columns`` with the batch are
+    removed in the same statement sequence when ``replace`` is requested.
+    Other backends use a plain ``executemany`` insert. Values for
+    ``geometry_column`` are shapely geometries and stored with ``srid``.
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        *,
+        key_columns: Sequence[str] = (),
+        geometry_column: str = "geometry",
+        srid: int = 4326,
+    ) -> None:
+        self.table = table
+        self.key_columns = tuple(key_columns)
+        self.srid = srid
+        self.geometry_column = (
+            geometry_column
+            if geometry_column in table.c and from_shape is not None
+            else None
+        )
+
+    def _columns(self, rows: Sequence[dict[str, Any]]) -> list[str]:
+        columns = [name for name in rows[0] if name in self.table.c]
+        if self.geometry_column is None and "geometry" in columns:
+            columns.remove("geometry")
+        return columns
+
+    async def load(
+        self, session, rows: Sequence[dict[str, Any]], *, replace: bool = False
+    ) -> int:
+        """Write ``rows`` inside the session's current transaction."""
+
+        if not rows:
+            return 0
+        columns = self._columns(rows)
+        bind = session.get_bind()
+        if bind.dialect.name == "postgresql" and bind.dialect.driver == "asyncpg":
+            await self._copy_via_staging(session, rows, columns, replace=replace)
+        else:
+            await self._insert_many(session, rows, columns, replace=replace)
+        return len(rows)
+
+    async def _insert_many(
+        self,
+        session,
+        rows: Sequence[dict[str, Any]],
+        columns: Sequence[str],
+        *,
+        replace: bool,
+    ) -> None:
+        if replace and self.key_columns:
+            keys = {tuple(row[name] for name in self.key_columns) for row in rows}
+            key_expr = tuple_(*(self.table.c[name] for name in self.key_columns))
+            await session.execute(delete(self.table).where(key_expr.in_(list(keys))))
+        payloads = []
+        for row in rows:
+            payload = {name: row[name] for name in columns}
+            if self.geometry_column and payload.get(self.geometry_column) is not None:
+                payload[self.geometry_column] = from_shape(
+                    payload[self.geometry_column], srid=self.srid
+                )
+            payloads.append(payload)
+        await session.execute(self.table.insert(), payloads)
+
+    def _copy_value(self, name: str, value: Any) -> str | None:
+        if value is None:
+            return None
+        if name == self.geometry_column and isinstance(value, BaseGeometry):
+            return f"SRID={self.srid};{value.wkt}"
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, separators=(",", ":"))
+        return str(value)
+
+    async def _copy_via_staging(
+        self,
+        session,
+        rows: Sequence[dict[str, Any]],
+        columns: Sequence[str],
+        *,
+        replace: bool,
+    ) -> None:
+        dialect = postgresql.dialect()
+        staging = f"ingest_staging_{uuid4().hex[:12]}"
+        target = self.table.name
+        column_list = ", ".join(columns)
+        await session.execute(
+            text(
+                f"CREATE TEMP TABLE {staging} ("
+                + ", ".join(f"{name} text" for name in columns)
+                + ") ON COMMIT DROP"
+            )
+        )
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            staging,
+            columns=list(columns),
+            records=[
+                tuple(self._copy_value(name, row.get(name)) for name in columns)
+                for row in rows
+            ],
+        )
+        if replace and self.key_columns:
+            matches = " AND ".join(
+                f"{target}.{name} = {staging}.{name}::"
+                f"{self.table.c[name].type.compile(dialect=dialect)}"
+                for name in self.key_columns
+            )
+            await session.execute(
+                text(f"DELETE FROM {target} USING {staging} WHERE {matches}")
+            )
+        select_list = ", ".join(
+            (
+                f"ST_GeomFromEWKT({name})"
+                if name == self.geometry_column
+                else f"{name}::{self.table.c[name].type.compile(dialect=dialect)}"
+            )
+            for name in columns
+        )
+        await session.execute(
+            text(
+                f"INSERT INTO {target} ({column_list}) "
+                f"SELECT {select_list} FROM {staging}"
+            )
+        )
+        await session.execute(text(f"DROP TABLE {staging}"))
+
+
+__all__ = [
+    "BulkLoader",
+    "IngestThroughput",
+    "NormalisedFeature",
+    "default_workers",
+    "iter_geojson_features",
+    "normalise_features",
+    "transformer_to_wgs84",
+]
@@ -25,11 +25,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import math
+from contextlib import closing
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Iterator, Sequence
+from typing import Any, Iterable, Iterator
 
 import structlog
 from pyproj import Transformer
@@ -38,17 +39,20 @@ from shapely.geometry import mapping as shapely_mapping
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import transform
 from shapely.validation import make_valid
-from sqlalchemy import delete, insert
+from sqlalchemy import delete
 
 import app.utils.logging  # noqa: F401  pylint: disable=unused-import
 from app.core.database import AsyncSessionLocal
 from app.models.rkp import RefParcel
 
-try:  # pragma: no cover - optional PostGIS column
-    from geoalchemy2.shape import from_shape
-except ModuleNotFoundError:  # pragma: no cover - geoalchemy2 not installed
-    from_shape = None  # type: ignore
-
+from .ingest_engine import (
+    BulkLoader,
+    IngestThroughput,
+    default_workers,
+    iter_geojson_features,
+    normalise_features,
+    transformer_to_wgs84,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -67,6 +71,7 @@ class ParcelIngestionOptions:
     reset: bool
     source_epsg: int
     source_label: str
+    workers: int = 1
 
 
 @dataclass(slots=True)
@@ -87,65 +92,19 @@ class ParcelIngestionStats:
     inserted_records: int = 0
     skipped_features: int = 0
     invalid_features: int = 0
+    rows_per_second: float = 0.0
 
-    def as_dict(self) -> dict[str, int]:
+    def as_dict(self) -> dict[str, int | float]:
         return {
             "seen_features": self.seen_features,
             "processed_records": self.processed_records,
             "inserted_records": self.inserted_records,
             "skipped_features": self.skipped_features,
             "invalid_features": self.invalid_features,
+            "rows_per_second": self.rows_per_second,
         }
 
 
-def _iter_geojson_features(path: Path) -> Iterator[dict[str, Any]]:
-    """Yield GeoJSON feature objects without loading the full file into memory."""
-
-    decoder = json.JSONDecoder()
-    buffer = ""
-    inside_features = False
-    with path.open("r", encoding="utf-8") as handle:
-        while True:
-            chunk = handle.read(131072)
-            if not chunk:
-                break
-            buffer += chunk
-            if not inside_features:
-                marker_index = buffer.find('"features"')
-                if marker_index == -1:
-                    buffer = buffer[-32_768:]
-                    continue
-                buffer = buffer[marker_index:]
-                bracket_index = buffer.find("[")
-                if bracket_index == -1:
-                    continue
-                buffer = buffer[bracket_index + 1 :]
-                inside_features = True
-
-            while inside_features:
-                buffer = buffer.lstrip()
-                if not buffer:
-                    break
-                leading = buffer[0]
-                if leading == ",":
-                    buffer = buffer[1:]
-                    continue
-                if leading == "]":
-                    inside_features = False
-                    buffer = buffer[1:]
-                    break
-                try:
-                    feature, offset = decoder.raw_decode(buffer)
-                except json.JSONDecodeError:
-                    break
-                if isinstance(feature, dict):
-                    yield feature
-                buffer = buffer[offset:]
-
-    if inside_features:
-        raise RuntimeError(f"Unexpected EOF before completing features array in {path}")
-
-
 def _force_multipolygon(geometry: BaseGeometry) -> MultiPolygon:
     """Return a MultiPolygon regardless of initial geometry type."""
 
@@ -228,34 +187,27 @@ def _normalise_feature(
     )
 
 
-async def _persist_batch(
-    session,
-    rows: Sequence[ParcelRecord],
-    *,
-    jurisdiction: str,
-) -> None:
-    if not rows:
-        return
-
-    payloads: list[dict[str, Any]] = []
-    has_geometry_column = getattr(RefParcel, "geometry", None) is not None
-
-    for row in rows:
-        payload: dict[str, Any] = {
-            "jurisdiction": jurisdiction,
-            "parcel_ref": row.parcel_ref,
-            "bounds_json": row.geometry_feature,
-            "centroid_lat": row.centroid_lat,
-            "centroid_lon": row.centroid_lon,
-            "area_m2": row.area_m2,
-            "source": row.source_label,
-        }
-        if has_geometry_column and from_shape is not None:
-            payload["geometry"] = from_shape(row.shapely_geometry, srid=4326)
-        payloads.append(payload)
+def _normalise_projected(
+    feature: dict[str, Any], *, source_epsg: int, source_label: str
+) -> ParcelRecord:
+    """Picklable normaliser used by the ingest engine's worker processes."""
+
+    return _normalise_feature(
+        feature, transformer_to_wgs84(source_epsg), source_label=source_label
+    )
 
-    stmt = insert(RefParcel).values(payloads)
-    await session.execute(stmt)
+
+def _record_row(record: ParcelRecord, *, jurisdiction: str) -> dict[str, Any]:
+    return {
+        "jurisdiction": jurisdiction,
+        "parcel_ref": record.parcel_ref,
+        "bounds_json": record.geometry_feature,
+        "geometry": record.shapely_geometry,
+        "centroid_lat": record.centroid_lat,
+        "centroid_lon": record.centroid_lon,
+        "area_m2": record.area_m2,
+        "source": record.source_label,
+    }
 
 
 async def _delete_existing(session, jurisdiction: str) -> int:
@@ -264,22 +216,19 @@ async def _delete_existing(session, jurisdiction: str) -> int:
     return result.rowcount or 0
 
 
-async def _delete_specific(
-    session, jurisdiction: str, parcel_refs: Sequence[str]
-) -> None:
-    if not parcel_refs:
-        return
-    stmt = delete(RefParcel).where(
-        RefParcel.jurisdiction == jurisdiction, RefParcel.parcel_ref.in_(parcel_refs)
-    )
-    await session.execute(stmt)
+def _iter_selected_features(
+    features: Iterable[dict[str, Any]], stats: ParcelIngestionStats, *, skip: int
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    for feature_index, feature in enumerate(features):
+        stats.seen_features += 1
+        if feature_index < skip:
+            stats.skipped_features += 1
+            continue
+        yield feature_index, feature
 
 
 async def ingest_parcels(options: ParcelIngestionOptions) -> ParcelIngestionStats:
     stats = ParcelIngestionStats()
-    transformer = Transformer.from_crs(
-        f"EPSG:{options.source_epsg}", "EPSG:4326", always_xy=True
-    )
 
     async with AsyncSessionLocal() as session:
         if options.reset:
@@ -287,77 +236,70 @@ async def ingest_parcels(options: ParcelIngestionOptions) -> ParcelIngestionStat
             await session.commit()
             logger.info("hk_parcels:cleared_existing", removed=removed)
 
+    loader = BulkLoader(RefParcel.__table__, key_columns=("jurisdiction", "parcel_ref"))
+    throughput = IngestThroughput()
+    normaliser = partial(
+        _normalise_projected,
+        source_epsg=options.source_epsg,
+        source_label=options.source_label,
+    )
+
+    async def _flush(session, batch: list[ParcelRecord]) -> None:
+        rows = [
+            _record_row(record, jurisdiction=options.jurisdiction) for record in batch
+        ]
+        await loader.load(session, rows, replace=not options.reset)
+        await session.commit()
+        stats.inserted_records += len(batch)
+        throughput.add(len(batch))
+        logger.info(
+            "hk_parcels:batch_committed",
+            inserted=len(batch),
+            total_inserted=stats.inserted_records,
+            rows_per_second=throughput.rows_per_second,
+        )
+        batch.clear()
+
+    results = normalise_features(
+        _iter_selected_features(
+            iter_geojson_features(options.input_path), stats, skip=options.skip
+        ),
+        normaliser,
+        workers=options.workers,
+    )
     async with AsyncSessionLocal() as session:
         batch: list[ParcelRecord] = []
-        for feature_index, feature in enumerate(
-            _iter_geojson_features(options.input_path)
-        ):
-            stats.seen_features += 1
-            if feature_index < options.skip:
-                stats.skipped_features += 1
-                continue
-            if options.limit is not None and stats.processed_records >= options.limit:
-                break
-            try:
-                record = _normalise_feature(
-                    feature,
-                    transformer,
-                    source_label=options.source_label,
-                )
-            except ValueError as exc:
-                stats.invalid_features += 1
-                logger.warning(
-                    "hk_parcels:feature_skipped",
-                    reason=str(exc),
-                    feature_index=feature_index,
-                )
-                continue
-
-            batch.append(record)
-            stats.processed_records += 1
-
-            if len(batch) >= options.batch_size:
-                if not options.reset:
-                    await _delete_specific(
-                        session,
-                        options.jurisdiction,
-                        [row.parcel_ref for row in batch],
+        with closing(results):
+            for result in results:
+                if (
+                    options.limit is not None
+                    and stats.processed_records >= options.limit
+                ):
+                    break
+                if result.error is not None:
+                    stats.invalid_features += 1
+                    logger.warning(
+                        "hk_parcels:feature_skipped",
+                        reason=result.error,
+                        feature_index=result.index,
                     )
-                await _persist_batch(
-                    session,
-                    batch,
-                    jurisdiction=options.jurisdiction,
-                )
-                await session.commit()
-                stats.inserted_records += len(batch)
-                logger.info(
-                    "hk_parcels:batch_committed",
-                    inserted=len(batch),
-                    total_inserted=stats.inserted_records,
-                )
-                batch.clear()
+                    continue
+
+                batch.append(result.record)
+                stats.processed_records += 1
+
+                if len(batch) >= options.batch_size:
+                    await _flush(session, batch)
 
         if batch:
-            if not options.reset:
-                await _delete_specific(
-                    session,
-                    options.jurisdiction,
-                    [row.parcel_ref for row in batch],
-                )
-            await _persist_batch(
-                session,
-                batch,
-                jurisdiction=options.jurisdiction,
-            )
-            await session.commit()
-            stats.inserted_records += len(batch)
-            logger.info(
-                "hk_parcels:batch_committed",
-                inserted=len(batch),
-                total_inserted=stats.inserted_records,
-            )
-
-    logger.info("hk_parcels:completed", **stats.as_dict())
+            await _flush(session, batch)
+
+    stats.rows_per_second = throughput.rows_per_second
+    logger.info(
+        "hk_parcels:completed",
+        elapsed_seconds=round(throughput.elapsed_seconds, 2),
+        **stats.as_dict(),
+    )
     return stats
 
 
@@ -379,6 +321,15 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         default=500,
         help="Number of parcels to insert per transaction (default: 500).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help=(
+            "Processes used to normalise features "
+            "(default: INGEST_WORKERS or the CPU count)."
+        ),
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -421,6 +372,7 @@ async def _run_from_cli(args: argparse.Namespace) -> ParcelIngestionStats:
         reset=args.reset,
         source_epsg=args.source_epsg,
         source_label=args.source_label,
+        workers=args.workers,
     )
     logger.info(
         "hk_parcels:starting",
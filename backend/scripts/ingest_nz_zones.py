@@ -50,11 +50,7 @@ import app.utils.logging  # noqa: F401  pylint: disable=unused-import
 from app.core.database import AsyncSessionLocal
 from app.models.rkp import RefZoningLayer
 
-try:  # pragma: no cover - optional PostGIS column
-    from geoalchemy2.shape import from_shape
-except ModuleNotFoundError:  # pragma: no cover - geoalchemy2 not installed
-    from_shape = None  # type: ignore
-
+from .ingest_engine import BulkLoader
 
 logger = structlog.get_logger(__name__)
 
@@ -350,21 +346,18 @@ async def _persist_zone_records(
                 )
             )
 
-        has_geometry_column = getattr(RefZoningLayer, "geometry", None) is not None
-        payloads: list[dict[str, Any]] = []
-        for record in records:
-            payload: dict[str, Any] = {
+        rows = [
+            {
                 "jurisdiction": jurisdiction,
                 "layer_name": layer_name,
                 "zone_code": record.zone_code,
                 "attributes": record.attributes,
                 "bounds_json": record.geometry_feature,
+                "geometry": record.shapely_geometry,
             }
-            if has_geometry_column and from_shape is not None:
-                payload["geometry"] = from_shape(record.shapely_geometry, srid=4326)
-            payloads.append(payload)
-
-        await session.execute(RefZoningLayer.__table__.insert(), payloads)
+            for record in records
+        ]
+        await BulkLoader(RefZoningLayer.__table__).load(session, rows)
         await session.commit()
 
     return len(records)
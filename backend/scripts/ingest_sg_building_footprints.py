@@ -10,11 +10,10 @@ from __future__ import annotations
 import argparse
 import asyncio
 import importlib
-import json
 import math
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator, Sequence
+from typing import Any, Sequence
 
 import httpx
 import structlog
@@ -34,6 +33,7 @@ except ModuleNotFoundError:  # pragma: no cover
 else:
     from_shape = getattr(geoalchemy_shape, "from_shape", None)
 
+from .ingest_engine import iter_geojson_features
 
 logger = structlog.get_logger(__name__)
 
@@ -85,52 +85,6 @@ class BuildingFootprintIngestionStats:
         }
 
 
-def _iter_geojson_features(path: Path) -> Iterator[dict[str, Any]]:
-    decoder = json.JSONDecoder()
-    buffer = ""
-    inside_features = False
-    with path.open("r", encoding="utf-8") as handle:
-        while True:
-            chunk = handle.read(131072)
-            if not chunk:
-                break
-            buffer += chunk
-            if not inside_features:
-                marker_index = buffer.find('"features"')
-                if marker_index == -1:
-                    buffer = buffer[-32_768:]
-                    continue
-                buffer = buffer[marker_index:]
-                bracket_index = buffer.find("[")
-                if bracket_index == -1:
-                    continue
-                buffer = buffer[bracket_index + 1 :]
-                inside_features = True
-
-            while inside_features:
-                buffer = buffer.lstrip()
-                if not buffer:
-                    break
-                leading = buffer[0]
-                if leading == ",":
-                    buffer = buffer[1:]
-                    continue
-                if leading == "]":
-                    inside_features = False
-                    buffer = buffer[1:]
-                    break
-                try:
-                    feature, offset = decoder.raw_decode(buffer)
-                except json.JSONDecodeError:
-                    break
-                if isinstance(feature, dict):
-                    yield feature
-                buffer = buffer[offset:]
-
-    if inside_features:
-        raise RuntimeError(f"Unexpected EOF before completing features array in {path}")
-
-
 async def _download_building_geojson(output_path: Path) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     async with httpx.AsyncClient(timeout=180.0, follow_redirects=True) as client:
@@ -313,7 +267,7 @@ async def ingest_building_footprints(
 
     async with AsyncSessionLocal() as session:
         batch: list[BuildingFootprintRecord] = []
-        for feature in _iter_geojson_features(input_path):
+        for feature in iter_geojson_features(input_path):
             stats.seen_features += 1
             if options.limit is not None and stats.processed_records >= options.limit:
                 break
@@ -10,13 +10,11 @@ from __future__ import annotations
 import argparse
 import asyncio
 import html
-import importlib
-import json
 import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator, Sequence
+from typing import Any, Sequence
 
 import httpx
 import structlog
@@ -28,12 +26,7 @@ from shapely.validation import make_valid
 from app.core.database import AsyncSessionLocal
 from app.models.rkp import RefZoningLayer
 
-try:  # pragma: no cover - optional dependency when PostGIS disabled
-    geoalchemy_shape = importlib.import_module("geoalchemy2.shape")
-except ModuleNotFoundError:  # pragma: no cover
-    from_shape = None
-else:
-    from_shape = getattr(geoalchemy_shape, "from_shape", None)
+from .ingest_engine import BulkLoader, iter_geojson_features
 
 logger = structlog.get_logger(__name__)
 
@@ -64,52 +57,6 @@ class SGZoneRecord:
     attributes: dict[str, Any]
 
 
-def _iter_geojson_features(path: Path) -> Iterator[dict[str, Any]]:
-    decoder = json.JSONDecoder()
-    buffer = ""
-    inside_features = False
-    with path.open("r", encoding="utf-8") as handle:
-        while True:
-            chunk = handle.read(131072)
-            if not chunk:
-                break
-            buffer += chunk
-            if not inside_features:
-                marker_index = buffer.find('"features"')
-                if marker_index == -1:
-                    buffer = buffer[-32_768:]
-                    continue
-                buffer = buffer[marker_index:]
-                bracket_index = buffer.find("[")
-                if bracket_index == -1:
-                    continue
-                buffer = buffer[bracket_index + 1 :]
-                inside_features = True
-
-            while inside_features:
-                buffer = buffer.lstrip()
-                if not buffer:
-                    break
-                leading = buffer[0]
-                if leading == ",":
-                    buffer = buffer[1:]
-                    continue
-                if leading == "]":
-                    inside_features = False
-                    buffer = buffer[1:]
-                    break
-                try:
-                    feature, offset = decoder.raw_decode(buffer)
-                except json.JSONDecodeError:
-                    break
-                if isinstance(feature, dict):
-                    yield feature
-                buffer = buffer[offset:]
-
-    if inside_features:
-        raise RuntimeError(f"Unexpected EOF before completing features array in {path}")
-
-
 async def _download_master_plan_geojson(output_path: Path) -> Path:
     output_path.parent.mkdir(parents=True, exist_ok=True)
     async with httpx.AsyncClient(timeout=180.0, follow_redirects=True) as client:
@@ -264,20 +211,18 @@ async def _persist_zone_records(
                     RefZoningLayer.layer_name == layer_name,
                 )
             )
-        has_geometry_column = getattr(RefZoningLayer, "geometry", None) is not None
-        payloads: list[dict[str, Any]] = []
-        for record in records:
-            payload: dict[str, Any] = {
+        rows = [
+            {
                 "jurisdiction": "SG",
                 "layer_name": layer_name,
                 "zone_code": record.zone_code,
                 "attributes": record.attributes,
                 "bounds_json": record.geometry_feature,
+                "geometry": record.shapely_geometry,
             }
-            if has_geometry_column and from_shape is not None:
-                payload["geometry"] = from_shape(record.shapely_geometry, srid=4326)
-            payloads.append(payload)
-        await session.execute(RefZoningLayer.__table__.insert(), payloads)
+            for record in records
+        ]
+        await BulkLoader(RefZoningLayer.__table__).load(session, rows)
         await session.commit()
     return len(records)
 
@@ -289,7 +234,7 @@ async def ingest_sg_zones(options: SGZoneIngestionOptions) -> dict[str, Any]:
 
     records: list[SGZoneRecord] = []
     skipped = 0
-    for index, feature in enumerate(_iter_geojson_features(input_path)):
+    for index, feature in enumerate(iter_geojson_features(input_path)):
         if options.max_features is not None and index >= options.max_features:
             break
         try:
@@ -30,7 +30,7 @@ import json
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterator, Optional, Sequence, Tuple
+from typing import Any, Optional, Sequence, Tuple
 
 import httpx
 import structlog
@@ -44,11 +44,7 @@ import app.utils.logging  # noqa: F401  pylint: disable=unused-import
 from app.core.database import AsyncSessionLocal
 from app.models.rkp import RefZoningLayer
 
-try:  # pragma: no cover
-    from geoalchemy2.shape import from_shape
-except ModuleNotFoundError:  # pragma: no cover
-    from_shape = None  # type: ignore
-
+from .ingest_engine import BulkLoader
 
 logger = structlog.get_logger(__name__)
 
@@ -76,52 +72,6 @@ class ZoneRecord:
     attributes: dict[str, Any]
 
 
-def _iter_geojson_features(path: Path) -> Iterator[dict[str, Any]]:
-    decoder = json.JSONDecoder()
-    buffer = ""
-    inside_features = False
-    with path.open("r", encoding="utf-8") as handle:
-        while True:
-            chunk = handle.read(131072)
-            if not chunk:
-                break
-            buffer += chunk
-            if not inside_features:
-                marker_index = buffer.find('"features"')
-                if marker_index == -1:
-                    buffer = buffer[-32_768:]
-                    continue
-                buffer = buffer[marker_index:]
-                bracket_index = buffer.find("[")
-                if bracket_index == -1:
-                    continue
-                buffer = buffer[bracket_index + 1 :]
-                inside_features = True
-
-            while inside_features:
-                buffer = buffer.lstrip()
-                if not buffer:
-                    break
-                leading = buffer[0]
-                if leading == ",":
-                    buffer = buffer[1:]
-                    continue
-                if leading == "]":
-                    inside_features = False
-                    buffer = buffer[1:]
-                    break
-                try:
-                    feature, offset = decoder.raw_decode(buffer)
-                except json.JSONDecodeError:
-                    break
-                if isinstance(feature, dict):
-                    yield feature
-                buffer = buffer[offset:]
-
-    if inside_features:
-        raise RuntimeError(f"Unexpected EOF before completing features array in {path}")
-
-
 def _extract_declared_crs_name(geojson: dict[str, Any]) -> Optional[str]:
     crs_block = geojson.get("crs")
     if not isinstance(crs_block, dict):
@@ -307,21 +257,18 @@ async def _persist_zone_records(
                 )
             )
 
-        has_geometry_column = getattr(RefZoningLayer, "geometry", None) is not None
-        payloads: list[dict[str, Any]] = []
-        for record in records:
-            payload: dict[str, Any] = {
+        rows = [
+            {
                 "jurisdiction": jurisdiction,
                 "layer_name": layer_name,
                 "zone_code": record.zone_code,
                 "attributes": record.attributes,
                 "bounds_json": record.geometry_feature,
+                "geometry": record.shapely_geometry,
             }
-            if has_geometry_column and from_shape is not None:
-                payload["geometry"] = from_shape(record.shapely_geometry, srid=4326)
-            payloads.append(payload)
-
-        await session.execute(RefZoningLayer.__table__.insert(), payloads)
+            for record in records
+        ]
+        await BulkLoader(RefZoningLayer.__table__).load(session, rows)
         await session.commit()
 
     return len(records)
@@ -6,44 +6,18 @@ import argparse
 import asyncio
 import shutil
 from pathlib import Path
-from typing import Iterable
 from uuid import UUID
 
 import structlog
-from backend._compat.datetime import utcnow
-from sqlalchemy import select
 
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
-from app.models.preview import PreviewJob, PreviewJobStatus
 from app.services.preview_generator import PREVIEW_STORAGE_DIR
+from app.services.preview_jobs import expire_preview_versions
 
 logger = structlog.get_logger(__name__)
 
 
-async def _expire_versions(
-    session,
-    property_id: UUID,
-    versions: Iterable[str],
-) -> int:
-    stmt = (
-        select(PreviewJob)
-        .where(PreviewJob.property_id == property_id)
-        .where(PreviewJob.asset_version.in_(list(versions)))
-    )
-    result = await session.execute(stmt)
-    jobs = result.scalars().all()
-    for job in jobs:
-        if job.status != PreviewJobStatus.EXPIRED:
-            job.status = PreviewJobStatus.EXPIRED
-            if not job.finished_at:
-                job.finished_at = utcnow()
-            job.message = job.message or "Preview assets pruned"
-    if jobs:
-        await session.flush()
-    return len(jobs)
-
-
 async def cleanup(max_versions: int) -> None:
     base_dir = Path(PREVIEW_STORAGE_DIR)
     if not base_dir.exists():
@@ -58,12 +32,16 @@ async def cleanup(max_versions: int) -> None:
             if not property_path.is_dir():
                 continue
             version_dirs = [
-                entry for entry in property_path.iterdir() if entry.is_dir()
+                entry
+                for entry in property_path.iterdir()
+                if entry.is_dir() and not entry.name.startswith(".")
             ]
             if len(version_dirs) <= max_versions:
                 continue
 
-            version_dirs.sort(key=lambda p: p.name, reverse=True)
+            # Content-addressed versions are touched on reuse, so recency of
+            # use (mtime) rather than the directory name decides what stays.
+            version_dirs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
             keep = version_dirs[:max_versions]
             prune = version_dirs[max_versions:]
 
@@ -87,7 +65,7 @@ async def cleanup(max_versions: int) -> None:
                 )
                 continue
 
-            expired_jobs += await _expire_versions(
+            expired_jobs += await expire_preview_versions(
                 session,
                 property_uuid,
                 [path.name for path in prune],
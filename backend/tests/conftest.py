@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import importlib
 import importlib.util
+import os
 import sys
 import uuid
 from collections.abc import AsyncGenerator, Callable, Iterator
@@ -802,6 +803,39 @@ else:
         pytest.skip("SQLAlchemy is unavailable in the current test environment")
 
 
+@pytest.fixture(scope="session", autouse=True)  # type: ignore[misc]
+def _isolated_local_storage(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[None]:
+    """Keep local storage writes (uploads, caches, previews) out of the repo."""
+
+    from app.services import preview_generator
+
+    patcher = pytest.MonkeyPatch()
+    preview_dir = tmp_path_factory.mktemp("dev-previews")
+    # The variable reaches spawned render workers; the attributes cover this
+    # process, which imported the module already.
+    patcher.setenv("PREVIEW_STORAGE_PATH", str(preview_dir))
+    patcher.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    patcher.setattr(preview_generator, "PREVIEW_STORAGE_DIR", preview_dir)
+    if os.environ.get("STORAGE_LOCAL_PATH"):
+        try:
+            yield
+        finally:
+            patcher.undo()
+        return
+
+    from app.services.storage import reset_storage_service
+
+    patcher.setenv("STORAGE_LOCAL_PATH", str(tmp_path_factory.mktemp("storage")))
+    reset_storage_service()
+    try:
+        yield
+    finally:
+        patcher.undo()
+        reset_storage_service()
+
+
 @pytest.fixture(autouse=True)  # type: ignore[misc]
 def reset_metrics() -> Iterator[None]:
     """Reset application metrics before and after every test."""
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+
+from app.flows import anomaly
+from app.services.ai.anomaly_detector import RuleRun
+
+
+@pytest.mark.asyncio
+async def test_anomaly_detection_flow_summarises_rule_runs(monkeypatch):
+    captured = {}
+
+    class StubService:
+        async def run_scheduled_cycle(self, session_factory, concurrency):
+            captured["session_factory"] = session_factory
+            captured["concurrency"] = concurrency
+            return [
+                RuleRun(rule="a", alerts=3, resolved=1),
+                RuleRun(rule="b", users_checked=0),
+                RuleRun(rule="c", error="boom"),
+            ]
+
+    monkeypatch.setattr(anomaly, "AnomalyDetectionService", lambda: StubService())
+
+    result = await anomaly.anomaly_detection_flow(concurrency=2)
+
+    assert result == {"rules": 3, "alerts": 3, "resolved": 1, "failed": 1}
+    assert captured == {
+        "session_factory": anomaly.AsyncSessionLocal,
+        "concurrency": 2,
+    }
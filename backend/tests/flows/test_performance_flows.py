@@ -36,9 +36,10 @@ async def test_agent_performance_snapshots_flow_invokes_service(monkeypatch):
     captured = {}
 
     class StubService:
-        async def generate_daily_snapshots(self, session, as_of, agent_ids):
+        async def generate_daily_snapshots(self, session, as_of, agent_ids, bulk):
             captured["as_of"] = as_of
             captured["agent_ids"] = agent_ids
+            captured["bulk"] = bulk
             return [1, 2, 3]
 
     monkeypatch.setattr(performance, "AgentPerformanceService", lambda: StubService())
@@ -50,6 +51,7 @@ async def test_agent_performance_snapshots_flow_invokes_service(monkeypatch):
     assert future["snapshots"] == 3
     assert captured["as_of"] == date(2024, 2, 1)
     assert len(captured["agent_ids"]) == 1
+    assert captured["bulk"] is True
 
 
 @pytest.mark.asyncio
@@ -240,3 +240,27 @@ async def test_all_agent_ids_filters_invalid():
     session.execute_results.append(DummyResult([], [str(valid), "not-a-uuid", " "]))
     ids = await service._all_agent_ids(session)
     assert ids == [valid]
+
+
+@pytest.mark.asyncio
+async def test_roi_cache_computes_each_project_once(monkeypatch):
+    from app.services.deals import performance as performance_module
+
+    service = AgentPerformanceService()
+    session = FakeAsyncSession()
+    compute = AsyncMock(
+        side_effect=[SimpleNamespace(as_dict=lambda: {"project_id": 7}), RuntimeError]
+    )
+    monkeypatch.setattr(performance_module, "compute_project_roi", compute)
+    cache: dict = {}
+
+    for _ in range(2):
+        metrics = await service._roi_metrics_from_metadata(
+            session=session,
+            metadata_items=[{"roi_project_id": 7}, {"overlay_project_id": "8"}],
+            roi_cache=cache,
+        )
+        assert [project["project_id"] for project in metrics["projects"]] == [7]
+
+    assert [call.kwargs["project_id"] for call in compute.await_args_list] == [7, 8]
+    assert cache[8] is None
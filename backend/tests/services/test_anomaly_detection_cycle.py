@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+
+from backend._compat.datetime import utcnow
+from app.models.anomaly import AnomalyAlertRecord, AnomalyRuleWatermark
+from app.models.business_performance import AgentDeal, DealAssetType, DealType
+from app.models.property import MarketTransaction, Property, PropertyType
+from app.models.users import User
+from app.services.ai.anomaly_detector import AlertCategory, AnomalyDetectionService
+from app.services.deals import AgentDealService
+
+
+async def _seed(session) -> dict[str, AgentDeal]:
+    tower = Property(
+        name="Anomaly Tower",
+        address="1 Anomaly Road",
+        property_type=PropertyType.OFFICE,
+        location="POINT(103.85 1.28)",
+        district="D01",
+        data_source="test",
+    )
+    session.add(tower)
+    await session.flush()
+    session.add(
+        MarketTransaction(
+            property_id=tower.id,
+            transaction_date=date.today(),
+            sale_price=2_000_000,
+            psf_price=2000,
+            data_source="test",
+        )
+    )
+
+    deals: dict[str, AgentDeal] = {}
+    service = AgentDealService()
+    for name, assumed_psf in (("alice", 3000), ("bob", 2900)):
+        agent_id = uuid4()
+        session.add(
+            User(
+                id=str(agent_id),
+                email=f"{name}@example.com",
+                username=name,
+                full_name=name.title(),
+                hashed_password="secret",
+            )
+        )
+        await session.commit()
+        deals[name] = await service.create_deal(
+            session=session,
+            agent_id=agent_id,
+            title=f"{name.title()} Office",
+            asset_type=DealAssetType.OFFICE,
+            deal_type=DealType.BUY_SIDE,
+            metadata={"assumed_psf": assumed_psf, "target_psf": assumed_psf},
+        )
+    return deals
+
+
+async def _alert_keys(session) -> set[str]:
+    rows = await session.execute(select(AnomalyAlertRecord.alert_key))
+    return set(rows.scalars())
+
+
+@pytest.mark.asyncio
+async def test_scheduled_cycle_persists_alerts_for_every_user(async_session_factory):
+    async with async_session_factory() as session:
+        deals = await _seed(session)
+    alice, bob = deals["alice"], deals["bob"]
+    service = AnomalyDetectionService()
+
+    runs = await service.run_scheduled_cycle(async_session_factory)
+
+    assert {run.rule: run.alerts for run in runs} == {
+        "assumption_vs_market": 2,
+        "pipeline_velocity": 0,
+        "regulatory_delay": 0,
+        "comparable_transaction": 2,
+        "cash_flow_deviation": 0,
+    }
+    assert all(run.error is None and run.users_checked is None for run in runs)
+
+    async with async_session_factory() as session:
+        alerts = await service.get_alerts_for_user(session, str(alice.agent_id))
+        live = await service.run_detection_cycle(session, str(alice.agent_id))
+        market = await service.get_alerts_for_user(
+            session, str(bob.agent_id), category=AlertCategory.MARKET
+        )
+        watermarks = (await session.execute(select(AnomalyRuleWatermark))).scalars()
+
+    assert {alert.id for alert in alerts} == {alert.id for alert in live}
+    assert {alert.entity_type for alert in alerts} == {"deal", "transaction"}
+    assert all(alert.user_id == str(alice.agent_id) for alert in alerts)
+    assert {alert.data.get("deal_id", "") for alert in market} == {"", str(bob.id)}
+    assert len(list(watermarks)) == len(service.rules)
+
+
+@pytest.mark.asyncio
+async def test_cycle_only_rechecks_users_changed_since_watermark(
+    async_session_factory,
+):
+    async with async_session_factory() as session:
+        deals = await _seed(session)
+    alice, bob = deals["alice"], deals["bob"]
+    service = AnomalyDetectionService()
+    await service.run_scheduled_cycle(async_session_factory)
+
+    earlier = utcnow() - timedelta(days=1)
+    async with async_session_factory() as session:
+        await session.execute(update(AnomalyRuleWatermark).values(checked_at=earlier))
+        await session.execute(
+            update(AgentDeal).values(updated_at=earlier - timedelta(days=1))
+        )
+        await session.execute(
+            update(MarketTransaction).values(synced_at=earlier - timedelta(days=1))
+        )
+        await session.execute(
+            update(AnomalyAlertRecord)
+            .where(AnomalyAlertRecord.user_id == str(bob.agent_id))
+            .values(acknowledged=True)
+        )
+        await session.commit()
+
+        deal = await session.get(AgentDeal, alice.id)
+        deal.metadata_json = {"assumed_psf": 2000, "target_psf": 2000}
+        await session.commit()
+
+    runs = {
+        run.rule: run
+        for run in await service.run_scheduled_cycle(async_session_factory)
+    }
+
+    assumption = runs["assumption_vs_market"]
+    assert (assumption.users_checked, assumption.alerts, assumption.resolved) == (
+        1,
+        0,
+        1,
+    )
+    assert runs["comparable_transaction"].resolved == 1
+    assert runs["regulatory_delay"].users_checked is None
+
+    async with async_session_factory() as session:
+        assert await service.get_alerts_for_user(session, str(alice.agent_id)) == []
+        bob_alerts = await service.get_alerts_for_user(session, str(bob.agent_id))
+        keys = await _alert_keys(session)
+
+    assert len(bob_alerts) == 2
+    assert all(alert.acknowledged for alert in bob_alerts)
+    assert keys == {alert.id for alert in bob_alerts}
+
+
+@pytest.mark.asyncio
+async def test_cycle_rechecks_deals_stamped_just_before_watermark(
+    async_session_factory,
+):
+    async with async_session_factory() as session:
+        deals = await _seed(session)
+    alice = deals["alice"]
+    service = AnomalyDetectionService()
+    await service.run_scheduled_cycle(async_session_factory)
+
+    async with async_session_factory() as session:
+        watermark = await session.get(AnomalyRuleWatermark, "assumption_vs_market")
+        checked_at = watermark.checked_at
+        await session.execute(
+            update(MarketTransaction).values(synced_at=utcnow() - timedelta(days=2))
+        )
+        # Stamped when its transaction started, committed only after the run.
+        await session.execute(
+            update(AgentDeal)
+            .where(AgentDeal.id == alice.id)
+            .values(
+                metadata_json={"assumed_psf": 2000, "target_psf": 2000},
+                updated_at=checked_at - timedelta(minutes=5),
+            )
+        )
+        await session.execute(
+            update(AgentDeal)
+            .where(AgentDeal.id != alice.id)
+            .values(updated_at=utcnow() - timedelta(days=2))
+        )
+        await session.commit()
+
+    runs = {
+        run.rule: run
+        for run in await service.run_scheduled_cycle(async_session_factory)
+    }
+
+    assumption = runs["assumption_vs_market"]
+    assert (assumption.users_checked, assumption.resolved) == (1, 1)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.models.business_performance import (
+    AgentDealFeature,
+    DealAssetType,
+    DealStatus,
+    DealType,
+    PipelineStage,
+)
+from app.models.property import Property, PropertyType
+from app.models.users import User
+from app.services.ai.deal_scoring import DealScoringService
+from app.services.deals import AgentDealService
+from app.services.deals.features import load_agent_features
+
+
+async def _seed(session):
+    agent_id = uuid4()
+    session.add(
+        User(
+            id=str(agent_id),
+            email="scoring-agent@example.com",
+            username="scoring_agent",
+            full_name="Scoring Agent",
+            hashed_password="secret",
+        )
+    )
+    tower = Property(
+        name="Scoring Tower",
+        address="1 Scoring Road",
+        property_type=PropertyType.OFFICE,
+        location="POINT(103.85 1.28)",
+        district="D01",
+        data_source="test",
+    )
+    session.add(tower)
+    await session.commit()
+
+    deals = AgentDealService()
+    for index, stage in enumerate(
+        [PipelineStage.CLOSED_WON] * 4 + [PipelineStage.CLOSED_LOST]
+    ):
+        closed = await deals.create_deal(
+            session=session,
+            agent_id=agent_id,
+            title=f"Closed {index}",
+            asset_type=DealAssetType.OFFICE,
+            deal_type=DealType.BUY_SIDE,
+            property_id=tower.id,
+        )
+        await deals.change_stage(
+            session=session, deal=closed, to_stage=stage, changed_by=agent_id
+        )
+
+    open_deals = [
+        await deals.create_deal(
+            session=session,
+            agent_id=agent_id,
+            title=f"Open {index}",
+            asset_type=DealAssetType.OFFICE,
+            deal_type=DealType.BUY_SIDE,
+            property_id=tower.id if index == 0 else None,
+            metadata={"competition_level": "low"},
+        )
+        for index in range(2)
+    ]
+    return agent_id, open_deals
+
+
+@pytest.mark.asyncio
+async def test_stage_changes_refresh_agent_features(session):
+    agent_id, _ = await _seed(session)
+
+    rows = (await session.execute(select(AgentDealFeature))).scalars().all()
+    assert [(row.location, row.won_count, row.lost_count) for row in rows] == [
+        ("D01", 4, 1)
+    ]
+    features = await load_agent_features(session, agent_id)
+    assert features.wins_in("D01") == 4
+    assert features.record(DealAssetType.OFFICE, DealType.BUY_SIDE) == (4, 1)
+
+
+@pytest.mark.asyncio
+async def test_creating_closed_deal_refreshes_agent_features(session):
+    agent_id = uuid4()
+    session.add(
+        User(
+            id=str(agent_id),
+            email="closed-agent@example.com",
+            username="closed_agent",
+            full_name="Closed Agent",
+            hashed_password="secret",
+        )
+    )
+    await session.commit()
+
+    await AgentDealService().create_deal(
+        session=session,
+        agent_id=agent_id,
+        title="Imported win",
+        asset_type=DealAssetType.RETAIL,
+        deal_type=DealType.SELL_SIDE,
+        pipeline_stage=PipelineStage.CLOSED_WON,
+        status=DealStatus.CLOSED_WON,
+    )
+
+    features = await load_agent_features(session, agent_id)
+    assert features.record(DealAssetType.RETAIL, DealType.SELL_SIDE) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_score_deals_matches_single_deal_scoring(session):
+    agent_id, open_deals = await _seed(session)
+    service = DealScoringService()
+    missing = str(uuid4())
+    deal_ids = [str(deal.id) for deal in open_deals] + [missing]
+
+    scores = await service.score_deals(deal_ids, session, str(agent_id))
+
+    assert set(scores) == set(deal_ids[:2])
+    located = scores[deal_ids[0]]
+    factors = {f.name: f for f in located.positive_factors}
+    assert factors["Location Match"].evidence == "4 historical wins"
+    assert factors["Historical Success"].evidence == "4 wins / 5 total"
+    assert "Location Match" not in {
+        f.name for f in scores[deal_ids[1]].positive_factors
+    }
+    assert len(located.comparable_deals) == 5
+    assert deal_ids[0] not in {deal["id"] for deal in located.comparable_deals}
+
+    single = await service.score_deal(deal_ids[0], session, str(agent_id))
+    assert single.score == located.score
+    assert single.recommendation == located.recommendation
+    not_found = await service.score_deal(missing, session, str(agent_id))
+    assert not_found.recommendation == "Deal not found"
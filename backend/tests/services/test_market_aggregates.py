@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import statistics
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.property import MarketTransaction, Property, PropertyType
+from app.services.agents import market_aggregates
+from app.services.agents.market_aggregates import (
+    transaction_aggregates,
+    transaction_filters,
+)
+
+PERIOD = (date(2023, 1, 1), date(2024, 12, 31))
+
+# (transaction_date, sale_price, psf_price)
+TRANSACTIONS = [
+    (date(2023, 2, 1), 1_000_000, 2000),
+    (date(2023, 3, 15), 2_000_000, 2200),
+    (date(2023, 8, 1), 1_500_000, None),
+    (date(2024, 1, 20), 3_000_000, 2640),
+    (date(2024, 3, 1), 1_200_000, 0),
+    (date(2025, 1, 1), 9_000_000, 9000),  # outside the period
+]
+
+
+async def _seed(session) -> None:
+    tower = Property(
+        name="Aggregate Tower",
+        address="1 Aggregate Road",
+        property_type=PropertyType.OFFICE,
+        location="POINT(103.85 1.28)",
+        district="D01",
+        data_source="test",
+    )
+    session.add(tower)
+    await session.flush()
+    session.add_all(
+        MarketTransaction(
+            property_id=tower.id,
+            transaction_date=when,
+            sale_price=price,
+            psf_price=psf,
+            data_source="test",
+        )
+        for when, price, psf in TRANSACTIONS
+    )
+    await session.flush()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_numpy", [True, False])
+async def test_columnar_aggregates_match_python_statistics(
+    session, monkeypatch, with_numpy
+):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(market_aggregates, "np", None)
+    await _seed(session)
+
+    aggregates = await transaction_aggregates(
+        session, transaction_filters(PropertyType.OFFICE, "D01", PERIOD)
+    )
+
+    psf = [2000.0, 2200.0, 2640.0]
+    assert aggregates.count == 5
+    assert aggregates.psf_count == 3
+    assert aggregates.total_volume == 8_700_000
+    assert aggregates.average_psf == pytest.approx(statistics.mean(psf))
+    assert aggregates.median_psf == statistics.median(psf)
+    assert (aggregates.min_psf, aggregates.max_psf) == (2000.0, 2640.0)
+    assert list(aggregates.quarterly) == ["2023-Q1", "2023-Q3", "2024-Q1"]
+    assert aggregates.quarterly["2023-Q1"]["avg_psf"] == 2100.0
+    assert aggregates.quarterly["2023-Q3"] == {
+        "count": 1,
+        "total_volume": 1_500_000.0,
+        "avg_psf": 0,
+    }
+    assert aggregates.quarterly["2024-Q1"]["count"] == 2
+    assert aggregates.quarterly["2024-Q1"]["yoy_psf_change_pct"] == pytest.approx(
+        (2640 - 2100) / 2100 * 100
+    )
+
+
+@pytest.mark.asyncio
+async def test_aggregates_for_empty_selection(session):
+    await _seed(session)
+
+    aggregates = await transaction_aggregates(
+        session, transaction_filters(PropertyType.RETAIL, "all", PERIOD)
+    )
+
+    assert aggregates.count == 0
+    assert aggregates.quarterly == {}
+
+
+class _PostgresSession:
+    """Records statements and answers with pre-aggregated rows."""
+
+    def __init__(self, results):
+        self.statements: list[str] = []
+        self._results = list(results)
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=postgresql.dialect())
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return self._results.pop(0)
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_postgres_path_aggregates_in_sql():
+    session = _PostgresSession(
+        [
+            SimpleNamespace(
+                one=lambda: (3, 4_500_000, 2100.0, 2100.0, 2000.0, 2200.0, 3)
+            ),
+            [(2023, 1, 2, 3_000_000, 2100.0), (2024, 1, 1, 1_500_000, 2310.0)],
+        ]
+    )
+
+    aggregates = await transaction_aggregates(
+        session, transaction_filters(PropertyType.OFFICE, "all", PERIOD)
+    )
+
+    assert "percentile_cont" in session.statements[0]
+    assert "WITHIN GROUP" in session.statements[0]
+    assert "GROUP BY" in session.statements[1]
+    assert aggregates.count == 3
+    assert aggregates.median_psf == 2100.0
+    assert list(aggregates.quarterly) == ["2023-Q1", "2024-Q1"]
+    assert aggregates.quarterly["2024-Q1"]["yoy_psf_change_pct"] == pytest.approx(10)
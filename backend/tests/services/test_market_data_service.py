@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import random
+from contextlib import asynccontextmanager
 from datetime import date, datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
@@ -29,33 +29,14 @@ class RecordingSession:
             scalar_one_or_none=lambda: None,
         )
 
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield self
+
     async def commit(self):
         self.commits += 1
 
 
-class _Result:
-    def __init__(self, record):
-        self._record = record
-
-    def scalar_one_or_none(self):
-        return self._record
-
-
-class PropertySession:
-    def __init__(self, results: list[_Result]):
-        self.results = results
-        self.executed: list[object] = []
-
-    async def execute(self, stmt):
-        self.executed.append(stmt)
-        if self.results:
-            return self.results.pop(0)
-        return SimpleNamespace(
-            scalars=lambda: SimpleNamespace(all=lambda: []),
-            scalar_one_or_none=lambda: None,
-        )
-
-
 @pytest.mark.asyncio
 async def test_mock_provider_generates_transactions_and_rentals():
     provider = MockMarketDataProvider()
@@ -76,7 +57,9 @@ async def test_store_transactions_converts_payload(monkeypatch):
     service = MarketDataService()
     session = RecordingSession()
     monkeypatch.setattr(
-        service, "_get_or_create_property", AsyncMock(return_value="prop-1")
+        service,
+        "_resolve_property_ids",
+        AsyncMock(return_value={"Unknown Property": "prop-1"}),
     )
 
     payload = [
@@ -97,7 +80,9 @@ async def test_store_rentals_upserts_records(monkeypatch):
     service = MarketDataService()
     session = RecordingSession()
     monkeypatch.setattr(
-        service, "_get_or_create_property", AsyncMock(return_value="prop-2")
+        service,
+        "_resolve_property_ids",
+        AsyncMock(return_value={"Unknown Property": "prop-2"}),
     )
 
     payload = [
@@ -145,36 +130,6 @@ def test_register_provider_and_sync_dates():
     assert service._get_last_sync_date("custom") == today
 
 
-@pytest.mark.asyncio
-async def test_get_or_create_property_returns_existing():
-    service = MarketDataService()
-    session = PropertySession(results=[_Result(SimpleNamespace(id="prop-existing"))])
-
-    prop_id = await service._get_or_create_property(
-        {"property_name": "Existing Tower"}, session
-    )
-    assert prop_id == "prop-existing"
-    assert len(session.executed) == 1
-
-
-@pytest.mark.asyncio
-async def test_get_or_create_property_creates_new(monkeypatch):
-    service = MarketDataService()
-    session = PropertySession(results=[_Result(None)])
-
-    monkeypatch.setattr(random, "uniform", lambda *args, **kwargs: 0)
-    payload = {
-        "property_name": "New Plaza",
-        "floor_area_sqm": "1200",
-        "property_type": "office",
-        "district": "D01",
-    }
-
-    prop_id = await service._get_or_create_property(payload, session)
-    assert prop_id
-    assert len(session.executed) >= 2  # select + insert
-
-
 class _AsyncSessionStub:
     def __init__(self):
         self.commits = 0
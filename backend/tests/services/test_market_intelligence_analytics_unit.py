@@ -6,7 +6,9 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from app.models.property import PropertyType
+from app.models.market import AbsorptionTracking
+from app.models.property import MarketTransaction, Property, PropertyType
+from app.services.agents import market_intelligence_analytics
 from app.services.agents.market_intelligence_analytics import (
     MarketIntelligenceAnalytics,
     MarketReport,
@@ -219,17 +221,31 @@ class _SessionStub:
 
 
 @pytest.mark.asyncio
-async def test_analyze_comparables_summarises_transactions():
+async def test_analyze_comparables_summarises_transactions(session):
     analytics = MarketIntelligenceAnalytics.__new__(MarketIntelligenceAnalytics)
     analytics.metrics = None
-    txn = SimpleNamespace(
-        transaction_date=date(2024, 1, 10),
-        sale_price=5_000_000,
-        psf_price=2500.0,
-        property=SimpleNamespace(name="Alpha Tower"),
-        buyer_type="REIT",
+    tower = Property(
+        name="Alpha Tower",
+        address="1 Alpha Road",
+        property_type=PropertyType.OFFICE,
+        location="POINT(103.85 1.28)",
+        district="D01",
+        data_source="test",
+    )
+    session.add(tower)
+    await session.flush()
+    session.add(
+        MarketTransaction(
+            property_id=tower.id,
+            transaction_date=date(2024, 1, 10),
+            sale_price=5_000_000,
+            psf_price=2500.0,
+            buyer_type="REIT",
+            data_source="test",
+        )
     )
-    session = _SessionStub([[txn]])
+    await session.flush()
+
     result = await analytics._analyze_comparables(
         PropertyType.OFFICE,
         location="D01",
@@ -238,6 +254,8 @@ async def test_analyze_comparables_summarises_transactions():
     )
     assert result["transaction_count"] == 1
     assert result["average_psf"] == 2500.0
+    assert result["top_transactions"][0]["property_name"] == "Alpha Tower"
+    assert result["buyer_profile"] == {"REIT": 1}
 
 
 @pytest.mark.asyncio
@@ -291,3 +309,45 @@ async def test_analyze_yield_benchmarks_derives_trends():
     )
     assert "current_metrics" in result
     assert result["current_metrics"]["cap_rate"]["median"] > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_numpy", [True, False])
+async def test_analyze_absorption_trends_reads_columns(
+    session, monkeypatch, with_numpy
+):
+    if with_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(market_intelligence_analytics, "np", None)
+    analytics = MarketIntelligenceAnalytics.__new__(MarketIntelligenceAnalytics)
+    analytics.metrics = None
+    session.add_all(
+        AbsorptionTracking(
+            project_name="Harbor Residences",
+            tracking_date=date(2024, month, 1),
+            district="D02",
+            property_type=PropertyType.RESIDENTIAL,
+            sales_absorption_rate=10 * month,
+            leasing_absorption_rate=5,
+            avg_units_per_month=month,
+            avg_days_to_sale=30,
+        )
+        for month in range(1, 5)
+    )
+    await session.flush()
+
+    result = await analytics._analyze_absorption_trends(
+        PropertyType.RESIDENTIAL,
+        location="D02",
+        period=(date(2024, 1, 1), date(2024, 12, 31)),
+        session=session,
+    )
+
+    assert result["current_metrics"]["sales_absorption_rate"] == 40.0
+    assert result["current_metrics"]["avg_days_to_sale"] == 30
+    assert result["period_averages"] == {
+        "avg_sales_absorption": 25.0,
+        "avg_leasing_absorption": 5.0,
+    }
+    assert result["velocity_trend"] == "accelerating"
@@ -21,85 +21,6 @@ def analytics():
     return instance
 
 
-def _make_transaction(**overrides):
-    """Create a mock transaction."""
-    defaults = {
-        "transaction_date": date(2024, 3, 15),
-        "sale_price": 5_000_000,
-        "psf_price": 2500.0,
-        "property": SimpleNamespace(name="Alpha Tower"),
-        "buyer_type": "REIT",
-    }
-    defaults.update(overrides)
-    return SimpleNamespace(**defaults)
-
-
-# -----------------------------------------------------------
-# _group_by_quarter tests
-# -----------------------------------------------------------
-
-
-def test_group_by_quarter_groups_correctly(analytics):
-    """Test transactions are correctly grouped into quarters."""
-    transactions = [
-        _make_transaction(
-            transaction_date=date(2024, 1, 15), sale_price=1_000_000, psf_price=1000.0
-        ),
-        _make_transaction(
-            transaction_date=date(2024, 2, 10), sale_price=2_000_000, psf_price=2000.0
-        ),
-        _make_transaction(
-            transaction_date=date(2024, 4, 20), sale_price=3_000_000, psf_price=3000.0
-        ),
-        _make_transaction(
-            transaction_date=date(2024, 7, 5), sale_price=4_000_000, psf_price=4000.0
-        ),
-    ]
-
-    result = analytics._group_by_quarter(transactions)
-
-    assert "2024-Q1" in result
-    assert "2024-Q2" in result
-    assert "2024-Q3" in result
-    assert result["2024-Q1"]["count"] == 2
-    assert result["2024-Q2"]["count"] == 1
-    assert result["2024-Q3"]["count"] == 1
-
-
-def test_group_by_quarter_calculates_averages(analytics):
-    """Test average PSF is correctly calculated per quarter."""
-    transactions = [
-        _make_transaction(
-            transaction_date=date(2024, 1, 1), sale_price=1_000_000, psf_price=1000.0
-        ),
-        _make_transaction(
-            transaction_date=date(2024, 1, 15), sale_price=2_000_000, psf_price=2000.0
-        ),
-    ]
-
-    result = analytics._group_by_quarter(transactions)
-
-    assert result["2024-Q1"]["avg_psf"] == 1500.0
-    assert result["2024-Q1"]["total_volume"] == 3_000_000
-
-
-def test_group_by_quarter_handles_missing_psf(analytics):
-    """Test handling of transactions without PSF price."""
-    transactions = [
-        _make_transaction(transaction_date=date(2024, 1, 1), psf_price=None),
-    ]
-
-    result = analytics._group_by_quarter(transactions)
-
-    assert result["2024-Q1"]["avg_psf"] == 0
-
-
-def test_group_by_quarter_empty_list(analytics):
-    """Test with empty transaction list."""
-    result = analytics._group_by_quarter([])
-    assert result == {}
-
-
 # -----------------------------------------------------------
 # _calculate_price_trend tests
 # -----------------------------------------------------------
@@ -179,100 +100,6 @@ def test_calculate_price_trend_zero_older_avg(analytics):
     assert result == "upward"
 
 
-# -----------------------------------------------------------
-# _get_top_transactions tests
-# -----------------------------------------------------------
-
-
-def test_get_top_transactions_sorts_by_value(analytics):
-    """Test transactions are sorted by value descending."""
-    transactions = [
-        _make_transaction(sale_price=1_000_000),
-        _make_transaction(sale_price=5_000_000),
-        _make_transaction(sale_price=3_000_000),
-    ]
-
-    result = analytics._get_top_transactions(transactions, limit=3)
-
-    assert len(result) == 3
-    assert result[0]["price"] == 5_000_000
-    assert result[1]["price"] == 3_000_000
-    assert result[2]["price"] == 1_000_000
-
-
-def test_get_top_transactions_respects_limit(analytics):
-    """Test limit is respected."""
-    transactions = [_make_transaction(sale_price=i * 1_000_000) for i in range(10)]
-
-    result = analytics._get_top_transactions(transactions, limit=3)
-
-    assert len(result) == 3
-
-
-def test_get_top_transactions_handles_missing_property(analytics):
-    """Test handling of transaction without property."""
-    transactions = [_make_transaction(property=None)]
-
-    result = analytics._get_top_transactions(transactions, limit=1)
-
-    assert result[0]["property_name"] == "Unknown"
-
-
-def test_get_top_transactions_handles_missing_psf(analytics):
-    """Test handling of transaction without PSF price."""
-    transactions = [_make_transaction(psf_price=None)]
-
-    result = analytics._get_top_transactions(transactions, limit=1)
-
-    assert result[0]["psf"] is None
-
-
-def test_get_top_transactions_empty_list(analytics):
-    """Test with empty transaction list."""
-    result = analytics._get_top_transactions([], limit=5)
-    assert result == []
-
-
-# -----------------------------------------------------------
-# _analyze_buyer_profile tests
-# -----------------------------------------------------------
-
-
-def test_analyze_buyer_profile_counts_correctly(analytics):
-    """Test buyer type counting."""
-    transactions = [
-        _make_transaction(buyer_type="REIT"),
-        _make_transaction(buyer_type="REIT"),
-        _make_transaction(buyer_type="Private"),
-        _make_transaction(buyer_type="Institution"),
-    ]
-
-    result = analytics._analyze_buyer_profile(transactions)
-
-    assert result["REIT"] == 2
-    assert result["Private"] == 1
-    assert result["Institution"] == 1
-
-
-def test_analyze_buyer_profile_handles_missing_type(analytics):
-    """Test handling of missing buyer type."""
-    transactions = [
-        _make_transaction(buyer_type=None),
-        _make_transaction(buyer_type="REIT"),
-    ]
-
-    result = analytics._analyze_buyer_profile(transactions)
-
-    assert result["Unknown"] == 1
-    assert result["REIT"] == 1
-
-
-def test_analyze_buyer_profile_empty_list(analytics):
-    """Test with empty transaction list."""
-    result = analytics._analyze_buyer_profile([])
-    assert result == {}
-
-
 # -----------------------------------------------------------
 # _calculate_supply_pressure tests
 # -----------------------------------------------------------
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select, update
+
+from backend._compat.datetime import utcnow
+from app.models.market import MarketSegmentSnapshot
+from app.models.property import MarketTransaction, Property, PropertyType
+from app.services.agents.market_aggregates import (
+    transaction_aggregates,
+    transaction_filters,
+)
+from app.services.agents.market_snapshots import (
+    quarter_bounds,
+    refresh_segment,
+    refresh_segments,
+    snapshot_comparables,
+)
+
+PERIOD = (date(2023, 1, 1), date(2024, 3, 31))
+
+# (transaction_date, sale_price, psf_price, buyer_type)
+TRANSACTIONS = [
+    (date(2023, 2, 1), 1_000_000, 2000, "REIT"),
+    (date(2023, 3, 15), 2_000_000, 2200, "Fund"),
+    (date(2023, 8, 1), 1_500_000, None, None),
+    (date(2024, 1, 20), 3_000_000, 2640, "REIT"),
+]
+
+
+async def _seed(session, transactions=TRANSACTIONS) -> Property:
+    tower = Property(
+        name="Snapshot Tower",
+        address="1 Snapshot Road",
+        property_type=PropertyType.OFFICE,
+        location="POINT(103.85 1.28)",
+        district="D01",
+        data_source="test",
+    )
+    session.add(tower)
+    await session.flush()
+    _add_transactions(session, tower, transactions)
+    await session.commit()
+    return tower
+
+
+def _add_transactions(session, tower, transactions) -> None:
+    session.add_all(
+        MarketTransaction(
+            property_id=tower.id,
+            transaction_date=when,
+            sale_price=price,
+            psf_price=psf,
+            buyer_type=buyer,
+            data_source="test",
+        )
+        for when, price, psf, buyer in transactions
+    )
+
+
+async def _snapshots(session) -> dict[date, MarketSegmentSnapshot]:
+    rows = (await session.execute(select(MarketSegmentSnapshot))).scalars().all()
+    return {row.quarter_start: row for row in rows}
+
+
+def test_quarter_bounds_cover_calendar_quarters():
+    assert quarter_bounds((2024, 1)) == (date(2024, 1, 1), date(2024, 3, 31))
+    assert quarter_bounds((2024, 4)) == (date(2024, 10, 1), date(2024, 12, 31))
+
+
+@pytest.mark.asyncio
+async def test_first_refresh_materialises_every_quarter(session):
+    await _seed(session)
+
+    result = await refresh_segment(session, PropertyType.OFFICE, "D01")
+
+    assert result.quarters == [(2023, 1), (2023, 3), (2024, 1)]
+    snapshots = await _snapshots(session)
+    first = snapshots[date(2023, 1, 1)]
+    assert first.transaction_count == 2
+    assert first.psf_count == 2
+    assert float(first.psf_sum) == 4200
+    assert first.buyer_profile == {"REIT": 1, "Fund": 1}
+    assert snapshots[date(2023, 7, 1)].psf_median is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_recomputes_quarters_touched_since_watermark(session):
+    tower = await _seed(session)
+    await refresh_segment(session, PropertyType.OFFICE, "D01")
+    refreshed = utcnow() - timedelta(days=1)
+    await session.execute(update(MarketSegmentSnapshot).values(refreshed_at=refreshed))
+    await session.execute(
+        update(MarketTransaction).values(synced_at=refreshed - timedelta(days=1))
+    )
+    await session.commit()
+
+    _add_transactions(session, tower, [(date(2024, 2, 2), 500_000, 1800, "REIT")])
+    await session.commit()
+    result = await refresh_segment(session, PropertyType.OFFICE, "D01")
+
+    assert result.quarters == [(2024, 1)]
+    snapshots = await _snapshots(session)
+    assert snapshots[date(2024, 1, 1)].transaction_count == 2
+    assert snapshots[date(2023, 1, 1)].refreshed_at < result.refreshed_at.replace(
+        tzinfo=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_rows_stamped_before_last_refresh_are_picked_up(session):
+    tower = await _seed(session)
+    first = await refresh_segment(session, PropertyType.OFFICE, "D01")
+    await session.execute(
+        update(MarketTransaction).values(synced_at=utcnow() - timedelta(days=2))
+    )
+    # Stamped when its sync started, committed only after the refresh read.
+    session.add(
+        MarketTransaction(
+            property_id=tower.id,
+            transaction_date=date(2023, 8, 20),
+            sale_price=700_000,
+            psf_price=1900,
+            data_source="test",
+            synced_at=first.refreshed_at - timedelta(minutes=5),
+        )
+    )
+    await session.commit()
+
+    result = await refresh_segment(session, PropertyType.OFFICE, "D01")
+
+    assert result.quarters == [(2023, 3)]
+    assert (await _snapshots(session))[date(2023, 7, 1)].transaction_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_watermark_bootstraps_first_refresh_only(session):
+    await _seed(session)
+    now = utcnow()
+    await session.execute(
+        update(MarketTransaction).values(synced_at=now - timedelta(days=30))
+    )
+    await session.execute(
+        update(MarketTransaction)
+        .where(MarketTransaction.transaction_date >= date(2024, 1, 1))
+        .values(synced_at=now - timedelta(days=5))
+    )
+    await session.commit()
+    watermark = date.today() - timedelta(days=10)
+
+    first = await refresh_segment(
+        session, PropertyType.OFFICE, "D01", sync_watermark=watermark
+    )
+    await session.execute(
+        update(MarketSegmentSnapshot).values(refreshed_at=now - timedelta(days=3))
+    )
+    await session.commit()
+    second = await refresh_segment(
+        session, PropertyType.OFFICE, "D01", sync_watermark=watermark
+    )
+
+    assert first.quarters == [(2024, 1)]
+    assert second.quarters == []
+
+
+@pytest.mark.asyncio
+async def test_snapshot_comparables_match_live_aggregates(session):
+    await _seed(session)
+    assert (
+        await snapshot_comparables(session, PropertyType.OFFICE, "D01", PERIOD) is None
+    )
+    await refresh_segment(session, PropertyType.OFFICE, "D01")
+
+    comparables, refreshed_at = await snapshot_comparables(
+        session, PropertyType.OFFICE, "D01", PERIOD
+    )
+    live = await transaction_aggregates(
+        session, transaction_filters(PropertyType.OFFICE, "D01", PERIOD)
+    )
+
+    assert comparables["transaction_count"] == live.count
+    assert comparables["total_volume"] == live.total_volume
+    assert comparables["average_psf"] == pytest.approx(live.average_psf)
+    assert comparables["psf_range"] == {"min": live.min_psf, "max": live.max_psf}
+    assert comparables["quarterly_trends"] == live.quarterly
+    assert comparables["buyer_profile"] == {"REIT": 2, "Fund": 1, "Unknown": 1}
+    assert comparables["top_transactions"][0]["price"] == 3_000_000
+    assert refreshed_at.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_refresh_segments_uses_a_session_per_segment(async_session_factory):
+    async with async_session_factory() as session:
+        await _seed(session)
+
+    results = await refresh_segments(
+        async_session_factory,
+        [(PropertyType.OFFICE, "D01"), (PropertyType.RETAIL, "all")],
+    )
+
+    assert [len(result.quarters) for result in results] == [3, 0]
+    async with async_session_factory() as session:
+        assert len(await _snapshots(session)) == 3
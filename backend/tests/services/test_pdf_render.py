@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import pickle
+import threading
+from types import SimpleNamespace
+
+import pytest
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Flowable, Paragraph, Spacer
+
+from app.services.agents.pdf_render import (
+    ChartDrawing,
+    PDFRenderQueueFull,
+    PDFRenderService,
+    chart_cache,
+    chart_drawing,
+    content_hash,
+    section_cache,
+)
+from app.services.agents.universal_site_pack import UniversalSitePackGenerator
+
+_BAR = {"values": [[1, 2, 3]], "categories": ["a", "b", "c"]}
+
+
+class _BlockingFlowable(Flowable):
+    """Holds the render thread until ``release`` is set."""
+
+    def __init__(self, release: threading.Event) -> None:
+        super().__init__()
+        self.release = release
+
+    def wrap(self, available_width, available_height):
+        self.release.wait(5)
+        return 0, 0
+
+    def draw(self) -> None:
+        pass
+
+
+def test_content_hash_is_order_independent_for_mappings():
+    assert content_hash("chart", {"a": 1, "b": 2}) == content_hash(
+        "chart", {"b": 2, "a": 1}
+    )
+    assert content_hash("chart", {"a": 1}) != content_hash("chart", {"a": 2})
+
+
+def test_chart_drawing_is_cached_and_pickles_as_recipe():
+    chart_cache.clear()
+    first = chart_drawing("bar", _BAR)
+
+    assert chart_drawing("bar", dict(_BAR)) is first
+    assert len(chart_cache) == 1
+    assert isinstance(first, ChartDrawing)
+    assert pickle.loads(pickle.dumps(first)) is first
+
+
+def test_static_sections_are_reused_across_packs():
+    section_cache.clear()
+    generator = UniversalSitePackGenerator(storage_service=SimpleNamespace())
+
+    first = generator._create_appendix_disclaimers()
+    second = UniversalSitePackGenerator(
+        storage_service=SimpleNamespace()
+    )._create_appendix_disclaimers()
+
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert generator._add_disclaimer("acquisition") is generator._add_disclaimer(
+        "acquisition"
+    )
+
+
+@pytest.mark.asyncio
+async def test_render_builds_cached_flowables_repeatedly():
+    styles = getSampleStyleSheet()
+    story = [
+        Paragraph("Render test", styles["Normal"]),
+        Spacer(1, 12),
+        chart_drawing("bar", _BAR),
+    ]
+    service = PDFRenderService(max_workers=0, max_pending=2)
+    try:
+        first = await service.render(story, doc_options={"pagesize": A4})
+        second = await service.render(story, doc_options={"pagesize": A4})
+    finally:
+        service.shutdown()
+
+    assert first.startswith(b"%PDF-")
+    assert len(first) == len(second)
+    assert service.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_render_rejects_work_beyond_pending_limit():
+    release = threading.Event()
+    service = PDFRenderService(max_workers=0, max_pending=1)
+    try:
+        running = asyncio.ensure_future(
+            service.render([_BlockingFlowable(release)], doc_options={})
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(PDFRenderQueueFull):
+            await service.render([Spacer(1, 1)], doc_options={})
+        release.set()
+        assert (await running).startswith(b"%PDF-")
+    finally:
+        release.set()
+        service.shutdown()
+
+    assert service.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_process_pool_hands_workers_the_secret_key(monkeypatch):
+    # Spawned workers rebuild settings; the key must reach them through the
+    # pool initializer rather than this process' environment.
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    service = PDFRenderService(max_workers=1, max_pending=1)
+    try:
+        pdf = await service.render([Spacer(1, 12)], doc_options={"pagesize": A4})
+    finally:
+        service.shutdown()
+
+    assert pdf.startswith(b"%PDF-")
+    assert "SECRET_KEY" not in os.environ
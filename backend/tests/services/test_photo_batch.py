@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+from sqlalchemy import select
+
+from app.models.property import Property, PropertyPhoto, PropertyType
+from app.services.agents.photo_documentation import (
+    PHOTO_VERSION_NAMES,
+    PhotoDocumentationManager,
+)
+
+
+class _Storage:
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.uploaded: list[str] = []
+        self.removed: list[str] = []
+
+    async def upload_file(self, **kwargs):
+        if self.fail_on and self.fail_on in kwargs["object_name"]:
+            raise RuntimeError("storage unavailable")
+        self.uploaded.append(kwargs["object_name"])
+
+    async def remove_object(self, bucket_name, object_name):
+        self.removed.append(object_name)
+
+
+class _Upload:
+    def __init__(self, filename, data, content_type="image/jpeg"):
+        self.filename = filename
+        self.content_type = content_type
+        self._data = data
+
+    async def read(self) -> bytes:
+        return self._data
+
+
+def _jpeg(taken: str | None = None) -> bytes:
+    image = Image.new("RGB", (640, 480), (120, 130, 140))
+    exif = Image.Exif()
+    if taken:
+        exif[0x0132] = taken  # Image DateTime
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+async def _property(session) -> Property:
+    prop = Property(
+        name="Batch Tower",
+        address="1 Batch Road",
+        property_type=PropertyType.OFFICE,
+        location="POINT(103.85 1.28)",
+        data_source="test",
+    )
+    session.add(prop)
+    await session.commit()
+    return prop
+
+
+@pytest.mark.asyncio
+async def test_batch_stores_records_together_in_capture_order(session):
+    prop = await _property(session)
+    storage = _Storage()
+    manager = PhotoDocumentationManager(storage_service=storage)
+    uploads = [
+        _Upload("late.jpg", _jpeg("2024:05:01 15:00:00")),
+        _Upload("notes.txt", b"text", content_type="text/plain"),
+        _Upload("undated.jpg", _jpeg()),
+        _Upload("early.jpg", _jpeg("2024:05:01 09:00:00")),
+    ]
+
+    results = await manager.process_photo_batch(
+        uploads,
+        str(prop.id),
+        session,
+        user_metadata={"tags": ["visit"]},
+        concurrency=2,
+    )
+
+    assert [(r.filename, r.status) for r in results] == [
+        ("early.jpg", "stored"),
+        ("late.jpg", "stored"),
+        ("notes.txt", "failed"),
+        ("undated.jpg", "stored"),
+    ]
+    assert results[2].error == "File must be an image"
+    assert len(storage.uploaded) == 3 * len(PHOTO_VERSION_NAMES)
+
+    rows = (await session.execute(select(PropertyPhoto))).scalars().all()
+    assert {row.filename for row in rows} == {"early.jpg", "late.jpg", "undated.jpg"}
+    assert all(row.manual_tags == ["visit"] for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_batch_reports_failed_photos_and_keeps_the_rest(session):
+    prop = await _property(session)
+    manager = PhotoDocumentationManager(storage_service=_Storage(fail_on="thumbnail"))
+
+    results = await manager.process_photo_batch(
+        [_Upload("a.jpg", _jpeg()), _Upload("b.jpg", b"not an image")],
+        str(prop.id),
+        session,
+    )
+
+    assert [r.status for r in results] == ["failed", "failed"]
+    assert results[0].error == "Photo could not be processed"
+    rows = (await session.execute(select(PropertyPhoto))).scalars().all()
+    assert rows == []
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_malformed_property_id(session):
+    manager = PhotoDocumentationManager(storage_service=_Storage())
+
+    with pytest.raises(ValueError):
+        await manager.process_photo_batch([], "not-a-uuid", session)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+from io import BytesIO
+from uuid import uuid4
+
+import pytest
+from PIL import Image
+
+from app.services.agents.photo_documentation import (
+    PHOTO_VERSION_NAMES,
+    PhotoDocumentationManager,
+)
+from app.services.agents.photo_pipeline import decode_photo, render_photo_versions
+
+
+def _encoded(image: Image.Image, format: str) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format=format)
+    return buffer.getvalue()
+
+
+def _size(buffer: BytesIO) -> tuple[int, int]:
+    with Image.open(BytesIO(buffer.getvalue())) as image:
+        return image.size
+
+
+class _ConcurrentStorage:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.keys: list[str] = []
+
+    async def upload_file(self, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0)
+        self.keys.append(kwargs["object_name"])
+        self.active -= 1
+
+
+def test_decode_photo_drafts_large_jpegs_and_keeps_the_upload():
+    upload = _encoded(Image.new("RGB", (4000, 3000), (90, 120, 150)), "JPEG")
+
+    decoded = decode_photo(upload)
+
+    assert decoded.source_jpeg is upload
+    assert decoded.image.mode == "RGB"
+    assert decoded.image.size == (2000, 1500)
+
+
+def test_decode_photo_converts_non_jpeg_uploads():
+    upload = _encoded(Image.new("RGBA", (640, 480), (10, 20, 30, 128)), "PNG")
+
+    decoded = decode_photo(upload)
+
+    assert decoded.source_jpeg is None
+    assert decoded.image.mode == "RGB"
+    assert decoded.image.size == (640, 480)
+
+
+@pytest.mark.asyncio
+async def test_render_photo_versions_resizes_and_watermarks_in_memory():
+    decoded = decode_photo(
+        _encoded(Image.new("RGB", (4000, 3000), (90, 120, 150)), "JPEG")
+    )
+
+    versions = await render_photo_versions(
+        decoded.image, watermark_text="Draft", source_jpeg=decoded.source_jpeg
+    )
+
+    assert set(versions) == set(PHOTO_VERSION_NAMES)
+    assert versions["original"].getvalue() == decoded.source_jpeg
+    assert _size(versions["thumbnail"]) == (300, 225)
+    assert _size(versions["medium"]) == _size(versions["marketing"]) == (1200, 900)
+    assert _size(versions["web"]) == _size(versions["web_watermarked"]) == (1920, 1440)
+    assert versions["web"].getvalue() != versions["web_watermarked"].getvalue()
+
+    plain = await render_photo_versions(decoded.image)
+    assert set(plain) == {"original", "thumbnail", "medium", "web"}
+    assert _size(plain["original"]) == (2000, 1500)
+
+
+@pytest.mark.asyncio
+async def test_store_photo_versions_uploads_concurrently():
+    storage = _ConcurrentStorage()
+    manager = PhotoDocumentationManager(storage_service=storage)
+    versions = await manager._generate_image_versions(
+        Image.new("RGB", (800, 600)), uuid4()
+    )
+
+    key = await manager._store_photo_versions(versions, "PROP", uuid4())
+
+    assert key.endswith("/original.jpg")
+    assert len(storage.keys) == len(PHOTO_VERSION_NAMES)
+    assert storage.peak == len(PHOTO_VERSION_NAMES)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import delete, update
+
+from app.models.property import Property, PropertyType
+from app.services import property_search
+from app.services.property_search import (
+    PropertySearchFilters,
+    property_facets,
+    search_properties,
+)
+
+_PROPERTIES = (
+    (
+        "Jurong Logistics Hub",
+        "8 Pioneer Road",
+        "D22",
+        "Jurong West",
+        "industrial",
+        1.5,
+        12000,
+    ),
+    (
+        "Jurong Gateway Tower",
+        "1 Gateway Drive",
+        "D22",
+        "Jurong East",
+        "office",
+        5.6,
+        4000,
+    ),
+    (
+        "Marina Bay Tower",
+        "10 Marina Boulevard",
+        "D01",
+        "Downtown Core",
+        "office",
+        8.4,
+        6000,
+    ),
+    ("Orchard Retail Podium", "290 Orchard Road", "D09", "Orchard", "retail", 3.5, 800),
+)
+
+
+async def _seed(session) -> dict[str, Property]:
+    created = {}
+    for name, address, district, area, kind, gpr, land in _PROPERTIES:
+        prop = Property(
+            name=name,
+            address=address,
+            district=district,
+            planning_area=area,
+            property_type=PropertyType(kind),
+            plot_ratio=gpr,
+            land_area_sqm=land,
+            location="POINT(103.8 1.3)",
+            data_source="test",
+        )
+        session.add(prop)
+        created[name] = prop
+    await session.commit()
+    return created
+
+
+async def _names(session, **filters) -> list[str]:
+    page = await search_properties(session, PropertySearchFilters(**filters))
+    return sorted(p.name for p in page.properties)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fts", [True, False], ids=["fts5", "like"])
+async def test_text_filters_match_with_and_without_fts(session, monkeypatch, fts):
+    await _seed(session)
+    assert await property_search._sqlite_fts_available(session)
+    if not fts:
+
+        async def _unavailable(_session):
+            return False
+
+        monkeypatch.setattr(property_search, "_sqlite_fts_available", _unavailable)
+
+    assert await _names(session, location="jurong") == [
+        "Jurong Gateway Tower",
+        "Jurong Logistics Hub",
+    ]
+    assert await _names(session, location="orchard rd") == []
+    assert await _names(session, location="D0") == [
+        "Marina Bay Tower",
+        "Orchard Retail Podium",
+    ]
+    assert await _names(session, keywords="tower jurong") == ["Jurong Gateway Tower"]
+    assert await _names(
+        session, keywords="tower", property_type="office", min_gpr=6
+    ) == ["Marina Bay Tower"]
+
+
+@pytest.mark.asyncio
+async def test_fts_index_follows_updates_and_deletes(session):
+    created = await _seed(session)
+    hub = created["Jurong Logistics Hub"]
+
+    await session.execute(
+        update(Property).where(Property.id == hub.id).values(planning_area="Tuas")
+    )
+    await session.execute(
+        delete(Property).where(Property.name == "Jurong Gateway Tower")
+    )
+    await session.commit()
+
+    assert await _names(session, location="jurong") == []
+    assert await _names(session, location="tuas") == ["Jurong Logistics Hub"]
+
+
+@pytest.mark.asyncio
+async def test_facets_exclude_their_own_filter(session):
+    await _seed(session)
+    filters = PropertySearchFilters(property_type="office", min_land_area=1000)
+
+    page = await search_properties(session, filters, include_counts=True)
+    facets = await property_facets(session, filters)
+
+    assert page.total == 2
+    assert page.facets == facets
+    assert [(f.value, f.count) for f in facets["property_type"]] == [
+        ("office", 2),
+        ("industrial", 1),
+    ]
+    assert [f.count for f in facets["plot_ratio"]] == [0, 0, 1, 1]
+    assert [(f.value, f.count) for f in facets["land_area"]] == [
+        ("under_1000", 0),
+        ("1000_to_5000", 1),
+        ("5000_to_20000", 1),
+        ("20000_plus", 0),
+    ]
@@ -0,0 +1,127 @@
+"""Tests for the storage retention index and background sweeper."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from backend._compat.datetime import UTC
+
+from app.services.retention import RetentionIndex, RetentionSweeper
+
+
+def _backdate(path: Path, *, days: int) -> None:
+    stamp = (datetime.now() - timedelta(days=days)).timestamp()
+    os.utime(path, (stamp, stamp))
+
+
+def test_record_is_noop_without_retention(tmp_path: Path) -> None:
+    index = RetentionIndex(tmp_path, retention_days=0)
+    target = tmp_path / "file.bin"
+    target.write_bytes(b"x")
+
+    index.record(target)
+
+    assert not (tmp_path / ".retention").exists()
+
+
+def test_sweep_only_reads_due_buckets(tmp_path: Path) -> None:
+    index = RetentionIndex(tmp_path, retention_days=3)
+    now = datetime.now(UTC)
+    old = tmp_path / "a" / "old.bin"
+    fresh = tmp_path / "b" / "fresh.bin"
+    for path in (old, fresh):
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"x")
+    index.record(old, now=now - timedelta(days=5))
+    index.record(fresh, now=now)
+    _backdate(old, days=5)
+
+    removed = index.sweep(now=now)
+
+    assert removed == ["a/old.bin"]
+    assert not old.exists()
+    assert not old.parent.exists(), "empty parent directories are pruned"
+    assert fresh.exists()
+    assert len(index.due_buckets(now=now)) == 0
+    assert len(list(index.index_dir.glob("*.idx"))) == 1
+
+
+def test_sweep_skips_paths_rewritten_inside_window(tmp_path: Path) -> None:
+    index = RetentionIndex(tmp_path, retention_days=1)
+    now = datetime.now(UTC)
+    target = tmp_path / "report.pdf"
+    target.write_bytes(b"v1")
+    index.record(target, now=now - timedelta(days=3))
+
+    # The file was rewritten today, so the stale entry must not delete it.
+    assert index.sweep(now=now) == []
+    assert target.exists()
+
+
+def test_sweep_removes_recorded_directories(tmp_path: Path) -> None:
+    index = RetentionIndex(tmp_path, retention_days=1)
+    asset_dir = tmp_path / "prop" / "20240101-abc"
+    asset_dir.mkdir(parents=True)
+    (asset_dir / "preview.gltf").write_text("{}")
+    index.record(asset_dir, now=datetime.now(UTC) - timedelta(days=2))
+    _backdate(asset_dir, days=2)
+
+    assert index.sweep() == ["prop/20240101-abc"]
+    assert not asset_dir.exists()
+
+
+@pytest.mark.asyncio
+async def test_sweeper_processes_entries_in_batches(tmp_path: Path) -> None:
+    index = RetentionIndex(tmp_path, retention_days=1)
+    recorded_at = datetime.now(UTC) - timedelta(days=2)
+    for number in range(5):
+        path = tmp_path / f"file-{number}.bin"
+        path.write_bytes(b"x")
+        index.record(path, now=recorded_at)
+        _backdate(path, days=2)
+
+    batches: list[int] = []
+    original = index.delete_batch
+
+    def _tracking_delete(entries, **kwargs):
+        batches.append(len(entries))
+        return original(entries, **kwargs)
+
+    index.delete_batch = _tracking_delete  # type: ignore[method-assign]
+    sweeper = RetentionSweeper(
+        [index, RetentionIndex(tmp_path / "disabled", retention_days=0)],
+        interval_seconds=60,
+        batch_size=2,
+    )
+
+    assert len(sweeper.indexes) == 1
+    assert await sweeper.sweep_once() == 5
+    assert batches == [2, 2, 1]
+    assert not list(tmp_path.glob("file-*.bin"))
+
+
+@pytest.mark.asyncio
+async def test_sweeper_reports_removed_paths_and_runs_after_sweep(
+    tmp_path: Path,
+) -> None:
+    reported: list[Path] = []
+    index = RetentionIndex(tmp_path, retention_days=1, on_removed=reported.extend)
+    target = tmp_path / "prop" / "version"
+    target.mkdir(parents=True)
+    index.record(target, now=datetime.now(UTC) - timedelta(days=2))
+    _backdate(target, days=2)
+    after: list[None] = []
+
+    async def _after_sweep() -> None:
+        after.append(None)
+
+    sweeper = RetentionSweeper(
+        [index], interval_seconds=60, batch_size=10, after_sweep=_after_sweep
+    )
+
+    assert await sweeper.sweep_once() == 1
+    assert reported == [target]
+    assert after == [None]
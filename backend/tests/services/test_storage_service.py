@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import io
 import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
+from backend._compat.datetime import UTC
 
 from app.services.storage import StorageResult, StorageService
 
@@ -60,7 +62,7 @@ async def test_store_import_file_writes_payload_and_metadata(tmp_path: Path) ->
 def test_store_bytes_honours_endpoint_and_retention(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    """store_bytes should construct URIs with endpoint and purge expired files."""
+    """store_bytes should construct URIs and record the write for expiry."""
 
     monkeypatch.setenv("STORAGE_RETENTION_DAYS", "1")
     service = StorageService(
@@ -70,7 +72,7 @@ def test_store_bytes_honours_endpoint_and_retention(
         endpoint_url="http://localhost:9000",
     )
 
-    # Create an old file that should be removed by retention.
+    # Old files are no longer purged inline; the retention sweeper owns expiry.
     old_file = tmp_path / "assets/old/data.txt"
     old_file.parent.mkdir(parents=True, exist_ok=True)
     old_file.write_text("stale")
@@ -87,7 +89,28 @@ def test_store_bytes_honours_endpoint_and_retention(
     assert stored_path.read_bytes() == b"live-data"
     assert result.content_type == "application/octet-stream"
     assert result.uri == "http://localhost:9000/demo-bucket/assets/current.bin"
-    assert not old_file.exists(), "retention should purge files older than cutoff"
+    assert old_file.exists(), "writes must not walk the tree to purge files"
+    index_lines = [
+        line
+        for bucket in (tmp_path / ".retention").glob("*.idx")
+        for line in bucket.read_text().splitlines()
+    ]
+    assert index_lines == ["assets/current.bin"]
+
+
+def test_store_stream_copies_in_chunks(tmp_path: Path) -> None:
+    """store_stream should copy the whole source without reading it at once."""
+
+    service = StorageService(bucket="", prefix="reports", local_base_path=tmp_path)
+    source = io.BytesIO(b"%PDF-" + b"x" * 10)
+
+    result = service.store_stream(
+        key="pack.pdf", source=source, content_type="application/pdf", chunk_size=4
+    )
+
+    assert (tmp_path / "reports/pack.pdf").read_bytes() == source.getvalue()
+    assert result.bytes_written == 15
+    assert result.content_type == "application/pdf"
 
 
 def test_storage_result_optional_fields_absent_when_none() -> None:
@@ -152,7 +175,7 @@ def test_storage_service_to_uri_without_bucket() -> None:
 
 @pytest.mark.asyncio
 async def test_store_import_file_with_retention(tmp_path: Path, monkeypatch) -> None:
-    """store_import_file should trigger purge when retention_days > 0."""
+    """Files written with retention enabled are removed by the sweeper once due."""
     monkeypatch.setenv("STORAGE_RETENTION_DAYS", "7")
 
     service = StorageService(
@@ -162,20 +185,29 @@ async def test_store_import_file_with_retention(tmp_path: Path, monkeypatch) ->
         endpoint_url=None,
     )
 
-    # Create an old file
-    old_file = tmp_path / "uploads/old_import/file.txt"
-    old_file.parent.mkdir(parents=True, exist_ok=True)
-    old_file.write_text("old")
-    old_time = datetime.now() - timedelta(days=10)
-    os.utime(old_file, (old_time.timestamp(), old_time.timestamp()))
-
     await service.store_import_file(
         import_id="new_import",
         filename="new_file.txt",
         payload=b"new data",
+        layer_metadata=[{"name": "L1"}],
     )
-
-    assert not old_file.exists(), "old file should be purged by retention"
+    stored = tmp_path / "uploads/new_import/new_file.txt"
+    metadata = tmp_path / "uploads/new_import/new_file.txt.layers.json"
+    assert stored.exists()
+
+    assert service.retention_index.sweep() == []
+
+    written_at = datetime.now() - timedelta(days=10)
+    for path in (stored, metadata):
+        os.utime(path, (written_at.timestamp(), written_at.timestamp()))
+    removed = service.retention_index.sweep(now=datetime.now(UTC) + timedelta(days=8))
+
+    assert sorted(removed) == [
+        "uploads/new_import/new_file.txt",
+        "uploads/new_import/new_file.txt.layers.json",
+    ]
+    assert not stored.exists()
+    assert not list((tmp_path / ".retention").glob("*.idx"))
 
 
 def test_purge_expired_with_nonexistent_prefix(tmp_path: Path) -> None:
@@ -30,6 +30,13 @@ class _StubPhotoManager:
     async def get_property_photos(self, **kwargs):
         return self._photos
 
+    async def process_photo_batch(self, photos, **kwargs):
+        self.batch_filenames = [photo.filename for photo in photos]
+        return [
+            SimpleNamespace(filename="a.jpg", metadata=self._response, error=None),
+            SimpleNamespace(filename="b.txt", metadata=None, error="Bad file"),
+        ]
+
 
 @pytest.mark.asyncio
 async def test_upload_property_photo_success(client, monkeypatch):
@@ -77,3 +84,42 @@ async def test_get_property_photos_success(client, monkeypatch):
 
     assert response.status_code == 200
     assert response.json()[0]["photo_id"] == photos[0]["photo_id"]
+
+
+@pytest.mark.asyncio
+async def test_upload_property_photos_batch_reports_each_photo(client, monkeypatch):
+    manager = _StubPhotoManager()
+    monkeypatch.setattr(agents_api, "PhotoDocumentationManager", lambda: manager)
+
+    response = await client.post(
+        "/api/v1/agents/commercial-property/properties/prop-1/photos/batch",
+        files=[
+            ("files", ("a.jpg", io.BytesIO(b"img"), "image/jpeg")),
+            ("files", ("b.txt", io.BytesIO(b"text"), "text/plain")),
+        ],
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert (payload["stored"], payload["failed"]) == (1, 1)
+    assert [photo["status"] for photo in payload["photos"]] == ["stored", "failed"]
+    assert payload["photos"][0]["auto_tags"] == ["well_lit"]
+    assert payload["photos"][1]["error"] == "Bad file"
+    assert manager.batch_filenames == ["a.jpg", "b.txt"]
+
+
+@pytest.mark.asyncio
+async def test_upload_property_photos_batch_rejects_oversized_batch(
+    client, monkeypatch
+):
+    monkeypatch.setattr(agents_api.settings, "PHOTO_BATCH_MAX_FILES", 1)
+
+    response = await client.post(
+        "/api/v1/agents/commercial-property/properties/prop-1/photos/batch",
+        files=[
+            ("files", ("a.jpg", io.BytesIO(b"img"), "image/jpeg")),
+            ("files", ("b.jpg", io.BytesIO(b"img"), "image/jpeg")),
+        ],
+    )
+
+    assert response.status_code == 413
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+
+from app.models.property import Property, PropertyType
+
+
+@pytest.mark.asyncio
+async def test_search_properties_returns_page_and_facets(client, async_session_factory):
+    async with async_session_factory() as session:
+        session.add_all(
+            [
+                Property(
+                    name=name,
+                    address=address,
+                    property_type=property_type,
+                    location="POINT(103.7 1.33)",
+                    district="D22",
+                    plot_ratio=plot_ratio,
+                    data_source="test",
+                )
+                for name, address, property_type, plot_ratio in (
+                    ("Jurong Hub", "1 Jurong Gateway", PropertyType.OFFICE, 4.2),
+                    ("Jurong Works", "8 Jurong Port", PropertyType.INDUSTRIAL, 2.5),
+                    ("Marina Point", "3 Marina Way", PropertyType.OFFICE, 8.0),
+                )
+            ]
+        )
+        await session.commit()
+
+    response = await client.get(
+        "/api/v1/agents/commercial-property/properties/search",
+        params={"location": "jurong", "property_type": "office"},
+    )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total"] == 1
+    assert [item["name"] for item in payload["properties"]] == ["Jurong Hub"]
+    assert {
+        facet["value"]: facet["count"] for facet in payload["facets"]["property_type"]
+    } == {"office": 1, "industrial": 1}
@@ -278,6 +278,25 @@ async def test_deal_score_missing_deal_id(client: AsyncClient) -> None:
     assert response.status_code == 422
 
 
+async def test_deal_score_batch_reports_missing_deals(client: AsyncClient) -> None:
+    """Test batch deal scoring lists deals that do not exist."""
+    deal_id = str(uuid4())
+    response = await client.post(
+        "/api/v1/ai/deals/score/batch", json={"deal_ids": [deal_id]}
+    )
+    assert response.status_code in [200, 500]
+    if response.status_code == 200:
+        data = response.json()
+        assert data["scores"] == []
+        assert data["missing_deal_ids"] == [deal_id]
+
+
+async def test_deal_score_batch_requires_deal_ids(client: AsyncClient) -> None:
+    """Test batch deal scoring rejects an empty page."""
+    response = await client.post("/api/v1/ai/deals/score/batch", json={"deal_ids": []})
+    assert response.status_code == 422
+
+
 # =============================================================================
 # Scenario Optimizer Tests
 # =============================================================================
@@ -341,3 +341,104 @@ print(
     assert payload["route_count"] > 0
     assert payload["loaded_routes"] == route_modules
     assert payload["loaded_helpers"] == []
+
+
+def _run_router_probe(body: str) -> dict[str, object]:
+    script = f"""
+import asyncio
+import importlib
+import json
+import sys
+
+from httpx import ASGITransport, AsyncClient
+
+main_module = importlib.import_module("app.main")
+app = main_module.app
+
+def _loaded_routes():
+    api_v1 = sys.modules["app.api.v1"]
+    return sorted(
+        name
+        for group in api_v1.router_groups()
+        for name in group
+        if "app.api.v1." + name in sys.modules
+    )
+
+async def _run():
+{body}
+
+print(json.dumps(asyncio.run(_run())))
+"""
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=False,
+        env={
+            **os.environ,
+            "PYTHONPATH": _pythonpath(),
+            "SECRET_KEY": os.environ.get("SECRET_KEY", "test-secret"),
+        },
+        text=True,
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_api_request_mounts_only_the_routers_for_its_prefix() -> None:
+    """A finance request should import the finance routers and nothing else."""
+
+    payload = _run_router_probe("""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://testserver"
+    ) as client:
+        finance = await client.get("/api/v1/finance/scenarios")
+        unknown = await client.get("/api/v1/not-a-prefix")
+    return {
+        "finance_status": finance.status_code,
+        "unknown_status": unknown.status_code,
+        "loaded_routes": _loaded_routes(),
+    }
+""")
+
+    assert payload["finance_status"] != 404
+    assert payload["unknown_status"] == 404
+    assert payload["loaded_routes"] == [
+        "finance_export",
+        "finance_feasibility",
+        "finance_jobs",
+        "finance_scenarios",
+        "finance_workbook",
+    ]
+
+
+def test_router_warmup_mounts_requested_groups() -> None:
+    """Lifespan warmup should import and mount only the configured groups."""
+
+    payload = _run_router_probe("""
+    timings = await main_module.warm_api_routers(["projects", "unknown"])
+    paths = {getattr(route, "path", "") for route in app.routes}
+    return {
+        "warmed": sorted(timings),
+        "loaded_routes": _loaded_routes(),
+        "projects_mounted": "/api/v1/projects/list" in paths,
+    }
+""")
+
+    assert payload == {
+        "warmed": ["projects"],
+        "loaded_routes": ["development_phases", "projects"],
+        "projects_mounted": True,
+    }
+
+
+def test_router_path_segments_cover_every_route() -> None:
+    """Each router's declared prefixes must match the paths it registers."""
+
+    api_v1 = importlib.import_module("app.api.v1")
+
+    for group in api_v1.router_groups():
+        router = api_v1.build_router_group(group)
+        for route in router.routes:
+            segment = route.path.strip("/").split("/", 1)[0]
+            assert api_v1.router_group_for_segment(segment) == group, route.path
@@ -69,11 +69,19 @@ async def test_diff_project_audit_missing_version_returns_404(client, monkeypatc
 @pytest.mark.asyncio
 async def test_project_audit_evidence_returns_summary(client, monkeypatch):
     logs = [SimpleNamespace(version=1), SimpleNamespace(version=2)]
-    monkeypatch.setattr(audit_api, "verify_chain", AsyncMock(return_value=(True, logs)))
+    monkeypatch.setattr(
+        audit_api,
+        "verify_chain_incremental",
+        AsyncMock(
+            return_value=SimpleNamespace(
+                valid=True, entries=logs, checkpoints=[], sealed=0
+            )
+        ),
+    )
     monkeypatch.setattr(
         audit_api,
         "build_evidence_report",
-        lambda project_id, valid, rows: {
+        lambda project_id, valid, rows, checkpoints: {
             "project_id": project_id,
             "valid": valid,
             "chain": {"entry_count": len(rows)},
@@ -95,14 +103,22 @@ async def test_project_audit_evidence_returns_summary(client, monkeypatch):
 async def test_project_audit_evidence_by_ref_returns_summary(client, monkeypatch):
     project_ref = str(uuid4())
     logs = [SimpleNamespace(version=1)]
-    monkeypatch.setattr(audit_api, "verify_chain", AsyncMock(return_value=(True, logs)))
+    monkeypatch.setattr(
+        audit_api,
+        "verify_chain_incremental",
+        AsyncMock(
+            return_value=SimpleNamespace(
+                valid=True, entries=logs, checkpoints=[SimpleNamespace()], sealed=0
+            )
+        ),
+    )
     monkeypatch.setattr(
         audit_api,
         "build_evidence_report",
-        lambda project_id, valid, rows: {
+        lambda project_id, valid, rows, checkpoints: {
             "project_id": project_id,
             "valid": valid,
-            "chain": {"entry_count": len(rows)},
+            "chain": {"entry_count": len(rows) + len(checkpoints)},
             "finance_events": [{"origin": "quick_screen"}],
         },
     )
@@ -112,7 +128,7 @@ async def test_project_audit_evidence_by_ref_returns_summary(client, monkeypatch
     assert response.status_code == 200
     payload = response.json()
     assert payload["valid"] is True
-    assert payload["chain"]["entry_count"] == 1
+    assert payload["chain"]["entry_count"] == 2
     assert payload["finance_events"][0]["origin"] == "quick_screen"
 
 
@@ -122,3 +138,17 @@ async def test_project_audit_evidence_by_ref_invalid_returns_404(client):
 
     assert response.status_code == 404
     assert response.json()["detail"] == "Audit project not found"
+
+
+@pytest.mark.asyncio
+async def test_project_audit_proof_returns_404_when_not_checkpointed(
+    client, monkeypatch
+):
+    monkeypatch.setattr(
+        audit_api, "build_inclusion_proof", AsyncMock(return_value=None)
+    )
+
+    response = await client.get("/api/v1/audit/17/proof/3")
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Audit entry not checkpointed"
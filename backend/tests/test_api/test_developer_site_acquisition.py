@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import json
 from decimal import Decimal
 from types import SimpleNamespace
 from typing import Any
@@ -663,10 +665,15 @@ async def test_developer_log_property_returns_envelope(
         "existing_building",
     ]
 
-    async with async_session_factory() as session:
-        jobs = (await session.execute(select(PreviewJob))).scalars().all()
-        assert jobs
-        assert jobs[0].preview_url
+    # Previews render in the background pool; wait for the job to finish.
+    for _attempt in range(150):
+        async with async_session_factory() as session:
+            jobs = (await session.execute(select(PreviewJob))).scalars().all()
+        if jobs and jobs[0].preview_url:
+            break
+        await asyncio.sleep(0.2)
+    assert jobs
+    assert jobs[0].preview_url
 
     jobs_response = await app_client.get(
         f"/api/v1/developers/properties/{property_id}/preview-jobs"
@@ -681,6 +688,14 @@ async def test_developer_log_property_returns_envelope(
     assert job_response.status_code == 200
     job_payload = job_response.json()
     assert job_payload["status"] in {"ready", "processing"}
+    if job_payload["status"] == "ready":
+        lods_response = await app_client.get(
+            f"/api/v1/developers/preview-jobs/{preview_job_id}/lods"
+        )
+        assert lods_response.status_code == 200
+        streamed = [json.loads(line) for line in lods_response.text.splitlines()]
+        assert streamed[0]["level"] == "proxy"
+        assert streamed == job_payload["lods"]
 
     refresh_response = await app_client.post(
         f"/api/v1/developers/preview-jobs/{preview_job_id}/refresh"
@@ -208,6 +208,43 @@ async def test_vectorize_payload_if_requested_handles_async_job(monkeypatch):
     assert derived_layers is not None
 
 
+@pytest.mark.asyncio
+async def test_vectorize_payload_keeps_pages_finished_before_failure(monkeypatch):
+    raster_vector = pytest.importorskip("backend.jobs.raster_vector")
+
+    def page(index: int) -> raster_vector.PdfPageResult:
+        return raster_vector.PdfPageResult(
+            page_index=index,
+            paths=[raster_vector.VectorPath(points=[(0, 0), (5, 0)], layer="A")],
+            vector_walls=[],
+            bitmap_walls=[],
+            bounds=(10.0, 10.0),
+            duration_ms=1.5,
+        )
+
+    async def failing_enqueue(*_args, on_page, **_kwargs):
+        on_page(page(1))
+        on_page(page(0))
+        raise RuntimeError("page 3 failed")
+
+    monkeypatch.setattr(imports_api.job_queue, "enqueue", failing_enqueue)
+
+    vector_payload, summary, _ = await imports_api._vectorize_payload_if_requested(
+        enable_raster_processing=True,
+        raw_payload=b"bytes",
+        filename="plan.pdf",
+        content_type="application/pdf",
+        infer_walls=False,
+        import_id="imp-1",
+        layer_metadata=[],
+    )
+
+    assert vector_payload["partial"] is True
+    assert len(vector_payload["paths"]) == 2
+    assert summary["partial"] is True
+    assert [entry["page"] for entry in summary["pages"]] == [1, 2]
+
+
 @pytest.mark.asyncio
 async def test_vectorize_payload_returns_none_when_disabled():
     result = await imports_api._vectorize_payload_if_requested(
@@ -21,6 +21,7 @@ class _StubReport:
         self.cycle = {"phase": "expansion"}
         self.recommendations = ["Hold inventory"]
         self.generated_at = datetime.utcnow()
+        self.snapshot_refreshed_at = datetime.utcnow()
 
     def to_dict(self):
         return {"summary": "ok"}
@@ -53,6 +54,7 @@ async def test_generate_market_report_success(client, monkeypatch):
     assert response.status_code == 200
     payload = response.json()
     assert payload["report"]["property_type"] == "office"
+    assert payload["snapshot_refreshed_at"] is not None
     # type: ignore[attr-defined]
     mi_api._market_analytics.generate_market_report.assert_awaited_once()
 
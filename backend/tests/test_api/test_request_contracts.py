@@ -23,6 +23,7 @@ from app.api.error_handlers import (
 from app.middleware.observability import RequestMetricsMiddleware
 from app.middleware.request_guards import (
     CorrelationIdMiddleware,
+    RequestContextMiddleware,
     RequestSizeLimitMiddleware,
 )
 from app.utils import metrics
@@ -172,3 +173,34 @@ def test_request_size_limit_returns_problem_details() -> None:
     assert payload["status"] == 413
     assert payload["correlation_id"] == "cid-413"
     assert payload["code"] == "request_entity_too_large"
+
+
+def test_fused_request_context_layer_matches_stacked_middleware() -> None:
+    app = FastAPI()
+    app.add_exception_handler(Exception, unhandled_exception_handler)
+    app.add_middleware(RequestContextMiddleware, max_size_bytes=2)
+
+    @app.post("/items/{item_id}")
+    def write_item(item_id: int) -> dict[str, int]:
+        return {"item_id": item_id}
+
+    client = TestClient(app, raise_server_exceptions=False)
+
+    response = client.post("/items/7", headers={"X-Correlation-ID": "cid-ok"})
+    assert response.status_code == 200
+    assert response.headers["x-correlation-id"] == "cid-ok"
+    assert (
+        metrics.counter_value(metrics.REQUEST_COUNTER, {"endpoint": "/items/{item_id}"})
+        == 1.0
+    )
+
+    rejected = client.post(
+        "/items/7", headers={"X-Correlation-ID": "cid-413"}, content=b"abc"
+    )
+    assert rejected.status_code == 413
+    assert rejected.headers["x-correlation-id"] == "cid-413"
+    assert rejected.json()["correlation_id"] == "cid-413"
+    assert (
+        metrics.counter_value(metrics.REQUEST_COUNTER, {"endpoint": "/items/{item_id}"})
+        == 1.0
+    )
@@ -0,0 +1,174 @@
+"""Tests for signed Merkle checkpoints over the audit ledger."""
+
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+from sqlalchemy import event, select, update
+
+from app.core.audit.ledger import (
+    append_event,
+    build_evidence_report,
+    build_inclusion_proof,
+    verify_chain,
+    verify_chain_incremental,
+)
+from app.core.audit.merkle import inclusion_proof, merkle_root, verify_inclusion
+from app.core.config import settings
+from app.models.audit import AuditCheckpoint, AuditLog
+
+
+def _leaves(count: int) -> list[str]:
+    return [hashlib.sha256(str(index).encode()).hexdigest() for index in range(count)]
+
+
+@pytest.mark.no_db
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 8])
+def test_inclusion_proofs_verify_against_root(count):
+    leaves = _leaves(count)
+    root = merkle_root(leaves)
+    for index, leaf in enumerate(leaves):
+        assert verify_inclusion(leaf, inclusion_proof(leaves, index), root)
+    assert not verify_inclusion(
+        _leaves(count + 1)[-1], inclusion_proof(leaves, 0), root
+    )
+
+
+@pytest.mark.no_db
+def test_merkle_root_rejects_empty_ranges():
+    with pytest.raises(ValueError):
+        merkle_root([])
+
+
+async def _append(session, project_id: int, count: int, **context) -> None:
+    for index in range(count):
+        await append_event(
+            session,
+            project_id=project_id,
+            event_type="export_generated" if index % 2 else "step",
+            context={"index": index, **context},
+        )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_verification_seals_intervals_and_rehashes_only_the_tail(session):
+    await _append(session, 51, 7, recipient="ops@example.com")
+
+    verification = await verify_chain_incremental(session, 51, seal=True, interval=3)
+    await session.commit()
+    assert verification.valid
+    assert verification.sealed == 2
+    assert [entry.version for entry in verification.entries] == [7]
+    assert verification.entry_count == 7
+
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        again = await verify_chain_incremental(session, 51, seal=True, interval=3)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert again.valid and again.sealed == 0
+    assert [entry.version for entry in again.entries] == [7]
+    assert not any("INSERT" in sql for sql in statements)
+
+    full = build_evidence_report(51, True, list((await verify_chain(session, 51))[1]))
+    report = build_evidence_report(
+        51, again.valid, again.entries, checkpoints=again.checkpoints
+    )
+    for key in ("chain", "event_types", "exports", "recipients", "timeframe"):
+        assert report[key] == full[key]
+
+
+@pytest.mark.asyncio
+async def test_writer_seals_intervals_as_it_appends(session, monkeypatch):
+    monkeypatch.setattr(settings, "AUDIT_CHECKPOINT_INTERVAL", 3)
+    await _append(session, 54, 2)
+    await _append(session, 54, 5)
+
+    checkpoints = (
+        (
+            await session.execute(
+                select(AuditCheckpoint)
+                .where(AuditCheckpoint.project_id == 54)
+                .order_by(AuditCheckpoint.end_version)
+            )
+        )
+        .scalars()
+        .all()
+    )
+    assert [(cp.start_version, cp.end_version) for cp in checkpoints] == [
+        (1, 3),
+        (4, 6),
+    ]
+    verification = await verify_chain_incremental(session, 54)
+    assert verification.valid and verification.sealed == 0
+    assert [entry.version for entry in verification.entries] == [7]
+
+
+@pytest.mark.asyncio
+async def test_tampered_checkpoint_summary_is_detected(session):
+    await _append(session, 55, 4, recipient="ops@example.com")
+    await verify_chain_incremental(session, 55, seal=True, interval=2)
+    await session.commit()
+
+    await session.execute(
+        update(AuditCheckpoint)
+        .where(AuditCheckpoint.project_id == 55, AuditCheckpoint.end_version == 2)
+        .values(summary={"entry_count": 2, "recipients": ["forged@example.com"]})
+    )
+    await session.commit()
+    session.expire_all()
+
+    assert not (await verify_chain_incremental(session, 55)).valid
+
+
+@pytest.mark.asyncio
+async def test_tampered_tail_and_checkpoint_are_detected(session):
+    await _append(session, 52, 5)
+    await verify_chain_incremental(session, 52, seal=True, interval=2)
+    await session.commit()
+
+    await session.execute(
+        update(AuditLog)
+        .where(AuditLog.project_id == 52, AuditLog.version == 5)
+        .values(context={"index": 99})
+    )
+    await session.commit()
+    session.expire_all()
+    assert not (await verify_chain(session, 52))[0]
+
+    await session.execute(
+        update(AuditCheckpoint)
+        .where(AuditCheckpoint.project_id == 52, AuditCheckpoint.end_version == 2)
+        .values(merkle_root="0" * 64)
+    )
+    await session.commit()
+    session.expire_all()
+    verification = await verify_chain_incremental(session, 52, seal=True, interval=2)
+    assert not verification.valid
+    assert verification.sealed == 0
+
+
+@pytest.mark.asyncio
+async def test_inclusion_proof_for_checkpointed_entry(session):
+    await _append(session, 53, 4)
+    await verify_chain_incremental(session, 53, seal=True, interval=3)
+    await session.commit()
+
+    proof = await build_inclusion_proof(session, 53, 2)
+    entry = (
+        await session.execute(
+            select(AuditLog).where(AuditLog.project_id == 53, AuditLog.version == 2)
+        )
+    ).scalar_one()
+    assert proof is not None and proof["valid"]
+    assert proof["hash"] == entry.hash
+    assert proof["checkpoint"]["end_version"] == 3
+    assert await build_inclusion_proof(session, 53, 4) is None
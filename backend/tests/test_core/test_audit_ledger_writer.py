@@ -0,0 +1,151 @@
+"""Tests for the group-commit audit ledger writer."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event, insert, select
+
+from app.core.audit.ledger import (
+    ChainHead,
+    _link,
+    append_event,
+    ledger_writer,
+    recover_chain_heads,
+    verify_chain,
+)
+from app.models.audit import AuditLog
+
+
+def _count_statements(session, statements: list[str]):
+    engine = session.get_bind()
+
+    def _before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(" ".join(statement.split()))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    return lambda: event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.mark.asyncio
+async def test_commit_window_reads_chain_heads_once(session):
+    statements: list[str] = []
+    stop = _count_statements(session, statements)
+    try:
+        for index in range(3):
+            await append_event(
+                session, project_id=11, event_type="step", context={"i": index}
+            )
+        await append_event(session, project_id=12, event_type="step")
+        assert statements == []
+        await session.commit()
+    finally:
+        stop()
+
+    selects = [sql for sql in statements if sql.startswith("SELECT")]
+    inserts = [sql for sql in statements if sql.startswith("INSERT INTO audit_logs")]
+    assert len(selects) == 1
+    assert inserts and statements.index(inserts[0]) > statements.index(selects[0])
+    for project_id, expected in ((11, [1, 2, 3]), (12, [1])):
+        valid, logs = await verify_chain(session, project_id)
+        assert valid
+        assert [log.version for log in logs] == expected
+
+
+@pytest.mark.asyncio
+async def test_later_flushes_chain_from_anchored_head(session):
+    await append_event(session, project_id=13, event_type="first", flush=True)
+    statements: list[str] = []
+    stop = _count_statements(session, statements)
+    try:
+        for index in range(2):
+            await append_event(
+                session,
+                project_id=13,
+                event_type="step",
+                context={"i": index},
+                flush=True,
+            )
+    finally:
+        stop()
+    await session.commit()
+
+    assert not [sql for sql in statements if sql.startswith("SELECT")]
+    valid, logs = await verify_chain(session, 13)
+    assert valid
+    assert [log.version for log in logs] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_stale_cached_head_is_relinked_at_flush(session):
+    await append_event(session, project_id=21, event_type="first")
+    await append_event(session, project_id=21, event_type="second")
+    await session.commit()
+
+    # Another writer appends version 3 behind this process's back.
+    foreign = AuditLog(
+        project_id=21,
+        event_type="foreign",
+        context={},
+        recorded_at=(await verify_chain(session, 21))[1][-1].recorded_at,
+    )
+    _link(foreign, ChainHead(version=2, hash=ledger_writer.head(session, 21).hash))
+    await session.execute(
+        insert(AuditLog).values(
+            project_id=foreign.project_id,
+            event_type=foreign.event_type,
+            context=foreign.context,
+            recorded_at=foreign.recorded_at,
+            version=foreign.version,
+            prev_hash=foreign.prev_hash,
+            hash=foreign.hash,
+            signature=foreign.signature,
+        )
+    )
+    await session.commit()
+
+    log = await append_event(session, project_id=21, event_type="third")
+    assert log.version == 3
+    await session.commit()
+
+    assert log.version == 4
+    valid, logs = await verify_chain(session, 21)
+    assert valid
+    assert [entry.event_type for entry in logs] == [
+        "first",
+        "second",
+        "foreign",
+        "third",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rollback_discards_staged_heads(session):
+    await append_event(session, project_id=31, event_type="kept")
+    await session.commit()
+    await append_event(session, project_id=31, event_type="dropped", flush=True)
+    await session.rollback()
+
+    log = await append_event(session, project_id=31, event_type="after", flush=True)
+    await session.commit()
+
+    assert log.version == 2
+    valid, logs = await verify_chain(session, 31)
+    assert valid
+    assert [entry.event_type for entry in logs] == ["kept", "after"]
+
+
+@pytest.mark.asyncio
+async def test_recover_chain_heads_loads_latest_entries(async_session_factory):
+    async with async_session_factory() as session:
+        for project_id in (41, 41, 42):
+            await append_event(session, project_id=project_id, event_type="step")
+        await session.commit()
+
+    async with async_session_factory() as session:
+        assert await recover_chain_heads(session) == 2
+        latest = (
+            await session.execute(
+                select(AuditLog).where(AuditLog.project_id == 41, AuditLog.version == 2)
+            )
+        ).scalar_one()
+        assert ledger_writer.head(session, 41) == ChainHead(version=2, hash=latest.hash)
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from app.core.rate_limit import (
     ENDPOINT_LIMITS,
+    EndpointLimitTrie,
+    InMemoryRateLimitBackend,
     RateLimitConfig,
     RateLimiter,
     RateLimitMiddleware,
     RateLimitTier,
+    RedisRateLimitBackend,
     get_rate_limiter,
     rate_limit,
 )
@@ -359,27 +364,184 @@ class TestBurstControl:
         assert sum(results) >= 5  # At least half should succeed
 
 
-class TestCleanup:
-    """Tests for state cleanup."""
+class _FakeClock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _LocalRedis:
+    """In-memory stand-in for a Redis client running the GCRA script."""
+
+    def __init__(self, clock: _FakeClock) -> None:
+        self.clock = clock
+        self.hashes: dict[str, dict[str, float]] = {}
+        self.fail = False
+
+    def register_script(self, script: str):
+        assert "HMGET" in script and "PEXPIRE" in script
+
+        def run(keys: list[str], args: list[float]) -> list[object]:
+            if self.fail:
+                raise ConnectionError("redis down")
+            now = self.clock() * 1000.0
+            cost = int(args[0])
+            stored = self.hashes.get(keys[0], {})
+            fields = ("burst", "minute", "hour", "day")
+            tats = [max(stored.get(name, now), now) for name in fields]
+            allowed = all(
+                args[i * 2 + 2] > 0
+                and tat + args[i * 2 + 2] * cost - now <= args[i * 2 + 1]
+                for i, tat in enumerate(tats)
+            )
+            if allowed and cost > 0:
+                tats = [tat + args[i * 2 + 2] * cost for i, tat in enumerate(tats)]
+                self.hashes[keys[0]] = dict(zip(fields, tats, strict=True))
+            return [int(allowed), str(now), *(str(tat) for tat in tats)]
+
+        return run
+
+
+class TestEndpointLimitTrie:
+    """Tests for precompiled endpoint patterns."""
+
+    def test_literal_segments_take_precedence_over_wildcards(self) -> None:
+        strict = RateLimitConfig(requests_per_minute=1)
+        loose = RateLimitConfig(requests_per_minute=2)
+        trie = EndpointLimitTrie(
+            {"/api/v1/projects/*/export": loose, "/api/v1/projects/42/export": strict}
+        )
+
+        assert trie.match("/api/v1/projects/42/export") is strict
+        assert trie.match("/api/v1/projects/7/export/") is loose
+        assert trie.match("/api/v1/projects/7/8/export") is None
+        assert trie.match("/api/v1/projects/7") is None
 
-    def test_cleanup_removes_expired_entries(self) -> None:
-        """Test expired entries are cleaned up."""
+    def test_limiter_resolves_wildcard_endpoint_limits(self) -> None:
         limiter = RateLimiter()
-        limiter._cleanup_interval = 0  # Force immediate cleanup
+        config = limiter._get_config_for_endpoint("/api/v1/projects/9/export")
+
+        assert config is ENDPOINT_LIMITS["/api/v1/projects/*/export"]
+
+
+class TestGcraBackends:
+    """Tests for GCRA state storage."""
 
-        # Add an entry
-        limiter.check_rate_limit("old-user", "/api/v1/test", RateLimitTier.ANONYMOUS)
+    def test_window_slides_instead_of_resetting(self) -> None:
+        clock = _FakeClock()
+        limiter = RateLimiter(InMemoryRateLimitBackend(clock=clock))
+        config = RateLimitConfig(requests_per_minute=6, burst_size=6)
 
-        # Manually expire the entry
-        key = limiter._get_key("old-user", "/api/v1/test")
-        state = limiter._state[key]
-        state.minute_reset = 0
-        state.hour_reset = 0
-        state.day_reset = 0
+        def check() -> tuple[bool, dict]:
+            return limiter.check_rate_limit(
+                "u", "/x", RateLimitTier.AUTHENTICATED, config=config
+            )
+
+        for _ in range(6):
+            assert check()[0]
+        allowed, headers = check()
+        assert not allowed
+        assert headers["Retry-After"] == "10"
+
+        clock.now += 10
+        assert check()[0]
+        assert not check()[0]
+
+    def test_expired_keys_are_evicted_incrementally(self) -> None:
+        clock = _FakeClock()
+        backend = InMemoryRateLimitBackend(clock=clock, max_keys=3)
+        limiter = RateLimiter(backend)
+
+        for index in range(5):
+            limiter.check_rate_limit(f"user-{index}", "/api/v1/test")
+        assert len(backend) == 3
+
+        clock.now += 86_401
+        limiter.check_rate_limit("fresh", "/api/v1/test")
+        assert len(backend) == 1
+
+    def test_limiters_sharing_redis_share_one_quota(self) -> None:
+        clock = _FakeClock()
+        redis = _LocalRedis(clock)
+        workers = [RateLimiter(RedisRateLimitBackend(redis)) for _ in range(2)]
+
+        results = [
+            workers[index % 2].check_rate_limit("ip:1", "/api/v1/auth/login")[0]
+            for index in range(4)
+        ]
+
+        # Anonymous login allows a burst of one request.
+        assert results == [True, False, False, False]
+        assert list(redis.hashes) == ["ratelimit:ip:1|/api/v1/auth/login"]
+        remaining = workers[1].get_remaining("ip:1", "/api/v1/auth/login")
+        assert remaining == {"minute": 1, "hour": 9, "day": 49}
+
+    def test_redis_failure_falls_back_to_local_counters(self) -> None:
+        clock = _FakeClock()
+        redis = _LocalRedis(clock)
+        redis.fail = True
+        backend = RedisRateLimitBackend(
+            redis, fallback=InMemoryRateLimitBackend(clock=clock)
+        )
+        limiter = RateLimiter(backend)
 
-        # Trigger cleanup
-        limiter._last_cleanup = 0
-        limiter._cleanup_expired()
+        assert limiter.check_rate_limit("u", "/api/v1/test")[0]
+        redis.fail = False
+        # Redis is not retried until the cooldown elapses.
+        assert limiter.check_rate_limit("u", "/api/v1/test")[0]
+        assert redis.hashes == {}
+        assert len(backend.fallback) == 1
 
-        # Entry should be removed
-        assert key not in limiter._state
+    @pytest.mark.asyncio
+    async def test_async_checks_run_the_script_on_the_async_client(self) -> None:
+        clock = _FakeClock()
+        redis = _LocalRedis(clock)
+        sync_script = redis.register_script("HMGET PEXPIRE")
+
+        class _AsyncRedis:
+            def register_script(self, script: str):
+                async def run(keys: list[str], args: list[float]) -> list[object]:
+                    return sync_script(keys=keys, args=args)
+
+                return run
+
+        class _BlockingRedis:
+            def register_script(self, script: str):
+                def run(**kwargs: object) -> list[object]:
+                    raise AssertionError("sync client used from the event loop")
+
+                return run
+
+        limiter = RateLimiter(
+            RedisRateLimitBackend(_BlockingRedis(), async_client=_AsyncRedis())
+        )
+        results = [
+            (await limiter.check_rate_limit_async("ip:1", "/api/v1/auth/login"))[0]
+            for _ in range(2)
+        ]
+
+        assert results == [True, False]
+        assert list(redis.hashes) == ["ratelimit:ip:1|/api/v1/auth/login"]
+
+    @pytest.mark.asyncio
+    async def test_async_checks_without_async_client_leave_the_loop(self) -> None:
+        clock = _FakeClock()
+        redis = _LocalRedis(clock)
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+        script = redis.register_script("HMGET PEXPIRE")
+
+        class _ThreadRecordingRedis:
+            def register_script(self, source: str):
+                def run(keys: list[str], args: list[float]) -> list[object]:
+                    threads.append(threading.get_ident())
+                    return script(keys=keys, args=args)
+
+                return run
+
+        limiter = RateLimiter(RedisRateLimitBackend(_ThreadRecordingRedis()))
+
+        assert (await limiter.check_rate_limit_async("u", "/api/v1/test"))[0]
+        assert threads and loop_thread not in threads
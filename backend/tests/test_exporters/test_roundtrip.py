@@ -1,13 +1,21 @@
+import io
+import json
+import os
+
 import pytest
 
 pytest.importorskip("sqlalchemy")
 
+from sqlalchemy import select
+
+import app.core.export as export_core
 from app.core.export import (
     ExportFormat,
     ExportOptions,
     LayerMapping,
     LocalExportStorage,
     generate_project_export,
+    get_writer,
 )
 from app.core.models.geometry import CanonicalGeometry, GeometryNode
 from app.models.overlay import OverlaySourceGeometry, OverlaySuggestion
@@ -173,3 +181,116 @@ async def test_pending_overlays_mapped_to_separate_layers(
     with artifact.open() as stream:
         payload = stream.read()
     assert payload
+
+
+@pytest.mark.asyncio
+async def test_unchanged_project_is_served_from_cached_artifact(
+    async_session_factory, tmp_path, monkeypatch
+):
+    project_id = await _seed_project(async_session_factory)
+    storage = LocalExportStorage(base_dir=tmp_path / "cache")
+    options = ExportOptions(format=ExportFormat.DXF, include_pending_overlays=True)
+
+    async with async_session_factory() as session:
+        first = await generate_project_export(
+            session, project_id=project_id, options=options, storage=storage
+        )
+
+    def _fail_render(*args, **kwargs):
+        raise AssertionError("cached export should not be re-rendered")
+
+    monkeypatch.setattr(export_core, "_render_artifact", _fail_render)
+    async with async_session_factory() as session:
+        second = await generate_project_export(
+            session, project_id=project_id, options=options, storage=storage
+        )
+
+    assert first.cached is False
+    assert second.cached is True
+    assert second.path == first.path
+    assert second.manifest == first.manifest
+    assert second.path.read_bytes() == first.path.read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_overlay_status_change_invalidates_cached_artifact(
+    async_session_factory, tmp_path
+):
+    project_id = await _seed_project(async_session_factory)
+    storage = LocalExportStorage(base_dir=tmp_path / "cache")
+    options = ExportOptions(format=ExportFormat.DWG)
+
+    async with async_session_factory() as session:
+        first = await generate_project_export(
+            session, project_id=project_id, options=options, storage=storage
+        )
+        overlay = (
+            await session.execute(
+                select(OverlaySuggestion).where(
+                    OverlaySuggestion.code == "tall_building_review"
+                )
+            )
+        ).scalar_one()
+        overlay.status = "approved"
+        await session.commit()
+
+    async with async_session_factory() as session:
+        second = await generate_project_export(
+            session, project_id=project_id, options=options, storage=storage
+        )
+
+    assert second.cached is False
+    assert second.path != first.path
+    assert "watermark" not in second.manifest
+    assert set(second.manifest["overlays"]) == {
+        "OVERLAYS:heritage_conservation",
+        "OVERLAYS:tall_building_review",
+    }
+
+
+@pytest.mark.no_db
+def test_writer_streams_features_without_materialising_lists():
+    options = ExportOptions(format=ExportFormat.DWG)
+    writer = get_writer(ExportFormat.DWG, options=options)
+    consumed: list[str] = []
+
+    def _features():
+        for index in range(3):
+            consumed.append(f"node-{index}")
+            yield {"layer": "MODEL", "id": f"node-{index}", "kind": "floor"}
+
+    buffer = io.BytesIO()
+    manifest = writer.write(
+        buffer, _features(), iter(()), None, metadata={"project_id": 7}
+    )
+
+    assert consumed == ["node-0", "node-1", "node-2"]
+    assert json.loads(buffer.getvalue()) == manifest
+    assert manifest["project_id"] == 7
+    assert [entity["id"] for entity in manifest["layers"]["MODEL"]] == consumed
+
+
+@pytest.mark.no_db
+def test_cached_artifacts_evict_least_recently_served(tmp_path):
+    storage = LocalExportStorage(base_dir=tmp_path / "cache", max_cached=2)
+
+    def _write(stream):
+        stream.write(b"{}")
+        return {}
+
+    def _store(key: str):
+        return storage.store_stream(
+            project_id=1, fmt=ExportFormat.DXF, write=_write, cache_key=key
+        )
+
+    first = _store("a" * 64)
+    _store("b" * 64)
+    os.utime(first.path.with_name(f"{first.path.name}.manifest.json"), (1, 1))
+    assert storage.lookup(project_id=1, fmt=ExportFormat.DXF, cache_key="a" * 64)
+    _store("c" * 64)
+
+    assert storage.lookup(project_id=1, fmt=ExportFormat.DXF, cache_key="a" * 64)
+    assert storage.lookup(project_id=1, fmt=ExportFormat.DXF, cache_key="c" * 64)
+    assert (
+        storage.lookup(project_id=1, fmt=ExportFormat.DXF, cache_key="b" * 64) is None
+    )
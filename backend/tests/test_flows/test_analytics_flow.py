@@ -0,0 +1,49 @@
+"""Tests for the market intelligence refresh flow."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.property import MarketTransaction, Property, PropertyType
+from backend.flows import refresh_market_intelligence
+
+
+@pytest.mark.asyncio
+async def test_refresh_serves_reports_from_fresh_snapshots(async_session_factory):
+    today = date.today()
+    async with async_session_factory() as session:
+        tower = Property(
+            name="Flow Tower",
+            address="1 Flow Road",
+            property_type=PropertyType.OFFICE,
+            location="POINT(103.85 1.28)",
+            district="D01",
+            data_source="test",
+        )
+        session.add(tower)
+        await session.flush()
+        session.add_all(
+            MarketTransaction(
+                property_id=tower.id,
+                transaction_date=today - timedelta(days=days),
+                sale_price=1_000_000,
+                psf_price=2000,
+                data_source="test",
+            )
+            for days in (10, 40)
+        )
+        await session.commit()
+
+    reports = await refresh_market_intelligence(
+        async_session_factory,
+        property_types=[PropertyType.OFFICE, PropertyType.RETAIL],
+        locations=["D01"],
+        period_months=3,
+    )
+
+    office, retail = reports
+    assert office["comparables_analysis"]["transaction_count"] == 2
+    assert office["snapshot_refreshed_at"] is not None
+    assert retail["snapshot_refreshed_at"] is None
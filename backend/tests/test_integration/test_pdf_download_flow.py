@@ -142,13 +142,14 @@ async def test_full_pdf_generation_download_flow(
         download_response.headers["content-type"] == "application/pdf"
     ), f"Wrong content-type: {download_response.headers.get('content-type')}"
 
-    # Verify content-length matches reported size
+    # Verify content-length matches reported size. A compressed response's
+    # Content-Length counts encoded bytes, so only the decoded body is compared.
     content_length = int(download_response.headers.get("content-length", 0))
     actual_size = len(download_response.content)
     assert (
         actual_size == size_bytes
     ), f"Downloaded PDF size ({actual_size}) doesn't match size_bytes ({size_bytes})"
-    if content_length:
+    if content_length and "content-encoding" not in download_response.headers:
         assert (
             content_length == size_bytes
         ), f"Content-Length ({content_length}) doesn't match size_bytes ({size_bytes})"
@@ -1,3 +1,4 @@
+import os
 import tempfile
 
 import pytest
@@ -5,10 +6,13 @@ import pytest
 pytest.importorskip("ezdxf")
 
 import ezdxf  # type: ignore  # noqa: E402
+from backend.app.services.storage import reset_storage_service
+from backend.jobs import parse_cad
 from backend.jobs.parse_cad import (
     _parse_dxf_payload,
     _persist_result,
     _prepare_dxf_quicklook,
+    detect_dxf_metadata,
 )
 
 from app.models.imports import ImportRecord
@@ -73,6 +77,48 @@ def test_parse_dxf_payload_propagates_metadata():
     assert pytest.approx(space.metadata["area_sqm"], rel=1e-6) == 12.0
 
 
+@pytest.mark.no_db
+def test_parse_reuses_entity_table_written_by_detection(monkeypatch, tmp_path):
+    monkeypatch.setenv("STORAGE_LOCAL_PATH", str(tmp_path))
+    reset_storage_service()
+    payload = _dxf_payload_mm()
+
+    try:
+        floors, units, layers = detect_dxf_metadata(payload)
+        cache_files = list((tmp_path / "cad-quicklook").glob("*.dxf.json"))
+        assert len(cache_files) == 1
+
+        def _fail_read(_payload: bytes) -> None:
+            raise AssertionError("DXF document should not be re-read")
+
+        monkeypatch.setattr(parse_cad, "_read_dxf_document", _fail_read)
+        parsed = _parse_dxf_payload(payload)
+    finally:
+        reset_storage_service()
+
+    assert parsed.floors == floors
+    assert parsed.units == units
+    assert parsed.layers == layers
+    assert pytest.approx(parsed.metadata["site_area_sqm"], rel=1e-6) == 12.0
+    space = parsed.graph.spaces[units[0]]
+    assert pytest.approx(space.metadata["area_sqm"], rel=1e-6) == 12.0
+
+
+@pytest.mark.no_db
+def test_quicklook_cache_evicts_least_recently_used(tmp_path):
+    for index in range(4):
+        entry = tmp_path / f"{index}.dxf.json"
+        entry.write_text("{}")
+        os.utime(entry, (index, index))
+
+    parse_cad._prune_quicklook_cache(tmp_path, 2)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "2.dxf.json",
+        "3.dxf.json",
+    ]
+
+
 @pytest.mark.asyncio
 async def test_persist_result_includes_zone(async_session_factory):
     payload_bytes = _dxf_payload_mm()
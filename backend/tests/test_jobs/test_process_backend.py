@@ -0,0 +1,119 @@
+"""Tests for the process-pool job backend."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+
+import pytest
+
+import backend.jobs as jobs_module
+
+# Test modules are not importable in spawned workers, so the probe runs as an
+# ``eval`` job that reads the worker's job queue backend and render settings.
+_WORKER_SETTINGS_PROBE = (
+    "(type(__import__('backend.jobs', fromlist=['job_queue']).job_queue._backend)"
+    ".__name__, __import__('os').environ['JOB_QUEUE_BACKEND'],"
+    " __import__('app.core.config', fromlist=['settings'])"
+    ".settings.PREVIEW_RENDER_WORKERS)"
+)
+
+
+@pytest.fixture
+def process_backend(monkeypatch):
+    # Spawned workers import the settings module outside of pytest.
+    monkeypatch.setenv("SECRET_KEY", "test-secret-key")
+    backend = jobs_module._ProcessPoolBackend(
+        max_workers=2,
+        queue_limits={"imports:parse": 1, "slow": 1},
+        timeout_seconds=60,
+        queue_timeouts={"slow": 0.5},
+    )
+    yield backend
+    backend.shutdown()
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_process_backend_hands_off_results(process_backend) -> None:
+    process_backend.register(math.factorial, "math.factorial", "imports:parse")
+
+    dispatch = await process_backend.enqueue("math.factorial", None, (10,), {})
+
+    assert dispatch.backend == "process"
+    assert dispatch.status == "completed"
+    assert dispatch.queue == "imports:parse"
+    assert dispatch.result == 3628800
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_process_backend_runs_coroutine_jobs(process_backend) -> None:
+    process_backend.register(asyncio.sleep, "asyncio.sleep", None)
+
+    dispatch = await process_backend.enqueue(
+        "asyncio.sleep", None, (0,), {"result": {"ok": True}}
+    )
+
+    assert dispatch.queue == "default"
+    assert dispatch.result == {"ok": True}
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_process_backend_enforces_queue_timeout(process_backend) -> None:
+    process_backend.register(asyncio.sleep, "asyncio.sleep", "slow")
+
+    with pytest.raises(TimeoutError, match="slow"):
+        await process_backend.enqueue("asyncio.sleep", None, (2,), {})
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_timed_out_job_keeps_its_slot_until_it_returns(process_backend) -> None:
+    process_backend.register(asyncio.sleep, "asyncio.sleep", "slow")
+
+    with pytest.raises(TimeoutError):
+        await process_backend.enqueue("asyncio.sleep", None, (1,), {})
+
+    slot = process_backend._get_semaphore("slow")
+    assert slot.locked()
+    for _ in range(200):
+        if not slot.locked():
+            break
+        await asyncio.sleep(0.05)
+    assert not slot.locked()
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_workers_dispatch_inline_and_render_on_threads(
+    monkeypatch, process_backend
+) -> None:
+    # The overrides must be in place before the worker builds its job queue.
+    monkeypatch.setenv("JOB_QUEUE_BACKEND", "process")
+    monkeypatch.setenv("PREVIEW_RENDER_WORKERS", "1")
+    process_backend.register(eval, "worker.settings", None)
+
+    dispatch = await process_backend.enqueue(
+        "worker.settings", None, (_WORKER_SETTINGS_PROBE,), {}
+    )
+
+    assert dispatch.result == ("_InlineBackend", "inline", 0)
+
+
+@pytest.mark.no_db
+def test_process_backend_caps_queue_concurrency(process_backend) -> None:
+    async def _limits() -> tuple[int, int]:
+        parse = process_backend._get_semaphore("imports:parse")
+        other = process_backend._get_semaphore("preview")
+        return parse._value, other._value
+
+    assert asyncio.run(_limits()) == (1, 2)
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_process_backend_rejects_unknown_jobs(process_backend) -> None:
+    with pytest.raises(KeyError):
+        await process_backend.enqueue("missing", None, (), {})
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
-from backend.jobs.raster_vector import vectorize_floorplan
+from backend.jobs.raster_vector import (
+    RasterVectorOptions,
+    _extract_pdf_paths,
+    shutdown_page_executor,
+    vectorize_floorplan,
+)
+from backend.jobs import raster_vector
 
 SAMPLE_PDF = (
     Path(__file__).resolve().parents[3] / "samples" / "pdf" / "floor_simple.pdf"
@@ -81,3 +91,80 @@ async def test_vectorize_jpeg_detects_bitmap_walls() -> None:
     assert result["paths"] == []
     assert result["bounds"] == {"width": 24.0, "height": 24.0}
     assert result["walls"]
+
+
+def test_parallel_pdf_pages_merge_in_page_order(monkeypatch) -> None:
+    pytest.importorskip("fitz")
+    # Spawned page workers import the settings module outside of pytest.
+    monkeypatch.setenv("SECRET_KEY", "test-secret-key")
+    payload = SAMPLE_PDF.read_bytes()
+
+    sequential = _extract_pdf_paths(
+        payload, RasterVectorOptions(infer_walls=True, page_workers=1)
+    )
+    completed: list[int] = []
+    try:
+        parallel = _extract_pdf_paths(
+            payload,
+            RasterVectorOptions(infer_walls=True, page_workers=2, parallel_min_pages=2),
+            on_page=lambda page: completed.append(page.page_index),
+        )
+    finally:
+        shutdown_page_executor()
+
+    sequential_payload = sequential.to_payload()
+    parallel_payload = parallel.to_payload()
+    assert sorted(completed) == list(range(len(parallel.pages)))
+    assert [page["page"] for page in parallel_payload["pages"]] == [1, 2]
+    assert all(page["duration_ms"] >= 0 for page in parallel_payload["pages"])
+    assert parallel_payload["paths"] == sequential_payload["paths"]
+    assert parallel_payload["walls"] == sequential_payload["walls"]
+    path_ids = [entry["id"] for entry in parallel_payload["paths"]]
+    assert len(path_ids) == len(set(path_ids))
+    assert path_ids[0].startswith("page-1-path-")
+
+
+def test_short_pdf_skips_page_worker_pool(monkeypatch) -> None:
+    pytest.importorskip("fitz")
+
+    def _no_pool():
+        raise AssertionError("short documents should not use the page pool")
+
+    monkeypatch.setattr(raster_vector, "_get_page_executor", _no_pool)
+    completed: list[int] = []
+    result = _extract_pdf_paths(
+        SAMPLE_PDF.read_bytes(),
+        RasterVectorOptions(page_workers=4, parallel_min_pages=3),
+        on_page=lambda page: completed.append(page.page_index),
+    )
+
+    assert completed == [0, 1]
+    assert [page["page"] for page in result.pages] == [1, 2]
+
+
+def test_page_workers_caps_pages_in_flight(monkeypatch) -> None:
+    lock = threading.Lock()
+    running = peak = 0
+
+    def _fake_page(pdf_path, index, options):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return SimpleNamespace(page_index=index)
+
+    pool = ThreadPoolExecutor(max_workers=4)
+    monkeypatch.setattr(raster_vector, "_get_page_executor", lambda: pool)
+    monkeypatch.setattr(raster_vector, "_process_pdf_page_from_path", _fake_page)
+    try:
+        results = raster_vector._extract_pages_parallel(
+            b"%PDF", 6, RasterVectorOptions(page_workers=2), None
+        )
+    finally:
+        pool.shutdown()
+
+    assert [result.page_index for result in results] == list(range(6))
+    assert peak == 2
@@ -2,68 +2,46 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Awaitable, Callable
+from collections.abc import Callable
 
-import pytest
-from fastapi import Request, Response
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
 
 from app.middleware.security import SecurityHeadersConfig, SecurityHeadersMiddleware
 
 
-def _build_request(
-    *,
-    method: str = "GET",
-    path: str = "/",
-    scheme: str = "http",
-    headers: dict[str, str] | None = None,
-    host: str = "testserver",
-) -> Request:
-    merged_headers = {"host": host}
-    if headers:
-        merged_headers.update(headers)
-    return Request(
-        scope={
-            "type": "http",
-            "method": method,
-            "path": path,
-            "headers": [
-                (key.lower().encode("utf-8"), value.encode("utf-8"))
-                for key, value in merged_headers.items()
-            ],
-            "scheme": scheme,
-            "server": ("testserver", 443 if scheme == "https" else 80),
-            "client": ("testclient", 123),
-            "root_path": "",
-            "query_string": b"",
-            "state": {},
-        }
-    )
+def _plain_response() -> Response:
+    return Response(content="test", media_type="text/plain")
 
 
-async def _dummy_app(*_args: object, **_kwargs: object) -> Response:
-    return Response(content="stub", media_type="text/plain")
+def _build_client(
+    config: SecurityHeadersConfig | None = None,
+    build_response: Callable[[], Response] = _plain_response,
+    *,
+    base_url: str = "https://testserver",
+) -> TestClient:
+    """Serve ``build_response`` from ``/`` behind the middleware."""
 
+    async def endpoint(_: Request) -> Response:
+        return build_response()
 
-def _build_middleware(
-    config: SecurityHeadersConfig | None = None,
-) -> SecurityHeadersMiddleware:
-    app: Callable[..., Awaitable[Response]] = _dummy_app
-    return SecurityHeadersMiddleware(app=app, config=config)
+    app = Starlette(
+        routes=[Route("/", endpoint, methods=["GET", "POST"])],
+        middleware=[Middleware(SecurityHeadersMiddleware, config=config)],
+    )
+    return TestClient(app, base_url=base_url)
 
 
-@pytest.mark.asyncio
-async def test_dispatch_adds_security_headers_for_secure_requests() -> None:
+def test_adds_security_headers_for_secure_requests() -> None:
     """Secure responses should receive the full default header set."""
 
-    async def mock_call_next(_: Request) -> Response:
-        return Response(content="test", media_type="text/plain")
-
     config = SecurityHeadersConfig(environment="production")
-    middleware = _build_middleware(config)
 
-    request = _build_request(scheme="https")
-    response = await middleware.dispatch(request, mock_call_next)
+    response = _build_client(config).get("/")
 
     assert response.headers["Strict-Transport-Security"] == config.production_hsts
     assert response.headers["X-Content-Type-Options"] == config.x_content_type_options
@@ -85,37 +63,29 @@ async def test_dispatch_adds_security_headers_for_secure_requests() -> None:
     )
 
 
-@pytest.mark.asyncio
-async def test_dispatch_skips_hsts_for_insecure_requests() -> None:
+def test_skips_hsts_for_insecure_requests() -> None:
     """HSTS should not be emitted when the request is not HTTPS."""
 
-    async def mock_call_next(_: Request) -> Response:
-        return Response(content="test", media_type="text/plain")
-
     config = SecurityHeadersConfig(environment="production")
-    middleware = _build_middleware(config)
+    client = _build_client(config, base_url="http://testserver")
 
-    request = _build_request(scheme="http")
-    response = await middleware.dispatch(request, mock_call_next)
+    response = client.get("/")
 
     assert "Strict-Transport-Security" not in response.headers
 
 
-@pytest.mark.asyncio
-async def test_dispatch_preserves_existing_headers() -> None:
+def test_preserves_existing_headers() -> None:
     """Pre-existing headers should not be overwritten."""
 
-    async def mock_call_next(_: Request) -> Response:
-        response = Response(content="test", media_type="text/plain")
+    def build_response() -> Response:
+        response = _plain_response()
         response.headers["Strict-Transport-Security"] = "max-age=31536000"
         response.headers["Custom-Header"] = "custom-value"
         return response
 
     config = SecurityHeadersConfig(environment="production")
-    middleware = _build_middleware(config)
-    request = _build_request(scheme="https")
 
-    response = await middleware.dispatch(request, mock_call_next)
+    response = _build_client(config, build_response).get("/")
 
     assert response.headers["Strict-Transport-Security"] == "max-age=31536000"
     assert response.headers["Custom-Header"] == "custom-value"
@@ -123,87 +93,72 @@ async def test_dispatch_preserves_existing_headers() -> None:
     assert response.headers["X-Frame-Options"] == config.x_frame_options
 
 
-@pytest.mark.asyncio
-async def test_dispatch_preserves_existing_csp() -> None:
+def test_preserves_existing_csp() -> None:
     """A response that already set CSP should keep its own policy."""
 
-    async def mock_call_next(_: Request) -> Response:
-        response = Response(content="test", media_type="text/plain")
+    def build_response() -> Response:
+        response = _plain_response()
         response.headers["Content-Security-Policy"] = "default-src 'self'"
         return response
 
     config = SecurityHeadersConfig(environment="production")
-    middleware = _build_middleware(config)
-    request = _build_request(scheme="https")
 
-    response = await middleware.dispatch(request, mock_call_next)
+    response = _build_client(config, build_response).get("/")
 
     assert response.headers["Content-Security-Policy"] == "default-src 'self'"
     assert response.headers["Strict-Transport-Security"] == config.production_hsts
     assert response.headers["X-Content-Type-Options"] == config.x_content_type_options
 
 
-@pytest.mark.asyncio
-async def test_dispatch_uses_setdefault() -> None:
+def test_uses_setdefault() -> None:
     """Headers already present should keep their original values."""
 
-    async def mock_call_next(_: Request) -> Response:
-        response = Response(content="test", media_type="text/plain")
+    def build_response() -> Response:
+        response = _plain_response()
         response.headers["X-Frame-Options"] = "SAMEORIGIN"
         response.headers["Referrer-Policy"] = "no-referrer"
         return response
 
     config = SecurityHeadersConfig(environment="production")
-    middleware = _build_middleware(config)
-    request = _build_request(scheme="https")
 
-    response = await middleware.dispatch(request, mock_call_next)
+    response = _build_client(config, build_response).get("/")
 
     assert response.headers["X-Frame-Options"] == "SAMEORIGIN"
     assert response.headers["Referrer-Policy"] == "no-referrer"
     assert response.headers["X-Content-Type-Options"] == "nosniff"
 
 
-@pytest.mark.asyncio
-async def test_dispatch_injects_nonce_for_html_responses() -> None:
+def test_injects_nonce_for_html_responses() -> None:
     """HTML responses should receive a per-request nonce in the body and CSP."""
 
-    async def mock_call_next(_: Request) -> Response:
+    def build_response() -> Response:
         return Response(
             content="<html><style>body{}</style><script>console.log('x')</script></html>",
             media_type="text/html",
         )
 
-    config = SecurityHeadersConfig(environment="production")
-    middleware = _build_middleware(config)
-    request = _build_request(scheme="https")
+    config = SecurityHeadersConfig(environment="production", expose_nonce_header=True)
 
-    response = await middleware.dispatch(request, mock_call_next)
+    response = _build_client(config, build_response).get("/")
 
-    nonce = request.state.csp_nonce
+    nonce = response.headers["X-CSP-Nonce"]
     assert f"'nonce-{nonce}'" in response.headers["Content-Security-Policy"]
-    body = response.body.decode("utf-8")
-    assert f'<style nonce="{nonce}">' in body
-    assert f'<script nonce="{nonce}">' in body
+    assert f'<style nonce="{nonce}">' in response.text
+    assert f'<script nonce="{nonce}">' in response.text
+    assert response.headers["content-length"] == str(len(response.content))
 
 
-@pytest.mark.asyncio
-async def test_dispatch_rejects_invalid_cookie_origin() -> None:
+def test_rejects_invalid_cookie_origin() -> None:
     """Cross-site mutating browser requests with cookies should be rejected."""
 
-    async def mock_call_next(_: Request) -> Response:
-        return Response(content="ok", media_type="text/plain")
-
     config = SecurityHeadersConfig(
         environment="production",
         allowed_origins=("https://app.example.com",),
     )
-    middleware = _build_middleware(config)
-    request = _build_request(
-        method="POST",
-        path="/session/update",
-        scheme="https",
-        host="api.example.com",
+    client = _build_client(config, base_url="https://api.example.com")
+
+    response = client.post(
+        "/",
         headers={
             "origin": "https://evil.example.com",
             "cookie": "session=abc123",
@@ -211,57 +166,79 @@ async def test_dispatch_rejects_invalid_cookie_origin() -> None:
         },
     )
 
-    response = await middleware.dispatch(request, mock_call_next)
-
     assert response.status_code == 403
     assert response.headers["content-type"].startswith("application/problem+json")
     assert response.headers["Strict-Transport-Security"] == config.production_hsts
-    payload = json.loads(response.body)
+    payload = response.json()
     assert payload["code"] == "origin_validation_failed"
     assert payload["correlation_id"] == "cid-browser"
 
 
-@pytest.mark.asyncio
-async def test_dispatch_allows_cookie_origin_from_allowlist() -> None:
+def test_allows_cookie_origin_from_allowlist() -> None:
     """Explicitly allowed browser origins should pass through."""
 
-    async def mock_call_next(_: Request) -> Response:
-        return Response(content="ok", media_type="text/plain")
-
     config = SecurityHeadersConfig(
         environment="production",
         allowed_origins=("https://app.example.com",),
     )
-    middleware = _build_middleware(config)
-    request = _build_request(
-        method="POST",
-        path="/session/update",
-        scheme="https",
-        host="api.example.com",
-        headers={
-            "origin": "https://app.example.com",
-            "cookie": "session=abc123",
-        },
+    client = _build_client(
+        config,
+        lambda: Response(content="ok", media_type="text/plain"),
+        base_url="https://api.example.com",
     )
 
-    response = await middleware.dispatch(request, mock_call_next)
+    response = client.post(
+        "/",
+        headers={"origin": "https://app.example.com", "cookie": "session=abc123"},
+    )
 
     assert response.status_code == 200
-    assert response.body == b"ok"
+    assert response.content == b"ok"
 
 
-@pytest.mark.asyncio
-async def test_dispatch_with_empty_response() -> None:
+def test_applies_headers_to_empty_responses() -> None:
     """Security headers should still be applied to empty responses."""
 
-    async def mock_call_next(_: Request) -> Response:
-        return Response(content="", status_code=204)
-
-    middleware = _build_middleware()
-    request = _build_request(scheme="https")
+    client = _build_client(build_response=lambda: Response(status_code=204))
 
-    response = await middleware.dispatch(request, mock_call_next)
+    response = client.get("/")
 
     assert response.status_code == 204
     assert "X-Content-Type-Options" in response.headers
     assert "X-Frame-Options" in response.headers
+
+
+def test_asgi_stack_injects_nonce_into_streamed_html() -> None:
+    """HTML bodies are buffered for nonce injection; other responses stream."""
+
+    from fastapi import FastAPI
+    from fastapi.responses import StreamingResponse
+    from fastapi.testclient import TestClient
+
+    app = FastAPI()
+    app.add_middleware(
+        SecurityHeadersMiddleware,
+        config=SecurityHeadersConfig(expose_nonce_header=True),
+    )
+
+    @app.get("/page")
+    def page() -> StreamingResponse:
+        chunks = iter([b"<html><script>", b"run()</script></html>"])
+        return StreamingResponse(chunks, media_type="text/html")
+
+    @app.get("/data")
+    def data() -> StreamingResponse:
+        return StreamingResponse(iter([b"a,", b"b"]), media_type="text/csv")
+
+    client = TestClient(app)
+
+    page_response = client.get("/page")
+    nonce = page_response.headers["X-CSP-Nonce"]
+    assert f"'nonce-{nonce}'" in page_response.headers["Content-Security-Policy"]
+    assert page_response.text == f'<html><script nonce="{nonce}">run()</script></html>'
+    assert page_response.headers["content-length"] == str(len(page_response.content))
+
+    data_response = client.get("/data")
+    assert data_response.text == "a,b"
+    assert data_response.headers["X-Frame-Options"] == "DENY"
+    assert "content-length" not in data_response.headers
@@ -0,0 +1,16 @@
+"""Tests for the middleware latency benchmark script."""
+
+from __future__ import annotations
+
+import pytest
+from backend.scripts import benchmark_middleware
+
+
+@pytest.mark.asyncio
+async def test_benchmark_reports_bare_and_stack_latencies() -> None:
+    report = await benchmark_middleware.run_benchmark(requests=5, warmup=1)
+
+    assert report["requests"] == 5
+    for name in ("bare", "stack"):
+        assert 0 < report[name]["p50_ms"] <= report[name]["p95_ms"] * 5
+    assert "overhead_p50_ms" in report
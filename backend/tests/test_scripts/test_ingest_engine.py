@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from contextlib import closing
+from functools import partial
+from pathlib import Path
+
+import pytest
+from backend.scripts import ingest_engine
+from backend.scripts import ingest_hk_parcels as hk_parcels
+from sqlalchemy import select
+
+from app.models.rkp import RefParcel
+
+FIXTURE_PATH = (
+    Path(__file__).resolve().parents[1] / "fixtures" / "hk" / "lots_sample.geojson"
+)
+
+
+def _square(x: float, y: float) -> dict:
+    return {
+        "type": "Polygon",
+        "coordinates": [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]],
+    }
+
+
+@pytest.mark.no_db
+def test_reader_matches_json_load_across_chunk_boundaries(tmp_path: Path) -> None:
+    features = [
+        {"type": "Feature", "geometry": _square(i, i), "properties": {"n": i}}
+        for i in range(50)
+    ]
+    path = tmp_path / "features.geojson"
+    path.write_text(
+        json.dumps({"type": "FeatureCollection", "features": features}, indent=2),
+        encoding="utf-8",
+    )
+
+    streamed = list(ingest_engine.iter_geojson_features(path, chunk_size=7))
+
+    assert streamed == features
+
+
+@pytest.mark.no_db
+def test_reader_rejects_truncated_features_array(tmp_path: Path) -> None:
+    path = tmp_path / "truncated.geojson"
+    path.write_text('{"features": [{"type": "Feature"}, {"type": ', encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        list(ingest_engine.iter_geojson_features(path, chunk_size=8))
+
+
+@pytest.mark.no_db
+def test_normalise_features_keeps_order_and_reports_errors() -> None:
+    def normaliser(feature: dict) -> int:
+        if feature["n"] % 3 == 0:
+            raise ValueError("multiple of three")
+        return feature["n"] * 10
+
+    results = list(
+        ingest_engine.normalise_features(
+            ((i, {"n": i}) for i in range(10)), normaliser, workers=1, chunk_size=4
+        )
+    )
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.record for result in results if result.error is None] == [
+        10,
+        20,
+        40,
+        50,
+        70,
+        80,
+    ]
+    assert results[3].error == "multiple of three"
+
+
+@pytest.mark.no_db
+def test_normalise_features_parallel_matches_sequential(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("SECRET_KEY", "test-secret-key")
+    features = list(ingest_engine.iter_geojson_features(FIXTURE_PATH)) * 4
+    normaliser = partial(
+        hk_parcels._normalise_projected,  # noqa: SLF001
+        source_epsg=2326,
+        source_label="unit_test",
+    )
+
+    def _refs(workers: int) -> list[str]:
+        results = ingest_engine.normalise_features(
+            enumerate(features), normaliser, workers=workers, chunk_size=1
+        )
+        with closing(results):
+            return [result.record.parcel_ref for result in results]
+
+    assert _refs(2) == _refs(1)
+
+
+@pytest.mark.asyncio
+async def test_bulk_loader_replaces_rows_sharing_keys(session) -> None:
+    loader = ingest_engine.BulkLoader(
+        RefParcel.__table__, key_columns=("jurisdiction", "parcel_ref")
+    )
+    rows = [
+        {"jurisdiction": "HK", "parcel_ref": "HK:LOT:1", "area_m2": 10.0},
+        {"jurisdiction": "HK", "parcel_ref": "HK:LOT:2", "area_m2": 20.0},
+    ]
+    await loader.load(session, rows)
+    await loader.load(
+        session,
+        [{"jurisdiction": "HK", "parcel_ref": "HK:LOT:2", "area_m2": 25.0}],
+        replace=True,
+    )
+    await session.commit()
+
+    stored = (
+        await session.execute(
+            select(RefParcel.parcel_ref, RefParcel.area_m2).order_by(
+                RefParcel.parcel_ref
+            )
+        )
+    ).all()
+    assert [(ref, float(area)) for ref, area in stored] == [
+        ("HK:LOT:1", 10.0),
+        ("HK:LOT:2", 25.0),
+    ]
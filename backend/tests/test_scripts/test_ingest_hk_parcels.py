@@ -9,7 +9,7 @@ FIXTURE_PATH = (
 
 
 def test_iter_geojson_features_streams_fixture():
-    features = list(hk_parcels._iter_geojson_features(FIXTURE_PATH))  # noqa: SLF001
+    features = list(hk_parcels.iter_geojson_features(FIXTURE_PATH))
     assert len(features) == 2
     assert features[0]["properties"]["LOTCSUID"] == "HKLOT0001"
     assert features[1]["properties"]["LOTCSUID"] == "HKLOT0002"
@@ -17,7 +17,7 @@ def test_iter_geojson_features_streams_fixture():
 
 def test_normalise_feature_projects_geometry():
     transformer = Transformer.from_crs("EPSG:2326", "EPSG:4326", always_xy=True)
-    features = list(hk_parcels._iter_geojson_features(FIXTURE_PATH))  # noqa: SLF001
+    features = list(hk_parcels.iter_geojson_features(FIXTURE_PATH))
 
     record = hk_parcels._normalise_feature(  # noqa: SLF001
         features[0], transformer, source_label="unit_test"
@@ -243,3 +243,136 @@ async def test_generate_skips_invalid_agent_ids(async_session_factory):
         assert (
             valid_snapshot is not None
         ), f"Expected snapshot for valid agent {agent_id}"
+
+
+_SNAPSHOT_FIELDS = (
+    "deals_open",
+    "deals_closed_won",
+    "deals_closed_lost",
+    "gross_pipeline_value",
+    "weighted_pipeline_value",
+    "confirmed_commission_amount",
+    "disputed_commission_amount",
+    "avg_cycle_days",
+    "conversion_rate",
+    "roi_metrics",
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [500, 1])
+async def test_bulk_snapshots_match_per_agent_snapshots(
+    async_session_factory, monkeypatch, batch_size
+):
+    from app.core.metrics import RoiSnapshot
+    from app.services.deals import performance as performance_module
+
+    roi_calls: list[int] = []
+
+    async def _fake_roi(session, *, project_id):
+        roi_calls.append(project_id)
+        return RoiSnapshot(
+            project_id=project_id,
+            iterations=2,
+            total_suggestions=4,
+            decided_suggestions=3,
+            accepted_suggestions=2,
+            acceptance_rate=0.67,
+            review_hours_saved=5.0,
+            automation_score=0.5,
+            savings_percent=40,
+            payback_weeks=4,
+            baseline_hours=10.0,
+            actual_hours=5.0,
+        )
+
+    monkeypatch.setattr(performance_module, "compute_project_roi", _fake_roi)
+    monkeypatch.setattr(performance_module, "SNAPSHOT_BATCH_SIZE", batch_size)
+    deal_service = AgentDealService()
+    commission_service = AgentCommissionService()
+    performance_service = AgentPerformanceService()
+    agent_ids = [uuid4(), uuid4()]
+
+    async with async_session_factory() as session:
+        for index, agent_id in enumerate(agent_ids):
+            session.add(
+                User(
+                    id=str(agent_id),
+                    email=f"bulk-agent-{index}@example.com",
+                    username=f"bulk_agent_{index}",
+                    full_name=f"Bulk Agent {index}",
+                    hashed_password="secret",
+                )
+            )
+        await session.commit()
+
+        for index, agent_id in enumerate(agent_ids):
+            won = await deal_service.create_deal(
+                session=session,
+                agent_id=agent_id,
+                title=f"Won Deal {index}",
+                asset_type=DealAssetType.OFFICE,
+                deal_type=DealType.SELL_SIDE,
+                estimated_value_amount=1_000_000.0 * (index + 1),
+                confidence=0.5,
+                created_by=agent_id,
+            )
+            await deal_service.change_stage(
+                session=session,
+                deal=won,
+                to_stage=PipelineStage.CLOSED_WON,
+                changed_by=agent_id,
+            )
+            won.metadata = {"roi_project_id": 7}
+            session.add(won)
+            await session.commit()
+            commission = await commission_service.create_commission(
+                session=session,
+                deal=won,
+                agent_id=agent_id,
+                commission_type=CommissionType.EXCLUSIVE,
+                basis_amount=100_000.0,
+                commission_rate=0.05,
+                commission_amount=5_000.0 * (index + 1),
+            )
+            await commission_service.update_status(
+                session=session,
+                deal=won,
+                record=commission,
+                status=CommissionStatus.CONFIRMED,
+            )
+            await deal_service.create_deal(
+                session=session,
+                agent_id=agent_id,
+                title=f"Open Deal {index}",
+                asset_type=DealAssetType.RETAIL,
+                deal_type=DealType.LEASE,
+                estimated_value_amount=250_000.0,
+                confidence=0.2,
+                created_by=agent_id,
+            )
+
+        per_agent = await performance_service.generate_daily_snapshots(
+            session=session, agent_ids=agent_ids
+        )
+        expected = {
+            str(snapshot.agent_id): {
+                field: getattr(snapshot, field) for field in _SNAPSHOT_FIELDS
+            }
+            for snapshot in per_agent
+        }
+        assert roi_calls == [7, 7]
+
+        roi_calls.clear()
+        bulk = await performance_service.generate_daily_snapshots(
+            session=session, agent_ids=agent_ids, bulk=True
+        )
+
+    assert roi_calls == [7]
+    assert [str(snapshot.agent_id) for snapshot in bulk] == [
+        str(agent_id) for agent_id in agent_ids
+    ]
+    for snapshot in bulk:
+        actual = {field: getattr(snapshot, field) for field in _SNAPSHOT_FIELDS}
+        assert actual == expected[str(snapshot.agent_id)]
+        assert snapshot.snapshot_context_json["win_ratio"] == pytest.approx(0.5)
@@ -6,6 +6,8 @@ from datetime import date, datetime, timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import event, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.market import MarketIndex
@@ -501,84 +503,194 @@ async def test_store_indices_handles_errors(db_session: AsyncSession):
 
 
 # ============================================================================
-# GET OR CREATE PROPERTY TESTS
+# BULK SYNC TESTS
 # ============================================================================
 
 
+def _transaction_rows(count: int, price: int) -> list[dict]:
+    return [
+        {
+            "transaction_id": f"TXN-{index}",
+            "property_name": f"Bulk Tower {index % 4}",
+            "property_type": "office",
+            "transaction_date": date.today().isoformat(),
+            "sale_price": price,
+            "floor_area_sqm": 1000,
+        }
+        for index in range(count)
+    ]
+
+
 @pytest.mark.asyncio
-async def test_get_or_create_property_creates_new(db_session: AsyncSession):
-    """Test _get_or_create_property creates new property."""
-    service = MarketDataService()
+async def test_store_transactions_batches_statements(db_session: AsyncSession):
+    """Statement count should depend on batches, not rows."""
+    db_session.add(_make_property(name="Bulk Tower 0"))
+    await db_session.flush()
 
-    data = {
-        "property_name": "New Building",
-        "property_type": "office",
-        "address": "123 Test St",
-        "district": "D02",
-        "floor_area_sqm": 5000,
-    }
+    statements: list[str] = []
+    engine = db_session.get_bind()
 
-    property_id = await service._get_or_create_property(data, db_session)
+    def _capture(conn, cursor, statement, *args):
+        statements.append(statement.lstrip().split(None, 1)[0].upper())
 
-    assert property_id is not None
-    assert isinstance(property_id, str)
+    service = MarketDataService(batch_size=50)
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        count = await service._store_transactions(
+            _transaction_rows(120, 1_000_000), "bulk", db_session
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert count == 120
+    # Per batch of 50: one property lookup, at most one property insert and
+    # one transaction upsert.
+    assert statements.count("SELECT") == 3
+    assert statements.count("INSERT") <= 6
+    properties = await db_session.scalar(
+        select(func.count())
+        .select_from(Property)
+        .where(Property.name.like("Bulk Tower %"))
+    )
+    assert properties == 4
 
 
 @pytest.mark.asyncio
-async def test_get_or_create_property_returns_existing(db_session: AsyncSession):
-    """Test _get_or_create_property returns existing property."""
-    # Create existing property
-    prop = _make_property(name="Existing Building")
-    db_session.add(prop)
-    await db_session.flush()
-    existing_id = str(prop.id)
-
+async def test_store_transactions_upserts_provider_records(db_session: AsyncSession):
+    """Re-syncing a provider record updates it instead of duplicating it."""
     service = MarketDataService()
-    data = {
-        "property_name": "Existing Building",
-        "property_type": "office",
-    }
 
-    property_id = await service._get_or_create_property(data, db_session)
+    rows = _transaction_rows(3, 1_000_000)
+    rows.append({**rows[0], "sale_price": 1_500_000})
+    assert await service._store_transactions(rows, "bulk", db_session) == 3
+    assert (
+        await service._store_transactions(
+            _transaction_rows(3, 2_000_000), "bulk", db_session
+        )
+        == 3
+    )
 
-    assert property_id == existing_id
+    prices = (
+        await db_session.execute(
+            select(MarketTransaction.source_record_id, MarketTransaction.sale_price)
+            .where(MarketTransaction.data_source == "bulk")
+            .order_by(MarketTransaction.source_record_id)
+        )
+    ).all()
+    assert [(record, int(price)) for record, price in prices] == [
+        ("TXN-0", 2_000_000),
+        ("TXN-1", 2_000_000),
+        ("TXN-2", 2_000_000),
+    ]
 
 
 @pytest.mark.asyncio
-async def test_get_or_create_property_handles_missing_name(db_session: AsyncSession):
-    """Test _get_or_create_property handles missing property_name."""
+async def test_sync_provider_reports_throughput(db_session: AsyncSession):
+    """Sync results include rows written and rows per second."""
     service = MarketDataService()
 
-    data = {
-        "property_type": "office",
-        "district": "D03",
-    }
+    result = await service.sync_provider(
+        "test_provider",
+        MockMarketDataProvider(),
+        db_session,
+        property_types=[PropertyType.OFFICE, PropertyType.RETAIL],
+    )
+
+    throughput = result["throughput"]
+    assert throughput["rows"] == 40
+    assert throughput["rows"] == (
+        result["results"]["transactions"] + result["results"]["rentals"]
+    )
+    assert throughput["rows_per_second"] > 0
 
-    property_id = await service._get_or_create_property(data, db_session)
 
-    assert property_id is not None
+# ============================================================================
+# RESOLVE PROPERTY IDS TESTS
+# ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_get_or_create_property_maps_types(db_session: AsyncSession):
-    """Test property type mapping from strings."""
+async def test_resolve_property_ids_reuses_and_creates(db_session: AsyncSession):
+    """Existing properties are reused and missing ones created in one insert."""
+    prop = _make_property(name="Existing Building")
+    db_session.add(prop)
+    await db_session.flush()
+
     service = MarketDataService()
+    rows = [
+        {"property_name": "Existing Building", "property_type": "office"},
+        {"property_name": "New Building", "property_type": "retail"},
+        {"property_type": "office", "district": "D03"},
+    ]
 
-    test_cases = [
-        ("office", PropertyType.OFFICE),
-        ("retail", PropertyType.RETAIL),
-        ("residential", PropertyType.RESIDENTIAL),
-        ("industrial", PropertyType.INDUSTRIAL),
-        ("unknown", PropertyType.OFFICE),  # Default fallback
+    property_ids = await service._resolve_property_ids(rows, db_session)
+
+    assert property_ids["Existing Building"] == prop.id
+    created = (
+        await db_session.execute(
+            select(Property.name, Property.property_type).where(
+                Property.id.in_(
+                    [property_ids["New Building"], property_ids["Unknown Property"]]
+                )
+            )
+        )
+    ).all()
+    assert sorted(created) == [
+        ("New Building", PropertyType.RETAIL),
+        ("Unknown Property", PropertyType.OFFICE),
     ]
 
-    for type_str, _expected_type in test_cases:
-        data = {
-            "property_name": f"Test {type_str} Building",
-            "property_type": type_str,
-        }
-        property_id = await service._get_or_create_property(data, db_session)
-        assert property_id is not None
+
+@pytest.mark.asyncio
+async def test_failed_batch_rolls_back_alone(db_session: AsyncSession, monkeypatch):
+    """A failing batch raises without poisoning the session for later work."""
+    service = MarketDataService(batch_size=2)
+    resolve = service._resolve_property_ids
+    calls = 0
+
+    async def _resolve(rows, session):
+        nonlocal calls
+        calls += 1
+        property_ids = await resolve(rows, session)
+        # The second batch points at no property, violating NOT NULL.
+        return property_ids if calls == 1 else dict.fromkeys(property_ids)
+
+    monkeypatch.setattr(service, "_resolve_property_ids", _resolve)
+
+    with pytest.raises(IntegrityError):
+        await service._store_transactions(
+            _transaction_rows(4, 1_000_000), "partial", db_session
+        )
+
+    stored = await db_session.scalar(
+        select(func.count())
+        .select_from(MarketTransaction)
+        .where(MarketTransaction.data_source == "partial")
+    )
+    assert stored == 2
+
+
+@pytest.mark.asyncio
+async def test_last_sync_watermark_reads_stored_sync_stamps(db_session: AsyncSession):
+    """The watermark comes from stored rows, not one instance's history."""
+    service = MarketDataService()
+    service.register_provider("other", MockMarketDataProvider())
+    assert await service.last_sync_watermark(db_session) is None
+
+    await service._store_transactions(
+        _transaction_rows(2, 1_000_000), "mock", db_session
+    )
+    await db_session.execute(
+        update(MarketTransaction)
+        .where(MarketTransaction.data_source == "mock")
+        .values(synced_at=datetime(2024, 5, 1, 8, 0))
+    )
+    await MarketDataService()._store_transactions(
+        _transaction_rows(1, 1_000_000), "other", db_session
+    )
+
+    assert await service.last_sync_watermark(db_session) == date(2024, 5, 1)
+    assert await MarketDataService().last_sync_watermark(db_session) == date(2024, 5, 1)
 
 
 # ============================================================================
@@ -22,7 +22,7 @@ from app.services.storage import StorageResult
 def _make_mock_storage_service() -> MagicMock:
     """Create a mock StorageService for testing."""
     mock = MagicMock()
-    mock.store_bytes.return_value = StorageResult(
+    mock.store_stream.return_value = StorageResult(
         bucket="test-bucket",
         key="reports/test/test.pdf",
         uri="s3://test-bucket/reports/test/test.pdf",
@@ -561,7 +561,7 @@ async def test_save_to_storage_success():
     result = await generator.save_to_storage(pdf_buffer, "test.pdf")
 
     assert result == "s3://test-bucket/reports/test/test.pdf"
-    mock_storage.store_bytes.assert_called_once()
+    mock_storage.store_stream.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -577,7 +577,7 @@ async def test_save_to_storage_with_property_id():
 
     assert result == "s3://test-bucket/reports/test/test.pdf"
     # Check that the key includes property_id
-    call_args = mock_storage.store_bytes.call_args
+    call_args = mock_storage.store_stream.call_args
     assert call_args[1]["key"] == "reports/prop-123/test.pdf"
 
 
@@ -592,7 +592,7 @@ async def test_save_to_storage_without_property_id():
 
     assert result == "s3://test-bucket/reports/test/test.pdf"
     # Check that the key uses 'general'
-    call_args = mock_storage.store_bytes.call_args
+    call_args = mock_storage.store_stream.call_args
     assert call_args[1]["key"] == "reports/general/test.pdf"
 
 
@@ -606,9 +606,9 @@ async def test_save_to_storage_with_empty_buffer():
     result = await generator.save_to_storage(pdf_buffer, "test.pdf")
 
     assert result == "s3://test-bucket/reports/test/test.pdf"
-    # Check that empty bytes were passed
-    call_args = mock_storage.store_bytes.call_args
-    assert call_args[1]["payload"] == b""
+    # Check that the empty buffer was streamed
+    call_args = mock_storage.store_stream.call_args
+    assert call_args[1]["source"].getvalue() == b""
 
 
 @pytest.mark.asyncio
@@ -621,7 +621,7 @@ async def test_save_to_storage_content_type():
     await generator.save_to_storage(pdf_buffer, "test.pdf")
 
     # Check that content_type is set correctly
-    call_args = mock_storage.store_bytes.call_args
+    call_args = mock_storage.store_stream.call_args
     assert call_args[1]["content_type"] == "application/pdf"
 
 
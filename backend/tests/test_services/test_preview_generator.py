@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
 from datetime import datetime, timezone
 from uuid import UUID
 
@@ -89,7 +91,7 @@ def test_ensure_preview_asset_writes_artifacts(monkeypatch, tmp_path):
 
     assert assets.asset_version
     assert assets.preview_url.endswith(
-        f"{property_id}/{assets.asset_version}/preview.gltf"
+        f"{property_id}/{assets.asset_version}/preview.glb"
     )
     assert assets.metadata_url.endswith(
         f"{property_id}/{assets.asset_version}/preview.json"
@@ -101,17 +103,14 @@ def test_ensure_preview_asset_writes_artifacts(monkeypatch, tmp_path):
     asset_root = preview_dir / str(property_id) / assets.asset_version
     payload_path = asset_root / "preview.json"
     thumbnail_path = asset_root / "thumbnail.png"
-    gltf_path = asset_root / "preview.gltf"
-    binary_path = asset_root / "preview.bin"
+    glb_path = asset_root / "preview.glb"
 
     payload = json.loads(payload_path.read_text(encoding="utf-8"))
     assert payload["schema_version"] == "1.0"
     assert payload["geometry_detail_level"] == "medium"
-    assert payload["asset_manifest"]["gltf"].endswith("preview.gltf")
-    assert payload["asset_manifest"]["binary"].endswith("preview.bin")
+    assert payload["asset_manifest"]["gltf"].endswith("preview.glb")
     assert payload["color_legend"][0]["label"] == "Res"
-    assert gltf_path.exists()
-    assert binary_path.exists()
+    assert glb_path.read_bytes()[:4] == b"glTF"
     assert thumbnail_path.exists()
 
 
@@ -165,3 +164,300 @@ def test_build_preview_payload_uses_footprint_area_for_geometry():
     footprint = layer["geometry"]["footprint"]["coordinates"][0]
     max_radius = max(max(abs(x), abs(y)) for x, y in footprint)
     assert max_radius < 10.0
+
+
+def _single_layer() -> list[dict[str, object]]:
+    return [{"asset_type": "Residential", "gfa_sqm": 256.0, "estimated_height_m": 32.0}]
+
+
+def test_ensure_preview_asset_reuses_identical_content(monkeypatch, tmp_path):
+    preview_dir = tmp_path / "dev-previews"
+    preview_dir.mkdir()
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    property_id = UUID("00000000-0000-0000-0000-00000000cace")
+
+    first = preview_generator.ensure_preview_asset(
+        property_id, UUID(int=1), _single_layer()
+    )
+    second = preview_generator.ensure_preview_asset(
+        property_id, UUID(int=2), _single_layer()
+    )
+    simple = preview_generator.ensure_preview_asset(
+        property_id, UUID(int=3), _single_layer(), geometry_detail_level="simple"
+    )
+
+    assert second == first
+    assert simple.asset_version != first.asset_version
+    assert sorted(path.name for path in (preview_dir / str(property_id)).iterdir()) == (
+        sorted([first.asset_version, simple.asset_version])
+    )
+    checksum = preview_generator.compute_payload_checksum(_single_layer())
+    assert (
+        preview_generator.find_preview_asset(property_id, checksum, "medium") == first
+    )
+
+
+def test_cache_hit_rerecords_directory_for_retention(monkeypatch, tmp_path):
+    preview_dir = tmp_path / "dev-previews"
+    preview_dir.mkdir()
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    monkeypatch.setenv("STORAGE_RETENTION_DAYS", "2")
+    property_id = UUID("00000000-0000-0000-0000-0000000000e1")
+    assets = preview_generator.ensure_preview_asset(
+        property_id, UUID(int=1), _single_layer()
+    )
+    asset_dir = preview_dir / str(property_id) / assets.asset_version
+    os.utime(asset_dir, (1_000_000, 1_000_000))
+    index = preview_generator.preview_retention_index()
+
+    checksum = preview_generator.compute_payload_checksum(_single_layer())
+    preview_generator.find_preview_asset(property_id, checksum, "medium")
+    preview_generator.find_preview_asset(property_id, checksum, "medium")
+
+    entries = [
+        line
+        for bucket in index.index_dir.glob("*.idx")
+        for line in bucket.read_text().splitlines()
+    ]
+    assert asset_dir.stat().st_mtime > 1_000_000
+    assert len(entries) == 2, "one record on render, one on the first stale hit"
+
+
+def test_removed_assets_are_claimed_until_rerendered(monkeypatch, tmp_path):
+    preview_dir = tmp_path / "dev-previews"
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    property_id = UUID("00000000-0000-0000-0000-0000000000e2")
+    gone = preview_dir / str(property_id) / "gone"
+    back = preview_dir / str(property_id) / "back"
+    back.mkdir(parents=True)
+    (back / "preview.json").write_text("{}")
+
+    preview_generator._journal_removed_assets([gone, back])
+    with preview_generator.claim_removed_preview_assets() as removed:
+        assert removed == {property_id: {"gone"}}
+    with preview_generator.claim_removed_preview_assets() as removed:
+        assert removed == {}
+
+
+def test_concurrent_identical_renders_coalesce(monkeypatch, tmp_path):
+    import threading
+
+    preview_dir = tmp_path / "dev-previews"
+    preview_dir.mkdir()
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    property_id = UUID("00000000-0000-0000-0000-00000000c0a1")
+
+    original = preview_generator._build_glb
+    calls: list[str] = []
+    release = threading.Event()
+
+    def slow_build(*args, **kwargs):
+        calls.append("proxy" if kwargs.get("proxy") else "mesh")
+        release.wait(timeout=5)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(preview_generator, "_build_glb", slow_build)
+
+    results: list[preview_generator.PreviewAssets] = []
+    threads = [
+        threading.Thread(
+            target=lambda index=index: results.append(
+                preview_generator.ensure_preview_asset(
+                    property_id, UUID(int=index), _single_layer()
+                )
+            )
+        )
+        for index in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert calls == ["proxy", "mesh", "mesh"]
+    assert len(results) == 3
+    assert len({result.asset_version for result in results}) == 1
+
+
+def test_collect_preview_garbage_evicts_least_recently_used(monkeypatch, tmp_path):
+    preview_dir = tmp_path / "dev-previews"
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    for index, name in enumerate(["old", "recent", "newest"]):
+        asset_dir = preview_dir / "property" / name
+        asset_dir.mkdir(parents=True)
+        (asset_dir / "preview.bin").write_bytes(b"x" * 100)
+        os.utime(asset_dir, (1_000_000 + index, 1_000_000 + index))
+
+    removed = preview_generator.collect_preview_garbage(max_bytes=200)
+
+    assert [path.name for path in removed] == ["old"]
+    assert sorted(path.name for path in (preview_dir / "property").iterdir()) == [
+        "newest",
+        "recent",
+    ]
+
+
+def test_evicted_assets_are_journalled_for_expiry(monkeypatch, tmp_path):
+    preview_dir = tmp_path / "dev-previews"
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    property_id = UUID("00000000-0000-0000-0000-0000000000e3")
+    for index, name in enumerate(["old", "new"]):
+        asset_dir = preview_dir / str(property_id) / name
+        asset_dir.mkdir(parents=True)
+        (asset_dir / "preview.bin").write_bytes(b"x" * 100)
+        os.utime(asset_dir, (1_000_000 + index, 1_000_000 + index))
+
+    preview_generator.collect_preview_garbage(max_bytes=100)
+    preview_generator.collect_preview_garbage(max_bytes=100)
+
+    with preview_generator.claim_removed_preview_assets() as removed:
+        assert removed == {property_id: {"old"}}
+
+
+def test_preview_writes_sweep_only_once_over_budget(monkeypatch, tmp_path):
+    ledger = preview_generator._PreviewCacheLedger()
+    ledger.reset(0)
+    sweeps: list[None] = []
+    monkeypatch.setattr(preview_generator, "_cache_ledger", ledger)
+    monkeypatch.setattr(preview_generator, "_cache_limit_bytes", lambda: 250)
+    monkeypatch.setattr(
+        preview_generator, "_sweep_preview_cache", lambda: sweeps.append(None)
+    )
+
+    for name in ("first", "second", "third"):
+        asset_dir = tmp_path / name
+        asset_dir.mkdir()
+        (asset_dir / "preview.glb").write_bytes(b"x" * 100)
+        preview_generator._record_preview_write(asset_dir)
+    for thread in threading.enumerate():
+        if thread.name == "preview-cache-gc":
+            thread.join(timeout=10)
+
+    assert ledger.bytes == 300
+    assert len(sweeps) == 1
+
+
+def test_ensure_preview_asset_publishes_lod_tiers_coarse_first(monkeypatch, tmp_path):
+    preview_dir = tmp_path / "dev-previews"
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    property_id = UUID("00000000-0000-0000-0000-0000000001d0")
+
+    assets = preview_generator.ensure_preview_asset(
+        property_id, UUID(int=7), _single_layer()
+    )
+
+    assert [lod.level for lod in assets.lods] == ["proxy", "simple", "medium"]
+    assert assets.lods[-1].url == assets.preview_url
+    asset_root = preview_dir / str(property_id) / assets.asset_version
+    manifest = json.loads((asset_root / "preview.json").read_text())["asset_manifest"]
+    assert manifest["lods"] == [lod.to_payload() for lod in assets.lods]
+    assert assets.manifest()["lods"] == manifest["lods"]
+    proxy, _binary = _read_glb((asset_root / "preview.proxy.glb").read_bytes())
+    proxy_indices = proxy["accessors"][proxy["meshes"][0]["primitives"][0]["indices"]]
+    assert proxy_indices["count"] == 36
+    assert not list(asset_root.glob(".*.tmp"))
+
+    simple = preview_generator.ensure_preview_asset(
+        property_id, UUID(int=8), _single_layer(), geometry_detail_level="simple"
+    )
+    assert [lod.level for lod in simple.lods] == ["proxy", "simple"]
+
+
+@pytest.mark.asyncio
+async def test_watch_preview_lods_streams_tiers_as_they_appear(monkeypatch, tmp_path):
+    import asyncio
+
+    preview_dir = tmp_path / "dev-previews"
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", preview_dir)
+    property_id = UUID("00000000-0000-0000-0000-0000000001d1")
+    asset_dir = preview_dir / str(property_id) / "v1"
+    asset_dir.mkdir(parents=True)
+    (asset_dir / "preview.proxy.glb").write_bytes(b"proxy")
+
+    received: list[str] = []
+
+    async def _consume() -> None:
+        async for lod in preview_generator.watch_preview_lods(
+            property_id, "v1", "simple", timeout_seconds=5, poll_interval=0.01
+        ):
+            received.append(lod.level)
+
+    consumer = asyncio.create_task(_consume())
+    await asyncio.sleep(0.05)
+    assert received == ["proxy"]
+    (asset_dir / "preview.glb").write_bytes(b"simple")
+    await asyncio.wait_for(consumer, timeout=5)
+
+    assert received == ["proxy", "simple"]
+
+
+def _read_glb(blob: bytes) -> tuple[dict, bytes]:
+    import struct
+
+    magic, version, length = struct.unpack_from("<III", blob, 0)
+    assert (magic, version, length) == (0x46546C67, 2, len(blob))
+    json_length, json_type = struct.unpack_from("<II", blob, 12)
+    assert json_type == 0x4E4F534A
+    document = json.loads(blob[20 : 20 + json_length])
+    bin_offset = 20 + json_length
+    bin_length, bin_type = struct.unpack_from("<II", blob, bin_offset)
+    assert bin_type == 0x004E4942
+    return document, blob[bin_offset + 8 : bin_offset + 8 + bin_length]
+
+
+def test_build_glb_interleaves_vertex_attributes():
+    property_id = UUID("00000000-0000-0000-0000-0000000000b1")
+    payload = preview_generator.build_preview_payload(property_id, _single_layer())
+
+    document, binary = _read_glb(
+        preview_generator._build_glb(property_id, "v1", payload["layers"])
+    )
+
+    primitive = document["meshes"][0]["primitives"][0]
+    position = document["accessors"][primitive["attributes"]["POSITION"]]
+    colour = document["accessors"][primitive["attributes"]["COLOR_0"]]
+    vertex_view = document["bufferViews"][position["bufferView"]]
+    assert colour["bufferView"] == position["bufferView"]
+    assert vertex_view["byteStride"] == 40
+    assert vertex_view["byteLength"] == 40 * position["count"]
+    indices = document["accessors"][primitive["indices"]]
+    assert indices["componentType"] == 5123
+    assert document["buffers"][0]["byteLength"] == len(binary)
+    assert "uri" not in document["buffers"][0]
+
+
+def test_build_glb_quantized_uses_khr_mesh_quantization():
+    property_id = UUID("00000000-0000-0000-0000-0000000000b2")
+    payload = preview_generator.build_preview_payload(property_id, _single_layer())
+
+    plain = preview_generator._build_glb(property_id, "v1", payload["layers"])
+    quantized = preview_generator._build_glb(
+        property_id, "v1", payload["layers"], quantize=True
+    )
+    document, _binary = _read_glb(quantized)
+
+    assert document["extensionsRequired"] == ["KHR_mesh_quantization"]
+    primitive = document["meshes"][0]["primitives"][0]
+    position = document["accessors"][primitive["attributes"]["POSITION"]]
+    normal = document["accessors"][primitive["attributes"]["NORMAL"]]
+    assert position["componentType"] == 5122
+    assert normal == {**normal, "componentType": 5120, "normalized": True}
+    assert document["bufferViews"][position["bufferView"]]["byteStride"] == 16
+    assert "scale" in document["nodes"][0]
+    assert len(quantized) < len(plain)
+
+
+def test_triangulate_and_normals_match_fan_semantics():
+    import numpy as np
+
+    triangles = preview_generator._triangulate_faces([[0, 1, 2, 3], [4, 5, 6]])
+    assert triangles.tolist() == [[0, 1, 2], [0, 2, 3], [4, 5, 6]]
+
+    vertices = np.array(
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 0.0, 1.0], [0.0, 0.0, 1.0]]
+    )
+    normals = preview_generator._compute_vertex_normals(
+        vertices, preview_generator._triangulate_faces([[0, 3, 2, 1]])
+    )
+    assert normals.tolist() == [[0.0, 1.0, 0.0]] * 4
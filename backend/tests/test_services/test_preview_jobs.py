@@ -280,3 +280,115 @@ async def test_refresh_job_applies_geometry_override(
 
     refreshed = await service.refresh_job(job, geometry_detail_level="medium")
     assert refreshed.metadata["geometry_detail_level"] == "medium"
+
+
+@pytest.mark.asyncio
+async def test_queue_preview_reuses_rendered_assets(
+    monkeypatch, db_session, demo_property
+):
+    inline_backend = _InlineBackend()
+    monkeypatch.setattr(job_queue_module.job_queue, "_backend", inline_backend)
+
+    async def fail_generate(job_id: str) -> None:  # pragma: no cover - guard
+        raise AssertionError("cached previews must not be re-rendered")
+
+    cached = preview_jobs.preview_generator.PreviewAssets(
+        preview_url="/static/dev-previews/p/abc/preview.gltf",
+        metadata_url="/static/dev-previews/p/abc/preview.json",
+        thumbnail_url="/static/dev-previews/p/abc/thumbnail.png",
+        asset_version="abc",
+    )
+    lookups: list[tuple[str, str]] = []
+
+    def fake_find(property_id, payload_checksum, detail_level):
+        lookups.append((payload_checksum, detail_level))
+        return cached
+
+    monkeypatch.setattr(preview_jobs, "generate_preview_job", fail_generate)
+    monkeypatch.setattr(preview_jobs.preview_generator, "find_preview_asset", fake_find)
+
+    service = PreviewJobService(db_session)
+    job = await service.queue_preview(
+        property_id=demo_property,
+        scenario="cached",
+        massing_layers=[{"id": "layer-c", "height": 40}],
+    )
+
+    assert job.status == PreviewJobStatus.READY
+    assert job.asset_version == "abc"
+    assert job.metadata["asset_manifest"]["gltf"] == cached.preview_url
+    assert lookups == [(job.payload_checksum, settings.PREVIEW_GEOMETRY_DETAIL_LEVEL)]
+
+
+@pytest.mark.asyncio
+async def test_queue_preview_applies_render_pool_back_pressure(
+    monkeypatch, db_session, demo_property
+):
+    from app.services.preview_render_pool import (
+        PreviewRenderPool,
+        PreviewRenderQueueFull,
+    )
+
+    inline_backend = _InlineBackend()
+    monkeypatch.setattr(job_queue_module.job_queue, "_backend", inline_backend)
+
+    async def fail_generate(job_id: str) -> None:  # pragma: no cover - guard
+        raise AssertionError("saturated pool must not accept new renders")
+
+    full_pool = PreviewRenderPool(max_workers=0, max_pending=1)
+    full_pool._pending = 1  # noqa: SLF001
+    monkeypatch.setattr(preview_jobs, "generate_preview_job", fail_generate)
+    monkeypatch.setattr(preview_jobs, "get_render_pool", lambda: full_pool)
+
+    service = PreviewJobService(db_session)
+    with pytest.raises(PreviewRenderQueueFull):
+        await service.queue_preview(
+            property_id=demo_property,
+            scenario="busy",
+            massing_layers=[{"id": "layer-busy", "height": 30}],
+        )
+
+    jobs = (await db_session.execute(select(PreviewJob))).scalars().all()
+    assert jobs == []
+
+    deferred = await service.queue_preview(
+        property_id=demo_property,
+        scenario="busy",
+        massing_layers=[{"id": "layer-busy", "height": 30}],
+        defer_when_saturated=True,
+    )
+
+    assert deferred.status == PreviewJobStatus.FAILED
+    assert "refresh" in deferred.message
+
+
+@pytest.mark.asyncio
+async def test_removed_preview_assets_expire_their_jobs(
+    monkeypatch, db_session, demo_property, tmp_path
+):
+    generator = preview_jobs.preview_generator
+    monkeypatch.setattr(generator, "_PREVIEW_DIR", tmp_path)
+    ready = PreviewJob(
+        property_id=demo_property,
+        status=PreviewJobStatus.READY,
+        asset_version="swept",
+        finished_at=utcnow(),
+    )
+    kept = PreviewJob(
+        property_id=demo_property,
+        status=PreviewJobStatus.READY,
+        asset_version="kept",
+        finished_at=utcnow(),
+    )
+    db_session.add_all([ready, kept])
+    await db_session.commit()
+
+    generator._journal_removed_assets([tmp_path / str(demo_property) / "swept"])
+
+    assert await preview_jobs.expire_removed_preview_jobs(db_session) == 1
+    await db_session.refresh(ready)
+    await db_session.refresh(kept)
+    assert ready.status == PreviewJobStatus.EXPIRED
+    assert ready.message == "Preview assets pruned"
+    assert kept.status == PreviewJobStatus.READY
+    assert await preview_jobs.expire_removed_preview_jobs(db_session) == 0
@@ -0,0 +1,144 @@
+"""Tests for the off-loop preview render pool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from uuid import UUID
+
+import pytest
+
+from app.services import preview_generator, preview_render_pool
+from app.utils import metrics
+
+
+def _layers(height: float = 32.0) -> list[dict[str, object]]:
+    return [
+        {"asset_type": "Residential", "gfa_sqm": 256.0, "estimated_height_m": height}
+    ]
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_thread_pool_renders_and_reports_worker_timings(monkeypatch, tmp_path):
+    monkeypatch.setattr(preview_generator, "_PREVIEW_DIR", tmp_path)
+    pool = preview_render_pool.PreviewRenderPool(max_workers=0, max_pending=2)
+    try:
+        outcome = await pool.render(
+            UUID(int=1), UUID(int=2), _layers(), geometry_detail_level="medium"
+        )
+    finally:
+        pool.shutdown()
+
+    assert outcome.finished_at >= outcome.started_at
+    assert outcome.render_ms >= 0
+    assert (tmp_path / str(UUID(int=1)) / outcome.assets.asset_version).is_dir()
+    assert pool.pending == 0
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_process_pool_renders_off_the_event_loop(monkeypatch):
+    # Spawned workers import settings outside of pytest; the pool initializer
+    # must hand them the secret key without touching this process' environment.
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    pool = preview_render_pool.PreviewRenderPool(max_workers=1, max_pending=2)
+    ticks = 0
+
+    async def _tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(_tick())
+    try:
+        outcome = await pool.render(
+            UUID("00000000-0000-0000-0000-0000000003e1"),
+            UUID(int=3),
+            _layers(41.0),
+            geometry_detail_level="simple",
+        )
+    finally:
+        ticker.cancel()
+        pool.shutdown()
+
+    assert outcome.assets.preview_url.endswith("preview.glb")
+    assert [lod.level for lod in outcome.assets.lods] == ["proxy", "simple"]
+    assert ticks > 1
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_content_but_coalesces_duplicates(monkeypatch):
+    release = threading.Event()
+    calls: list[UUID] = []
+
+    def blocking_render(property_id, job_id, *args):
+        calls.append(job_id)
+        release.wait(timeout=5)
+        return "assets", 1.0, 2.0
+
+    monkeypatch.setattr(preview_render_pool, "_render_in_worker", blocking_render)
+    pool = preview_render_pool.PreviewRenderPool(max_workers=0, max_pending=1)
+    rejected_before = metrics.PREVIEW_JOBS_REJECTED_TOTAL.labels(
+        backend="render_pool"
+    )._value.get()
+
+    def _render(job: int, checksum: str):
+        return pool.render(
+            UUID(int=9),
+            UUID(int=job),
+            _layers(),
+            geometry_detail_level="medium",
+            payload_checksum=checksum,
+        )
+
+    try:
+        first = asyncio.create_task(_render(1, "a" * 64))
+        await asyncio.sleep(0.05)
+        assert pool.saturated
+        duplicate = asyncio.create_task(_render(2, "a" * 64))
+        await asyncio.sleep(0.05)
+        with pytest.raises(preview_render_pool.PreviewRenderQueueFull):
+            await _render(3, "b" * 64)
+        release.set()
+        results = await asyncio.gather(first, duplicate)
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert calls == [UUID(int=1)]
+    assert [result.render_ms for result in results] == [1000.0, 1000.0]
+    assert pool.pending == 0
+    assert (
+        metrics.PREVIEW_JOBS_REJECTED_TOTAL.labels(backend="render_pool")._value.get()
+        == rejected_before + 1
+    )
+
+
+@pytest.mark.no_db
+@pytest.mark.asyncio
+async def test_reserved_slot_passes_to_the_jobs_render(monkeypatch):
+    monkeypatch.setattr(
+        preview_render_pool, "_render_in_worker", lambda *args: ("assets", 1.0, 2.0)
+    )
+    pool = preview_render_pool.PreviewRenderPool(max_workers=0, max_pending=1)
+    try:
+        pool.reserve(UUID(int=1))
+        assert pool.saturated
+        with pytest.raises(preview_render_pool.PreviewRenderQueueFull):
+            pool.reserve(UUID(int=2))
+
+        outcome = await pool.render(
+            UUID(int=9), UUID(int=1), _layers(), geometry_detail_level="medium"
+        )
+        assert outcome.assets == "assets"
+        assert pool.pending == 0
+
+        pool.reserve(UUID(int=2))
+        pool.release_reservation(UUID(int=2))
+        pool.release_reservation(UUID(int=2))
+        assert pool.pending == 0
+    finally:
+        pool.shutdown()